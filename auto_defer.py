@@ -0,0 +1,132 @@
+"""
+Automatic deferral for slow slash commands.
+
+The deferral timer is an asyncio task, so it only fires while the handler is awaiting something.
+A handler that blocks the event loop (synchronous pymongo calls before its first await) can't be
+preempted: by the time the timer wakes up, the handler's late response has already failed. Commands
+like that either run their database work through asyncio.to_thread or opt in to deferring up front
+with extras={"defer_budget": 0}, which defers before the handler starts.
+"""
+
+import asyncio
+import functools
+import os
+import discord
+from discord.utils import MISSING
+from logging_config import get_logger
+from perf_tracker import current_command
+
+logger = get_logger("auto_defer")
+
+# Seconds a handler gets to respond before the bot defers for it (Discord allows 3)
+DEFAULT_DEFER_BUDGET = float(os.getenv("AUTO_DEFER_BUDGET", 2.0))
+
+# Set once the AutoDeferResponse swap has been found not to work on this discord.py
+_swap_unsupported = False
+
+
+class AutoDeferResponse(discord.InteractionResponse):
+    """
+    InteractionResponse that the tree can defer on a slow handler's behalf.
+    Once that has happened, the handler's own send_message calls go out as followups
+    and its defer calls become no-ops, so handlers don't need to know it happened.
+    """
+
+    __slots__ = ("lock", "auto_deferred", "deferred_ephemeral", "original_replaced")
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.lock = asyncio.Lock()
+        self.auto_deferred = False
+        self.deferred_ephemeral = False
+        self.original_replaced = False
+
+    async def defer_after(self, budget, ephemeral=False):
+        """Sleep for the budget, then defer if the handler still hasn't responded"""
+        await asyncio.sleep(budget)
+        async with self.lock:
+            if self.is_done():
+                return False
+            await super().defer(thinking=True, ephemeral=ephemeral)
+            self.auto_deferred = True
+            self.deferred_ephemeral = ephemeral
+
+        timing = current_command.get()
+        if timing is not None:
+            timing.auto_deferred = True
+        logger.info("⏳ Auto-deferred /%s after %.1fs", timing.name if timing else "unknown", budget)
+        return True
+
+    async def defer(self, *, ephemeral=False, thinking=False):
+        async with self.lock:
+            if self.auto_deferred:
+                return
+            await super().defer(ephemeral=ephemeral, thinking=thinking)
+
+    async def send_message(self, content=None, *, delete_after=None, **kwargs):
+        async with self.lock:
+            if not self.auto_deferred:
+                return await super().send_message(content, delete_after=delete_after, **kwargs)
+
+        # The first followup fills in the "thinking" message, which keeps the deferral's visibility.
+        # If the handler wanted the other visibility, drop the placeholder so the followup stands alone
+        ephemeral = kwargs.get("ephemeral", False)
+        if not self.original_replaced and ephemeral != self.deferred_ephemeral:
+            try:
+                await self._parent.delete_original_response()
+            except discord.HTTPException as e:
+                logger.warning("Could not remove auto-defer placeholder: %s", e)
+        self.original_replaced = True
+
+        message = await self._parent.followup.send(
+            content if content is not None else MISSING, wait=delete_after is not None, **kwargs
+        )
+        if delete_after is not None and message:
+            await message.delete(delay=delete_after)
+
+
+async def plain_defer_after(interaction, budget):
+    """
+    Fallback when the response can't be swapped: defer on the same timer, but the handler's own
+    send_message calls aren't rerouted to followups afterwards
+    """
+    await asyncio.sleep(budget)
+    if interaction.response.is_done():
+        return False
+    await interaction.response.defer(thinking=True)
+    logger.info("⏳ Deferred /%s after %.1fs (plain)", getattr(interaction.command, "name", "unknown"), budget)
+    return True
+
+
+async def install_auto_defer(interaction, budget=DEFAULT_DEFER_BUDGET):
+    """
+    Swap in an AutoDeferResponse and start its timer. Returns the timer task (cancel it when the
+    handler finishes), or None when the command opted out with extras={"defer_budget": None} or
+    deferred up front with a budget of 0
+    """
+    command = interaction.command
+    if command is not None and "defer_budget" in command.extras:
+        budget = command.extras["defer_budget"]
+    if budget is None:
+        return None
+
+    # Interaction.response is discord.py's cached _cs_response slot (checked against 2.3.x);
+    # if a release lays Interaction out differently, fall back to a plain timed defer
+    global _swap_unsupported
+    response = AutoDeferResponse(interaction)
+    try:
+        interaction._cs_response = response
+    except AttributeError:
+        pass
+    if interaction.response is response:
+        timer = response.defer_after
+    else:
+        if not _swap_unsupported:
+            _swap_unsupported = True
+            logger.warning("⚠️ Couldn't install AutoDeferResponse on this discord.py - using plain deferral")
+        timer = functools.partial(plain_defer_after, interaction)
+
+    if budget <= 0:
+        await timer(0)
+        return None
+    return asyncio.create_task(timer(budget))
@@ -0,0 +1,573 @@
+"""
+Shared bot state - config, the bot instance, database handles and helpers used by every command module in cogs/
+"""
+import time
+
+# Taken before the heavy imports so startup timings include them
+BOOT_TIME = time.perf_counter()
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+import logging
+import datetime
+import os
+import asyncio
+from dotenv import load_dotenv
+from database import Database
+from system_coordinator import SystemCoordinator
+from pymongo.mongo_client import MongoClient
+from pymongo.server_api import ServerApi
+import random
+from rate_limiter import DiscordRateLimiter
+from command_sync import CommandSyncManager
+from health_server import HealthServer
+from loop_monitor import LoopLagMonitor
+from report_pipeline import ReportPipeline
+from perf_tracker import CommandPerfTracker
+from db_instrumentation import register_query_stats
+from logging_config import setup_logging
+from auto_defer import install_auto_defer
+from cooldowns import CooldownEngine
+from leaderboard_ranks import LeaderboardRanks
+from leaderboard_snapshot import LeaderboardSnapshotWriter
+from tiers import tier_for_mmr
+
+
+# Rate limiting configuration
+EMERGENCY_MODE = False
+DISCORD_RATE_LIMIT_ENABLED = True
+MAX_CONCURRENT_ROLE_OPERATIONS = 1  # Reduced from 3 to 1 for maximum safety
+DELAY_BETWEEN_ROLE_OPERATIONS = 2.0  # Increased from 0.5 to 2.0 seconds
+GUILD_SYNC_DELAY = 15.0  # Increased from 1.0 to 15.0 seconds
+DM_RETRY_DELAY = 5.0  # Increased from 2.0 to 5.0 seconds
+MEMBER_FETCH_DELAY = 1.0  # Increased from 0.1 to 1.0 second
+
+print("🚀 ENHANCED rate limiting system loaded with ULTRA-CONSERVATIVE settings")
+print("📊 Configuration:")
+print(f"  • Rate limiting enabled: {DISCORD_RATE_LIMIT_ENABLED}")
+print(f"  • Max concurrent role ops: {MAX_CONCURRENT_ROLE_OPERATIONS}")
+print(f"  • Role operation delay: {DELAY_BETWEEN_ROLE_OPERATIONS}s")
+print(f"  • Guild sync delay: {GUILD_SYNC_DELAY}s")
+print(f"  • DM retry delay: {DM_RETRY_DELAY}s")
+print(f"  • Member fetch delay: {MEMBER_FETCH_DELAY}s")
+
+
+# Load environment variables
+load_dotenv()
+TOKEN = os.getenv('DISCORD_TOKEN')
+MONGO_URI = os.getenv('MONGO_URI')
+
+# Module loggers write through a background queue (LOG_LEVEL / LOG_LEVELS / MMR_AUDIT_SAMPLE_RATE)
+setup_logging()
+
+RESET_IN_PROGRESS = False
+RESET_START_TIME = None
+
+# Set up logging
+handler = logging.FileHandler(filename='discord.log', encoding='utf-8', mode='w')
+
+# Seconds from BOOT_TIME to each startup stage
+STARTUP_TIMINGS = {}
+
+
+def mark_startup(stage):
+    """Record how long after boot a startup stage was reached"""
+    STARTUP_TIMINGS[stage] = round(time.perf_counter() - BOOT_TIME, 3)
+    print(f"⏱️ Startup: {stage} at {STARTUP_TIMINGS[stage]:.2f}s")
+
+
+# Command modules. Core ones load before the bot connects, the rest load in on_ready
+# or the first time one of their commands is used, whichever comes first
+CORE_EXTENSIONS = ["cogs.queue", "cogs.match", "cogs.stats"]
+DEFERRED_EXTENSIONS = {
+    "cogs.admin": ["checkpending", "forceprocess", "synccommands", "adjustmmr", "resetstreak", "reloadext"],
+    "cogs.reset": ["resetleaderboard", "resetpreview", "resetplayer", "clearreset", "rebuildratings"],
+    "cogs.debug": ["debugmmr", "testmmr"],
+    "cogs.perf": ["perf", "perfstats"],
+}
+DEFERRED_COMMANDS = {name: ext for ext, names in DEFERRED_EXTENSIONS.items() for name in names}
+ALL_EXTENSIONS = CORE_EXTENSIONS + list(DEFERRED_EXTENSIONS)
+
+extension_lock = asyncio.Lock()
+
+
+async def ensure_extension_loaded(bot, extension):
+    """Load an extension unless it is already loaded. Returns True if it was loaded now"""
+    async with extension_lock:
+        if extension in bot.extensions:
+            return False
+
+        started = time.perf_counter()
+        await bot.load_extension(extension)
+        print(f"📦 Loaded {extension} in {(time.perf_counter() - started) * 1000:.0f}ms")
+        return True
+
+
+def add_extension_commands(bot, extension_commands):
+    """Register an extension's slash commands on the tree (called from its setup)"""
+    for command in extension_commands:
+        bot.tree.add_command(command, override=True)
+
+
+def remove_extension_commands(bot, extension_commands):
+    """Remove an extension's slash commands from the tree (called from its teardown)"""
+    for command in extension_commands:
+        bot.tree.remove_command(command.name)
+
+
+class LazyCommandTree(app_commands.CommandTree):
+    """
+    Command tree that loads a deferred extension the first time one of its commands is used,
+    times every slash command it dispatches, and defers for handlers that are slow to respond
+    """
+
+    async def interaction_check(self, interaction):
+        """Drop redelivered interactions and turn away commands still on cooldown"""
+        if interaction.type is not discord.InteractionType.application_command:
+            return True
+
+        allowed, retry_after = cooldown_engine.check(interaction)
+        if not allowed and retry_after:
+            command = interaction.command
+            name = getattr(command, "qualified_name", None) or (interaction.data or {}).get("name")
+            try:
+                await interaction.response.send_message(
+                    f"⏳ Slow down! You can use `/{name}` again in {retry_after:.1f}s.", ephemeral=True
+                )
+            except discord.HTTPException as e:
+                print(f"⚠️ Could not send cooldown notice for /{name}: {e}")
+        return allowed
+
+    async def _call(self, interaction):
+        command_name = (interaction.data or {}).get("name")
+        if interaction.type is not discord.InteractionType.application_command:
+            await super()._call(interaction)
+            return
+
+        timing, token = command_perf.begin(command_name)
+        failed = False
+        auto_defer_task = None
+        try:
+            extension = DEFERRED_COMMANDS.get(command_name)
+            if extension and extension not in self.client.extensions:
+                try:
+                    await ensure_extension_loaded(self.client, extension)
+                except Exception as e:
+                    print(f"❌ Error loading {extension} for /{command_name}: {e}")
+
+            auto_defer_task = await install_auto_defer(interaction)
+            await super()._call(interaction)
+        except Exception:
+            failed = True
+            raise
+        finally:
+            if auto_defer_task:
+                auto_defer_task.cancel()
+            command = interaction.command
+            command_perf.finish(
+                timing, token,
+                name=getattr(command, "qualified_name", command_name),
+                failed=failed or interaction.command_failed
+            )
+
+
+intents = discord.Intents.default()
+intents.members = True
+intents.message_content = True
+intents.reactions = True
+
+bot = commands.Bot(command_prefix='/', intents=intents, tree_cls=LazyCommandTree)
+bot.remove_command('help')
+
+
+# Simple context class to help with command processing
+class SimpleContext:
+    def __init__(self, interaction):
+        self.interaction = interaction
+        self.author = interaction.user
+        self.guild = interaction.guild
+        self.channel = interaction.channel
+        self.message = SimpleMessage(interaction)
+        self.command = SimpleCommand(interaction.command)
+        self.responded = False
+
+        # ADDED: Additional attributes that the role system might expect
+        self.bot = interaction.client if hasattr(interaction, 'client') else None
+        self.user = interaction.user  # Alias for author
+
+    async def send(self, content=None, embed=None, view=None, ephemeral=False):
+        if self.responded:
+            return await self.interaction.followup.send(content=content, embed=embed, view=view, ephemeral=ephemeral)
+        else:
+            await self.interaction.response.send_message(content=content, embed=embed, view=view, ephemeral=ephemeral)
+            self.responded = True
+
+
+class SimpleMessage:
+    def __init__(self, interaction):
+        self.id = interaction.id
+        self.created_at = interaction.created_at
+        self.mentions = []
+        if hasattr(interaction, 'data') and hasattr(interaction.data, 'resolved') and hasattr(interaction.data.resolved,
+                                                                                              'users'):
+            self.mentions = list(interaction.data.resolved.users.values())
+
+
+class SimpleCommand:
+    def __init__(self, command):
+        self.name = command.name if command else "unknown"
+
+
+# Dedup and per-command cooldowns for every slash command (see LazyCommandTree.interaction_check)
+cooldown_engine = CooldownEngine()
+
+
+
+async def safe_fetch_member(guild, user_id, fallback_name="Unknown"):
+    """Safely fetch a Discord member with emergency mode protection"""
+    global EMERGENCY_MODE
+
+    # Skip all fetches during emergency mode
+    if EMERGENCY_MODE:
+        print(f"🚨 Emergency mode: Skipping member fetch for {user_id}")
+        return None
+
+    try:
+        # CRITICAL: Skip dummy players immediately - don't try to fetch them
+        if str(user_id).startswith('9000'):
+            print(f"ℹ️ Skipping dummy player fetch: {user_id}")
+            return None
+
+        # Skip invalid IDs
+        if not str(user_id).isdigit():
+            print(f"⚠️ Invalid user ID format: {user_id}")
+            return None
+
+        user_id = int(user_id)  # Convert to int after validation
+
+        if rate_limiter:
+            # Add random delay before fetching
+            await asyncio.sleep(random.uniform(2.0, 4.0))  # Increased delay
+            return await rate_limiter.fetch_member_with_limit(guild, user_id, max_retries=1)
+        else:
+            # Manual rate limiting fallback with much longer delays
+            await asyncio.sleep(random.uniform(3.0, 6.0))  # Much longer delay
+            return await guild.fetch_member(user_id)
+
+    except discord.HTTPException as e:
+        if e.status == 429:
+            print(f"⚠️ Rate limited fetching member {user_id} - backing off")
+            # Don't retry immediately on rate limit
+            return None
+        elif e.status == 404:
+            print(f"ℹ️ Member {user_id} not found (404)")
+            return None
+        else:
+            print(f"❌ HTTP error fetching member {user_id}: {e}")
+            return None
+    except ValueError:
+        print(f"❌ Invalid user ID: {user_id}")
+        return None
+    except Exception as e:
+        print(f"❌ Unexpected error fetching member {user_id}: {e}")
+        return None
+
+
+async def emergency_rate_limit_recovery():
+    """Emergency function to handle severe rate limiting"""
+    print("🆘 EMERGENCY: Severe rate limiting detected!")
+    print("🚨 Implementing emergency recovery measures...")
+
+    # Disable all background tasks temporarily
+    global EMERGENCY_MODE
+    EMERGENCY_MODE = True
+
+    # Long cooling-off period
+    print("❄️ Entering 5-minute cooling-off period...")
+    await asyncio.sleep(300)  # 5 minutes
+
+    print("✅ Emergency recovery completed - resuming limited operations")
+    EMERGENCY_MODE = False
+
+
+def check_rate_limit_health():
+    """Check if rate limiter is in healthy state"""
+    if rate_limiter:
+        status = rate_limiter.get_rate_limit_status()
+
+        total_failures = sum(
+            status.get(op_type, {}).get('failure_count', 0)
+            for op_type in status.keys()
+        )
+
+        if total_failures > 10:
+            print(f"⚠️ Rate limiter health warning: {total_failures} total failures")
+            return False
+
+        return True
+
+    return False
+
+
+async def startup_health_check():
+    """Perform health checks after bot startup"""
+    await asyncio.sleep(30)  # Wait 30 seconds after startup
+
+    try:
+        # Check rate limiter health
+        if not check_rate_limit_health():
+            print("⚠️ Rate limiter health check failed")
+            await emergency_rate_limit_recovery()
+
+        # Check if we can make basic API calls
+        for guild in bot.guilds:
+            try:
+                await guild.fetch_member(bot.user.id)  # Try to fetch self
+                print(f"✅ Health check passed for guild: {guild.name}")
+                break  # Only test one guild
+            except discord.HTTPException as e:
+                if e.status == 429:
+                    print(f"⚠️ Rate limited during health check - initiating recovery")
+                    await emergency_rate_limit_recovery()
+                    break
+                else:
+                    print(f"⚠️ API error during health check: {e}")
+            except Exception as e:
+                print(f"⚠️ Unexpected error during health check: {e}")
+
+        print("✅ Startup health check completed")
+
+    except Exception as e:
+        print(f"❌ Health check failed: {e}")
+
+async def safe_role_operation(member, operation, *roles, reason=None):
+    """Safely perform role operations with rate limiting"""
+    try:
+        if rate_limiter:
+            if operation == "add":
+                await rate_limiter.add_role_with_limit(member, *roles, reason=reason)
+            elif operation == "remove":
+                await rate_limiter.remove_role_with_limit(member, *roles, reason=reason)
+        else:
+            # Manual rate limiting fallback
+            await asyncio.sleep(0.5)
+            if operation == "add":
+                await member.add_roles(*roles, reason=reason)
+            elif operation == "remove":
+                await member.remove_roles(*roles, reason=reason)
+        return True
+    except discord.HTTPException as e:
+        if e.status == 429:
+            retry_after = getattr(e, 'retry_after', 2)
+            print(f"Rate limited on role operation, waiting {retry_after}s")
+            await asyncio.sleep(retry_after)
+            try:
+                if operation == "add":
+                    await member.add_roles(*roles, reason=f"{reason} - retry")
+                elif operation == "remove":
+                    await member.remove_roles(*roles, reason=f"{reason} - retry")
+                return True
+            except Exception as retry_error:
+                print(f"Role operation retry failed: {retry_error}")
+                return False
+        else:
+            print(f"Role operation failed: {e}")
+            return False
+    except Exception as e:
+        print(f"Unexpected error in role operation: {e}")
+        return False
+
+
+async def safe_send_followup(interaction, content=None, embed=None, ephemeral=False, max_retries=2):
+    """Safely send followup messages with enhanced rate limiting protection"""
+    for attempt in range(max_retries):
+        try:
+            if rate_limiter:
+                # Add delay before sending
+                await asyncio.sleep(random.uniform(0.5, 1.0))
+                return await rate_limiter.send_message_with_limit(
+                    interaction.followup, content=content, embed=embed, ephemeral=ephemeral
+                )
+            else:
+                # Manual delay fallback with longer delays
+                if attempt > 0:
+                    await asyncio.sleep(random.uniform(2.0, 5.0))  # Longer delay on retry
+                return await interaction.followup.send(content=content, embed=embed, ephemeral=ephemeral)
+        except discord.HTTPException as e:
+            if e.status == 429 and attempt < max_retries - 1:
+                retry_after = max(getattr(e, 'retry_after', 5), 5)  # Minimum 5s wait
+                jitter = random.uniform(0, retry_after * 0.3)  # Add jitter
+                total_wait = retry_after + jitter
+                print(f"⚠️ Followup rate limited, waiting {total_wait:.1f}s (attempt {attempt + 1})")
+                await asyncio.sleep(total_wait)
+                continue
+            else:
+                raise
+        except Exception as e:
+            if attempt < max_retries - 1:
+                print(f"⚠️ Followup error, retrying: {e}")
+                await asyncio.sleep(random.uniform(2.0, 4.0))
+                continue
+            else:
+                raise
+
+    # If we get here, all retries failed
+    raise Exception(f"Failed to send followup after {max_retries} attempts")
+
+
+# Helper function to check if command is used in a queue-specific channel
+def is_queue_channel(channel):
+    """Check if the command is being used in a queue-allowed channel"""
+    allowed_channels = ["rank-a", "rank-b", "rank-c", "global"]
+    return channel.name.lower() in allowed_channels
+
+
+# Helper function to check if command is used in a general command channel
+def is_command_channel(channel):
+    """Check if the command is being used in a general command channel"""
+    allowed_channels = ["rank-a", "rank-b", "rank-c", "global", "sixgents"]
+    return channel.name.lower() in allowed_channels
+
+
+def has_admin_or_mod_permissions(user, guild):
+    """Check if user has admin permissions OR the "6mod" role"""
+    if user.guild_permissions.administrator:
+        return True
+    mod_role = discord.utils.get(guild.roles, name="6mod")
+    if mod_role and mod_role in user.roles:
+        return True
+    return False
+
+
+# Database setup - query stats have to be registered before any client is created
+register_query_stats()
+client = MongoClient(MONGO_URI, server_api=ServerApi('1'))
+try:
+    client.admin.command('ping')
+    print("MongoDB connection successful!")
+except Exception as e:
+    print(f"MongoDB connection error: {e}")
+
+# Initialize components
+db = Database(MONGO_URI)
+system_coordinator = SystemCoordinator(db)
+
+# Initialize rate limiter only
+rate_limiter = DiscordRateLimiter()
+
+# Skips slash command syncs when the tree hasn't changed
+command_sync_manager = CommandSyncManager(db, bot)
+
+# Per-command latency for /perfstats
+command_perf = CommandPerfTracker(db)
+
+# Watches for event loop stalls and what caused them
+loop_monitor = LoopLagMonitor()
+
+# Rates reported matches on a worker pool so /report can reply straight away
+report_pipeline = ReportPipeline(system_coordinator.match_system)
+
+# Leaderboard positions for /rank, loaded in on_ready and kept current as matches are rated
+leaderboard_ranks = LeaderboardRanks(system_coordinator.match_system.players)
+system_coordinator.match_system.set_leaderboard_ranks(leaderboard_ranks)
+
+# Binary leaderboard snapshot the website maps instead of querying Mongo, rewritten as matches are rated
+leaderboard_snapshot = LeaderboardSnapshotWriter(system_coordinator.match_system.players,
+                                                 system_coordinator.match_system.matches)
+system_coordinator.match_system.set_leaderboard_snapshot(leaderboard_snapshot)
+
+# /health and /metrics, served from the bot's event loop
+health_server = HealthServer(bot, db, rate_limiter, system_coordinator, loop_monitor=loop_monitor,
+                             report_pipeline=report_pipeline)
+
+# Created in on_ready once the bot is connected
+bulk_role_manager = None
+
+
+def get_rank_from_mmr(mmr):
+    """Helper function to determine rank from MMR"""
+    return tier_for_mmr(mmr)
+
+
+async def set_reset_status(status: bool, interaction=None):
+    """Set the reset status and notify channels"""
+    global RESET_IN_PROGRESS, RESET_START_TIME
+
+    RESET_IN_PROGRESS = status
+
+    if not status:
+        # Resets and rating rebuilds rewrite everyone's MMR
+        leaderboard_ranks.invalidate()
+        leaderboard_snapshot.invalidate()
+
+    if status:
+        RESET_START_TIME = datetime.datetime.now()
+        if interaction:
+            # Notify all queue channels that reset is starting
+            for guild in bot.guilds:
+                for channel in guild.text_channels:
+                    if channel.name.lower() in ["rank-a", "rank-b", "rank-c", "global"]:
+                        try:
+                            embed = discord.Embed(
+                                title="🚨 RESET IN PROGRESS",
+                                description="⛔ **Queuing is temporarily disabled**\n\nA leaderboard reset is currently running. Please wait for completion.",
+                                color=0xff0000
+                            )
+                            embed.add_field(
+                                name="What's Happening",
+                                value="• Database is being reset\n• Discord roles may be updated\n• This may take several minutes",
+                                inline=False
+                            )
+                            embed.set_footer(text=f"Reset started by {interaction.user.display_name}")
+                            await channel.send(embed=embed)
+                        except Exception as e:
+                            print(f"Error notifying channel {channel.name}: {e}")
+    else:
+        RESET_START_TIME = None
+        if interaction:
+            # Notify that reset is complete
+            for guild in bot.guilds:
+                for channel in guild.text_channels:
+                    if channel.name.lower() in ["rank-a", "rank-b", "rank-c", "global"]:
+                        try:
+                            embed = discord.Embed(
+                                title="✅ RESET COMPLETE",
+                                description="🎉 **Queuing is now re-enabled!**\n\nThe leaderboard reset has finished successfully.",
+                                color=0x00ff00
+                            )
+                            embed.add_field(
+                                name="Ready to Play",
+                                value="• Use `/queue` to join matches\n• Check `/rank` for your stats\n• Visit the website for leaderboards",
+                                inline=False
+                            )
+                            await channel.send(embed=embed)
+                        except Exception as e:
+                            print(f"Error notifying channel {channel.name}: {e}")
+
+
+async def safe_send_message(channel, content=None, embed=None, max_retries=3):
+    """Safely send a message with rate limiting protection"""
+    for attempt in range(max_retries):
+        try:
+            if embed:
+                return await channel.send(embed=embed)
+            else:
+                return await channel.send(content)
+        except discord.HTTPException as e:
+            if e.status == 429:  # Rate limited
+                retry_after = getattr(e, 'retry_after', 2 ** attempt)
+                print(f"Rate limited sending message, waiting {retry_after}s")
+                await asyncio.sleep(retry_after)
+                continue
+            else:
+                print(f"HTTP error sending message: {e}")
+                break
+        except Exception as e:
+            print(f"Error sending message: {e}")
+            if attempt == max_retries - 1:
+                break
+            await asyncio.sleep(1)
+
+    print(f"Failed to send message after {max_retries} attempts")
+    return None
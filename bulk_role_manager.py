@@ -2,6 +2,8 @@ import asyncio
 import datetime
 import discord
 from typing import Dict, List, Set
+from pymongo import UpdateOne
+from tiers import tier_for_mmr
 import random
 
 
@@ -14,76 +16,372 @@ class BulkRoleManager:
         # Database collection for pending role updates
         self.pending_roles = db.get_collection('pending_role_updates')
 
-        # Track if daily task is running
+        # Desired rank state per (guild_id, player_id) - repeated updates collapse to the latest MMR
+        self.desired_roles = {}
+        self.reconcile_event = asyncio.Event()
+
+        # Floor for the delay between players when no rate limiter is attached
+        self.min_reconcile_interval = 2.0
+
+        # Buffered writes - upserts coalesce per (player_id, guild_id), status results are batched
+        self._pending_upserts = {}
+        self._pending_status_ops = []
+        self.flush_interval = 5.0
+        self.flush_batch_size = 100
+        self.flush_task = None
+
+        self.ensure_indexes()
+
+        # Track if the reconciliation task is running
         self.daily_task = None
 
     def start_daily_role_update_task(self):
-        """Start the daily 3am role update task"""
+        """Start the role reconciliation task (kept under the old name for existing callers)"""
+        self.start_role_reconciliation_task()
+
+    def start_role_reconciliation_task(self):
+        """Start the continuous role reconciliation task"""
         if self.daily_task and not self.daily_task.done():
             self.daily_task.cancel()
 
-        self.daily_task = self.bot.loop.create_task(self._daily_role_update_loop())
-        print("✅ Daily role update task started - will run at 3:00 AM daily")
+        if not self.flush_task or self.flush_task.done():
+            self.flush_task = self.bot.loop.create_task(self._flush_loop())
+
+        self.daily_task = self.bot.loop.create_task(self._reconcile_loop())
+        print(f"✅ Role reconciliation task started - draining updates every ~{self.get_reconcile_interval():.1f}s")
+
+    def ensure_indexes(self):
+        """Create the unique (player_id, guild_id) index, collapsing any duplicates first"""
+        try:
+            duplicates = self.pending_roles.aggregate([
+                {"$sort": {"queued_at": -1}},
+                {"$group": {"_id": {"player_id": "$player_id", "guild_id": "$guild_id"},
+                            "ids": {"$push": "$_id"}, "count": {"$sum": 1}}},
+                {"$match": {"count": {"$gt": 1}}}
+            ])
+
+            removed = 0
+            for group in duplicates:
+                # Keep the newest record for each player
+                result = self.pending_roles.delete_many({"_id": {"$in": group["ids"][1:]}})
+                removed += result.deleted_count
+
+            if removed:
+                print(f"🧹 Removed {removed} duplicate pending role updates")
+
+            self.pending_roles.create_index(
+                [("player_id", 1), ("guild_id", 1)],
+                unique=True,
+                name="player_guild_unique"
+            )
+        except Exception as e:
+            print(f"⚠️ Could not ensure pending_role_updates indexes: {e}")
+
+    def _buffered_write_count(self) -> int:
+        return len(self._pending_upserts) + len(self._pending_status_ops)
+
+    def _buffer_status(self, query: dict, update: dict):
+        """Buffer a status write-back for the next bulk flush"""
+        self._pending_status_ops.append(UpdateOne(query, update))
 
-    async def _daily_role_update_loop(self):
-        """Main loop that runs daily at 3am"""
+        if self._buffered_write_count() >= self.flush_batch_size:
+            self.flush_pending_writes()
+
+    def flush_pending_writes(self) -> int:
+        """Write buffered upserts and status results in one bulk_write"""
+        if not self._pending_upserts and not self._pending_status_ops:
+            return 0
+
+        # Upserts go first so status writes for the same state find their document
+        operations = [
+            UpdateOne(
+                {"player_id": doc["player_id"], "guild_id": doc["guild_id"]},
+                {"$set": doc, "$unset": {"result": "", "error": "", "final_role": "", "processed_at": ""}},
+                upsert=True
+            )
+            for doc in self._pending_upserts.values()
+        ]
+        operations.extend(self._pending_status_ops)
+
+        upserts = self._pending_upserts
+        status_ops = self._pending_status_ops
+        self._pending_upserts = {}
+        self._pending_status_ops = []
+
+        try:
+            self.pending_roles.bulk_write(operations, ordered=True)
+            print(f"💾 Flushed {len(upserts)} role upserts and {len(status_ops)} status updates")
+            return len(operations)
+
+        except Exception as e:
+            print(f"❌ Error flushing pending role writes: {e}")
+            # Put the writes back - newer upserts queued meanwhile win
+            for key, doc in upserts.items():
+                self._pending_upserts.setdefault(key, doc)
+            self._pending_status_ops = status_ops + self._pending_status_ops
+            return 0
+
+    async def _flush_loop(self):
+        """Periodically flush buffered writes"""
         while True:
             try:
-                # Calculate time until next 3am
-                now = datetime.datetime.now()
-                target_time = now.replace(hour=3, minute=0, second=0, microsecond=0)
+                await asyncio.sleep(self.flush_interval)
+                self.flush_pending_writes()
+            except asyncio.CancelledError:
+                self.flush_pending_writes()
+                break
+            except Exception as e:
+                print(f"❌ Error in pending role flush loop: {e}")
+
+    def get_reconcile_interval(self) -> float:
+        """Seconds to wait between players, derived from the rate limiter's role budget"""
+        if not self.rate_limiter:
+            return self.min_reconcile_interval * 5
+
+        config = self.rate_limiter.rate_limits['role_modification']
+
+        # A rank change costs up to two role calls (remove old + add new)
+        interval = max(2.0 / config['requests_per_second'], config['delay_between_requests'] * 2,
+                       self.min_reconcile_interval)
+
+        # Slow down while the limiter is backing off from recent failures
+        failures = self.rate_limiter.failure_counts.get('role_modification', 0)
+        if failures > 0:
+            interval = min(interval * (config['backoff_multiplier'] ** failures), config['max_backoff'])
+
+        return interval
+
+    def get_reconciler_status(self) -> dict:
+        """Get a snapshot of the reconciliation backlog"""
+        interval = self.get_reconcile_interval()
+        backlog = len(self.desired_roles)
+        return {
+            "running": bool(self.daily_task and not self.daily_task.done()),
+            "backlog": backlog,
+            "interval": interval,
+            "estimated_drain_seconds": backlog * interval
+        }
+
+    def _load_pending_into_desired(self):
+        """Seed the desired-role map from unprocessed updates left in the database"""
+        try:
+            self.flush_pending_writes()
+
+            loaded = 0
+            for update in self.pending_roles.find({"processed": False}):
+                key = (update["guild_id"], update["player_id"])
+                if key not in self.desired_roles:
+                    self.desired_roles[key] = {
+                        "new_mmr": update["new_mmr"],
+                        "old_rank": update.get("old_rank"),
+                        "new_rank": update.get("new_rank"),
+                        "promotion": update.get("promotion", False),
+                        "queued_at": update.get("queued_at") or datetime.datetime.utcnow()
+                    }
+                    loaded += 1
+
+            if loaded:
+                print(f"📋 Loaded {loaded} pending role updates into reconciler")
+                self.reconcile_event.set()
+
+        except Exception as e:
+            print(f"❌ Error loading pending role updates: {e}")
+
+    async def _reconcile_loop(self):
+        """Main loop that continuously drains desired roles at the limiter's pace"""
+        self._load_pending_into_desired()
 
-                # If it's already past 3am today, target tomorrow's 3am
-                if now >= target_time:
-                    target_time += datetime.timedelta(days=1)
+        while True:
+            try:
+                if not self.desired_roles:
+                    self.reconcile_event.clear()
+                    try:
+                        await asyncio.wait_for(self.reconcile_event.wait(), timeout=300)
+                    except asyncio.TimeoutError:
+                        # Periodically pick up anything left in the database
+                        self._load_pending_into_desired()
+                    continue
 
-                sleep_seconds = (target_time - now).total_seconds()
-                print(
-                    f"💤 Next bulk role update scheduled for {target_time.strftime('%Y-%m-%d %H:%M:%S')} (in {sleep_seconds / 3600:.1f} hours)")
+                # Oldest desired state first
+                key = min(self.desired_roles, key=lambda k: self.desired_roles[k]["queued_at"])
+                desired = self.desired_roles.pop(key)
 
-                # Sleep until 3am
-                await asyncio.sleep(sleep_seconds)
+                try:
+                    await self._reconcile_player(key[0], key[1], desired)
+                except Exception:
+                    # Keep the state for another pass unless a newer one was queued meanwhile
+                    self.desired_roles.setdefault(key, desired)
+                    raise
 
-                # Run the bulk update
-                await self.process_all_pending_role_updates()
+                await asyncio.sleep(self.get_reconcile_interval())
 
             except asyncio.CancelledError:
-                print("🛑 Daily role update task cancelled")
+                print("🛑 Role reconciliation task cancelled")
                 break
             except Exception as e:
-                print(f"❌ Error in daily role update loop: {e}")
-                # Wait 1 hour before trying again if there's an error
-                await asyncio.sleep(3600)
+                print(f"❌ Error in role reconciliation loop: {e}")
+                await asyncio.sleep(30)
+
+    @staticmethod
+    def _state_query(guild_id: str, player_id: str, state: dict) -> dict:
+        """Match a player's pending document only while it still holds this exact state"""
+        return {"player_id": player_id, "guild_id": guild_id,
+                "queued_at": state.get("queued_at"), "new_mmr": state["new_mmr"]}
+
+    async def _reconcile_player(self, guild_id: str, player_id: str, desired: dict):
+        """Bring one player's Discord rank role in line with their latest desired state"""
+        query = self._state_query(guild_id, player_id, desired)
+
+        guild = self.bot.get_guild(int(guild_id))
+        if not guild:
+            print(f"❌ Guild {guild_id} not found")
+            self._buffer_status(query, {"$set": {"processed": True, "error": "Guild not found",
+                                                 "processed_at": datetime.datetime.utcnow()}})
+            return False
+
+        rank_roles = self._get_rank_roles(guild)
+        missing_roles = [name for name, role in rank_roles.items() if role is None]
+        if missing_roles:
+            print(f"❌ Missing roles in {guild.name}: {missing_roles}")
+            self._buffer_status(query, {"$set": {"processed": True,
+                                                 "error": f"Missing roles: {missing_roles}",
+                                                 "processed_at": datetime.datetime.utcnow()}})
+            return False
+
+        success, status = await self._apply_rank_role(guild, rank_roles, player_id, desired["new_mmr"],
+                                                      desired.get("old_rank"), desired.get("promotion", False))
+
+        # Only mark the exact state we applied - a newer update for this player stays pending
+        self._buffer_status(query, {"$set": status})
+        return success
+
+    def _get_rank_roles(self, guild) -> dict:
+        """Look up the rank roles for a guild"""
+        return {
+            "Rank A": discord.utils.get(guild.roles, name="Rank A"),
+            "Rank B": discord.utils.get(guild.roles, name="Rank B"),
+            "Rank C": discord.utils.get(guild.roles, name="Rank C")
+        }
+
+    async def _apply_rank_role(self, guild, rank_roles: dict, player_id: str, new_mmr: int, old_rank: str = None,
+                               promotion: bool = False) -> tuple:
+        """Apply the rank role for an MMR value. Returns (success, status fields to store)"""
+        now = datetime.datetime.utcnow()
+
+        # Fetch member - cache first so unchanged players cost no API calls
+        try:
+            member = guild.get_member(int(player_id))
+            if member is None:
+                if self.rate_limiter:
+                    member = await self.rate_limiter.fetch_member_with_limit(guild, int(player_id))
+                else:
+                    await asyncio.sleep(random.uniform(1.0, 2.0))
+                    member = await guild.fetch_member(int(player_id))
+        except discord.NotFound:
+            print(f"⚠️ Member {player_id} not found in {guild.name} - may have left server")
+            return False, {"processed": True, "error": "Member not found", "processed_at": now}
+        except Exception as e:
+            print(f"❌ Error fetching member {player_id}: {e}")
+            return False, {"processed": True, "error": str(e), "processed_at": now}
+
+        # Determine target role based on MMR
+        target_rank_name = tier_for_mmr(new_mmr)
+        target_role = rank_roles[target_rank_name]
+
+        # Check current rank roles
+        current_rank_roles = [role for role in member.roles if role in rank_roles.values()]
+
+        # Skip if already has correct role
+        if len(current_rank_roles) == 1 and current_rank_roles[0] == target_role:
+            print(f"✅ {member.display_name} already has correct role ({target_rank_name})")
+            return True, {"processed": True, "result": "No change needed", "final_role": target_rank_name,
+                          "processed_at": now}
+
+        # Remove old rank roles
+        stale_roles = [role for role in current_rank_roles if role != target_role]
+        if stale_roles:
+            try:
+                if self.rate_limiter:
+                    await self.rate_limiter.remove_role_with_limit(
+                        member, *stale_roles,
+                        reason="Role reconciliation - removing old rank"
+                    )
+                else:
+                    await asyncio.sleep(random.uniform(3.0, 6.0))
+                    await member.remove_roles(*stale_roles, reason="Role reconciliation - removing old rank")
+
+            except Exception as e:
+                print(f"❌ Error removing old roles from {member.display_name}: {e}")
+                return False, {"processed": True, "error": f"Failed to remove old roles: {str(e)}",
+                               "processed_at": now}
+
+        # Add new role
+        if target_role not in current_rank_roles:
+            try:
+                if self.rate_limiter:
+                    await self.rate_limiter.add_role_with_limit(
+                        member, target_role,
+                        reason=f"Role reconciliation - MMR: {new_mmr}"
+                    )
+                else:
+                    await asyncio.sleep(random.uniform(3.0, 6.0))
+                    await member.add_roles(target_role, reason=f"Role reconciliation - MMR: {new_mmr}")
+
+            except Exception as e:
+                print(f"❌ Error adding new role to {member.display_name}: {e}")
+                return False, {"processed": True, "error": f"Failed to add new role: {str(e)}",
+                               "processed_at": now}
+
+        result_msg = f"Updated to {target_rank_name}"
+        if promotion:
+            result_msg += " (Promotion)"
+
+        print(f"✅ Updated {member.display_name}: {old_rank or 'Unknown'} → {target_rank_name} (MMR: {new_mmr})")
+        return True, {"processed": True, "result": result_msg, "final_role": target_rank_name,
+                      "processed_at": datetime.datetime.utcnow()}
 
     def queue_role_update(self, player_id: str, guild_id: str, new_mmr: int, old_rank: str = None, new_rank: str = None,
                           promotion: bool = False):
-        """Queue a role update to be processed at 3am"""
+        """Record the desired role for a player; the reconciler applies the latest state"""
         try:
-            # Check if there's already a pending update for this player
-            existing = self.pending_roles.find_one({"player_id": player_id, "guild_id": guild_id})
+            key = (guild_id, player_id)
+            # Mongo keeps milliseconds - queue the value it will store so state comparisons match
+            now = datetime.datetime.utcnow()
+            queued_at = now.replace(microsecond=now.microsecond // 1000 * 1000)
+
+            # Coalesce with an update that hasn't been applied yet - keep the original starting rank
+            previous = self.desired_roles.get(key)
+            if previous and previous.get("old_rank"):
+                old_rank = previous["old_rank"]
+                promotion = {"Rank C": 1, "Rank B": 2, "Rank A": 3}.get(new_rank, 1) > \
+                            {"Rank C": 1, "Rank B": 2, "Rank A": 3}.get(old_rank, 1)
+
+            self.desired_roles[key] = {
+                "new_mmr": new_mmr,
+                "old_rank": old_rank,
+                "new_rank": new_rank,
+                "promotion": promotion,
+                "queued_at": queued_at
+            }
 
-            update_data = {
+            # Single upsert keyed by (player_id, guild_id), buffered until the next flush
+            self._pending_upserts[(player_id, guild_id)] = {
                 "player_id": player_id,
                 "guild_id": guild_id,
                 "new_mmr": new_mmr,
                 "old_rank": old_rank,
                 "new_rank": new_rank,
                 "promotion": promotion,
-                "queued_at": datetime.datetime.utcnow(),
+                "queued_at": queued_at,
                 "processed": False
             }
+            print(f"📋 Queued role update for player {player_id}: {new_mmr} MMR")
 
-            if existing:
-                # Update existing record with latest MMR/rank info
-                self.pending_roles.update_one(
-                    {"player_id": player_id, "guild_id": guild_id},
-                    {"$set": update_data}
-                )
-                print(f"📝 Updated pending role update for player {player_id}: {new_mmr} MMR")
-            else:
-                # Create new pending update
-                self.pending_roles.insert_one(update_data)
-                print(f"📋 Queued role update for player {player_id}: {new_mmr} MMR")
+            if self._buffered_write_count() >= self.flush_batch_size:
+                self.flush_pending_writes()
+
+            # Wake the reconciler
+            self.reconcile_event.set()
 
             return True
 
@@ -92,11 +390,12 @@ class BulkRoleManager:
             return False
 
     async def process_all_pending_role_updates(self):
-        """Process all pending role updates (runs at 3am)"""
+        """Process all pending role updates in one sweep (manual full pass)"""
         try:
-            print("🚀 Starting bulk role update process at 3:00 AM...")
+            print("🚀 Starting bulk role update sweep...")
 
             # Get all unprocessed role updates
+            self.flush_pending_writes()
             pending_updates = list(self.pending_roles.find({"processed": False}))
 
             if not pending_updates:
@@ -122,10 +421,7 @@ class BulkRoleManager:
                 total_processed += guild_processed
                 total_errors += guild_errors
 
-                # Long delay between guilds to be extra safe
-                if len(updates_by_guild) > 1:
-                    await asyncio.sleep(random.uniform(30.0, 60.0))
-
+            self.flush_pending_writes()
             print(f"✅ Bulk role update completed: {total_processed} successful, {total_errors} errors")
 
             # Send completion summary to admin channel if configured
@@ -144,8 +440,8 @@ class BulkRoleManager:
                 print(f"❌ Guild {guild_id} not found")
                 # Mark all updates as processed with error
                 for update in updates:
-                    self.pending_roles.update_one(
-                        {"_id": update["_id"]},
+                    self._buffer_status(
+                        self._state_query(guild_id, update["player_id"], update),
                         {"$set": {"processed": True, "error": "Guild not found",
                                   "processed_at": datetime.datetime.utcnow()}}
                     )
@@ -154,11 +450,7 @@ class BulkRoleManager:
             print(f"🔄 Processing {len(updates)} role updates for guild: {guild.name}")
 
             # Get rank roles
-            rank_roles = {
-                "Rank A": discord.utils.get(guild.roles, name="Rank A"),
-                "Rank B": discord.utils.get(guild.roles, name="Rank B"),
-                "Rank C": discord.utils.get(guild.roles, name="Rank C")
-            }
+            rank_roles = self._get_rank_roles(guild)
 
             # Verify all roles exist
             missing_roles = [name for name, role in rank_roles.items() if role is None]
@@ -166,8 +458,8 @@ class BulkRoleManager:
                 print(f"❌ Missing roles in {guild.name}: {missing_roles}")
                 # Mark updates as processed with error
                 for update in updates:
-                    self.pending_roles.update_one(
-                        {"_id": update["_id"]},
+                    self._buffer_status(
+                        self._state_query(guild_id, update["player_id"], update),
                         {"$set": {"processed": True, "error": f"Missing roles: {missing_roles}",
                                   "processed_at": datetime.datetime.utcnow()}}
                     )
@@ -179,136 +471,34 @@ class BulkRoleManager:
             # Process each player's role update
             for i, update in enumerate(updates):
                 try:
-                    player_id = update["player_id"]
-                    new_mmr = update["new_mmr"]
-                    old_rank = update.get("old_rank")
-                    new_rank = update.get("new_rank")
-                    promotion = update.get("promotion", False)
-
-                    # Fetch member
-                    try:
-                        if self.rate_limiter:
-                            await asyncio.sleep(random.uniform(3.0, 6.0))
-                            member = await self.rate_limiter.fetch_member_with_limit(guild, int(player_id))
-                        else:
-                            await asyncio.sleep(random.uniform(5.0, 8.0))
-                            member = await guild.fetch_member(int(player_id))
-                    except discord.NotFound:
-                        print(f"⚠️ Member {player_id} not found in {guild.name} - may have left server")
-                        self.pending_roles.update_one(
-                            {"_id": update["_id"]},
-                            {"$set": {"processed": True, "error": "Member not found",
-                                      "processed_at": datetime.datetime.utcnow()}}
-                        )
-                        errors += 1
-                        continue
-                    except Exception as e:
-                        print(f"❌ Error fetching member {player_id}: {e}")
-                        self.pending_roles.update_one(
-                            {"_id": update["_id"]},
-                            {"$set": {"processed": True, "error": str(e), "processed_at": datetime.datetime.utcnow()}}
-                        )
-                        errors += 1
-                        continue
-
-                    # Determine target role based on MMR
-                    if new_mmr >= 1600:
-                        target_role = rank_roles["Rank A"]
-                        target_rank_name = "Rank A"
-                    elif new_mmr >= 1100:
-                        target_role = rank_roles["Rank B"]
-                        target_rank_name = "Rank B"
-                    else:
-                        target_role = rank_roles["Rank C"]
-                        target_rank_name = "Rank C"
-
-                    # Check current rank roles
-                    current_rank_roles = [role for role in member.roles if role in rank_roles.values()]
-
-                    # Skip if already has correct role
-                    if len(current_rank_roles) == 1 and current_rank_roles[0] == target_role:
-                        print(f"✅ {member.display_name} already has correct role ({target_rank_name})")
-                        self.pending_roles.update_one(
-                            {"_id": update["_id"]},
-                            {"$set": {"processed": True, "result": "No change needed",
-                                      "processed_at": datetime.datetime.utcnow()}}
-                        )
-                        successful += 1
-                        continue
-
-                    # Remove old rank roles
-                    if current_rank_roles:
-                        try:
-                            if self.rate_limiter:
-                                await self.rate_limiter.remove_role_with_limit(
-                                    member, *current_rank_roles,
-                                    reason="Bulk role update - removing old rank"
-                                )
-                            else:
-                                await asyncio.sleep(random.uniform(3.0, 6.0))
-                                await member.remove_roles(*current_rank_roles,
-                                                          reason="Bulk role update - removing old rank")
-
-                            await asyncio.sleep(random.uniform(5.0, 8.0))  # Delay between remove and add
-
-                        except Exception as e:
-                            print(f"❌ Error removing old roles from {member.display_name}: {e}")
-                            self.pending_roles.update_one(
-                                {"_id": update["_id"]},
-                                {"$set": {"processed": True, "error": f"Failed to remove old roles: {str(e)}",
-                                          "processed_at": datetime.datetime.utcnow()}}
-                            )
-                            errors += 1
-                            continue
-
-                    # Add new role
-                    try:
-                        if self.rate_limiter:
-                            await self.rate_limiter.add_role_with_limit(
-                                member, target_role,
-                                reason=f"Bulk role update - MMR: {new_mmr}"
-                            )
-                        else:
-                            await asyncio.sleep(random.uniform(3.0, 6.0))
-                            await member.add_roles(target_role, reason=f"Bulk role update - MMR: {new_mmr}")
-
-                        # Mark as successfully processed
-                        result_msg = f"Updated to {target_rank_name}"
-                        if promotion:
-                            result_msg += " (Promotion)"
-
-                        self.pending_roles.update_one(
-                            {"_id": update["_id"]},
-                            {"$set": {
-                                "processed": True,
-                                "result": result_msg,
-                                "final_role": target_rank_name,
-                                "processed_at": datetime.datetime.utcnow()
-                            }}
-                        )
+                    # This sweep supersedes in-memory state for the same player, unless a newer
+                    # update was queued while the sweep was running
+                    key = (guild_id, update["player_id"])
+                    desired = self.desired_roles.get(key)
+                    if desired and update.get("queued_at") and desired["queued_at"] <= update["queued_at"]:
+                        del self.desired_roles[key]
+
+                    success, status = await self._apply_rank_role(
+                        guild, rank_roles, update["player_id"], update["new_mmr"],
+                        update.get("old_rank"), update.get("promotion", False)
+                    )
+                    # Only mark the state this sweep applied - a newer update stays pending
+                    self._buffer_status(self._state_query(guild_id, update["player_id"], update),
+                                        {"$set": status})
 
-                        print(
-                            f"✅ Updated {member.display_name}: {old_rank or 'Unknown'} → {target_rank_name} (MMR: {new_mmr})")
+                    if success:
                         successful += 1
-
-                    except Exception as e:
-                        print(f"❌ Error adding new role to {member.display_name}: {e}")
-                        self.pending_roles.update_one(
-                            {"_id": update["_id"]},
-                            {"$set": {"processed": True, "error": f"Failed to add new role: {str(e)}",
-                                      "processed_at": datetime.datetime.utcnow()}}
-                        )
+                    else:
                         errors += 1
-                        continue
 
-                    # Delay between each player to prevent rate limiting
+                    # Pace players at the limiter's role budget
                     if i < len(updates) - 1:  # Don't delay after the last update
-                        await asyncio.sleep(random.uniform(8.0, 15.0))
+                        await asyncio.sleep(self.get_reconcile_interval())
 
                 except Exception as e:
                     print(f"❌ Unexpected error processing update for player {update.get('player_id', 'unknown')}: {e}")
-                    self.pending_roles.update_one(
-                        {"_id": update["_id"]},
+                    self._buffer_status(
+                        self._state_query(guild_id, update["player_id"], update),
                         {"$set": {"processed": True, "error": f"Unexpected error: {str(e)}",
                                   "processed_at": datetime.datetime.utcnow()}}
                     )
@@ -321,8 +511,8 @@ class BulkRoleManager:
             print(f"❌ Critical error processing guild {guild_id}: {e}")
             # Mark all updates as processed with error
             for update in updates:
-                self.pending_roles.update_one(
-                    {"_id": update["_id"]},
+                self._buffer_status(
+                    self._state_query(guild_id, update["player_id"], update),
                     {"$set": {"processed": True, "error": f"Guild processing error: {str(e)}",
                               "processed_at": datetime.datetime.utcnow()}}
                 )
@@ -332,7 +522,7 @@ class BulkRoleManager:
         """Send completion summary to rl-admin channel instead of admin channels"""
         try:
             summary_msg = (
-                f"🌅 **Daily Role Update Complete**\n"
+                f"🌅 **Role Update Sweep Complete**\n"
                 f"✅ **Successful:** {successful}\n"
                 f"❌ **Errors:** {errors}\n"
                 f"📅 **Completed:** {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
@@ -348,8 +538,8 @@ class BulkRoleManager:
                 if role_updates_channel:
                     try:
                         embed = discord.Embed(
-                            title="🌅 Daily Role Update Complete",
-                            description="The automated role update process has finished.",
+                            title="🌅 Role Update Sweep Complete",
+                            description="A full pass over pending role updates has finished.",
                             color=0x00ff00 if errors == 0 else 0xffa500,
                             timestamp=datetime.datetime.utcnow()
                         )
@@ -381,10 +571,10 @@ class BulkRoleManager:
                                 inline=True
                             )
 
-                        # Add next update info
+                        # Add reconciler info
                         embed.add_field(
-                            name="⏰ Next Update",
-                            value="Tomorrow at 3:00 AM",
+                            name="⏰ Reconciler Backlog",
+                            value=str(len(self.desired_roles)),
                             inline=True
                         )
 
@@ -392,7 +582,7 @@ class BulkRoleManager:
                         embed.add_field(
                             name="ℹ️ Information",
                             value=(
-                                "• Role updates happen automatically every day at 3:00 AM\n"
+                                "• Role updates are applied continuously after each match\n"
                                 "• Only players with MMR changes get role updates\n"
                                 "• Use `/checkpending` to see queued updates\n"
                                 "• Use `/forceprocess @player` for immediate updates"
@@ -421,7 +611,7 @@ class BulkRoleManager:
                         if channel:
                             try:
                                 fallback_embed = discord.Embed(
-                                    title="🌅 Daily Role Update Complete",
+                                    title="🌅 Role Update Sweep Complete",
                                     description=(
                                         f"**Note:** This message should be in #rl-admin channel\n\n"
                                         f"✅ **Successful:** {successful}\n"
@@ -451,6 +641,7 @@ class BulkRoleManager:
     def get_pending_updates_count(self) -> int:
         """Get count of pending role updates"""
         try:
+            self.flush_pending_writes()
             return self.pending_roles.count_documents({"processed": False})
         except Exception as e:
             print(f"❌ Error getting pending updates count: {e}")
@@ -459,6 +650,7 @@ class BulkRoleManager:
     def get_player_pending_update(self, player_id: str, guild_id: str) -> dict:
         """Check if a player has a pending role update"""
         try:
+            self.flush_pending_writes()
             return self.pending_roles.find_one({
                 "player_id": player_id,
                 "guild_id": guild_id,
@@ -479,6 +671,7 @@ class BulkRoleManager:
 
             # Process just this one update
             successful, errors = await self._process_guild_role_updates(guild_id, [pending])
+            self.flush_pending_writes()
 
             return successful > 0
 
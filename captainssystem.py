@@ -830,14 +830,17 @@ class CaptainsSystem:
 
     def create_teams_embed(self, match_id, captain1, captain2, team1, team2):
         """Create a nice embed for team announcement"""
-        # Format team mentions
-        team1_mentions = [player['mention'] for player in team1]
-        team2_mentions = [player['mention'] for player in team2]
-
         # Determine if this is a global match based on match data
         match = self.queue_manager.get_match_by_id(match_id)
         is_global = match.get('is_global', False) if match else False
 
+        # Format team mentions with each player's precomputed win / loss MMR change
+        mmr_preview = match.get('mmr_preview') if match else None
+        team1_mentions = [player['mention'] + self.match_system.format_mmr_preview(mmr_preview, player['id'])
+                          for player in team1]
+        team2_mentions = [player['mention'] + self.match_system.format_mmr_preview(mmr_preview, player['id'])
+                          for player in team2]
+
         # Calculate average MMR for each team using the correct MMR type
         team1_mmr = self.calculate_team_mmr_for_embed(team1, is_global)
         team2_mmr = self.calculate_team_mmr_for_embed(team2, is_global)
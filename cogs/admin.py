@@ -0,0 +1,662 @@
+"""
+Admin commands - role update tools, command sync, MMR adjustments, streak resets and extension reloads
+"""
+import discord
+from discord import app_commands
+import datetime
+import asyncio
+import random
+import time
+from cooldowns import cooldown
+from tiers import tier_for_mmr
+from render_config import (
+    RenderErrorHandler,
+    cloud_safe_defer,
+    cloud_safe_followup,
+    is_cloud_platform
+)
+import bot_core
+from bot_core import (
+    add_extension_commands,
+    command_sync_manager,
+    cooldown_engine,
+    db,
+    get_rank_from_mmr,
+    has_admin_or_mod_permissions,
+    is_command_channel,
+    remove_extension_commands,
+    system_coordinator
+)
+
+
+@app_commands.command(name="checkpending", description="Check pending role updates (Admin only)")
+async def checkpending_slash(interaction: discord.Interaction):
+    if not has_admin_or_mod_permissions(interaction.user, interaction.guild):
+        await interaction.response.send_message("Admin only", ephemeral=True)
+        return
+
+    pending_count = bot_core.bulk_role_manager.get_pending_updates_count()
+
+    embed = discord.Embed(
+        title="📋 Pending Role Updates",
+        description=f"There are **{pending_count}** pending role updates",
+        color=0x3498db
+    )
+
+    if pending_count > 0:
+        reconciler_status = bot_core.bulk_role_manager.get_reconciler_status()
+        embed.add_field(
+            name="Next Processing",
+            value=(
+                f"Continuous - one player every ~{reconciler_status['interval']:.0f}s\n"
+                f"Reconciler backlog: **{reconciler_status['backlog']}** "
+                f"(~{max(1, round(reconciler_status['estimated_drain_seconds'] / 60))} min to drain)"
+            ),
+            inline=False
+        )
+        embed.add_field(
+            name="Manual Processing",
+            value="Use `/forceprocess @member` to process a specific player immediately",
+            inline=False
+        )
+    else:
+        embed.add_field(
+            name="Status",
+            value="✅ No pending updates",
+            inline=False
+        )
+
+    await interaction.response.send_message(embed=embed)
+
+
+@app_commands.command(name="forceprocess", description="Force process a player's role update (Admin only)")
+@app_commands.describe(member="Member to process role update for")
+async def forceprocess_slash(interaction: discord.Interaction, member: discord.Member):
+    if not has_admin_or_mod_permissions(interaction.user, interaction.guild):
+        await interaction.response.send_message("Admin only", ephemeral=True)
+        return
+
+    await interaction.response.defer()
+
+    player_id = str(member.id)
+    guild_id = str(interaction.guild.id)
+
+    # Check if there's a pending update
+    pending = bot_core.bulk_role_manager.get_player_pending_update(player_id, guild_id)
+
+    if not pending:
+        await interaction.followup.send(f"{member.mention} has no pending role updates.")
+        return
+
+    # Process the update
+    success = await bot_core.bulk_role_manager.force_process_player_update(player_id, guild_id)
+
+    if success:
+        embed = discord.Embed(
+            title="✅ Role Update Processed",
+            description=f"Successfully processed role update for {member.mention}",
+            color=0x00ff00
+        )
+        embed.add_field(
+            name="New MMR",
+            value=str(pending.get("new_mmr", "Unknown")),
+            inline=True
+        )
+        embed.add_field(
+            name="New Rank",
+            value=pending.get("new_rank", "Unknown"),
+            inline=True
+        )
+    else:
+        embed = discord.Embed(
+            title="❌ Processing Failed",
+            description=f"Failed to process role update for {member.mention}",
+            color=0xff0000
+        )
+        embed.add_field(
+            name="Note",
+            value="Check logs for details. The reconciler will retry on the next match update.",
+            inline=False
+        )
+
+    await interaction.followup.send(embed=embed)
+
+@cooldown(30, scope="global")
+@app_commands.command(name="synccommands", description="Force a slash command sync (Admin only)")
+@app_commands.describe(scope="Which commands to sync")
+@app_commands.choices(scope=[
+    app_commands.Choice(name="Everything", value="all"),
+    app_commands.Choice(name="Global Only", value="global"),
+    app_commands.Choice(name="This Server Only", value="guild")
+])
+async def synccommands_slash(interaction: discord.Interaction, scope: str = "all"):
+    if not has_admin_or_mod_permissions(interaction.user, interaction.guild):
+        await interaction.response.send_message("Admin only", ephemeral=True)
+        return
+
+    await interaction.response.defer(ephemeral=True)
+
+    if command_sync_manager.sync_lock.locked():
+        await interaction.followup.send("⏳ A command sync is already running, try again shortly.", ephemeral=True)
+        return
+
+    if scope == "all":
+        results = await command_sync_manager.sync_all(force=True)
+    else:
+        async with command_sync_manager.sync_lock:
+            guild = interaction.guild if scope == "guild" else None
+            outcome = await command_sync_manager.sync_scope(guild, force=True)
+            results = {"synced": [], "skipped": [], "failed": []}
+            results[outcome].append(guild.name if guild else "global")
+
+    embed = discord.Embed(
+        title="🔄 Command Sync",
+        description=f"Forced sync of **{scope}** commands",
+        color=0x00ff00 if not results["failed"] else 0xffa500
+    )
+    embed.add_field(name="✅ Synced", value=", ".join(results["synced"]) or "None", inline=False)
+    if results["failed"]:
+        embed.add_field(name="❌ Failed", value=", ".join(results["failed"]), inline=False)
+
+    await interaction.followup.send(embed=embed, ephemeral=True)
+
+
+# 1. Adjust MMR Command
+@app_commands.command(name="adjustmmr", description="Admin command to adjust a player's MMR")
+@app_commands.describe(
+    player="The player whose MMR you want to adjust",
+    amount="The amount to adjust (positive or negative)",
+    global_mmr="Whether to adjust global MMR instead of ranked MMR"
+)
+@app_commands.choices(global_mmr=[
+    app_commands.Choice(name="Ranked MMR", value="false"),
+    app_commands.Choice(name="Global MMR", value="true")
+])
+async def adjustmmr_slash_rate_limited(interaction: discord.Interaction, player: discord.Member, amount: int,
+                                       global_mmr: str = "false"):
+    # Check if command is used in an allowed channel
+    if not is_command_channel(interaction.channel):
+        await interaction.response.send_message(
+            f"{interaction.user.mention}, this command can only be used in the rank-a, rank-b, rank-c, global, or sixgents channels.",
+            ephemeral=True
+        )
+        return
+
+    # Check if user has admin permissions
+    if not has_admin_or_mod_permissions(interaction.user, interaction.guild):
+        await interaction.response.send_message(
+            "You need administrator permissions or the 6mod role to use this command.",
+            ephemeral=True)
+        return
+
+    # ENHANCED: Check for duplicate command prevention
+    if await is_duplicate_command_for_adjustmmr(interaction, player.id):
+        await interaction.response.send_message(
+            "⚠️ An MMR adjustment for this player is already in progress. Please wait.",
+            ephemeral=True
+        )
+        return
+
+    # CLOUD-SAFE defer with enhanced error handling
+    try:
+        defer_success = await cloud_safe_defer(interaction)
+        if not defer_success:
+            await RenderErrorHandler.handle_rate_limit(interaction, "MMR adjustment")
+            return
+    except Exception as defer_error:
+        print(f"Critical defer error in adjustmmr: {defer_error}")
+        await RenderErrorHandler.handle_general_error(interaction, defer_error, "MMR adjustment")
+        return
+
+    # Add cloud platform delay before processing
+    if is_cloud_platform():
+        await asyncio.sleep(random.uniform(2.0, 4.0))
+    else:
+        await asyncio.sleep(random.uniform(1.0, 2.0))
+
+    # Determine which MMR to adjust
+    is_global = global_mmr.lower() == "true"
+    mmr_type = "Global" if is_global else "Ranked"
+
+    # Get player data with rate limiting protection
+    player_id = str(player.id)
+
+    try:
+        # Add delay before database operation
+        await asyncio.sleep(random.uniform(0.5, 1.0))
+        player_data = system_coordinator.match_system.players.find_one({"id": player_id})
+    except Exception as db_error:
+        print(f"Database error in adjustmmr: {db_error}")
+        await cloud_safe_followup(interaction, "❌ Database error occurred. Please try again.", ephemeral=True)
+        return
+
+    # Handle player not found
+    if not player_data:
+        # Check for rank record as fallback with rate limiting
+        try:
+            await asyncio.sleep(random.uniform(0.3, 0.7))
+            rank_record = db.get_collection('ranks').find_one({"discord_id": player_id})
+        except Exception as rank_error:
+            print(f"Error checking rank record: {rank_error}")
+            await cloud_safe_followup(interaction, "❌ Error accessing player data. Please try again.", ephemeral=True)
+            return
+
+        if rank_record:
+            # Create player entry with initial values
+            try:
+                await create_new_player_entry_rate_limited(
+                    interaction, player, player_id, rank_record, is_global, amount, mmr_type
+                )
+                return
+            except Exception as create_error:
+                print(f"Error creating new player entry: {create_error}")
+                await cloud_safe_followup(interaction, "❌ Error creating player entry. Please try again.",
+                                          ephemeral=True)
+                return
+        else:
+            await cloud_safe_followup(interaction,
+                                      f"Player {player.mention} not found in the database and has no rank verification. They need to verify their rank first.",
+                                      ephemeral=True
+                                      )
+            return
+
+    # Update existing player with rate limiting protection
+    try:
+        await update_existing_player_mmr_rate_limited(
+            interaction, player, player_id, player_data, is_global, amount, mmr_type
+        )
+    except Exception as update_error:
+        print(f"Error updating existing player: {update_error}")
+        await cloud_safe_followup(interaction, "❌ Error updating player MMR. Please try again.", ephemeral=True)
+
+
+async def is_duplicate_command_for_adjustmmr(interaction, target_player_id):
+    """True if this admin adjusted this player's MMR within the last 5 seconds"""
+    key = ("adjustmmr", "target", interaction.user.id, str(target_player_id))
+    if cooldown_engine.hit(key, 5.0):
+        print(f"DUPLICATE ADJUSTMMR BLOCKED: adjustmmr from {interaction.user.name} for player {target_player_id}")
+        return True
+    return False
+
+
+async def create_new_player_entry_rate_limited(interaction, player, player_id, rank_record, is_global, amount,
+                                               mmr_type):
+    """Create new player entry with rate limiting protection"""
+
+    if is_global:
+        starting_mmr = rank_record.get("global_mmr", 300)
+        new_mmr = starting_mmr + amount
+
+        # Add delay before database insert
+        await asyncio.sleep(random.uniform(0.5, 1.0))
+
+        system_coordinator.match_system.players.insert_one({
+            "id": player_id,
+            "name": player.display_name,
+            "mmr": 600,  # Default ranked MMR
+            "tier": tier_for_mmr(600),
+            "global_mmr": new_mmr,
+            "wins": 0,
+            "global_wins": 0,
+            "losses": 0,
+            "global_losses": 0,
+            "matches": 0,
+            "global_matches": 0,
+            "current_streak": 0,
+            "longest_win_streak": 0,
+            "longest_loss_streak": 0,
+            "global_current_streak": 0,
+            "global_longest_win_streak": 0,
+            "global_longest_loss_streak": 0,
+            "created_at": datetime.datetime.utcnow(),
+            "last_updated": datetime.datetime.utcnow()
+        })
+        system_coordinator.match_system.note_players_written()
+
+        await cloud_safe_followup(interaction,
+                                  f"Created new player entry for {player.mention}. Adjusted {mmr_type} MMR from {starting_mmr} to {new_mmr} ({'+' if amount >= 0 else ''}{amount})."
+                                  )
+    else:
+        # For ranked MMR, use tier-based MMR
+        tier = rank_record.get("tier", "Rank C")
+        starting_mmr = system_coordinator.match_system.TIER_MMR.get(tier, 600)
+        new_mmr = starting_mmr + amount
+
+        # Add delay before database insert
+        await asyncio.sleep(random.uniform(0.5, 1.0))
+
+        system_coordinator.match_system.players.insert_one({
+            "id": player_id,
+            "name": player.display_name,
+            "mmr": new_mmr,
+            "tier": tier_for_mmr(new_mmr),
+            "global_mmr": 300,  # Default global MMR
+            "wins": 0,
+            "global_wins": 0,
+            "losses": 0,
+            "global_losses": 0,
+            "matches": 0,
+            "global_matches": 0,
+            "current_streak": 0,
+            "longest_win_streak": 0,
+            "longest_loss_streak": 0,
+            "global_current_streak": 0,
+            "global_longest_win_streak": 0,
+            "global_longest_loss_streak": 0,
+            "created_at": datetime.datetime.utcnow(),
+            "last_updated": datetime.datetime.utcnow()
+        })
+        system_coordinator.match_system.note_players_written()
+
+        # ENHANCED: Try to update Discord role with ULTRA-SAFE rate limiting protection
+        try:
+            await system_coordinator.match_system.update_discord_role_ultra_safe(
+                interaction, player_id, new_mmr
+            )
+
+            await cloud_safe_followup(interaction,
+                                      f"✅ Created new player entry for {player.mention}. Adjusted {mmr_type} MMR from {starting_mmr} to {new_mmr} ({'+' if amount >= 0 else ''}{amount}). Discord role updated."
+                                      )
+        except Exception as role_error:
+            print(f"Warning: Could not update Discord role for {player.display_name}: {role_error}")
+            await cloud_safe_followup(interaction,
+                                      f"⚠️ Created new player entry for {player.mention}. Adjusted {mmr_type} MMR from {starting_mmr} to {new_mmr} ({'+' if amount >= 0 else ''}{amount}). Role update failed - may need manual update."
+                                      )
+
+
+async def update_existing_player_mmr_rate_limited(interaction, player, player_id, player_data, is_global, amount,
+                                                  mmr_type):
+    """Update existing player MMR with comprehensive rate limiting"""
+
+    # Determine old and new MMR values
+    if is_global:
+        old_mmr = player_data.get("global_mmr", 300)
+        new_mmr = old_mmr + amount
+
+        # Add delay before database update
+        await asyncio.sleep(random.uniform(0.5, 1.0))
+
+        system_coordinator.match_system.players.update_one(
+            {"id": player_id},
+            {"$set": {
+                "global_mmr": new_mmr,
+                "last_updated": datetime.datetime.utcnow()
+            }}
+        )
+        system_coordinator.match_system.note_players_written()
+
+        # Create response embed for global MMR (no role update needed)
+        await send_mmr_adjustment_embed_rate_limited(
+            interaction, player, mmr_type, old_mmr, new_mmr, amount,
+            tier_changed=False, role_updated=False
+        )
+
+    else:
+        old_mmr = player_data.get("mmr", 600)
+        new_mmr = old_mmr + amount
+
+        # Determine rank changes
+        old_tier = get_rank_from_mmr(old_mmr)
+        new_tier = get_rank_from_mmr(new_mmr)
+        tier_changed = old_tier != new_tier
+
+        # Add delay before database update
+        await asyncio.sleep(random.uniform(0.5, 1.0))
+
+        system_coordinator.match_system.players.update_one(
+            {"id": player_id},
+            {"$set": {
+                "mmr": new_mmr,
+                "tier": tier_for_mmr(new_mmr),
+                "last_updated": datetime.datetime.utcnow()
+            }}
+        )
+        system_coordinator.match_system.note_players_written()
+
+        # ENHANCED: Try to update Discord role for ranked MMR changes with ULTRA-SAFE rate limiting protection
+        role_updated = False
+
+        if tier_changed:
+            print(f"🚨 RANK CHANGE DETECTED: {player.display_name} {old_tier} → {new_tier}")
+
+            try:
+                # PRIORITY: Immediate role update for rank changes
+                await system_coordinator.match_system.update_discord_role_ultra_safe(
+                    interaction, player_id, new_mmr
+                )
+                role_updated = True
+                print(f"✅ PRIORITY ROLE UPDATE: {player.display_name} role updated to {new_tier}")
+
+            except Exception as role_error:
+                print(f"❌ Priority role update failed for {player.display_name}: {role_error}")
+        else:
+            # Same rank - still let the reconciler confirm the role
+            try:
+                await system_coordinator.match_system.update_discord_role_ultra_safe(
+                    interaction, player_id, new_mmr
+                )
+                role_updated = True
+
+            except Exception as role_error:
+                print(f"Warning: Normal role update failed for {player.display_name}: {role_error}")
+
+        # Send response with comprehensive information
+        await send_mmr_adjustment_embed_rate_limited(
+            interaction, player, mmr_type, old_mmr, new_mmr, amount,
+            tier_changed, role_updated, old_tier, new_tier
+        )
+
+
+async def send_mmr_adjustment_embed_rate_limited(interaction, player, mmr_type, old_mmr, new_mmr, amount,
+                                                 tier_changed=False, role_updated=False, old_tier=None, new_tier=None):
+    """Send MMR adjustment embed with rate limiting protection"""
+
+    try:
+        # Add delay before sending embed
+        await asyncio.sleep(random.uniform(0.3, 0.7))
+
+        # Create embed response
+        embed = discord.Embed(
+            title=f"MMR Adjustment for {player.display_name}",
+            color=0x00ff00 if amount >= 0 else 0xff0000
+        )
+
+        embed.add_field(
+            name=f"{mmr_type} MMR Adjustment",
+            value=f"**Old MMR:** {old_mmr}\n**New MMR:** {new_mmr}\n**Change:** {'+' if amount >= 0 else ''}{amount}",
+            inline=False
+        )
+
+        # Add tier information if it's ranked MMR
+        if not mmr_type.startswith("Global"):
+            if tier_changed and old_tier and new_tier:
+                embed.add_field(
+                    name="🎯 Rank Change",
+                    value=f"**Old Tier:** {old_tier}\n**New Tier:** {new_tier}\n**Promotion/Demotion:** {'✅ Yes' if tier_changed else 'No'}",
+                    inline=False
+                )
+
+                if role_updated:
+                    embed.add_field(
+                        name="🔄 Discord Role",
+                        value="✅ Discord role updated successfully",
+                        inline=False
+                    )
+                else:
+                    embed.add_field(
+                        name="⚠️ Discord Role",
+                        value="❌ Role update failed - may need manual update",
+                        inline=False
+                    )
+            else:
+                # Same tier
+                embed.add_field(
+                    name="Rank Tier",
+                    value=f"**Tier:** {new_tier or get_rank_from_mmr(new_mmr)} (unchanged)",
+                    inline=False
+                )
+
+                if role_updated:
+                    embed.add_field(
+                        name="Discord Role",
+                        value="✅ Role information updated",
+                        inline=False
+                    )
+
+        embed.set_footer(
+            text=f"Adjusted by {interaction.user.display_name} | {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+
+        # Use cloud-safe followup with additional rate limiting
+        await cloud_safe_followup(interaction, embed=embed)
+
+    except Exception as embed_error:
+        print(f"Error sending MMR adjustment embed: {embed_error}")
+        # Fallback to simple text message
+        try:
+            await cloud_safe_followup(interaction,
+                                      f"✅ MMR adjustment completed for {player.mention}: {old_mmr} → {new_mmr} ({'+' if amount >= 0 else ''}{amount})"
+                                      )
+        except:
+            pass  # If even the fallback fails, we've already updated the database
+
+@app_commands.command(name="resetstreak", description="Reset a player's streak (Admin only)")
+@app_commands.describe(
+            member="The member whose streak to reset",
+            reset_type="Type of streak to reset"
+        )
+@app_commands.choices(reset_type=[
+            app_commands.Choice(name="Current Streak Only", value="current"),
+            app_commands.Choice(name="All Streak Records", value="all")
+        ])
+async def resetstreak_slash(interaction: discord.Interaction, member: discord.Member, reset_type: str):
+            # Check if command is used in an allowed channel
+            if not is_command_channel(interaction.channel):
+                await interaction.response.send_message(
+                    f"{interaction.user.mention}, this command can only be used in the rank-a, rank-b, rank-c, global, or sixgents channels.",
+                    ephemeral=True
+                )
+                return
+
+            # Check if user has admin permissions
+            if not has_admin_or_mod_permissions(interaction.user, interaction.guild):
+                await interaction.response.send_message(
+                    "You need administrator permissions or the 6mod role to use this command.",
+                    ephemeral=True)
+                return
+
+            player_id = str(member.id)
+            player_data = system_coordinator.match_system.players.find_one({"id": player_id})
+
+            if not player_data:
+                await interaction.response.send_message(
+                    f"{member.mention} hasn't played any matches. No streak information to reset.",
+                    ephemeral=True
+                )
+                return
+
+            # Get current streak values
+            current_streak = player_data.get("current_streak", 0)
+
+            # Create update document based on reset type
+            if reset_type == "current":
+                update_doc = {
+                    "$set": {
+                        "current_streak": 0
+                    }
+                }
+                success_message = f"Reset current streak for {member.mention}. Previous streak: "
+                if current_streak > 0:
+                    success_message += f"**{current_streak}** Win Streak"
+                elif current_streak < 0:
+                    success_message += f"**{abs(current_streak)}** Loss Streak"
+                else:
+                    success_message += "No streak"
+            else:  # "all"
+                update_doc = {
+                    "$set": {
+                        "current_streak": 0,
+                        "longest_win_streak": 0,
+                        "longest_loss_streak": 0
+                    }
+                }
+                success_message = f"Reset all streak records for {member.mention}."
+
+            # Update player record
+            result = system_coordinator.match_system.players.update_one(
+                {"id": player_id},
+                update_doc
+            )
+
+            if result.modified_count > 0:
+                system_coordinator.match_system.note_players_written()
+                await interaction.response.send_message(success_message)
+            else:
+                await interaction.response.send_message(
+                    f"Failed to reset streak for {member.mention}. No changes were made.")
+
+
+# Slash commands registered by this extension
+@app_commands.command(name="reloadext", description="Reload a command module without restarting the bot (Admin only)")
+@app_commands.describe(extension="Which command module to reload")
+@app_commands.choices(extension=[
+    app_commands.Choice(name=name.split(".")[-1].title(), value=name) for name in bot_core.ALL_EXTENSIONS
+])
+async def reloadext_slash(interaction: discord.Interaction, extension: str):
+    if not has_admin_or_mod_permissions(interaction.user, interaction.guild):
+        await interaction.response.send_message("Admin only", ephemeral=True)
+        return
+
+    await interaction.response.defer(ephemeral=True)
+
+    bot = interaction.client
+    started = time.perf_counter()
+    try:
+        if extension in bot.extensions:
+            await bot.reload_extension(extension)
+            action = "Reloaded"
+        else:
+            await bot_core.ensure_extension_loaded(bot, extension)
+            action = "Loaded"
+    except Exception as e:
+        await interaction.followup.send(f"❌ Error reloading `{extension}`: {e}", ephemeral=True)
+        return
+
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    embed = discord.Embed(
+        title="📦 Extension Reload",
+        description=f"{action} `{extension}` in **{elapsed_ms:.0f}ms**",
+        color=0x00ff00
+    )
+    embed.add_field(
+        name="Loaded Modules",
+        value=", ".join(f"`{name}`" for name in sorted(bot.extensions)) or "None",
+        inline=False
+    )
+    if bot_core.STARTUP_TIMINGS:
+        embed.add_field(
+            name="⏱️ Startup Timings",
+            value="\n".join(f"{stage}: {seconds:.2f}s" for stage, seconds in bot_core.STARTUP_TIMINGS.items()),
+            inline=False
+        )
+    embed.set_footer(text="Changed command names or options still need /synccommands")
+
+    await interaction.followup.send(embed=embed, ephemeral=True)
+
+
+COMMANDS = [
+    checkpending_slash,
+    forceprocess_slash,
+    synccommands_slash,
+    adjustmmr_slash_rate_limited,
+    resetstreak_slash,
+    reloadext_slash,
+]
+
+
+async def setup(bot):
+    add_extension_commands(bot, COMMANDS)
+
+
+async def teardown(bot):
+    remove_extension_commands(bot, COMMANDS)
@@ -0,0 +1,2794 @@
+"""
+Match commands - reporting results, the match manager (MMR verification, recovery, winner changes, removal) and active match tools
+"""
+import discord
+from discord import app_commands
+import datetime
+from render_config import is_cloud_platform
+from tiers import tier_for_mmr
+import bot_core
+from bot_core import (
+    add_extension_commands,
+    bot,
+    has_admin_or_mod_permissions,
+    is_command_channel,
+    remove_extension_commands,
+    report_pipeline,
+    safe_fetch_member,
+    SimpleContext,
+    system_coordinator
+)
+
+
+@app_commands.command(name="report", description="Report match results")
+@app_commands.describe(
+    match_id="The ID of the match you want to report",
+    result="Your match result (win or loss)"
+)
+@app_commands.choices(result=[
+    app_commands.Choice(name="Win", value="win"),
+    app_commands.Choice(name="Loss", value="loss")
+])
+async def report_slash_cloud_enhanced(interaction: discord.Interaction, match_id: str, result: str):
+    if bot_core.RESET_IN_PROGRESS:
+        duration = ""
+        if bot_core.RESET_START_TIME:
+            elapsed = datetime.datetime.now() - bot_core.RESET_START_TIME
+            duration = f" (Running for {elapsed.seconds // 60}m {elapsed.seconds % 60}s)"
+
+        embed = discord.Embed(
+            title="⛔ Match Reporting Disabled",
+            description=f"A leaderboard reset is currently in progress{duration}",
+            color=0xff9900
+        )
+        embed.add_field(
+            name="Please Wait",
+            value="• Reset operations are running\n• Match reporting will be re-enabled automatically\n• Your match results will be preserved",
+            inline=False
+        )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+        return
+
+    # Create context for backward compatibility
+    ctx = SimpleContext(interaction)
+
+    # Normalize the match ID
+    match_id = match_id.strip()
+    if len(match_id) > 8:
+        match_id = match_id[:6]
+
+    # Check if command is used in an allowed channel
+    if not is_command_channel(interaction.channel):
+        await interaction.response.send_message(
+            f"{interaction.user.mention}, this command can only be used in the rank-a, rank-b, rank-c, global, or sixgents channels.",
+            ephemeral=True
+        )
+        return
+
+    reporter_id = str(interaction.user.id)
+
+    # Validate result argument
+    if result.lower() not in ["win", "loss"]:
+        await interaction.response.send_message("Invalid result. Please use 'win' or 'loss'.", ephemeral=True)
+        return
+
+    # Check if the match was created in this specific channel
+    current_channel_id = str(interaction.channel.id)
+
+    # Find the match first to check which channel it belongs to
+    match = None
+
+    # Check active matches first
+    if system_coordinator.queue_manager:
+        match = system_coordinator.queue_manager.get_match_by_id(match_id)
+
+    # If not in active matches, check completed matches in database
+    if not match:
+        match = system_coordinator.match_system.matches.find_one({"match_id": match_id})
+
+    if not match:
+        await interaction.response.send_message(f"No match found with ID `{match_id}`.", ephemeral=True)
+        return
+
+    # Check if the match belongs to this channel
+    match_channel_id = str(match.get('channel_id', ''))
+    if match_channel_id != current_channel_id:
+        try:
+            correct_channel = bot.get_channel(int(match_channel_id))
+            if correct_channel:
+                await interaction.response.send_message(
+                    f"❌ This match was created in {correct_channel.mention}. Please report it there instead.",
+                    ephemeral=True
+                )
+            else:
+                await interaction.response.send_message(
+                    f"❌ This match was not created in this channel. Please report it in the correct channel.",
+                    ephemeral=True
+                )
+        except:
+            await interaction.response.send_message(
+                f"❌ This match was not created in this channel. Please report it in the correct channel.",
+                ephemeral=True
+            )
+        return
+
+    # Claim the match (one atomic status update) - the MMR work happens on the report pipeline
+    claimed_match_id, error = system_coordinator.match_system.claim_match_report(match_id, reporter_id, result)
+    if error:
+        print(f"❌ Match report error: {error}")
+        await interaction.response.send_message(f"Error: {error}", ephemeral=True)
+        return
+
+    print(f"🔄 Match {claimed_match_id} reported by {interaction.user.display_name} - queued for rating")
+
+    embed = discord.Embed(
+        title="📝 Match Reported",
+        description=f"{interaction.user.mention} reported a **{result.lower()}** for match `{claimed_match_id}`.\n"
+                    f"Updating MMR - the results will appear here in a moment.",
+        color=0x3498db
+    )
+    try:
+        await interaction.response.send_message(embed=embed)
+    except discord.HTTPException as e:
+        # The report is already claimed, so the result still gets posted to the channel
+        print(f"⚠️ Could not acknowledge report for {claimed_match_id}: {e}")
+
+    await report_pipeline.submit(claimed_match_id, report_pipeline.team_player_ids(match),
+                                 interaction=interaction, ctx=ctx)
+
+
+async def show_report_result(job, match_result, error):
+    """Report pipeline result handler - edits the /report reply (or posts in the match channel)"""
+    if error:
+        embed = discord.Embed(title="⚠️ MMR Update Delayed", description=error, color=0xff9900)
+        embed.add_field(name="Match ID", value=f"`{job.match_id}`", inline=False)
+    else:
+        guild = job.interaction.guild if job.interaction else None
+        if job.interaction:
+            reporter_name = job.interaction.user.display_name
+        else:
+            reporter_name = next((player.get("name", "Unknown") for player in match_result["team1"] + match_result["team2"]
+                                  if str(player.get("id")) == str(match_result.get("reported_by"))), "Unknown")
+        embed = await build_report_embed(match_result, guild, reporter_name)
+
+    if job.interaction:
+        try:
+            await job.interaction.edit_original_response(embed=embed)
+            print(f"✅ Match report completed successfully for {job.match_id}")
+            return
+        except discord.HTTPException as e:
+            # Interaction tokens expire after 15 minutes - fall back to a channel message
+            print(f"⚠️ Could not edit report reply for {job.match_id}: {e}")
+
+    channel = None
+    if job.interaction:
+        channel = job.interaction.channel
+    elif match_result and match_result.get("channel_id"):
+        channel = bot.get_channel(int(match_result["channel_id"]))
+    if channel:
+        await channel.send(embed=embed)
+
+
+async def build_report_embed(match_result, guild, reporter_name):
+    """Results embed for a rated match: every player's MMR change and streak"""
+    match_id = match_result["match_id"]
+
+    # Determine winning team
+    winner = match_result["winner"]
+    is_global = match_result.get("is_global", False)
+    mmr_type = "Global" if is_global else "Ranked"
+
+    if winner == 1:
+        winning_team = match_result["team1"]
+        losing_team = match_result["team2"]
+    else:
+        winning_team = match_result["team2"]
+        losing_team = match_result["team1"]
+
+    print(f"Processing match report display for match {match_id}")
+    print(f"Match type: {mmr_type}")
+    print(f"MMR changes available: {len(match_result.get('mmr_changes', []))}")
+
+    # Extract MMR changes and streaks from match result properly
+    mmr_changes_by_player = {}
+    for change in match_result.get("mmr_changes", []):
+        player_id = change.get("player_id")
+        if player_id:
+            mmr_changes_by_player[player_id] = {
+                "mmr_change": change.get("mmr_change", 0),
+                "streak": change.get("streak", 0),
+                "is_win": change.get("is_win", False),
+                "is_global": change.get("is_global", False),
+                "old_mmr": change.get("old_mmr", 0),
+                "new_mmr": change.get("new_mmr", 0)
+            }
+
+    # Initialize arrays for MMR changes and streaks
+    winning_team_mmr_changes = []
+    losing_team_mmr_changes = []
+    winning_team_streaks = []
+    losing_team_streaks = []
+
+    # Debug: Print all MMR changes and player data
+    print(f"\n=== DEBUG MMR CHANGES FOR MATCH {match_id} ===")
+    print(f"Match is global: {is_global}")
+    print(f"Total MMR changes found: {len(match_result.get('mmr_changes', []))}")
+
+    for i, change in enumerate(match_result.get('mmr_changes', [])):
+        player_id = change.get("player_id")
+        mmr_change = change.get("mmr_change", 0)
+        change_is_global = change.get("is_global", False)
+        streak = change.get("streak", 0)
+        print(
+            f"  Change {i + 1}: Player {player_id}, MMR: {mmr_change:+d}, Global: {change_is_global}, Streak: {streak}")
+
+    print(f"\nProcessing teams:")
+    print(f"Winning team: {[p.get('name', 'Unknown') + ' (' + p.get('id', 'no-id') + ')' for p in winning_team]}")
+    print(f"Losing team: {[p.get('name', 'Unknown') + ' (' + p.get('id', 'no-id') + ')' for p in losing_team]}")
+
+    print(f"\nMMR changes by player:")
+    for player_id, change_data in mmr_changes_by_player.items():
+        print(f"  Player {player_id}: {change_data}")
+
+    print("=== END DEBUG ===\n")
+
+    # Extract MMR changes for winning team with proper global/ranked filtering
+    for player in winning_team:
+        player_id = player.get("id")
+
+        # Add this debug line right here:
+        print(f"Processing winner {player.get('name', 'Unknown')} (ID: {player_id})")
+
+        if player_id and player_id in mmr_changes_by_player:
+            change_data = mmr_changes_by_player[player_id]
+
+            # Only show MMR changes that match the current match type
+            change_is_global = change_data.get("is_global", False)
+            if change_is_global == is_global:
+                mmr_change = change_data["mmr_change"]
+                streak = change_data["streak"]
+
+                winning_team_mmr_changes.append(f"+{mmr_change} MMR")
+
+                # Format streak display with emojis
+                if streak >= 3:
+                    winning_team_streaks.append(f"🔥 {streak}W")
+                elif streak == 2:
+                    winning_team_streaks.append(f"↗️ {streak}W")
+                elif streak == 1:
+                    winning_team_streaks.append(f"↗️ {streak}W")
+                else:
+                    winning_team_streaks.append("—")
+            else:
+                winning_team_mmr_changes.append("—")
+                winning_team_streaks.append("—")
+        elif player_id and player_id.startswith('9000'):  # Dummy player
+            winning_team_mmr_changes.append("+0 MMR")
+            winning_team_streaks.append("—")
+        else:
+            winning_team_mmr_changes.append("—")
+            winning_team_streaks.append("—")
+
+    # Extract MMR changes for losing team with proper global/ranked filtering
+    for player in losing_team:
+        player_id = player.get("id")
+
+        if player_id and player_id in mmr_changes_by_player:
+            change_data = mmr_changes_by_player[player_id]
+
+            # Only show MMR changes that match the current match type
+            change_is_global = change_data.get("is_global", False)
+            if change_is_global == is_global:
+                mmr_change = change_data["mmr_change"]
+                streak = change_data["streak"]
+
+                losing_team_mmr_changes.append(f"{mmr_change} MMR")  # Already negative
+
+                # Format streak display for losses
+                if streak <= -3:
+                    losing_team_streaks.append(f"❄️ {abs(streak)}L")
+                elif streak == -2:
+                    losing_team_streaks.append(f"↘️ {abs(streak)}L")
+                elif streak == -1:
+                    losing_team_streaks.append(f"↘️ {abs(streak)}L")
+                else:
+                    losing_team_streaks.append("—")
+            else:
+                losing_team_mmr_changes.append("—")
+                losing_team_streaks.append("—")
+        elif player_id and player_id.startswith('9000'):  # Dummy player
+            losing_team_mmr_changes.append("-0 MMR")
+            losing_team_streaks.append("—")
+        else:
+            losing_team_mmr_changes.append("—")
+            losing_team_streaks.append("—")
+
+    # Create the embed with enhanced formatting
+    embed = discord.Embed(
+        title=f"{mmr_type} Match Results",
+        description=f"Match completed",
+        color=0x00ff00  # Green color
+    )
+
+    # Match ID and type field
+    embed.add_field(
+        name="Match Info",
+        value=f"**Match ID:** `{match_id}`\n**Type:** {mmr_type} Match",
+        inline=False
+    )
+
+    # Add Winners header
+    embed.add_field(name="🏆 Winners", value="\u200b", inline=False)
+
+    # Create individual fields for each winning player with SAFE member fetching
+    for i, player in enumerate(winning_team):
+        try:
+            # CLOUD-SAFE member fetching with fallback to stored name
+            if is_cloud_platform():
+                # On cloud platforms, skip member fetching to avoid rate limits
+                name = player.get('name', 'Unknown')
+            else:
+                # Only fetch members locally
+                member = await safe_fetch_member(guild, player.get("id", 0))
+                name = member.display_name if member else player.get('name', 'Unknown')
+        except:
+            name = player.get("name", "Unknown")
+
+        # Enhanced display with simplified MMR format
+        mmr_display = winning_team_mmr_changes[i] if i < len(winning_team_mmr_changes) else "—"
+        streak_display = winning_team_streaks[i] if i < len(winning_team_streaks) else "—"
+
+        embed.add_field(
+            name=f"**{name}**",
+            value=f"{mmr_display}\n{streak_display}",
+            inline=True
+        )
+
+    # Spacer field if needed for proper alignment (for 3-column layout)
+    if len(winning_team) % 3 == 1:
+        embed.add_field(name="\u200b", value="\u200b", inline=True)
+        embed.add_field(name="\u200b", value="\u200b", inline=True)
+    elif len(winning_team) % 3 == 2:
+        embed.add_field(name="\u200b", value="\u200b", inline=True)
+
+    # Add Losers header
+    embed.add_field(name="😔 Losers", value="\u200b", inline=False)
+
+    # Create individual fields for each losing player with SAFE member fetching
+    for i, player in enumerate(losing_team):
+        try:
+            # CLOUD-SAFE member fetching with fallback to stored name
+            if is_cloud_platform():
+                # On cloud platforms, skip member fetching to avoid rate limits
+                name = player.get('name', 'Unknown')
+            else:
+                # Only fetch members locally
+                member = await safe_fetch_member(guild, player.get("id", 0))
+                name = member.display_name if member else player.get('name', 'Unknown')
+        except:
+            name = player.get("name", "Unknown")
+
+        # Enhanced display with simplified MMR format
+        mmr_display = losing_team_mmr_changes[i] if i < len(losing_team_mmr_changes) else "—"
+        streak_display = losing_team_streaks[i] if i < len(losing_team_streaks) else "—"
+
+        embed.add_field(
+            name=f"**{name}**",
+            value=f"{mmr_display}\n{streak_display}",
+            inline=True
+        )
+
+    # Spacer field if needed for proper alignment (for 3-column layout)
+    if len(losing_team) % 3 == 1:
+        embed.add_field(name="\u200b", value="\u200b", inline=True)
+        embed.add_field(name="\u200b", value="\u200b", inline=True)
+    elif len(losing_team) % 3 == 2:
+        embed.add_field(name="\u200b", value="\u200b", inline=True)
+
+    # Enhanced MMR System explanation with streak info
+    embed.add_field(
+        name="📊 MMR & Streak System",
+        value=(
+            f"**{mmr_type} MMR:** Dynamic changes based on team balance and streaks\n"
+            f"**Streaks:** 🔥 3+ wins = bonus MMR | ❄️ 3+ losses = extra penalty\n"
+            f"**Icons:** ↗️ Recent win | ↘️ Recent loss | — No streak"
+        ),
+        inline=False
+    )
+
+    # Footer with reporter info and timestamp
+    embed.set_footer(
+        text=f"Reported by {reporter_name} | {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+    )
+
+    return embed
+
+
+@app_commands.command(name="adminreport", description="Admin command to report match results")
+@app_commands.describe(
+    match_id="Match ID",
+    team_number="The team number that won (1 or 2)",
+    result="Must be 'win'"
+)
+@app_commands.choices(result=[
+    app_commands.Choice(name="Win", value="win"),
+])
+async def adminreport_slash(interaction: discord.Interaction, match_id: str, team_number: int, result: str = "win"):
+    # Check if command is used in an allowed channel
+    if not is_command_channel(interaction.channel):
+        await interaction.response.send_message(
+            f"{interaction.user.mention}, this command can only be used in the rank-a, rank-b, rank-c, global, or sixgents channels.",
+            ephemeral=True
+        )
+        return
+
+    # Check if user has admin permissions
+    if not has_admin_or_mod_permissions(interaction.user, interaction.guild):
+        await interaction.response.send_message(
+            "You need administrator permissions or the 6mod role to use this command.",
+            ephemeral=True)
+        return
+
+    # Validate team number
+    if team_number not in [1, 2]:
+        await interaction.response.send_message("Invalid team number. Please use 1 or 2.", ephemeral=True)
+        return
+
+    # Validate result argument
+    if result.lower() != "win":
+        await interaction.response.send_message("Invalid result. Please use 'win' to indicate the winning team.",
+                                                ephemeral=True)
+        return
+
+    # Claim the match for the chosen team - rated on the report pipeline like any other report
+    claimed_match_id, error = system_coordinator.match_system.claim_match_report(
+        match_id, str(interaction.user.id), result, winner=team_number
+    )
+    if error:
+        await interaction.response.send_message(f"Error: {error}", ephemeral=True)
+        return
+
+    print(f"🔄 Match {claimed_match_id} reported by admin {interaction.user.display_name} - queued for rating")
+
+    embed = discord.Embed(
+        title="📝 Match Reported (Admin)",
+        description=f"{interaction.user.mention} reported **Team {team_number}** as the winner of match "
+                    f"`{claimed_match_id}`.\nUpdating MMR - the results will appear here in a moment.",
+        color=0x3498db
+    )
+    try:
+        await interaction.response.send_message(embed=embed)
+    except discord.HTTPException as e:
+        print(f"⚠️ Could not acknowledge admin report for {claimed_match_id}: {e}")
+
+    match = system_coordinator.match_system.matches.find_one(
+        {"match_id": claimed_match_id}, {"team1.id": 1, "team2.id": 1}
+    )
+    await report_pipeline.submit(claimed_match_id, report_pipeline.team_player_ids(match or {}),
+                                 interaction=interaction, ctx=SimpleContext(interaction))
+
+
+@app_commands.command(name="matchmanager",
+                  description="Enhanced match management - remove, verify MMR, or reselect winner (Admin only)")
+@app_commands.describe(
+    action="Choose an action",
+    match_id="Optional: Specific match ID to work with"
+)
+@app_commands.choices(action=[
+    app_commands.Choice(name="Browse Recent Matches", value="browse"),
+    app_commands.Choice(name="Search by Match ID", value="search")
+])
+async def removematch_enhanced_slash(interaction: discord.Interaction, action: str = "browse", match_id: str = None):
+    # Check if command is used in an allowed channel
+    if not is_command_channel(interaction.channel):
+        await interaction.response.send_message(
+            f"{interaction.user.mention}, this command can only be used in the rank-a, rank-b, rank-c, global, or sixgents channels.",
+            ephemeral=True
+        )
+        return
+
+    # Check if user has admin permissions
+    if not has_admin_or_mod_permissions(interaction.user, interaction.guild):
+        await interaction.response.send_message(
+            "You need administrator permissions or the 6mod role to use this command.",
+            ephemeral=True
+        )
+        return
+
+    if action == "search" and match_id:
+        # Direct search for specific match ID
+        await show_specific_match(interaction, match_id.strip())
+    else:
+        # Show recent matches browser
+        await show_recent_matches_browser(interaction)
+
+
+async def show_recent_matches_browser(interaction: discord.Interaction):
+    """Show a browser of the most recent matches"""
+    try:
+        # Get recent matches from database (last 10 completed matches)
+        recent_matches = list(system_coordinator.match_system.matches.find(
+            {"status": "completed"}
+        ).sort("completed_at", -1).limit(10))
+
+        if not recent_matches:
+            embed = discord.Embed(
+                title="📋 No Recent Matches",
+                description="No completed matches found in the database.",
+                color=0x95a5a6
+            )
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+            return
+
+        # Create embed showing recent matches
+        embed = discord.Embed(
+            title="🔍 Match Management Browser",
+            description=f"Found **{len(recent_matches)}** recent matches. Select one to manage:",
+            color=0x3498db
+        )
+
+        # Create select menu options
+        select_options = []
+
+        for i, match in enumerate(recent_matches):
+            match_id = match.get('match_id', f'unknown_{i}')
+            completed_at = match.get('completed_at')
+            winner = match.get('winner', 0)
+            is_global = match.get('is_global', False)
+
+            # Get team info
+            team1 = match.get('team1', [])
+            team2 = match.get('team2', [])
+
+            # Format time
+            time_str = "Unknown time"
+            if completed_at:
+                time_diff = datetime.datetime.utcnow() - completed_at
+                hours = int(time_diff.total_seconds() // 3600)
+                minutes = int((time_diff.total_seconds() % 3600) // 60)
+
+                if hours < 24:
+                    if hours > 0:
+                        time_str = f"{hours}h {minutes}m ago"
+                    else:
+                        time_str = f"{minutes}m ago"
+                else:
+                    days = hours // 24
+                    time_str = f"{days}d ago"
+
+            # Get winner info
+            winner_info = f"Team {winner}" if winner in [1, 2] else "Unknown"
+
+            # Add to embed
+            embed.add_field(
+                name=f"🏆 Match `{match_id}`",
+                value=(
+                    f"**Type:** {'Global' if is_global else 'Ranked'}\n"
+                    f"**Winner:** {winner_info}\n"
+                    f"**Completed:** {time_str}\n"
+                    f"**Players:** {len(team1 + team2)}"
+                ),
+                inline=True
+            )
+
+            # Add to select options (Discord limit: 25 options)
+            if len(select_options) < 25:
+                select_options.append(
+                    discord.SelectOption(
+                        label=f"Match {match_id}",
+                        description=f"{'Global' if is_global else 'Ranked'} • {winner_info} • {time_str}",
+                        value=match_id,
+                        emoji="🏆"
+                    )
+                )
+
+        # Add search option
+        embed.add_field(
+            name="🔍 Can't Find Your Match?",
+            value="Use the 'Search by Match ID' button below to find any match by its ID",
+            inline=False
+        )
+
+        embed.set_footer(text=f"Match Management • {len(recent_matches)} recent matches")
+        embed.timestamp = datetime.datetime.utcnow()
+
+        # Create the select menu and buttons
+        class MatchBrowserView(discord.ui.View):
+            def __init__(self):
+                super().__init__(timeout=300)
+                if select_options:
+                    self.add_item(MatchSelect(select_options))
+
+            @discord.ui.button(label="🔍 Search by Match ID", style=discord.ButtonStyle.secondary, row=1)
+            async def search_match(self, interaction: discord.Interaction, button: discord.ui.Button):
+                await show_match_search_modal(interaction)
+
+            @discord.ui.button(label="❌ Close", style=discord.ButtonStyle.red, row=1)
+            async def close_browser(self, interaction: discord.Interaction, button: discord.ui.Button):
+                await interaction.response.edit_message(content="Match browser closed.", embed=None, view=None)
+
+        await interaction.response.send_message(embed=embed, view=MatchBrowserView())
+
+    except Exception as e:
+        print(f"Error in show_recent_matches_browser: {e}")
+        await interaction.response.send_message(f"❌ Error loading recent matches: {str(e)}", ephemeral=True)
+
+
+class MatchSelect(discord.ui.Select):
+    def __init__(self, options):
+        super().__init__(
+            placeholder="Choose a match to manage...",
+            min_values=1,
+            max_values=1,
+            options=options
+        )
+
+    async def callback(self, interaction: discord.Interaction):
+        selected_match_id = self.values[0]
+        await show_specific_match(interaction, selected_match_id)
+
+
+async def show_match_search_modal(interaction: discord.Interaction):
+    """Show a modal to search for a match by ID"""
+
+    class MatchSearchModal(discord.ui.Modal, title="Search for Match by ID"):
+        match_id_input = discord.ui.TextInput(
+            label="Match ID",
+            placeholder="Enter the match ID (e.g., abc123)",
+            required=True,
+            max_length=20
+        )
+
+        async def on_submit(self, interaction: discord.Interaction):
+            match_id = self.match_id_input.value.strip()
+            await show_specific_match(interaction, match_id)
+
+    await interaction.response.send_modal(MatchSearchModal())
+
+
+async def show_specific_match(interaction: discord.Interaction, match_id: str):
+    """Show management options for a specific match"""
+    try:
+        # Clean match ID
+        match_id = match_id.strip()
+        if len(match_id) > 8:
+            match_id = match_id[:6]
+
+        # Find the match in database
+        match = system_coordinator.match_system.matches.find_one({"match_id": match_id})
+
+        if not match:
+            embed = discord.Embed(
+                title="❌ Match Not Found",
+                description=f"No match found with ID `{match_id}`",
+                color=0xff0000
+            )
+            embed.add_field(
+                name="💡 Suggestions",
+                value="• Check the match ID spelling\n• Try browsing recent matches\n• Make sure the match was completed",
+                inline=False
+            )
+
+            # Add back button
+            class BackView(discord.ui.View):
+                def __init__(self):
+                    super().__init__(timeout=60)
+
+                @discord.ui.button(label="🔙 Back to Browser", style=discord.ButtonStyle.secondary)
+                async def back_to_browser(self, interaction: discord.Interaction, button: discord.ui.Button):
+                    await show_recent_matches_browser(interaction)
+
+            if hasattr(interaction, 'response') and not interaction.response.is_done():
+                await interaction.response.send_message(embed=embed, view=BackView(), ephemeral=True)
+            else:
+                await interaction.edit_original_response(embed=embed, view=BackView())
+            return
+
+        # Get match details
+        status = match.get('status', 'unknown')
+        winner = match.get('winner', 0)
+        completed_at = match.get('completed_at')
+        is_global = match.get('is_global', False)
+        team1 = match.get('team1', [])
+        team2 = match.get('team2', [])
+        mmr_changes = match.get('mmr_changes', [])
+        reported_by = match.get('reported_by')
+
+        # Create detailed match info embed
+        embed = discord.Embed(
+            title=f"🎮 Match Management: `{match_id}`",
+            description="Choose an action to perform on this match",
+            color=0x3498db
+        )
+
+        # Basic info
+        embed.add_field(
+            name="📊 Match Details",
+            value=(
+                f"**Status:** {status.title()}\n"
+                f"**Type:** {'Global' if is_global else 'Ranked'}\n"
+                f"**Winner:** Team {winner} ({len(team1 if winner == 1 else team2)} players)\n"
+                f"**MMR Changes:** {len(mmr_changes)} recorded"
+            ),
+            inline=True
+        )
+
+        # Time info
+        if completed_at:
+            time_str = f"<t:{int(completed_at.timestamp())}:R>"
+            embed.add_field(
+                name="⏰ Timing",
+                value=f"**Completed:** {time_str}",
+                inline=True
+            )
+
+        # Reporter info
+        if reported_by:
+            try:
+                reporter = await interaction.guild.fetch_member(int(reported_by))
+                reporter_name = reporter.display_name if reporter else f"ID: {reported_by}"
+            except:
+                reporter_name = f"ID: {reported_by}"
+
+            embed.add_field(
+                name="👤 Reported By",
+                value=reporter_name,
+                inline=True
+            )
+
+        # Team compositions
+        if team1:
+            team1_names = [p.get('name', 'Unknown') for p in team1]
+            embed.add_field(
+                name="👥 Team 1" + (" 🏆" if winner == 1 else ""),
+                value="\n".join([f"• {name}" for name in team1_names]),
+                inline=True
+            )
+
+        if team2:
+            team2_names = [p.get('name', 'Unknown') for p in team2]
+            embed.add_field(
+                name="👥 Team 2" + (" 🏆" if winner == 2 else ""),
+                value="\n".join([f"• {name}" for name in team2_names]),
+                inline=True
+            )
+
+        # MMR Summary
+        if mmr_changes:
+            total_positive = sum(1 for change in mmr_changes if change.get('mmr_change', 0) > 0)
+            total_negative = sum(1 for change in mmr_changes if change.get('mmr_change', 0) < 0)
+            embed.add_field(
+                name="💰 MMR Summary",
+                value=f"**Gains:** {total_positive} players\n**Losses:** {total_negative} players",
+                inline=True
+            )
+
+        # Create action buttons
+        class MatchActionView(discord.ui.View):
+            def __init__(self, match_data):
+                super().__init__(timeout=300)
+                self.match_data = match_data
+
+            @discord.ui.button(label="🔍 Verify MMR", style=discord.ButtonStyle.primary)
+            async def verify_mmr(self, interaction: discord.Interaction, button: discord.ui.Button):
+                await show_mmr_verification(interaction, self.match_data)
+
+            @discord.ui.button(label="💉 Recover MMR", style=discord.ButtonStyle.green)
+            async def recover_mmr(self, interaction: discord.Interaction, button: discord.ui.Button):
+                await show_mmr_recovery_confirmation(interaction, self.match_data)
+
+            @discord.ui.button(label="🔄 Reselect Winner", style=discord.ButtonStyle.secondary)
+            async def reselect_winner(self, interaction: discord.Interaction, button: discord.ui.Button):
+                await show_winner_reselection(interaction, self.match_data)
+
+            @discord.ui.button(label="🗑️ Remove Match", style=discord.ButtonStyle.red, row=1)
+            async def remove_match(self, interaction: discord.Interaction, button: discord.ui.Button):
+                await show_removal_confirmation(interaction, self.match_data)
+
+            @discord.ui.button(label="🔙 Back to Browser", style=discord.ButtonStyle.gray, row=1)
+            async def back_to_browser(self, interaction: discord.Interaction, button: discord.ui.Button):
+                await show_recent_matches_browser(interaction)
+
+        if hasattr(interaction, 'response') and not interaction.response.is_done():
+            await interaction.response.send_message(embed=embed, view=MatchActionView(match))
+        else:
+            await interaction.edit_original_response(embed=embed, view=MatchActionView(match))
+
+    except Exception as e:
+        print(f"Error in show_specific_match: {e}")
+        error_embed = discord.Embed(
+            title="❌ Error",
+            description=f"An error occurred while loading match `{match_id}`: {str(e)}",
+            color=0xff0000
+        )
+
+        if hasattr(interaction, 'response') and not interaction.response.is_done():
+            await interaction.response.send_message(embed=error_embed, ephemeral=True)
+        else:
+            await interaction.edit_original_response(embed=error_embed, view=None)
+
+
+async def show_mmr_verification(interaction: discord.Interaction, match_data):
+    """Show detailed MMR verification for the match"""
+    try:
+        match_id = match_data.get('match_id')
+        mmr_changes = match_data.get('mmr_changes', [])
+        team1 = match_data.get('team1', [])
+        team2 = match_data.get('team2', [])
+        winner = match_data.get('winner', 0)
+        is_global = match_data.get('is_global', False)
+
+        embed = discord.Embed(
+            title=f"🔍 MMR Verification: `{match_id}`",
+            description="Detailed MMR change analysis for this match",
+            color=0x3498db
+        )
+
+        # Overall stats
+        total_changes = len(mmr_changes)
+        expected_changes = len([p for p in team1 + team2 if not p.get('id', '').startswith('9000')])
+
+        embed.add_field(
+            name="📊 Overview",
+            value=(
+                f"**Expected Changes:** {expected_changes}\n"
+                f"**Recorded Changes:** {total_changes}\n"
+                f"**Status:** {'✅ Complete' if total_changes == expected_changes else '⚠️ Missing Changes'}"
+            ),
+            inline=False
+        )
+
+        # Detailed player analysis
+        verification_text = ""
+        issues_found = []
+
+        # Check each real player
+        for team_num, team in enumerate([team1, team2], 1):
+            team_won = (team_num == winner)
+            verification_text += f"\n**Team {team_num} ({'Winners' if team_won else 'Losers'}):**\n"
+
+            for player in team:
+                player_id = player.get('id', '')
+                player_name = player.get('name', 'Unknown')
+
+                # Skip dummy players
+                if player_id.startswith('9000'):
+                    verification_text += f"• {player_name} - Dummy player (skipped)\n"
+                    continue
+
+                # Find MMR change for this player
+                player_change = None
+                for change in mmr_changes:
+                    if change.get('player_id') == player_id:
+                        player_change = change
+                        break
+
+                if player_change:
+                    mmr_change = player_change.get('mmr_change', 0)
+                    old_mmr = player_change.get('old_mmr', 0)
+                    new_mmr = player_change.get('new_mmr', 0)
+                    streak = player_change.get('streak', 0)
+                    change_is_global = player_change.get('is_global', False)
+
+                    # Verify match type consistency
+                    if change_is_global != is_global:
+                        issues_found.append(
+                            f"{player_name}: MMR type mismatch (change: {'global' if change_is_global else 'ranked'}, match: {'global' if is_global else 'ranked'})")
+
+                    # Verify win/loss direction
+                    expected_positive = team_won
+                    actual_positive = mmr_change > 0
+                    if expected_positive != actual_positive:
+                        issues_found.append(
+                            f"{player_name}: MMR direction incorrect (expected {'gain' if expected_positive else 'loss'}, got {'gain' if actual_positive else 'loss'})")
+
+                    verification_text += f"• {player_name}: {old_mmr} → {new_mmr} ({mmr_change:+d}) [Streak: {streak}]\n"
+                else:
+                    verification_text += f"• {player_name}: ❌ **NO MMR CHANGE RECORDED**\n"
+                    issues_found.append(f"{player_name}: Missing MMR change record")
+
+        # Add verification details (split if too long)
+        if len(verification_text) > 1024:
+            # Split into chunks
+            chunks = []
+            lines = verification_text.split('\n')
+            current_chunk = ""
+
+            for line in lines:
+                if len(current_chunk + line + '\n') > 1024:
+                    if current_chunk:
+                        chunks.append(current_chunk)
+                    current_chunk = line + '\n'
+                else:
+                    current_chunk += line + '\n'
+
+            if current_chunk:
+                chunks.append(current_chunk)
+
+            for i, chunk in enumerate(chunks):
+                field_name = f"🔍 Player Analysis {i + 1}/{len(chunks)}" if len(chunks) > 1 else "🔍 Player Analysis"
+                embed.add_field(name=field_name, value=chunk, inline=False)
+        else:
+            embed.add_field(name="🔍 Player Analysis", value=verification_text, inline=False)
+
+        # Issues summary
+        if issues_found:
+            issues_text = "\n".join([f"• {issue}" for issue in issues_found])
+            if len(issues_text) > 1024:
+                issues_text = issues_text[:1020] + "..."
+            embed.add_field(name="⚠️ Issues Found", value=issues_text, inline=False)
+            embed.color = 0xff9900  # Orange for issues
+        else:
+            embed.add_field(name="✅ Verification Result", value="No issues found - all MMR changes appear correct",
+                            inline=False)
+            embed.color = 0x00ff00  # Green for success
+
+        # Action buttons
+        class VerificationView(discord.ui.View):
+            def __init__(self, match_data, has_issues):
+                super().__init__(timeout=180)
+                self.match_data = match_data
+                self.has_issues = has_issues
+
+            @discord.ui.button(label="💉 Recover Missing MMR", style=discord.ButtonStyle.green,
+                               disabled=not any("Missing MMR change" in issue for issue in issues_found))
+            async def recover_missing_mmr(self, interaction: discord.Interaction, button: discord.ui.Button):
+                await show_mmr_recovery_confirmation(interaction, self.match_data)
+
+            @discord.ui.button(label="🔙 Back to Match", style=discord.ButtonStyle.secondary)
+            async def back_to_match(self, interaction: discord.Interaction, button: discord.ui.Button):
+                await show_specific_match(interaction, self.match_data.get('match_id'))
+
+        await interaction.response.edit_message(embed=embed, view=VerificationView(match_data, len(issues_found) > 0))
+
+    except Exception as e:
+        print(f"Error in show_mmr_verification: {e}")
+        await interaction.response.send_message(f"❌ Error during MMR verification: {str(e)}", ephemeral=True)
+
+
+async def show_mmr_recovery_confirmation(interaction: discord.Interaction, match_data):
+    """Show confirmation for MMR recovery"""
+    match_id = match_data.get('match_id')
+
+    embed = discord.Embed(
+        title="💉 MMR Recovery Confirmation",
+        description=f"Are you sure you want to recover MMR for match `{match_id}`?",
+        color=0xff9900
+    )
+
+    embed.add_field(
+        name="⚠️ What This Does",
+        value=(
+            "• Recalculates MMR changes for all players\n"
+            "• Applies missing MMR changes to player records\n"
+            "• Updates player statistics (wins/losses)\n"
+            "• Fixes any MMR calculation errors"
+        ),
+        inline=False
+    )
+
+    embed.add_field(
+        name="🔄 Process",
+        value=(
+            "1. Analyze current player MMR states\n"
+            "2. Recalculate what MMR should have been given\n"
+            "3. Apply the difference to current MMR\n"
+            "4. Update match record with correct changes"
+        ),
+        inline=False
+    )
+
+    class RecoveryConfirmView(discord.ui.View):
+        def __init__(self, match_data):
+            super().__init__(timeout=60)
+            self.match_data = match_data
+
+        @discord.ui.button(label="✅ Confirm Recovery", style=discord.ButtonStyle.green)
+        async def confirm_recovery(self, interaction: discord.Interaction, button: discord.ui.Button):
+            await execute_mmr_recovery(interaction, self.match_data)
+
+        @discord.ui.button(label="❌ Cancel", style=discord.ButtonStyle.red)
+        async def cancel_recovery(self, interaction: discord.Interaction, button: discord.ui.Button):
+            await show_specific_match(interaction, self.match_data.get('match_id'))
+
+    await interaction.response.edit_message(embed=embed, view=RecoveryConfirmView(match_data))
+
+
+async def execute_mmr_recovery(interaction: discord.Interaction, match_data):
+    """Execute the MMR recovery process using your existing MMR calculation logic"""
+    try:
+        await interaction.response.defer()
+
+        match_id = match_data.get('match_id')
+        team1 = match_data.get('team1', [])
+        team2 = match_data.get('team2', [])
+        winner = match_data.get('winner', 0)
+        is_global = match_data.get('is_global', False)
+        existing_mmr_changes = match_data.get('mmr_changes', [])
+
+        print(f"Starting MMR recovery for match {match_id}")
+
+        # Step 1: Calculate what MMR changes SHOULD have been
+        print("Step 1: Recalculating expected MMR changes...")
+
+        # Calculate team average MMRs (using your existing logic)
+        team1_mmrs = []
+        team2_mmrs = []
+
+        # Get MMRs for team calculations
+        for player in team1:
+            player_id = player.get("id")
+            if player_id and not player_id.startswith('9000'):
+                player_data = system_coordinator.match_system.players.find_one({"id": player_id})
+                if player_data:
+                    if is_global:
+                        team1_mmrs.append(player_data.get("global_mmr", 300))
+                    else:
+                        team1_mmrs.append(player_data.get("mmr", 600))
+                else:
+                    # For players without records, use defaults
+                    team1_mmrs.append(300 if is_global else 600)
+            elif player_id and player_id.startswith('9000') and "dummy_mmr" in player:
+                team1_mmrs.append(player["dummy_mmr"])
+
+        for player in team2:
+            player_id = player.get("id")
+            if player_id and not player_id.startswith('9000'):
+                player_data = system_coordinator.match_system.players.find_one({"id": player_id})
+                if player_data:
+                    if is_global:
+                        team2_mmrs.append(player_data.get("global_mmr", 300))
+                    else:
+                        team2_mmrs.append(player_data.get("mmr", 600))
+                else:
+                    team2_mmrs.append(300 if is_global else 600)
+            elif player_id and player_id.startswith('9000') and "dummy_mmr" in player:
+                team2_mmrs.append(player["dummy_mmr"])
+
+        team1_avg_mmr = sum(team1_mmrs) / len(team1_mmrs) if team1_mmrs else 0
+        team2_avg_mmr = sum(team2_mmrs) / len(team2_mmrs) if team2_mmrs else 0
+
+        print(f"Team averages: Team1={team1_avg_mmr}, Team2={team2_avg_mmr}")
+
+        # Determine winning and losing teams
+        winning_team = team1 if winner == 1 else team2
+        losing_team = team2 if winner == 1 else team1
+
+        # Step 2: Calculate expected MMR changes for each player
+        expected_changes = {}
+        recovery_summary = []
+
+        # Calculate for winners
+        for player in winning_team:
+            player_id = player.get("id")
+            if not player_id or player_id.startswith('9000'):
+                continue
+
+            player_data = system_coordinator.match_system.players.find_one({"id": player_id})
+            if not player_data:
+                recovery_summary.append(f"⚠️ Player {player.get('name', 'Unknown')} not found in database")
+                continue
+
+            # Get player's pre-match MMR (need to reverse current state)
+            if is_global:
+                current_mmr = player_data.get("global_mmr", 300)
+                current_matches = player_data.get("global_matches", 0)
+                current_streak = player_data.get("global_current_streak", 0)
+            else:
+                current_mmr = player_data.get("mmr", 600)
+                current_matches = player_data.get("matches", 0)
+                current_streak = player_data.get("current_streak", 0)
+
+            # Find existing MMR change for this player
+            existing_change = None
+            for change in existing_mmr_changes:
+                if change.get("player_id") == player_id and change.get("is_global", False) == is_global:
+                    existing_change = change
+                    break
+
+            if existing_change:
+                # Calculate what their MMR was before this match
+                old_mmr = existing_change.get("old_mmr", current_mmr)
+                old_matches = current_matches  # We need to work backwards
+            else:
+                # No existing change found - this is what we need to recover
+                old_mmr = current_mmr
+                old_matches = current_matches
+
+            # Calculate what the MMR gain should have been
+            expected_mmr_gain = system_coordinator.match_system.calculate_dynamic_mmr(
+                old_mmr,
+                team1_avg_mmr if player in team1 else team2_avg_mmr,
+                team2_avg_mmr if player in team1 else team1_avg_mmr,
+                old_matches + 1,  # This would be their match count after the game
+                is_win=True,
+                streak=current_streak if existing_change else 1,  # Use current or assume 1
+                player_data=player_data
+            )
+
+            expected_changes[player_id] = {
+                "player_name": player.get("name", "Unknown"),
+                "old_mmr": old_mmr,
+                "expected_new_mmr": old_mmr + expected_mmr_gain,
+                "expected_change": expected_mmr_gain,
+                "existing_change": existing_change.get("mmr_change", 0) if existing_change else 0,
+                "is_win": True,
+                "is_global": is_global
+            }
+
+        # Calculate for losers
+        for player in losing_team:
+            player_id = player.get("id")
+            if not player_id or player_id.startswith('9000'):
+                continue
+
+            player_data = system_coordinator.match_system.players.find_one({"id": player_id})
+            if not player_data:
+                recovery_summary.append(f"⚠️ Player {player.get('name', 'Unknown')} not found in database")
+                continue
+
+            # Get player's current MMR
+            if is_global:
+                current_mmr = player_data.get("global_mmr", 300)
+                current_matches = player_data.get("global_matches", 0)
+                current_streak = player_data.get("global_current_streak", 0)
+            else:
+                current_mmr = player_data.get("mmr", 600)
+                current_matches = player_data.get("matches", 0)
+                current_streak = player_data.get("current_streak", 0)
+
+            # Find existing MMR change for this player
+            existing_change = None
+            for change in existing_mmr_changes:
+                if change.get("player_id") == player_id and change.get("is_global", False) == is_global:
+                    existing_change = change
+                    break
+
+            if existing_change:
+                old_mmr = existing_change.get("old_mmr", current_mmr)
+                old_matches = current_matches
+            else:
+                old_mmr = current_mmr
+                old_matches = current_matches
+
+            # Calculate what the MMR loss should have been
+            expected_mmr_loss = system_coordinator.match_system.calculate_dynamic_mmr(
+                old_mmr,
+                team1_avg_mmr if player in team1 else team2_avg_mmr,
+                team2_avg_mmr if player in team1 else team1_avg_mmr,
+                old_matches + 1,
+                is_win=False,
+                streak=current_streak if existing_change else -1,
+                player_data=player_data
+            )
+
+            expected_changes[player_id] = {
+                "player_name": player.get("name", "Unknown"),
+                "old_mmr": old_mmr,
+                "expected_new_mmr": max(0, old_mmr - expected_mmr_loss),
+                "expected_change": -expected_mmr_loss,
+                "existing_change": existing_change.get("mmr_change", 0) if existing_change else 0,
+                "is_win": False,
+                "is_global": is_global
+            }
+
+        # Step 3: Apply the differences
+        print("Step 3: Applying MMR corrections...")
+        corrections_applied = 0
+
+        for player_id, change_data in expected_changes.items():
+            expected_change = change_data["expected_change"]
+            existing_change = change_data["existing_change"]
+            difference = expected_change - existing_change
+
+            if abs(difference) < 1:  # No significant difference
+                recovery_summary.append(
+                    f"✅ {change_data['player_name']}: No correction needed (difference: {difference:+.1f})")
+                continue
+
+            # Apply the correction to current MMR
+            player_data = system_coordinator.match_system.players.find_one({"id": player_id})
+            if not player_data:
+                continue
+
+            if is_global:
+                current_mmr = player_data.get("global_mmr", 300)
+                new_mmr = max(0, current_mmr + difference)
+
+                system_coordinator.match_system.players.update_one(
+                    {"id": player_id},
+                    {"$set": {
+                        "global_mmr": new_mmr,
+                        "last_updated": datetime.datetime.utcnow()
+                    }}
+                )
+            else:
+                current_mmr = player_data.get("mmr", 600)
+                new_mmr = max(0, current_mmr + difference)
+
+                system_coordinator.match_system.players.update_one(
+                    {"id": player_id},
+                    {"$set": {
+                        "mmr": new_mmr,
+                        "tier": tier_for_mmr(new_mmr),
+                        "last_updated": datetime.datetime.utcnow()
+                    }}
+                )
+
+            corrections_applied += 1
+            recovery_summary.append(
+                f"🔧 {change_data['player_name']}: {current_mmr} → {new_mmr} (corrected {difference:+.1f} MMR)"
+            )
+
+        # Step 4: Update match record with corrected MMR changes
+        corrected_mmr_changes = []
+        for player_id, change_data in expected_changes.items():
+            corrected_mmr_changes.append({
+                "player_id": player_id,
+                "old_mmr": change_data["old_mmr"],
+                "new_mmr": change_data["expected_new_mmr"],
+                "mmr_change": change_data["expected_change"],
+                "is_win": change_data["is_win"],
+                "is_global": change_data["is_global"],
+                "streak": 1 if change_data["is_win"] else -1  # Simplified for recovery
+            })
+
+        system_coordinator.match_system.matches.update_one(
+            {"match_id": match_id},
+            {"$set": {
+                "mmr_changes": corrected_mmr_changes,
+                "mmr_recovery_applied": True,
+                "mmr_recovery_date": datetime.datetime.utcnow(),
+                "mmr_recovery_by": str(interaction.user.id)
+            }}
+        )
+        system_coordinator.match_system.note_players_written(history_changed=True)
+
+        # Create result embed
+        recovery_embed = discord.Embed(
+            title="💉 MMR Recovery Complete",
+            description=f"MMR recovery has been executed for match `{match_id}`",
+            color=0x00ff00
+        )
+
+        recovery_embed.add_field(
+            name="📊 Recovery Summary",
+            value=(
+                f"**Players Analyzed:** {len(expected_changes)}\n"
+                f"**Corrections Applied:** {corrections_applied}\n"
+                f"**Match Type:** {'Global' if is_global else 'Ranked'}"
+            ),
+            inline=False
+        )
+
+        # Add detailed results
+        if recovery_summary:
+            recovery_text = "\n".join(recovery_summary)
+            if len(recovery_text) > 1024:
+                # Split into chunks
+                chunks = []
+                current_chunk = []
+                current_length = 0
+
+                for line in recovery_summary:
+                    if current_length + len(line) + 1 > 1024:
+                        chunks.append("\n".join(current_chunk))
+                        current_chunk = [line]
+                        current_length = len(line)
+                    else:
+                        current_chunk.append(line)
+                        current_length += len(line) + 1
+
+                if current_chunk:
+                    chunks.append("\n".join(current_chunk))
+
+                for i, chunk in enumerate(chunks):
+                    field_name = f"Recovery Details {i + 1}/{len(chunks)}" if len(chunks) > 1 else "Recovery Details"
+                    recovery_embed.add_field(name=field_name, value=chunk, inline=False)
+            else:
+                recovery_embed.add_field(name="Recovery Details", value=recovery_text, inline=False)
+
+        recovery_embed.add_field(
+            name="✅ Actions Completed",
+            value="• Recalculated expected MMR changes\n• Applied missing/incorrect MMR\n• Updated match records\n• Preserved player statistics",
+            inline=False
+        )
+
+        # Back button
+        class RecoveryResultView(discord.ui.View):
+            def __init__(self, match_data):
+                super().__init__(timeout=60)
+                self.match_data = match_data
+
+            @discord.ui.button(label="🔙 Back to Match", style=discord.ButtonStyle.secondary)
+            async def back_to_match(self, interaction: discord.Interaction, button: discord.ui.Button):
+                await show_specific_match(interaction, self.match_data.get('match_id'))
+
+        await interaction.followup.send(embed=recovery_embed, view=RecoveryResultView(match_data))
+
+    except Exception as e:
+        print(f"Error in execute_mmr_recovery: {e}")
+        await interaction.followup.send(f"❌ Error during MMR recovery: {str(e)}")
+
+
+async def show_winner_reselection(interaction: discord.Interaction, match_data):
+    """Show winner reselection interface"""
+    match_id = match_data.get('match_id')
+    current_winner = match_data.get('winner', 0)
+    team1 = match_data.get('team1', [])
+    team2 = match_data.get('team2', [])
+
+    embed = discord.Embed(
+        title=f"🔄 Reselect Winner: `{match_id}`",
+        description="Choose the correct winning team for this match",
+        color=0x3498db
+    )
+
+    # Show current winner
+    embed.add_field(
+        name="🏆 Current Winner",
+        value=f"Team {current_winner}",
+        inline=False
+    )
+
+    # Show teams
+    if team1:
+        team1_names = [p.get('name', 'Unknown') for p in team1]
+        embed.add_field(
+            name="👥 Team 1" + (" 🏆" if current_winner == 1 else ""),
+            value="\n".join([f"• {name}" for name in team1_names]),
+            inline=True
+        )
+
+    if team2:
+        team2_names = [p.get('name', 'Unknown') for p in team2]
+        embed.add_field(
+            name="👥 Team 2" + (" 🏆" if current_winner == 2 else ""),
+            value="\n".join([f"• {name}" for name in team2_names]),
+            inline=True
+        )
+
+    embed.add_field(
+        name="⚠️ Warning",
+        value="Changing the winner will reverse all MMR changes and recalculate them for the new winner!",
+        inline=False
+    )
+
+    class WinnerSelectionView(discord.ui.View):
+        def __init__(self, match_data):
+            super().__init__(timeout=120)
+            self.match_data = match_data
+
+        @discord.ui.button(label="🏆 Team 1 Wins", style=discord.ButtonStyle.green, disabled=(current_winner == 1))
+        async def select_team1(self, interaction: discord.Interaction, button: discord.ui.Button):
+            await confirm_winner_change(interaction, self.match_data, 1)
+
+        @discord.ui.button(label="🏆 Team 2 Wins", style=discord.ButtonStyle.green, disabled=(current_winner == 2))
+        async def select_team2(self, interaction: discord.Interaction, button: discord.ui.Button):
+            await confirm_winner_change(interaction, self.match_data, 2)
+
+        @discord.ui.button(label="🔙 Back to Match", style=discord.ButtonStyle.secondary)
+        async def back_to_match(self, interaction: discord.Interaction, button: discord.ui.Button):
+            await show_specific_match(interaction, self.match_data.get('match_id'))
+
+    await interaction.response.edit_message(embed=embed, view=WinnerSelectionView(match_data))
+
+
+async def confirm_winner_change(interaction: discord.Interaction, match_data, new_winner):
+    """Confirm the winner change"""
+    match_id = match_data.get('match_id')
+    current_winner = match_data.get('winner', 0)
+
+    embed = discord.Embed(
+        title="🔄 Confirm Winner Change",
+        description=f"Change winner of match `{match_id}` from Team {current_winner} to Team {new_winner}?",
+        color=0xff9900
+    )
+
+    embed.add_field(
+        name="⚠️ This Will",
+        value=(
+            "• Reverse all existing MMR changes\n"
+            "• Recalculate MMR for new winner/loser\n"
+            "• Update win/loss records\n"
+            "• Update match record"
+        ),
+        inline=False
+    )
+
+    class ConfirmWinnerView(discord.ui.View):
+        def __init__(self, match_data, new_winner):
+            super().__init__(timeout=60)
+            self.match_data = match_data
+            self.new_winner = new_winner
+
+        @discord.ui.button(label="✅ Confirm Change", style=discord.ButtonStyle.green)
+        async def confirm_change(self, interaction: discord.Interaction, button: discord.ui.Button):
+            await execute_winner_change(interaction, self.match_data, self.new_winner)
+
+        @discord.ui.button(label="❌ Cancel", style=discord.ButtonStyle.red)
+        async def cancel_change(self, interaction: discord.Interaction, button: discord.ui.Button):
+            await show_winner_reselection(interaction, self.match_data)
+
+    await interaction.response.edit_message(embed=embed, view=ConfirmWinnerView(match_data, new_winner))
+
+
+async def execute_winner_change(interaction: discord.Interaction, match_data, new_winner):
+    """Execute the winner change process with complete MMR recalculation"""
+    try:
+        await interaction.response.defer()
+
+        match_id = match_data.get('match_id')
+        current_winner = match_data.get('winner', 0)
+        team1 = match_data.get('team1', [])
+        team2 = match_data.get('team2', [])
+        is_global = match_data.get('is_global', False)
+        existing_mmr_changes = match_data.get('mmr_changes', [])
+
+        print(f"Changing winner for match {match_id} from team {current_winner} to team {new_winner}")
+
+        # Step 1: Reverse all existing MMR changes
+        print("Step 1: Reversing existing MMR changes...")
+        reversal_summary = []
+
+        for mmr_change in existing_mmr_changes:
+            player_id = mmr_change.get("player_id")
+            if not player_id or player_id.startswith('9000'):
+                continue
+
+            player_data = system_coordinator.match_system.players.find_one({"id": player_id})
+            if not player_data:
+                reversal_summary.append(f"⚠️ Player {player_id} not found in database")
+                continue
+
+            # Get the MMR change details
+            mmr_change_amount = mmr_change.get("mmr_change", 0)
+            was_win = mmr_change.get("is_win", False)
+            was_global = mmr_change.get("is_global", False)
+            streak_at_time = mmr_change.get("streak", 0)
+
+            # Only reverse changes that match the match type
+            if was_global != is_global:
+                continue
+
+            # Get current player stats
+            if is_global:
+                current_mmr = player_data.get("global_mmr", 300)
+                current_wins = player_data.get("global_wins", 0)
+                current_losses = player_data.get("global_losses", 0)
+                current_matches = player_data.get("global_matches", 0)
+                current_streak = player_data.get("global_current_streak", 0)
+            else:
+                current_mmr = player_data.get("mmr", 600)
+                current_wins = player_data.get("wins", 0)
+                current_losses = player_data.get("losses", 0)
+                current_matches = player_data.get("matches", 0)
+                current_streak = player_data.get("current_streak", 0)
+
+            # Reverse the changes
+            new_mmr = current_mmr - mmr_change_amount
+            new_matches = max(0, current_matches - 1)
+
+            if was_win:
+                new_wins = max(0, current_wins - 1)
+                new_losses = current_losses
+            else:
+                new_wins = current_wins
+                new_losses = max(0, current_losses - 1)
+
+            # Reverse streak changes (using your existing logic)
+            if was_win:
+                if streak_at_time > 0:
+                    if streak_at_time == 1:
+                        new_streak = 0
+                    else:
+                        new_streak = streak_at_time - 1
+                else:
+                    new_streak = 0
+            else:
+                if streak_at_time < 0:
+                    if streak_at_time == -1:
+                        new_streak = 0
+                    else:
+                        new_streak = streak_at_time + 1
+                else:
+                    new_streak = 0
+
+            # Apply reversal
+            if is_global:
+                update_doc = {
+                    "$set": {
+                        "global_mmr": max(0, new_mmr),
+                        "global_wins": new_wins,
+                        "global_losses": new_losses,
+                        "global_matches": new_matches,
+                        "global_current_streak": new_streak,
+                        "last_updated": datetime.datetime.utcnow()
+                    }
+                }
+            else:
+                update_doc = {
+                    "$set": {
+                        "mmr": max(0, new_mmr),
+                        "tier": tier_for_mmr(max(0, new_mmr)),
+                        "wins": new_wins,
+                        "losses": new_losses,
+                        "matches": new_matches,
+                        "current_streak": new_streak,
+                        "last_updated": datetime.datetime.utcnow()
+                    }
+                }
+
+            result = system_coordinator.match_system.players.update_one({"id": player_id}, update_doc)
+
+            if result.modified_count > 0:
+                # Find player name
+                player_name = "Unknown"
+                for team in [team1, team2]:
+                    for p in team:
+                        if p.get("id") == player_id:
+                            player_name = p.get("name", "Unknown")
+                            break
+                    if player_name != "Unknown":
+                        break
+
+                reversal_summary.append(f"↩️ {player_name}: Reversed {mmr_change_amount:+d} MMR")
+
+        # Step 2: Recalculate team averages for new MMR calculations
+        print("Step 2: Recalculating team averages...")
+
+        team1_mmrs = []
+        team2_mmrs = []
+
+        # Calculate team averages based on current (post-reversal) MMR
+        for player in team1:
+            player_id = player.get("id")
+            if player_id and not player_id.startswith('9000'):
+                player_data = system_coordinator.match_system.players.find_one({"id": player_id})
+                if player_data:
+                    if is_global:
+                        team1_mmrs.append(player_data.get("global_mmr", 300))
+                    else:
+                        team1_mmrs.append(player_data.get("mmr", 600))
+                else:
+                    team1_mmrs.append(300 if is_global else 600)
+            elif player_id and player_id.startswith('9000') and "dummy_mmr" in player:
+                team1_mmrs.append(player["dummy_mmr"])
+
+        for player in team2:
+            player_id = player.get("id")
+            if player_id and not player_id.startswith('9000'):
+                player_data = system_coordinator.match_system.players.find_one({"id": player_id})
+                if player_data:
+                    if is_global:
+                        team2_mmrs.append(player_data.get("global_mmr", 300))
+                    else:
+                        team2_mmrs.append(player_data.get("mmr", 600))
+                else:
+                    team2_mmrs.append(300 if is_global else 600)
+            elif player_id and player_id.startswith('9000') and "dummy_mmr" in player:
+                team2_mmrs.append(player["dummy_mmr"])
+
+        team1_avg_mmr = sum(team1_mmrs) / len(team1_mmrs) if team1_mmrs else 0
+        team2_avg_mmr = sum(team2_mmrs) / len(team2_mmrs) if team2_mmrs else 0
+
+        # Step 3: Apply new MMR changes with new winner
+        print("Step 3: Applying new MMR changes...")
+
+        new_winning_team = team1 if new_winner == 1 else team2
+        new_losing_team = team2 if new_winner == 1 else team1
+        new_mmr_changes = []
+        application_summary = []
+
+        # Process new winners
+        for player in new_winning_team:
+            player_id = player.get("id")
+            if not player_id or player_id.startswith('9000'):
+                continue
+
+            player_data = system_coordinator.match_system.players.find_one({"id": player_id})
+            if not player_data:
+                continue
+
+            # Get current (post-reversal) stats
+            if is_global:
+                current_mmr = player_data.get("global_mmr", 300)
+                current_matches = player_data.get("global_matches", 0)
+                current_wins = player_data.get("global_wins", 0)
+                current_streak = player_data.get("global_current_streak", 0)
+            else:
+                current_mmr = player_data.get("mmr", 600)
+                current_matches = player_data.get("matches", 0)
+                current_wins = player_data.get("wins", 0)
+                current_streak = player_data.get("current_streak", 0)
+
+            # Calculate new streak
+            new_streak = current_streak + 1 if current_streak >= 0 else 1
+
+            # Calculate MMR gain using your system
+            mmr_gain = system_coordinator.match_system.calculate_dynamic_mmr(
+                current_mmr,
+                team1_avg_mmr if player in team1 else team2_avg_mmr,
+                team2_avg_mmr if player in team1 else team1_avg_mmr,
+                current_matches + 1,
+                is_win=True,
+                streak=new_streak,
+                player_data=player_data
+            )
+
+            new_mmr = current_mmr + mmr_gain
+            new_matches = current_matches + 1
+            new_wins = current_wins + 1
+
+            # Update longest win streak if needed
+            if is_global:
+                longest_win_streak = max(player_data.get("global_longest_win_streak", 0), new_streak)
+                update_doc = {
+                    "$set": {
+                        "global_mmr": new_mmr,
+                        "global_wins": new_wins,
+                        "global_matches": new_matches,
+                        "global_current_streak": new_streak,
+                        "global_longest_win_streak": longest_win_streak,
+                        "last_updated": datetime.datetime.utcnow()
+                    }
+                }
+            else:
+                longest_win_streak = max(player_data.get("longest_win_streak", 0), new_streak)
+                update_doc = {
+                    "$set": {
+                        "mmr": new_mmr,
+                        "tier": tier_for_mmr(new_mmr),
+                        "wins": new_wins,
+                        "matches": new_matches,
+                        "current_streak": new_streak,
+                        "longest_win_streak": longest_win_streak,
+                        "last_updated": datetime.datetime.utcnow()
+                    }
+                }
+
+            system_coordinator.match_system.players.update_one({"id": player_id}, update_doc)
+
+            # Track the change
+            new_mmr_changes.append({
+                "player_id": player_id,
+                "old_mmr": current_mmr,
+                "new_mmr": new_mmr,
+                "mmr_change": mmr_gain,
+                "is_win": True,
+                "is_global": is_global,
+                "streak": new_streak
+            })
+
+            application_summary.append(f"🏆 {player.get('name', 'Unknown')}: +{mmr_gain} MMR (streak: {new_streak})")
+
+        # Process new losers
+        for player in new_losing_team:
+            player_id = player.get("id")
+            if not player_id or player_id.startswith('9000'):
+                continue
+
+            player_data = system_coordinator.match_system.players.find_one({"id": player_id})
+            if not player_data:
+                continue
+
+            # Get current (post-reversal) stats
+            if is_global:
+                current_mmr = player_data.get("global_mmr", 300)
+                current_matches = player_data.get("global_matches", 0)
+                current_losses = player_data.get("global_losses", 0)
+                current_streak = player_data.get("global_current_streak", 0)
+            else:
+                current_mmr = player_data.get("mmr", 600)
+                current_matches = player_data.get("matches", 0)
+                current_losses = player_data.get("losses", 0)
+                current_streak = player_data.get("current_streak", 0)
+
+            # Calculate new streak
+            new_streak = current_streak - 1 if current_streak <= 0 else -1
+
+            # Calculate MMR loss using your system
+            mmr_loss = system_coordinator.match_system.calculate_dynamic_mmr(
+                current_mmr,
+                team1_avg_mmr if player in team1 else team2_avg_mmr,
+                team2_avg_mmr if player in team1 else team1_avg_mmr,
+                current_matches + 1,
+                is_win=False,
+                streak=new_streak,
+                player_data=player_data
+            )
+
+            new_mmr = max(0, current_mmr - mmr_loss)
+            new_matches = current_matches + 1
+            new_losses = current_losses + 1
+
+            # Update longest loss streak if needed
+            if is_global:
+                longest_loss_streak = min(player_data.get("global_longest_loss_streak", 0), new_streak)
+                update_doc = {
+                    "$set": {
+                        "global_mmr": new_mmr,
+                        "global_losses": new_losses,
+                        "global_matches": new_matches,
+                        "global_current_streak": new_streak,
+                        "global_longest_loss_streak": longest_loss_streak,
+                        "last_updated": datetime.datetime.utcnow()
+                    }
+                }
+            else:
+                longest_loss_streak = min(player_data.get("longest_loss_streak", 0), new_streak)
+                update_doc = {
+                    "$set": {
+                        "mmr": new_mmr,
+                        "tier": tier_for_mmr(new_mmr),
+                        "losses": new_losses,
+                        "matches": new_matches,
+                        "current_streak": new_streak,
+                        "longest_loss_streak": longest_loss_streak,
+                        "last_updated": datetime.datetime.utcnow()
+                    }
+                }
+
+            system_coordinator.match_system.players.update_one({"id": player_id}, update_doc)
+
+            # Track the change
+            new_mmr_changes.append({
+                "player_id": player_id,
+                "old_mmr": current_mmr,
+                "new_mmr": new_mmr,
+                "mmr_change": -mmr_loss,
+                "is_win": False,
+                "is_global": is_global,
+                "streak": new_streak
+            })
+
+            application_summary.append(f"😔 {player.get('name', 'Unknown')}: -{mmr_loss} MMR (streak: {new_streak})")
+
+        # Step 4: Update match record
+        print("Step 4: Updating match record...")
+
+        system_coordinator.match_system.matches.update_one(
+            {"match_id": match_id},
+            {"$set": {
+                "winner": new_winner,
+                "score": {"team1": 1 if new_winner == 1 else 0, "team2": 1 if new_winner == 2 else 0},
+                "mmr_changes": new_mmr_changes,
+                "team1_avg_mmr": team1_avg_mmr,
+                "team2_avg_mmr": team2_avg_mmr,
+                "winner_changed": True,
+                "winner_change_date": datetime.datetime.utcnow(),
+                "winner_change_by": str(interaction.user.id),
+                "winner_change_from": current_winner,
+                "winner_change_to": new_winner,
+                "last_modified": datetime.datetime.utcnow()
+            }}
+        )
+        system_coordinator.match_system.note_players_written(history_changed=True)
+
+        # Create result embed
+        result_embed = discord.Embed(
+            title="🔄 Winner Change Complete",
+            description=f"Successfully changed winner of match `{match_id}` from Team {current_winner} to Team {new_winner}",
+            color=0x00ff00
+        )
+
+        result_embed.add_field(
+            name="📊 Process Summary",
+            value=(
+                f"**Reversals Applied:** {len(reversal_summary)}\n"
+                f"**New Changes Applied:** {len(application_summary)}\n"
+                f"**Match Type:** {'Global' if is_global else 'Ranked'}\n"
+                f"**New Winner:** Team {new_winner}"
+            ),
+            inline=False
+        )
+
+        # Add reversal details
+        if reversal_summary:
+            reversal_text = "\n".join(reversal_summary)
+            if len(reversal_text) > 1024:
+                reversal_text = reversal_text[:1020] + "..."
+            result_embed.add_field(name="↩️ MMR Reversals", value=reversal_text, inline=False)
+
+        # Add new changes details
+        if application_summary:
+            application_text = "\n".join(application_summary)
+            if len(application_text) > 1024:
+                application_text = application_text[:1020] + "..."
+            result_embed.add_field(name="✅ New MMR Changes", value=application_text, inline=False)
+
+        result_embed.add_field(
+            name="🎯 Actions Completed",
+            value=(
+                "• Reversed all existing MMR changes\n"
+                f"• Recalculated team averages\n"
+                "• Applied new MMR changes for correct winner\n"
+                "• Updated match record and statistics\n"
+                "• Preserved all streak calculations"
+            ),
+            inline=False
+        )
+
+        result_embed.set_footer(
+            text=f"Winner changed by {interaction.user.display_name} | {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        )
+
+        # Back button
+        class WinnerChangeResultView(discord.ui.View):
+            def __init__(self, match_data):
+                super().__init__(timeout=60)
+                self.match_data = match_data
+
+            @discord.ui.button(label="🔙 Back to Match", style=discord.ButtonStyle.secondary)
+            async def back_to_match(self, interaction: discord.Interaction, button: discord.ui.Button):
+                await show_specific_match(interaction, self.match_data.get('match_id'))
+
+            @discord.ui.button(label="🔙 Back to Browser", style=discord.ButtonStyle.gray)
+            async def back_to_browser(self, interaction: discord.Interaction, button: discord.ui.Button):
+                await show_recent_matches_browser(interaction)
+
+        await interaction.followup.send(embed=result_embed, view=WinnerChangeResultView(match_data))
+
+        # Send notification to affected players
+        try:
+            notification_embed = discord.Embed(
+                title="🔄 Match Winner Changed",
+                description=f"The winner of match `{match_id}` has been corrected by an administrator.",
+                color=0x3498db
+            )
+
+            notification_embed.add_field(
+                name="What Changed",
+                value=(
+                    f"• Winner changed from Team {current_winner} to Team {new_winner}\n"
+                    "• All MMR changes have been recalculated\n"
+                    "• Your statistics have been updated accordingly"
+                ),
+                inline=False
+            )
+
+            notification_embed.add_field(
+                name="Your MMR",
+                value="Check `/rank` to see your updated MMR and statistics",
+                inline=False
+            )
+
+            await interaction.channel.send(embed=notification_embed)
+
+        except Exception as notification_error:
+            print(f"Could not send winner change notification: {notification_error}")
+
+    except Exception as e:
+        print(f"Error in execute_winner_change: {e}")
+        import traceback
+        traceback.print_exc()
+        await interaction.followup.send(f"❌ Error changing winner: {str(e)}")
+
+
+async def show_removal_confirmation(interaction: discord.Interaction, match_data):
+    """Show confirmation for match removal (similar to original removematch)"""
+    match_id = match_data.get('match_id')
+    team1 = match_data.get('team1', [])
+    team2 = match_data.get('team2', [])
+    winner = match_data.get('winner', 0)
+    is_global = match_data.get('is_global', False)
+    mmr_changes = match_data.get('mmr_changes', [])
+
+    embed = discord.Embed(
+        title="🗑️ Confirm Match Removal",
+        description=f"Are you sure you want to **permanently remove** match `{match_id}`?",
+        color=0xff0000
+    )
+
+    # Match summary
+    team1_names = [p.get('name', 'Unknown') for p in team1]
+    team2_names = [p.get('name', 'Unknown') for p in team2]
+
+    embed.add_field(
+        name="📊 Match Summary",
+        value=(
+            f"**Type:** {'Global' if is_global else 'Ranked'}\n"
+            f"**Winner:** Team {winner}\n"
+            f"**Players Affected:** {len(team1 + team2)}\n"
+            f"**MMR Changes:** {len(mmr_changes)}"
+        ),
+        inline=False
+    )
+
+    embed.add_field(
+        name="👥 Teams",
+        value=(
+            f"**Team 1:** {', '.join(team1_names)}\n"
+            f"**Team 2:** {', '.join(team2_names)}"
+        ),
+        inline=False
+    )
+
+    embed.add_field(
+        name="⚠️ This Will",
+        value=(
+            "• **Permanently delete** the match from database\n"
+            "• **Reverse all MMR changes** for all players\n"
+            "• **Update win/loss records** (subtract this match)\n"
+            "• **Reverse streak changes** to pre-match state\n"
+            "• **Cannot be undone** once confirmed"
+        ),
+        inline=False
+    )
+
+    class RemovalConfirmView(discord.ui.View):
+        def __init__(self, match_data):
+            super().__init__(timeout=60)
+            self.match_data = match_data
+
+        @discord.ui.button(label="⚠️ Type CONFIRM to Delete", style=discord.ButtonStyle.red, disabled=True)
+        async def confirm_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+            pass  # This button is just for display
+
+        @discord.ui.button(label="🔑 Enter Confirmation", style=discord.ButtonStyle.gray)
+        async def enter_confirmation(self, interaction: discord.Interaction, button: discord.ui.Button):
+            await show_confirmation_modal(interaction, self.match_data)
+
+        @discord.ui.button(label="❌ Cancel", style=discord.ButtonStyle.secondary)
+        async def cancel_removal(self, interaction: discord.Interaction, button: discord.ui.Button):
+            await show_specific_match(interaction, self.match_data.get('match_id'))
+
+    await interaction.response.edit_message(embed=embed, view=RemovalConfirmView(match_data))
+
+
+async def show_confirmation_modal(interaction: discord.Interaction, match_data):
+    """Show modal for typing CONFIRM"""
+
+    class ConfirmationModal(discord.ui.Modal, title="Confirm Match Removal"):
+        confirmation_input = discord.ui.TextInput(
+            label="Type CONFIRM to proceed",
+            placeholder="CONFIRM",
+            required=True,
+            max_length=10
+        )
+
+        def __init__(self, match_data):
+            super().__init__()
+            self.match_data = match_data
+
+        async def on_submit(self, interaction: discord.Interaction):
+            if self.confirmation_input.value.strip().upper() == "CONFIRM":
+                await execute_match_removal(interaction, self.match_data)
+            else:
+                await interaction.response.send_message(
+                    "❌ Incorrect confirmation. Match removal cancelled.",
+                    ephemeral=True
+                )
+
+    await interaction.response.send_modal(ConfirmationModal(match_data))
+
+
+async def execute_match_removal(interaction: discord.Interaction, match_data):
+    """Execute the match removal process (adapted from original removematch)"""
+    try:
+        await interaction.response.defer()
+
+        match_id = match_data.get('match_id')
+        team1 = match_data.get('team1', [])
+        team2 = match_data.get('team2', [])
+        mmr_changes = match_data.get('mmr_changes', [])
+
+        print(f"Executing removal for match {match_id}")
+
+        # Store original player stats for rollback verification
+        affected_players = []
+        rollback_summary = []
+
+        # Reverse MMR changes for each player (adapted from original logic)
+        for mmr_change in mmr_changes:
+            player_id = mmr_change.get("player_id")
+            if not player_id or player_id.startswith('9000'):
+                continue
+
+            # Get current player data
+            player_data = system_coordinator.match_system.players.find_one({"id": player_id})
+            if not player_data:
+                rollback_summary.append(f"⚠️ Player {player_id} not found in database")
+                continue
+
+            # Get the MMR change details
+            mmr_change_amount = mmr_change.get("mmr_change", 0)
+            was_win = mmr_change.get("is_win", False)
+            was_global = mmr_change.get("is_global", False)
+            streak_at_time = mmr_change.get("streak", 0)
+
+            # Store current stats before changes
+            if was_global:
+                current_mmr = player_data.get("global_mmr", 300)
+                current_wins = player_data.get("global_wins", 0)
+                current_losses = player_data.get("global_losses", 0)
+                current_matches = player_data.get("global_matches", 0)
+                current_streak = player_data.get("global_current_streak", 0)
+            else:
+                current_mmr = player_data.get("mmr", 600)
+                current_wins = player_data.get("wins", 0)
+                current_losses = player_data.get("losses", 0)
+                current_matches = player_data.get("matches", 0)
+                current_streak = player_data.get("current_streak", 0)
+
+            # Calculate new values (reverse the changes)
+            new_mmr = current_mmr - mmr_change_amount  # Subtract the MMR change
+            new_matches = max(0, current_matches - 1)  # Decrease match count
+
+            if was_win:
+                new_wins = max(0, current_wins - 1)
+                new_losses = current_losses
+            else:
+                new_wins = current_wins
+                new_losses = max(0, current_losses - 1)
+
+            # Robust streak reversal (from original logic)
+            streak_after_match = streak_at_time
+
+            if was_win:
+                if streak_after_match > 0:
+                    if streak_after_match == 1:
+                        new_streak = 0
+                    else:
+                        new_streak = streak_after_match - 1
+                else:
+                    new_streak = 0
+            else:
+                if streak_after_match < 0:
+                    if streak_after_match == -1:
+                        new_streak = 0
+                    else:
+                        new_streak = streak_after_match + 1
+                else:
+                    new_streak = 0
+
+            # Prepare update document
+            if was_global:
+                update_doc = {
+                    "$set": {
+                        "global_mmr": max(0, new_mmr),
+                        "global_wins": new_wins,
+                        "global_losses": new_losses,
+                        "global_matches": new_matches,
+                        "global_current_streak": new_streak,
+                        "last_updated": datetime.datetime.utcnow()
+                    }
+                }
+                mmr_type = "Global"
+            else:
+                update_doc = {
+                    "$set": {
+                        "mmr": max(0, new_mmr),
+                        "tier": tier_for_mmr(max(0, new_mmr)),
+                        "wins": new_wins,
+                        "losses": new_losses,
+                        "matches": new_matches,
+                        "current_streak": new_streak,
+                        "last_updated": datetime.datetime.utcnow()
+                    }
+                }
+                mmr_type = "Ranked"
+
+            # Apply the update
+            result = system_coordinator.match_system.players.update_one(
+                {"id": player_id},
+                update_doc
+            )
+
+            if result.modified_count > 0:
+                # Try to get player name from the match data
+                player_name = "Unknown"
+                for team in [team1, team2]:
+                    for p in team:
+                        if p.get("id") == player_id:
+                            player_name = p.get("name", "Unknown")
+                            break
+                    if player_name != "Unknown":
+                        break
+
+                rollback_summary.append(
+                    f"✅ {player_name}: {mmr_type} MMR {current_mmr} → {max(0, new_mmr)} ({mmr_change_amount:+d} reversed), Streak {current_streak} → {new_streak}"
+                )
+                affected_players.append(player_name)
+            else:
+                rollback_summary.append(f"⚠️ Failed to update player {player_id}")
+
+        # Delete the match from the database
+        delete_result = system_coordinator.match_system.matches.delete_one({"match_id": match_id})
+        system_coordinator.match_system.note_players_written(history_changed=True)
+
+        # Create detailed response embed
+        embed = discord.Embed(
+            title="🗑️ Match Removed Successfully",
+            description=f"Match `{match_id}` has been removed and all MMR changes reversed.",
+            color=0xff9900
+        )
+
+        # Add match details
+        team1_names = [p.get("name", "Unknown") for p in team1]
+        team2_names = [p.get("name", "Unknown") for p in team2]
+
+        winner_team = "Team 1" if match_data.get("winner") == 1 else "Team 2"
+        match_type = "Global" if match_data.get("is_global") else "Ranked"
+        completed_at = match_data.get("completed_at")
+
+        embed.add_field(
+            name="Match Details",
+            value=(
+                f"**Type:** {match_type}\n"
+                f"**Winner:** {winner_team}\n"
+                f"**Completed:** {completed_at.strftime('%Y-%m-%d %H:%M') if completed_at else 'Unknown'}"
+            ),
+            inline=False
+        )
+
+        embed.add_field(
+            name="Team 1",
+            value=", ".join(team1_names),
+            inline=True
+        )
+
+        embed.add_field(
+            name="Team 2",
+            value=", ".join(team2_names),
+            inline=True
+        )
+
+        # Add rollback summary
+        if rollback_summary:
+            # Split into chunks if too long
+            rollback_text = "\n".join(rollback_summary)
+            if len(rollback_text) > 1024:
+                # Split into multiple fields
+                chunks = []
+                current_chunk = []
+                current_length = 0
+
+                for line in rollback_summary:
+                    if current_length + len(line) + 1 > 1024:
+                        chunks.append("\n".join(current_chunk))
+                        current_chunk = [line]
+                        current_length = len(line)
+                    else:
+                        current_chunk.append(line)
+                        current_length += len(line) + 1
+
+                if current_chunk:
+                    chunks.append("\n".join(current_chunk))
+
+                for i, chunk in enumerate(chunks):
+                    field_name = f"MMR Changes Reversed {i + 1}/{len(chunks)}" if len(
+                        chunks) > 1 else "MMR Changes Reversed"
+                    embed.add_field(name=field_name, value=chunk, inline=False)
+            else:
+                embed.add_field(name="MMR Changes Reversed", value=rollback_text, inline=False)
+
+        embed.add_field(
+            name="Summary",
+            value=f"**Players Affected:** {len(affected_players)}\n**Database Records:** Match deleted",
+            inline=False
+        )
+
+        embed.set_footer(
+            text=f"Removed by {interaction.user.display_name} | {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        )
+
+        # Final result view
+        class RemovalResultView(discord.ui.View):
+            def __init__(self):
+                super().__init__(timeout=120)
+
+            @discord.ui.button(label="🔙 Back to Browser", style=discord.ButtonStyle.secondary)
+            async def back_to_browser(self, interaction: discord.Interaction, button: discord.ui.Button):
+                await show_recent_matches_browser(interaction)
+
+            @discord.ui.button(label="❌ Close", style=discord.ButtonStyle.red)
+            async def close_menu(self, interaction: discord.Interaction, button: discord.ui.Button):
+                await interaction.response.edit_message(content="Match management session ended.", embed=None,
+                                                        view=None)
+
+        await interaction.followup.send(embed=embed, view=RemovalResultView())
+
+        # Send notification to affected players (if reasonable number)
+        if len(affected_players) <= 10:
+            try:
+                notification_embed = discord.Embed(
+                    title="Match Removed - MMR Restored",
+                    description=f"Match `{match_id}` has been removed by an administrator and your MMR has been restored.",
+                    color=0x00ff00
+                )
+
+                notification_embed.add_field(
+                    name="What This Means",
+                    value="• The match result has been reversed\n• Your MMR has been restored to pre-match values\n• Your win/loss record has been adjusted",
+                    inline=False
+                )
+
+                await interaction.channel.send(embed=notification_embed)
+            except:
+                pass  # Don't let notification errors break the process
+
+    except Exception as e:
+        print(f"Error in execute_match_removal: {e}")
+        import traceback
+        traceback.print_exc()
+        await interaction.followup.send(f"❌ Error removing match: {str(e)}")
+
+
+# Helper function to update help command with new removematch info
+def update_help_command_removematch():
+    """
+    Update the help command description for removematch to reflect new functionality
+    This should be integrated into your existing help command
+    """
+    return {
+        'removematch': 'Interactive match management - browse recent matches, search by ID, verify/recover MMR, reselect winners, or remove matches (Admin/Mod only)'
+    }
+
+
+# Additional helper function for comprehensive MMR verification
+async def perform_detailed_mmr_analysis(match_data):
+    """
+    Perform a comprehensive analysis of MMR changes for verification
+    Returns detailed analysis results
+    """
+    try:
+        match_id = match_data.get('match_id')
+        team1 = match_data.get('team1', [])
+        team2 = match_data.get('team2', [])
+        winner = match_data.get('winner', 0)
+        is_global = match_data.get('is_global', False)
+        existing_mmr_changes = match_data.get('mmr_changes', [])
+
+        analysis_results = {
+            'total_players': len(team1 + team2),
+            'real_players': len([p for p in team1 + team2 if not p.get('id', '').startswith('9000')]),
+            'dummy_players': len([p for p in team1 + team2 if p.get('id', '').startswith('9000')]),
+            'recorded_changes': len(existing_mmr_changes),
+            'issues': [],
+            'player_details': []
+        }
+
+        # Analyze each player
+        for team_num, team in enumerate([team1, team2], 1):
+            team_won = (team_num == winner)
+
+            for player in team:
+                player_id = player.get('id', '')
+                player_name = player.get('name', 'Unknown')
+
+                player_analysis = {
+                    'name': player_name,
+                    'id': player_id,
+                    'team': team_num,
+                    'expected_result': 'win' if team_won else 'loss',
+                    'is_dummy': player_id.startswith('9000'),
+                    'has_mmr_record': False,
+                    'mmr_correct': None,
+                    'issues': []
+                }
+
+                if player_id.startswith('9000'):
+                    player_analysis['status'] = 'Dummy player (no MMR changes expected)'
+                else:
+                    # Find MMR change record for this player
+                    player_change = None
+                    for change in existing_mmr_changes:
+                        if change.get('player_id') == player_id and change.get('is_global', False) == is_global:
+                            player_change = change
+                            break
+
+                    if player_change:
+                        player_analysis['has_mmr_record'] = True
+                        mmr_change = player_change.get('mmr_change', 0)
+                        is_win_in_record = player_change.get('is_win', False)
+
+                        # Check if win/loss direction is correct
+                        if is_win_in_record != team_won:
+                            player_analysis['issues'].append('Win/loss direction incorrect')
+                            analysis_results['issues'].append(
+                                f"{player_name}: Expected {'win' if team_won else 'loss'}, recorded as {'win' if is_win_in_record else 'loss'}")
+
+                        # Check if MMR change direction makes sense
+                        if team_won and mmr_change <= 0:
+                            player_analysis['issues'].append('Winner has negative/zero MMR change')
+                            analysis_results['issues'].append(f"{player_name}: Winner with {mmr_change} MMR change")
+                        elif not team_won and mmr_change >= 0:
+                            player_analysis['issues'].append('Loser has positive/zero MMR change')
+                            analysis_results['issues'].append(f"{player_name}: Loser with {mmr_change} MMR change")
+
+                        # Check match type consistency
+                        change_is_global = player_change.get('is_global', False)
+                        if change_is_global != is_global:
+                            player_analysis['issues'].append('Match type mismatch')
+                            analysis_results['issues'].append(
+                                f"{player_name}: MMR change is {'global' if change_is_global else 'ranked'}, match is {'global' if is_global else 'ranked'}")
+
+                        player_analysis['mmr_change'] = mmr_change
+                        player_analysis['old_mmr'] = player_change.get('old_mmr', 0)
+                        player_analysis['new_mmr'] = player_change.get('new_mmr', 0)
+                        player_analysis['streak'] = player_change.get('streak', 0)
+
+                    else:
+                        player_analysis['has_mmr_record'] = False
+                        player_analysis['issues'].append('No MMR change record found')
+                        analysis_results['issues'].append(f"{player_name}: Missing MMR change record")
+
+                analysis_results['player_details'].append(player_analysis)
+
+        # Overall analysis
+        expected_changes = analysis_results['real_players']
+        actual_changes = analysis_results['recorded_changes']
+
+        if expected_changes != actual_changes:
+            analysis_results['issues'].append(
+                f"MMR record count mismatch: expected {expected_changes}, found {actual_changes}")
+
+        analysis_results['health_score'] = max(0, 100 - (len(analysis_results['issues']) * 10))
+        analysis_results['status'] = 'healthy' if len(analysis_results['issues']) == 0 else 'issues_found'
+
+        return analysis_results
+
+    except Exception as e:
+        print(f"Error in detailed MMR analysis: {e}")
+        return {
+            'status': 'error',
+            'error': str(e),
+            'issues': [f"Analysis failed: {str(e)}"]
+        }
+
+
+# Helper function to format MMR analysis for display
+def format_mmr_analysis_for_embed(analysis_results):
+    """Format the MMR analysis results for Discord embed display"""
+
+    if analysis_results.get('status') == 'error':
+        return [{
+            'name': '❌ Analysis Error',
+            'value': analysis_results.get('error', 'Unknown error occurred'),
+            'inline': False
+        }]
+
+    fields = []
+
+    # Overview field
+    overview_text = (
+        f"**Total Players:** {analysis_results['total_players']}\n"
+        f"**Real Players:** {analysis_results['real_players']}\n"
+        f"**Dummy Players:** {analysis_results['dummy_players']}\n"
+        f"**MMR Records:** {analysis_results['recorded_changes']}\n"
+        f"**Health Score:** {analysis_results['health_score']}/100"
+    )
+    fields.append({
+        'name': '📊 Overview',
+        'value': overview_text,
+        'inline': False
+    })
+
+    # Issues summary
+    if analysis_results['issues']:
+        issues_text = '\n'.join([f"• {issue}" for issue in analysis_results['issues'][:10]])  # Limit to 10 issues
+        if len(analysis_results['issues']) > 10:
+            issues_text += f"\n• ... and {len(analysis_results['issues']) - 10} more issues"
+
+        fields.append({
+            'name': '⚠️ Issues Found',
+            'value': issues_text,
+            'inline': False
+        })
+    else:
+        fields.append({
+            'name': '✅ Status',
+            'value': 'No issues detected - all MMR changes appear correct',
+            'inline': False
+        })
+
+    return fields
+
+
+@app_commands.command(name="activematches", description="Manage active matches in this channel (Admin only)")
+async def activematches_slash(interaction: discord.Interaction):
+    # Check if command is used in an allowed channel
+    if not is_command_channel(interaction.channel):
+        await interaction.response.send_message(
+            f"{interaction.user.mention}, this command can only be used in the rank-a, rank-b, rank-c, global, or sixgents channels.",
+            ephemeral=True
+        )
+        return
+
+    # Check if user has admin permissions
+    if not has_admin_or_mod_permissions(interaction.user, interaction.guild):
+        await interaction.response.send_message(
+            "You need administrator permissions or the 6mod role to use this command.",
+            ephemeral=True)
+        return
+
+    await show_active_matches_list(interaction)
+
+
+async def show_active_matches_list(interaction: discord.Interaction, edit_response: bool = False):
+    """Show the main active matches list"""
+    channel_id = str(interaction.channel.id)
+
+    # Find all active matches in this channel
+    active_matches = []
+    for match_id, match in system_coordinator.queue_manager.active_matches.items():
+        if match.get('channel_id') == channel_id:
+            active_matches.append(match)
+
+    # If no active matches, inform the user
+    if not active_matches:
+        embed = discord.Embed(
+            title="📋 No Active Matches",
+            description="There are no active matches in this channel.",
+            color=0x95a5a6
+        )
+        embed.add_field(
+            name="💡 Info",
+            value="Active matches will appear here when players are in voting, team selection, or playing.",
+            inline=False
+        )
+
+        # Add close button
+        class CloseView(discord.ui.View):
+            def __init__(self):
+                super().__init__(timeout=300)
+
+            @discord.ui.button(label="❌ Close", style=discord.ButtonStyle.red)
+            async def close_menu(self, interaction: discord.Interaction, button: discord.ui.Button):
+                await interaction.response.edit_message(content="Menu closed.", embed=None, view=None)
+
+        if edit_response:
+            await interaction.response.edit_message(embed=embed, view=CloseView())
+        else:
+            await interaction.response.send_message(embed=embed, view=CloseView())
+        return
+
+    # Create embed showing active matches
+    embed = discord.Embed(
+        title="⚔️ Active Matches Management",
+        description=f"Found **{len(active_matches)}** active match(es) in this channel",
+        color=0x3498db
+    )
+
+    # Create select menu options
+    select_options = []
+
+    for i, match in enumerate(active_matches):
+        match_id = match.get('match_id', f'unknown_{i}')
+        status = match.get('status', 'unknown')
+        created_at = match.get('created_at')
+
+        # Get player count
+        player_count = 0
+        team1 = match.get('team1', [])
+        team2 = match.get('team2', [])
+        players = match.get('players', [])
+
+        if team1 and team2:
+            player_count = len(team1) + len(team2)
+        elif players:
+            player_count = len(players)
+
+        # Format time
+        time_str = "Unknown time"
+        if created_at:
+            time_diff = datetime.datetime.utcnow() - created_at
+            minutes = int(time_diff.total_seconds() / 60)
+            if minutes < 60:
+                time_str = f"{minutes}m ago"
+            else:
+                hours = minutes // 60
+                time_str = f"{hours}h {minutes % 60}m ago"
+
+        # Status emoji
+        status_emoji = {
+            'voting': '🗳️',
+            'selection': '👑',
+            'in_progress': '⚔️',
+            'completed': '✅'
+        }.get(status, '❓')
+
+        # Add to embed
+        embed.add_field(
+            name=f"{status_emoji} Match `{match_id}`",
+            value=f"**Status:** {status.title()}\n**Players:** {player_count}\n**Started:** {time_str}",
+            inline=True
+        )
+
+        # Add to select options (Discord limit: 25 options)
+        if len(select_options) < 25:
+            select_options.append(
+                discord.SelectOption(
+                    label=f"Match {match_id}",
+                    description=f"{status.title()} • {player_count} players • {time_str}",
+                    value=match_id,
+                    emoji=status_emoji
+                )
+            )
+
+    # Add instructions
+    embed.add_field(
+        name="🛠️ How to Use",
+        value="Select a match from the dropdown below to manage it.",
+        inline=False
+    )
+
+    embed.set_footer(text=f"Active Matches • {len(active_matches)} total")
+    embed.timestamp = datetime.datetime.utcnow()
+
+    # Create the select menu
+    class ActiveMatchSelect(discord.ui.Select):
+        def __init__(self):
+            super().__init__(
+                placeholder="Choose a match to manage...",
+                min_values=1,
+                max_values=1,
+                options=select_options
+            )
+
+        async def callback(self, interaction: discord.Interaction):
+            selected_match_id = self.values[0]
+
+            # Find the selected match
+            selected_match = None
+            for match_id, match in system_coordinator.queue_manager.active_matches.items():
+                if match_id == selected_match_id:
+                    selected_match = match
+                    break
+
+            if not selected_match:
+                await interaction.response.send_message("❌ Match not found or no longer active.", ephemeral=True)
+                return
+
+            # Show match actions
+            await show_match_actions(interaction, selected_match_id, selected_match)
+
+    # Create the view with the select menu and close button
+    class ActiveMatchView(discord.ui.View):
+        def __init__(self):
+            super().__init__(timeout=300)  # 5 minute timeout
+            self.add_item(ActiveMatchSelect())
+
+        @discord.ui.button(label="❌ Close Menu", style=discord.ButtonStyle.red, row=1)
+        async def close_menu(self, interaction: discord.Interaction, button: discord.ui.Button):
+            await interaction.response.edit_message(content="Menu closed.", embed=None, view=None)
+
+    if edit_response:
+        await interaction.response.edit_message(embed=embed, view=ActiveMatchView())
+    else:
+        await interaction.response.send_message(embed=embed, view=ActiveMatchView())
+
+
+async def show_match_actions(interaction: discord.Interaction, match_id: str, match: dict):
+    """Show action buttons for a selected match"""
+    status = match.get('status', 'unknown')
+
+    # Create action embed
+    embed = discord.Embed(
+        title=f"🎮 Match Management: `{match_id}`",
+        color=0xe74c3c
+    )
+
+    # Add match details
+    team1 = match.get('team1', [])
+    team2 = match.get('team2', [])
+    players = match.get('players', [])
+
+    embed.add_field(name="📊 Status", value=status.title(), inline=True)
+    embed.add_field(name="🆔 Match ID", value=f"`{match_id}`", inline=True)
+    embed.add_field(name="🏁 Type", value="Global" if match.get('is_global') else "Ranked", inline=True)
+
+    # Show players
+    if team1 and team2:
+        team1_names = [p.get('name', 'Unknown') for p in team1]
+        team2_names = [p.get('name', 'Unknown') for p in team2]
+        embed.add_field(name="👥 Team 1", value="\n".join(team1_names) or "None", inline=True)
+        embed.add_field(name="👥 Team 2", value="\n".join(team2_names) or "None", inline=True)
+        embed.add_field(name="\u200b", value="\u200b", inline=True)  # Spacer
+    elif players:
+        player_names = [p.get('name', 'Unknown') for p in players[:6]]  # Show first 6
+        embed.add_field(name="👥 Players", value="\n".join(player_names) or "None", inline=False)
+
+    # Create action buttons
+    class MatchActionView(discord.ui.View):
+        def __init__(self):
+            super().__init__(timeout=300)  # 5 minute timeout
+
+        @discord.ui.button(label="🛑 Stop Match", style=discord.ButtonStyle.red)
+        async def stop_match(self, interaction: discord.Interaction, button: discord.ui.Button):
+            await show_confirmation(interaction, "stop", match_id, match)
+
+        @discord.ui.button(label="🏆 Report Team 1 Win", style=discord.ButtonStyle.green)
+        async def team1_win(self, interaction: discord.Interaction, button: discord.ui.Button):
+            if not team1 or not team2:
+                await interaction.response.send_message("❌ Cannot report - teams not set up properly.", ephemeral=True)
+                return
+            await show_confirmation(interaction, "report_team1", match_id, match)
+
+        @discord.ui.button(label="🏆 Report Team 2 Win", style=discord.ButtonStyle.green)
+        async def team2_win(self, interaction: discord.Interaction, button: discord.ui.Button):
+            if not team1 or not team2:
+                await interaction.response.send_message("❌ Cannot report - teams not set up properly.", ephemeral=True)
+                return
+            await show_confirmation(interaction, "report_team2", match_id, match)
+
+        @discord.ui.button(label="📊 Match Details", style=discord.ButtonStyle.gray)
+        async def match_details(self, interaction: discord.Interaction, button: discord.ui.Button):
+            await show_match_details(interaction, match_id, match)
+
+        @discord.ui.button(label="🔙 Back to List", style=discord.ButtonStyle.secondary, row=1)
+        async def back_to_list(self, interaction: discord.Interaction, button: discord.ui.Button):
+            # Go back to the main list
+            await show_active_matches_list(interaction, edit_response=True)
+
+        @discord.ui.button(label="❌ Close Menu", style=discord.ButtonStyle.red, row=1)
+        async def close_menu(self, interaction: discord.Interaction, button: discord.ui.Button):
+            await interaction.response.edit_message(content="Menu closed.", embed=None, view=None)
+
+    await interaction.response.edit_message(embed=embed, view=MatchActionView())
+
+
+async def show_confirmation(interaction: discord.Interaction, action: str, match_id: str, match: dict):
+    """Show confirmation dialog for destructive actions"""
+    # Create confirmation embed
+    action_names = {
+        "stop": "🛑 Stop this match",
+        "report_team1": "🏆 Report Team 1 as winners",
+        "report_team2": "🏆 Report Team 2 as winners"
+    }
+
+    confirm_embed = discord.Embed(
+        title="⚠️ Confirm Action",
+        description=f"Are you sure you want to: **{action_names.get(action, action)}**?",
+        color=0xff9900
+    )
+    confirm_embed.add_field(name="Match ID", value=f"`{match_id}`", inline=True)
+    confirm_embed.add_field(name="Action", value=action_names.get(action, action), inline=True)
+
+    class ConfirmView(discord.ui.View):
+        def __init__(self):
+            super().__init__(timeout=30)
+
+        @discord.ui.button(label="✅ Confirm", style=discord.ButtonStyle.green)
+        async def confirm(self, interaction: discord.Interaction, button: discord.ui.Button):
+            await execute_action(interaction, action, match_id)
+
+        @discord.ui.button(label="❌ Cancel", style=discord.ButtonStyle.red)
+        async def cancel(self, interaction: discord.Interaction, button: discord.ui.Button):
+            # Go back to the match actions screen
+            await show_match_actions(interaction, match_id, match)
+
+        @discord.ui.button(label="🔙 Back to Actions", style=discord.ButtonStyle.secondary)
+        async def back_to_actions(self, interaction: discord.Interaction, button: discord.ui.Button):
+            # Go back to the match actions screen
+            await show_match_actions(interaction, match_id, match)
+
+    await interaction.response.edit_message(embed=confirm_embed, view=ConfirmView())
+
+
+async def execute_action(interaction: discord.Interaction, action: str, match_id: str):
+    """Execute the confirmed action"""
+    if action == "stop":
+        # Stop the match
+        success = system_coordinator.queue_manager.remove_match(match_id)
+        if success:
+            embed = discord.Embed(
+                title="✅ Match Stopped",
+                description=f"Match `{match_id}` has been stopped and removed.",
+                color=0x00ff00
+            )
+        else:
+            embed = discord.Embed(
+                title="❌ Error",
+                description=f"Failed to stop match `{match_id}`.",
+                color=0xff0000
+            )
+
+    elif action.startswith("report_team"):
+        # Report match result
+        winner = 1 if action == "report_team1" else 2
+
+        try:
+            # Claim it like any other report; the pipeline rates it and posts the results in the match channel
+            claimed_match_id, error = system_coordinator.match_system.claim_match_report(
+                match_id, str(interaction.user.id), "win", winner=winner
+            )
+            if error:
+                raise ValueError(error)
+
+            match = system_coordinator.match_system.matches.find_one(
+                {"match_id": claimed_match_id}, {"team1.id": 1, "team2.id": 1}
+            )
+            await report_pipeline.submit(claimed_match_id, report_pipeline.team_player_ids(match or {}))
+
+            embed = discord.Embed(
+                title="✅ Match Reported",
+                description=f"Match `{claimed_match_id}` has been reported with Team {winner} as winners.",
+                color=0x00ff00
+            )
+            embed.add_field(name="Winner", value=f"Team {winner}", inline=True)
+            embed.add_field(name="MMR", value="Updating - results will be posted in the match channel", inline=True)
+
+        except Exception as e:
+            embed = discord.Embed(
+                title="❌ Error",
+                description=f"Failed to report match `{match_id}`: {str(e)}",
+                color=0xff0000
+            )
+
+    # Add close button to final result
+    class ResultView(discord.ui.View):
+        def __init__(self):
+            super().__init__(timeout=60)
+
+        @discord.ui.button(label="❌ Close", style=discord.ButtonStyle.red)
+        async def close_result(self, interaction: discord.Interaction, button: discord.ui.Button):
+            await interaction.response.edit_message(content="Menu closed.", embed=None, view=None)
+
+    await interaction.response.edit_message(embed=embed, view=ResultView())
+
+
+async def show_match_details(interaction: discord.Interaction, match_id: str, match: dict):
+    """Show detailed match information"""
+    # Create detailed match info
+    detail_embed = discord.Embed(
+        title=f"📊 Match Details: `{match_id}`",
+        color=0x3498db
+    )
+
+    # Basic info
+    detail_embed.add_field(name="Status", value=match.get('status', 'Unknown').title(), inline=True)
+    detail_embed.add_field(name="Type", value="Global" if match.get('is_global') else "Ranked", inline=True)
+    detail_embed.add_field(name="Channel", value=f"<#{match.get('channel_id', 'Unknown')}>", inline=True)
+
+    # Time info
+    created_at = match.get('created_at')
+    if created_at:
+        detail_embed.add_field(name="Created", value=f"<t:{int(created_at.timestamp())}:R>", inline=True)
+
+    # Players
+    team1 = match.get('team1', [])
+    team2 = match.get('team2', [])
+    players = match.get('players', [])
+
+    if team1 and team2:
+        team1_list = "\n".join([f"• {p.get('name', 'Unknown')}" for p in team1])
+        team2_list = "\n".join([f"• {p.get('name', 'Unknown')}" for p in team2])
+        detail_embed.add_field(name="Team 1", value=team1_list or "None", inline=True)
+        detail_embed.add_field(name="Team 2", value=team2_list or "None", inline=True)
+    elif players:
+        player_list = "\n".join([f"• {p.get('name', 'Unknown')}" for p in players])
+        detail_embed.add_field(name="Players", value=player_list or "None", inline=False)
+
+    class BackView(discord.ui.View):
+        def __init__(self):
+            super().__init__(timeout=60)
+
+        @discord.ui.button(label="🔙 Back to Actions", style=discord.ButtonStyle.secondary)
+        async def back(self, interaction: discord.Interaction, button: discord.ui.Button):
+            await show_match_actions(interaction, match_id, match)
+
+        @discord.ui.button(label="❌ Close Menu", style=discord.ButtonStyle.red)
+        async def close_menu(self, interaction: discord.Interaction, button: discord.ui.Button):
+            await interaction.response.edit_message(content="Menu closed.", embed=None, view=None)
+
+    await interaction.response.edit_message(embed=detail_embed, view=BackView())
+
+
+# Slash commands registered by this extension
+COMMANDS = [
+    report_slash_cloud_enhanced,
+    adminreport_slash,
+    removematch_enhanced_slash,
+    activematches_slash,
+]
+
+
+async def setup(bot):
+    report_pipeline.set_result_handler(show_report_result)
+    add_extension_commands(bot, COMMANDS)
+
+
+async def teardown(bot):
+    remove_extension_commands(bot, COMMANDS)
@@ -0,0 +1,286 @@
+"""
+Performance commands - event loop lag, blocking call reports and per-command latency
+"""
+import asyncio
+import discord
+from discord import app_commands
+from bot_core import (
+    add_extension_commands,
+    command_perf,
+    has_admin_or_mod_permissions,
+    loop_monitor,
+    remove_extension_commands,
+    report_pipeline
+)
+from db_instrumentation import query_stats
+from logging_config import set_log_level
+
+perf_group = app_commands.Group(name="perf", description="Bot performance diagnostics (Admin only)")
+
+
+@perf_group.command(name="loop", description="Show event loop lag and the calls that blocked it (Admin only)")
+@app_commands.describe(reset="Clear the collected stats after showing them")
+async def perf_loop_slash(interaction: discord.Interaction, reset: bool = False):
+    if not has_admin_or_mod_permissions(interaction.user, interaction.guild):
+        await interaction.response.send_message("Admin only", ephemeral=True)
+        return
+
+    status = loop_monitor.get_status(limit=10)
+    worst = status["p99_lag_seconds"]
+
+    if not status["running"]:
+        color = 0x808080
+    elif worst >= status["threshold_seconds"]:
+        color = 0xff0000
+    elif worst >= status["threshold_seconds"] / 2:
+        color = 0xffa500
+    else:
+        color = 0x00ff00
+
+    embed = discord.Embed(
+        title="🩺 Event Loop Lag",
+        description=f"Last {status['window_seconds']}s of ticks, stall threshold "
+                    f"{status['threshold_seconds'] * 1000:.0f}ms",
+        color=color
+    )
+    embed.add_field(
+        name="Lag",
+        value=f"Now: {status['current_lag_seconds'] * 1000:.1f}ms\n"
+              f"p50: {status['p50_lag_seconds'] * 1000:.1f}ms\n"
+              f"p99: {status['p99_lag_seconds'] * 1000:.1f}ms\n"
+              f"Max: {status['max_lag_seconds'] * 1000:.0f}ms",
+        inline=True
+    )
+    embed.add_field(name="Stalls", value=str(status["stall_count"]), inline=True)
+
+    if status["top_offenders"]:
+        lines = []
+        for offender in status["top_offenders"]:
+            lines.append(f"`{offender['call']}` ({offender['location']})\n"
+                         f"  {offender['count']}x, {offender['blocked_seconds']:.2f}s blocked, "
+                         f"worst {offender['max_stall_seconds'] * 1000:.0f}ms")
+        value = "\n".join(lines)
+        if len(value) > 1024:
+            value = value[:1020] + "..."
+        embed.add_field(name="🐌 Blocking Calls", value=value, inline=False)
+    else:
+        embed.add_field(name="🐌 Blocking Calls", value="No stalls recorded", inline=False)
+
+    if reset:
+        loop_monitor.reset()
+        embed.set_footer(text="Stats have been reset")
+
+    await interaction.response.send_message(embed=embed, ephemeral=True)
+
+
+@perf_group.command(name="logs", description="Change a module's log level without restarting (Admin only)")
+@app_commands.describe(
+    level="New log level - DEBUG turns on hot-path traces",
+    module="Module logger such as matchsystem or rate_limiter (blank for the whole bot)"
+)
+@app_commands.choices(level=[
+    app_commands.Choice(name=name, value=name) for name in ["DEBUG", "INFO", "WARNING", "ERROR"]
+])
+async def perf_logs_slash(interaction: discord.Interaction, level: str, module: str = ""):
+    if not has_admin_or_mod_permissions(interaction.user, interaction.guild):
+        await interaction.response.send_message("Admin only", ephemeral=True)
+        return
+
+    logger = set_log_level(module.strip(), level)
+    await interaction.response.send_message(f"📝 `{logger.name}` now logs at **{level}**", ephemeral=True)
+
+
+def format_ms(value):
+    return f"{value:.0f}ms" if value is not None else "-"
+
+
+@perf_group.command(name="reports", description="Show the match report pipeline's queue and worker stats (Admin only)")
+async def perf_reports_slash(interaction: discord.Interaction):
+    if not has_admin_or_mod_permissions(interaction.user, interaction.guild):
+        await interaction.response.send_message("Admin only", ephemeral=True)
+        return
+
+    stats = report_pipeline.get_stats()
+    if not stats["running"]:
+        color = 0x808080
+    elif stats["queue_depth"] >= stats["queue_limit"] / 2 or stats["failed"]:
+        color = 0xffa500
+    else:
+        color = 0x00ff00
+
+    def seconds_ms(value):
+        return format_ms(value * 1000 if value is not None else None)
+
+    embed = discord.Embed(
+        title="📝 Match Report Pipeline",
+        description=f"{stats['workers']} workers, queue limit {stats['queue_limit']}",
+        color=color
+    )
+    embed.add_field(
+        name="Queue",
+        value=f"Waiting: {stats['queue_depth']}\n"
+              f"Rating now: {stats['in_flight']}\n"
+              f"Deepest: {stats['max_depth']}\n"
+              f"Waited for room: {stats['backpressure_waits']}",
+        inline=True
+    )
+    embed.add_field(
+        name="Reports",
+        value=f"Submitted: {stats['submitted']}\n"
+              f"Completed: {stats['completed']}\n"
+              f"Failed: {stats['failed']}\n"
+              f"Retried: {stats['retried']}\n"
+              f"Recovered: {stats['recovered']}",
+        inline=True
+    )
+    embed.add_field(
+        name="Latency",
+        value=f"Queue wait p50/p95: {seconds_ms(stats['wait_p50_seconds'])} / "
+              f"{seconds_ms(stats['wait_p95_seconds'])}\n"
+              f"Rating p50/p95: {seconds_ms(stats['process_p50_seconds'])} / "
+              f"{seconds_ms(stats['process_p95_seconds'])}",
+        inline=False
+    )
+    if stats["worker_restarts"]:
+        embed.add_field(name="Worker Restarts", value=str(stats["worker_restarts"]), inline=True)
+    if stats["last_error"]:
+        embed.add_field(name="Last Error", value=stats["last_error"][:1024], inline=False)
+
+    await interaction.response.send_message(embed=embed, ephemeral=True)
+
+
+@app_commands.command(name="perfstats", description="Slash command latency percentiles and breakdowns (Admin only)")
+@app_commands.describe(
+    command="Show details and the saved trend for one command",
+    hours="How far back the trend goes (default 24)"
+)
+async def perfstats_slash(interaction: discord.Interaction, command: str = None, hours: int = 24):
+    if not has_admin_or_mod_permissions(interaction.user, interaction.guild):
+        await interaction.response.send_message("Admin only", ephemeral=True)
+        return
+
+    await interaction.response.defer(ephemeral=True)
+
+    summaries = command_perf.get_summaries()
+
+    if not command:
+        embed = discord.Embed(
+            title="⏱️ Command Latency",
+            description=f"Last {command_perf.window_size} runs per command since startup, slowest p95 first",
+            color=0x3498db
+        )
+
+        if not summaries:
+            embed.add_field(name="No Data", value="No slash commands have run since startup", inline=False)
+
+        for name, summary in list(summaries.items())[:18]:
+            embed.add_field(
+                name=f"/{name} ({summary['count']} runs"
+                     f"{', ' + str(summary['failed']) + ' failed' if summary['failed'] else ''}"
+                     f"{', ' + str(summary['auto_deferred']) + ' auto-deferred' if summary['auto_deferred'] else ''})",
+                value=f"p50 {format_ms(summary['p50_ms'])} · p95 {format_ms(summary['p95_ms'])} · "
+                      f"p99 {format_ms(summary['p99_ms'])}\n"
+                      f"First response p95: {format_ms(summary['first_response_p95_ms'])}\n"
+                      f"Avg DB {format_ms(summary['avg_db_ms'])} · Discord {format_ms(summary['avg_discord_ms'])} · "
+                      f"Sleep {format_ms(summary['avg_sleep_ms'])} · Other {format_ms(summary['avg_other_ms'])}",
+                inline=False
+            )
+
+        top_shapes = query_stats.get_top_shapes(5)
+        if top_shapes:
+            lines = [
+                f"`{row['collection']}.{row['command']}` {row['shape'][:80]}\n"
+                f"  {row['count']}x, avg {row['avg_ms']:.1f}ms, total {row['total_ms'] / 1000:.1f}s"
+                for row in top_shapes
+            ]
+            value = "\n".join(lines)
+            embed.add_field(name="🗄️ Top Queries (by total time)",
+                            value=value[:1020] + "..." if len(value) > 1024 else value, inline=False)
+
+        slow_queries = query_stats.get_slow_queries(3)
+        if slow_queries:
+            lines = [f"{row['duration_ms']:.0f}ms `{row['collection']}.{row['command']}` from {row['caller']}"
+                     for row in slow_queries]
+            value = "\n".join(lines)
+            embed.add_field(name=f"🐢 Recent Slow Queries (≥{query_stats.slow_query_ms:.0f}ms)",
+                            value=value[:1020] + "..." if len(value) > 1024 else value, inline=False)
+
+        embed.set_footer(text="Use /perfstats command:<name> for a histogram and trend")
+        await interaction.followup.send(embed=embed, ephemeral=True)
+        return
+
+    command = command.lstrip("/")
+    summary = summaries.get(command)
+    trend = await asyncio.to_thread(command_perf.get_trend, command, hours)
+
+    if not summary and not trend:
+        await interaction.followup.send(f"No timing data for `/{command}` yet.", ephemeral=True)
+        return
+
+    embed = discord.Embed(title=f"⏱️ /{command} Latency", color=0x3498db)
+
+    if summary:
+        embed.add_field(
+            name=f"Latency ({summary['count']} recent runs)",
+            value=f"p50: {format_ms(summary['p50_ms'])}\n"
+                  f"p95: {format_ms(summary['p95_ms'])}\n"
+                  f"p99: {format_ms(summary['p99_ms'])}\n"
+                  f"Max: {format_ms(summary['max_ms'])}",
+            inline=True
+        )
+        embed.add_field(
+            name="First Response",
+            value=f"p50: {format_ms(summary['first_response_p50_ms'])}\n"
+                  f"p95: {format_ms(summary['first_response_p95_ms'])}\n"
+                  f"Auto-deferred: {summary['auto_deferred']}/{summary['count']}",
+            inline=True
+        )
+        embed.add_field(
+            name="Average Breakdown",
+            value=f"DB: {format_ms(summary['avg_db_ms'])} ({summary['avg_db_calls']} calls)\n"
+                  f"Discord: {format_ms(summary['avg_discord_ms'])} ({summary['avg_discord_calls']} calls)\n"
+                  f"Sleep: {format_ms(summary['avg_sleep_ms'])}\n"
+                  f"Other: {format_ms(summary['avg_other_ms'])}",
+            inline=True
+        )
+
+        histogram = command_perf.get_histogram(command)
+        most = max((count for _, count in histogram), default=0)
+        if most:
+            bars = "\n".join(f"{label:>8} {'█' * max(1, round(count / most * 15)) if count else ''} {count}"
+                             for label, count in histogram)
+            embed.add_field(name="Histogram (since startup)", value=f"```\n{bars}\n```", inline=False)
+
+    if trend:
+        lines = [
+            f"{doc['window_end'].strftime('%m-%d %H:%M')}  n={doc['count']:<4} p50 {format_ms(doc['p50_ms']):>7}  "
+            f"p95 {format_ms(doc['p95_ms']):>7}"
+            for doc in trend[-12:]
+        ]
+        embed.add_field(
+            name=f"Trend (last {hours}h, {len(trend)} saved intervals)",
+            value="```\n" + "\n".join(lines) + "\n```",
+            inline=False
+        )
+
+    await interaction.followup.send(embed=embed, ephemeral=True)
+
+
+@perfstats_slash.autocomplete("command")
+async def perfstats_command_autocomplete(interaction: discord.Interaction, current: str):
+    names = sorted(command_perf.samples)
+    return [app_commands.Choice(name=f"/{name}", value=name) for name in names if current.lower() in name][:25]
+
+
+COMMANDS = [
+    perf_group,
+    perfstats_slash,
+]
+
+
+async def setup(bot):
+    add_extension_commands(bot, COMMANDS)
+
+
+async def teardown(bot):
+    remove_extension_commands(bot, COMMANDS)
@@ -0,0 +1,1285 @@
+"""
+Queue commands - joining and leaving queues, queue status, admin queue tools and substitutions
+"""
+import discord
+from discord import app_commands
+import datetime
+import asyncio
+import random
+import bot_core
+from bot_core import (
+    add_extension_commands,
+    bot,
+    db,
+    has_admin_or_mod_permissions,
+    is_command_channel,
+    is_queue_channel,
+    remove_extension_commands,
+    system_coordinator
+)
+
+
+# Queue commands
+# Updated queue command - database-bound, so the tree defers it up front (see auto_defer)
+@app_commands.command(name="queue", description="Join the queue for 6 mans", extras={"defer_budget": 0})
+async def queue_slash(interaction: discord.Interaction):
+    if bot_core.RESET_IN_PROGRESS:
+        duration = ""
+        if bot_core.RESET_START_TIME:
+            elapsed = datetime.datetime.now() - bot_core.RESET_START_TIME
+            duration = f" (Running for {elapsed.seconds // 60}m {elapsed.seconds % 60}s)"
+
+        embed = discord.Embed(
+            title="⛔ Queuing Disabled",
+            description=f"A leaderboard reset is currently in progress{duration}",
+            color=0xff9900
+        )
+        embed.add_field(
+            name="Please Wait",
+            value="• Reset operations are running\n• Queuing will be re-enabled automatically\n• Check back in a few minutes",
+            inline=False
+        )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+        return
+
+    # Check channel first
+    if not is_queue_channel(interaction.channel):
+        await interaction.response.send_message(
+            f"{interaction.user.mention}, this command can only be used in the rank-a, rank-b, rank-c, or global channels.",
+            ephemeral=True
+        )
+        return
+
+    # IMMEDIATE response to prevent timeout
+    await interaction.response.defer()
+
+    # Fast rank verification check
+    player = interaction.user
+    player_id = str(player.id)
+
+    rank_record = db.get_collection('ranks').find_one({"discord_id": player_id})
+    rank_a_role = discord.utils.get(interaction.guild.roles, name="Rank A")
+    rank_b_role = discord.utils.get(interaction.guild.roles, name="Rank B")
+    rank_c_role = discord.utils.get(interaction.guild.roles, name="Rank C")
+    has_rank_role = any(role in player.roles for role in [rank_a_role, rank_b_role, rank_c_role])
+
+    if not (rank_record or has_rank_role):
+        embed = discord.Embed(
+            title="Rank Verification Required",
+            description="You need to verify your Rocket League rank before joining the queue.",
+            color=0xf1c40f
+        )
+        embed.add_field(
+            name="How to Verify",
+            value="Visit the rank check page on the website to complete verification.",
+            inline=False
+        )
+        await interaction.followup.send(embed=embed, ephemeral=True)
+        return
+
+    # Create missing rank record if needed
+    if has_rank_role and not rank_record:
+        tier = "Rank C"
+        mmr = 600
+        if rank_a_role in player.roles:
+            tier = "Rank A"
+            mmr = 1600
+        elif rank_b_role in player.roles:
+            tier = "Rank B"
+            mmr = 1100
+
+        try:
+            db.get_collection('ranks').insert_one({
+                "discord_id": player_id,
+                "discord_username": player.display_name,
+                "tier": tier,
+                "mmr": mmr,
+                "timestamp": datetime.datetime.utcnow()
+            })
+        except Exception as e:
+            print(f"Error creating rank record: {e}")
+
+    # Get queue manager response
+    try:
+        response_message = await system_coordinator.queue_manager.add_player(player, interaction.channel)
+    except Exception as e:
+        print(f"Error adding player to queue: {e}")
+        await interaction.followup.send("An error occurred while joining the queue. Please try again.", ephemeral=True)
+        return
+
+    # Handle response - SINGLE followup message only
+    if "QUEUE_ERROR:" in response_message:
+        error_msg = response_message.replace("QUEUE_ERROR:", "").strip()
+
+        if "already in the queue for" in error_msg:
+            embed = discord.Embed(
+                title="Queue Error",
+                description=error_msg,
+                color=0xe74c3c
+            )
+            embed.add_field(name="What to do",
+                            value="Use `/leave` in that channel first, then try joining this queue again.",
+                            inline=False)
+        elif "already in this queue" in error_msg:
+            status_data = system_coordinator.queue_manager.get_queue_status(interaction.channel)
+            queue_count = status_data['queue_count']
+            embed = discord.Embed(
+                title="Queue Status",
+                description=f"{player.mention}, you're already in this queue!",
+                color=0xffa500
+            )
+            embed.add_field(name="Current Queue", value=f"**{queue_count}/6** players waiting", inline=False)
+            embed.add_field(name="Queue Progress",
+                            value=f"{'▰' * queue_count}{'▱' * (6 - queue_count)} ({queue_count}/6)", inline=False)
+        else:
+            embed = discord.Embed(title="Queue Error", description=error_msg, color=0xff0000)
+
+        embed.timestamp = datetime.datetime.now()
+        embed.set_footer(text=f"Channel: #{interaction.channel.name}")
+        await interaction.followup.send(embed=embed)
+
+    elif "SUCCESS:" in response_message:
+        success_msg = response_message.replace("SUCCESS:", "").strip()
+        status_data = system_coordinator.queue_manager.get_queue_status(interaction.channel)
+        queue_count = status_data['queue_count']
+
+        embed = discord.Embed(
+            title="Queue Status",
+            description=success_msg,
+            color=0x00ff00
+        )
+        embed.add_field(name="Queue Progress", value=f"{'▰' * queue_count}{'▱' * (6 - queue_count)} ({queue_count}/6)",
+                        inline=False)
+
+        if queue_count < 6:
+            embed.add_field(name="Status", value=f"Waiting for **{6 - queue_count}** more player(s)", inline=False)
+        else:
+            embed.add_field(name="Status", value="🎉 **Queue is FULL!** Match starting soon...", inline=False)
+
+        embed.timestamp = datetime.datetime.now()
+        embed.set_footer(text=f"Channel: #{interaction.channel.name}")
+        await interaction.followup.send(embed=embed)
+
+    else:
+        # Match creation
+        match_id = response_message
+        embed = discord.Embed(
+            title="Match Starting!",
+            description=f"Queue is full! Starting team selection for match `{match_id}`",
+            color=0x00ff00
+        )
+        embed.add_field(name="Match ID", value=f"`{match_id}`", inline=False)
+        embed.add_field(name="Next Step", value="Team selection voting will begin shortly. Make sure to vote!",
+                        inline=False)
+        embed.timestamp = datetime.datetime.now()
+        embed.set_footer(text=f"Channel: #{interaction.channel.name}")
+        await interaction.followup.send(embed=embed)
+
+        # FIXED: Start voting AFTER sending the match creation message
+        # Check if voting system exists for this channel
+        channel_name = interaction.channel.name.lower()
+        if channel_name in system_coordinator.vote_systems:
+            # Small delay to ensure proper order
+            await asyncio.sleep(1.0)
+            try:
+                await system_coordinator.vote_systems[channel_name].start_vote(interaction.channel)
+            except Exception as vote_error:
+                print(f"Error starting vote: {vote_error}")
+
+
+# FIXED: Leave command with proper interaction handling
+@app_commands.command(name="leave", description="Leave the queue", extras={"defer_budget": 0})
+async def leave_slash(interaction: discord.Interaction):
+    if bot_core.RESET_IN_PROGRESS:
+        duration = ""
+        if bot_core.RESET_START_TIME:
+            elapsed = datetime.datetime.now() - bot_core.RESET_START_TIME
+            duration = f" (Running for {elapsed.seconds // 60}m {elapsed.seconds % 60}s)"
+
+        embed = discord.Embed(
+            title="⛔ Queuing Disabled",
+            description=f"A leaderboard reset is currently in progress{duration}",
+            color=0xff9900
+        )
+        embed.add_field(
+            name="Please Wait",
+            value="• Reset operations are running\n• Queuing will be re-enabled automatically\n• Check back in a few minutes",
+            inline=False
+        )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+        return
+
+    if not is_queue_channel(interaction.channel):
+        await interaction.response.send_message(
+            f"{interaction.user.mention}, this command can only be used in the rank-a, rank-b, rank-c, or global channels.",
+            ephemeral=True
+        )
+        return
+
+    # IMMEDIATE response to prevent timeout
+    await interaction.response.defer()
+
+    # Fast rank verification check
+    player = interaction.user
+    player_id = str(player.id)
+
+    rank_record = db.get_collection('ranks').find_one({"discord_id": player_id})
+    rank_a_role = discord.utils.get(interaction.guild.roles, name="Rank A")
+    rank_b_role = discord.utils.get(interaction.guild.roles, name="Rank B")
+    rank_c_role = discord.utils.get(interaction.guild.roles, name="Rank C")
+    has_rank_role = any(role in player.roles for role in [rank_a_role, rank_b_role, rank_c_role])
+
+    if not (rank_record or has_rank_role):
+        embed = discord.Embed(
+            title="Rank Verification Required",
+            description="You need to verify your Rocket League rank before joining the queue.",
+            color=0xf1c40f
+        )
+        embed.add_field(name="How to Verify",
+                        value="Visit the rank check page on the website to complete verification.", inline=False)
+        await interaction.followup.send(embed=embed, ephemeral=True)
+        return
+
+    # Get queue manager response
+    try:
+        response_message = await system_coordinator.queue_manager.remove_player(interaction.user, interaction.channel)
+    except Exception as e:
+        print(f"Error removing player from queue: {e}")
+        await interaction.followup.send("An error occurred while leaving the queue. Please try again.", ephemeral=True)
+        return
+
+    # Handle response - SINGLE followup message only
+    if "MATCH_ERROR:" in response_message:
+        error_msg = response_message.replace("MATCH_ERROR:", "").strip()
+
+        # Extract match ID if present
+        match_id = None
+        if "Match ID:" in error_msg:
+            import re
+            match = re.search(r'Match ID: `([^`]+)`', error_msg)
+            if match:
+                match_id = match.group(1)
+
+        embed = discord.Embed(title="Cannot Leave Queue", description=error_msg, color=0xe74c3c)
+
+        if "voting" in error_msg:
+            embed.add_field(name="Reason", value="Team selection voting is in progress", inline=False)
+            embed.add_field(name="What to do", value="Wait for the vote to complete, then you'll be in a match",
+                            inline=False)
+        elif "selection" in error_msg:
+            embed.add_field(name="Reason", value="Captain selection is in progress", inline=False)
+            embed.add_field(name="What to do", value="Wait for team selection to complete, then you'll be in a match",
+                            inline=False)
+        elif "active match" in error_msg:
+            embed.add_field(name="Reason", value="You're currently in an active match", inline=False)
+            if match_id:
+                embed.add_field(name="What to do",
+                                value=f"Complete your match using `/report {match_id} win` or `/report {match_id} loss`",
+                                inline=False)
+
+        embed.timestamp = datetime.datetime.now()
+        embed.set_footer(text=f"Channel: #{interaction.channel.name}")
+        await interaction.followup.send(embed=embed)
+
+    elif "QUEUE_ERROR:" in response_message:
+        error_msg = response_message.replace("QUEUE_ERROR:", "").strip()
+        status_data = system_coordinator.queue_manager.get_queue_status(interaction.channel)
+        queue_count = status_data['queue_count']
+
+        if "not in this channel's queue" in error_msg:
+            embed = discord.Embed(title="Queue Error", description=error_msg, color=0xf1c40f)
+            embed.add_field(name="Current Queue", value=f"**{queue_count}/6** players waiting in this channel",
+                            inline=False)
+            embed.add_field(name="Your Queue",
+                            value="You're queued in a different channel. Use `/leave` in that channel to leave your queue.",
+                            inline=False)
+        elif "not in any queue" in error_msg:
+            embed = discord.Embed(title="Queue Status", description=error_msg, color=0xf1c40f)
+            embed.add_field(name="Current Queue", value=f"**{queue_count}/6** players waiting", inline=False)
+            if queue_count > 0:
+                embed.add_field(name="Join Queue", value="Use `/queue` to join the current queue", inline=False)
+            else:
+                embed.add_field(name="Join Queue", value="Use `/queue` to start a new queue", inline=False)
+        else:
+            embed = discord.Embed(title="Queue Error", description=error_msg, color=0xe74c3c)
+
+        embed.timestamp = datetime.datetime.now()
+        embed.set_footer(text=f"Channel: #{interaction.channel.name}")
+        await interaction.followup.send(embed=embed)
+
+    elif "SUCCESS:" in response_message:
+        success_msg = response_message.replace("SUCCESS:", "").strip()
+        status_data = system_coordinator.queue_manager.get_queue_status(interaction.channel)
+        queue_count = status_data['queue_count']
+
+        embed = discord.Embed(title="Queue Status", description=success_msg, color=0xff9900)
+        embed.add_field(name="Updated Queue", value=f"**{queue_count}/6** players remaining", inline=False)
+
+        if queue_count > 0:
+            embed.add_field(name="Queue Progress",
+                            value=f"{'▰' * queue_count}{'▱' * (6 - queue_count)} ({queue_count}/6)", inline=False)
+            embed.add_field(name="Status", value=f"Waiting for **{6 - queue_count}** more player(s)", inline=False)
+        else:
+            embed.add_field(name="Status", value="Queue is now empty", inline=False)
+
+        embed.timestamp = datetime.datetime.now()
+        embed.set_footer(text=f"Channel: #{interaction.channel.name}")
+        await interaction.followup.send(embed=embed)
+
+    else:
+        # Fallback
+        embed = discord.Embed(title="Queue Status", description=response_message, color=0x95a5a6)
+        status_data = system_coordinator.queue_manager.get_queue_status(interaction.channel)
+        queue_count = status_data['queue_count']
+        embed.add_field(name="Current Queue", value=f"**{queue_count}/6** players waiting", inline=False)
+        embed.timestamp = datetime.datetime.now()
+        embed.set_footer(text=f"Channel: #{interaction.channel.name}")
+        await interaction.followup.send(embed=embed)
+
+
+@app_commands.command(name="status", description="Shows the current queue status", extras={"defer_budget": 0})
+async def status_slash(interaction: discord.Interaction):
+    if bot_core.RESET_IN_PROGRESS:
+        duration = ""
+        if bot_core.RESET_START_TIME:
+            elapsed = datetime.datetime.now() - bot_core.RESET_START_TIME
+            duration = f" (Running for {elapsed.seconds // 60}m {elapsed.seconds % 60}s)"
+
+        embed = discord.Embed(
+            title="⛔ Queue Status Unavailable",
+            description=f"A leaderboard reset is currently in progress{duration}",
+            color=0xff9900
+        )
+        embed.add_field(
+            name="Please Wait",
+            value="• Reset operations are running\n• Queue status will be available after reset\n• All queues are currently disabled",
+            inline=False
+        )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+        return
+
+    # Check if command is used in an allowed channel
+    if not is_queue_channel(interaction.channel):
+        await interaction.response.send_message(
+            f"{interaction.user.mention}, this command can only be used in the rank-a, rank-b, rank-c, or global channels.",
+            ephemeral=True
+        )
+        return
+
+    # Use the queue manager to get status
+    status_data = system_coordinator.queue_manager.get_queue_status(interaction.channel)
+
+    # Get queue count and players
+    queue_count = status_data['queue_count']
+    queue_players = status_data['queue_players']
+
+    # Create a simple embed that just shows queue status
+    embed = discord.Embed(
+        title="Queue Status",
+        description=f"**Current Queue: {queue_count}/6 players**",
+        color=0x3498db
+    )
+
+    if queue_count == 0:
+        embed.add_field(name="Status", value="Queue is empty! Use `/queue` to join the queue.", inline=False)
+    else:
+        # Create a list of player mentions
+        player_mentions = [player['mention'] for player in queue_players]
+
+        # Add player list to embed
+        embed.add_field(name="Players in Queue", value=", ".join(player_mentions), inline=False)
+
+        # Add info about how many more players are needed
+        if queue_count < 6:
+            more_needed = 6 - queue_count
+            embed.add_field(name="Info", value=f"{more_needed} more player(s) needed for a match.", inline=False)
+        else:
+            # Queue is full
+            embed.add_field(name="Status", value="**Queue is FULL!** Ready to start match.", inline=False)
+
+    # Simply note the number of active matches without details
+    active_matches = status_data['active_matches']
+    if active_matches:
+        embed.add_field(
+            name="Active Matches",
+            value=f"There are currently {len(active_matches)} active match(es) in progress.",
+            inline=False
+        )
+
+    await interaction.response.send_message(embed=embed)
+
+
+@app_commands.command(name="addplayer", description="Add a player to the queue (Admin/Mod only)")
+@app_commands.describe(member="The member to add to the queue")
+async def addplayer_slash(interaction: discord.Interaction, member: discord.Member):
+    if bot_core.RESET_IN_PROGRESS:
+        duration = ""
+        if bot_core.RESET_START_TIME:
+            elapsed = datetime.datetime.now() - bot_core.RESET_START_TIME
+            duration = f" (Running for {elapsed.seconds // 60}m {elapsed.seconds % 60}s)"
+
+        embed = discord.Embed(
+            title="⛔ Admin Queue Commands Disabled",
+            description=f"A leaderboard reset is currently in progress{duration}",
+            color=0xff9900
+        )
+        embed.add_field(
+            name="Please Wait",
+            value="• Reset operations are running\n• Admin queue commands will be re-enabled automatically\n• Check back in a few minutes",
+            inline=False
+        )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+        return
+
+    # Check if command is used in an allowed channel
+    if not is_queue_channel(interaction.channel):
+        await interaction.response.send_message(
+            f"{interaction.user.mention}, this command can only be used in the rank-a, rank-b, rank-c, or global channels.",
+            ephemeral=True
+        )
+        return
+
+    # Check if user has admin permissions
+    if not has_admin_or_mod_permissions(interaction.user, interaction.guild):
+        await interaction.response.send_message(
+            "You need administrator permissions or the 6mod role to use this command.",
+            ephemeral=True)
+        return
+
+    # Defer response since queue operations might take time
+    await interaction.response.defer()
+
+    # Check if the target member has rank verification
+    player_id = str(member.id)
+    rank_record = db.get_collection('ranks').find_one({"discord_id": player_id})
+    rank_a_role = discord.utils.get(interaction.guild.roles, name="Rank A")
+    rank_b_role = discord.utils.get(interaction.guild.roles, name="Rank B")
+    rank_c_role = discord.utils.get(interaction.guild.roles, name="Rank C")
+    has_rank_role = any(role in member.roles for role in [rank_a_role, rank_b_role, rank_c_role])
+
+    if not (rank_record or has_rank_role):
+        embed = discord.Embed(
+            title="Cannot Add Player",
+            description=f"{member.mention} needs to verify their Rocket League rank before being added to the queue.",
+            color=0xf1c40f
+        )
+        embed.add_field(
+            name="What they need to do",
+            value="The player must visit the rank check page on the website to complete verification.",
+            inline=False
+        )
+        await interaction.followup.send(embed=embed)
+        return
+
+    # Create missing rank record if needed
+    if has_rank_role and not rank_record:
+        tier = "Rank C"
+        mmr = 600
+        if rank_a_role in member.roles:
+            tier = "Rank A"
+            mmr = 1600
+        elif rank_b_role in member.roles:
+            tier = "Rank B"
+            mmr = 1100
+
+        try:
+            db.get_collection('ranks').insert_one({
+                "discord_id": player_id,
+                "discord_username": member.display_name,
+                "tier": tier,
+                "mmr": mmr,
+                "timestamp": datetime.datetime.utcnow()
+            })
+        except Exception as e:
+            print(f"Error creating rank record: {e}")
+
+    # Try to add the player to the queue using the existing queue manager
+    try:
+        response_message = await system_coordinator.queue_manager.add_player(member, interaction.channel)
+    except Exception as e:
+        print(f"Error adding player to queue: {e}")
+        await interaction.followup.send(
+            f"An error occurred while adding {member.mention} to the queue. Please try again.")
+        return
+
+    # Handle response
+    if "QUEUE_ERROR:" in response_message:
+        error_msg = response_message.replace("QUEUE_ERROR:", "").strip()
+
+        embed = discord.Embed(
+            title="Cannot Add Player",
+            description=error_msg,
+            color=0xe74c3c
+        )
+        embed.set_footer(text=f"Admin action by {interaction.user.display_name}")
+        await interaction.followup.send(embed=embed)
+
+    elif "SUCCESS:" in response_message:
+        success_msg = response_message.replace("SUCCESS:", "").strip()
+        status_data = system_coordinator.queue_manager.get_queue_status(interaction.channel)
+        queue_count = status_data['queue_count']
+
+        embed = discord.Embed(
+            title="Player Added to Queue",
+            description=f"Successfully added {member.mention} to the queue!",
+            color=0x00ff00
+        )
+        embed.add_field(name="Queue Progress", value=f"{'▰' * queue_count}{'▱' * (6 - queue_count)} ({queue_count}/6)",
+                        inline=False)
+
+        if queue_count < 6:
+            embed.add_field(name="Status", value=f"Waiting for **{6 - queue_count}** more player(s)", inline=False)
+        else:
+            embed.add_field(name="Status", value="🎉 **Queue is FULL!** Match starting soon...", inline=False)
+
+        embed.set_footer(text=f"Added by admin: {interaction.user.display_name}")
+        await interaction.followup.send(embed=embed)
+
+    else:
+        # Match creation response
+        match_id = response_message
+        embed = discord.Embed(
+            title="Match Starting!",
+            description=f"Queue filled! Starting team selection for match `{match_id}`",
+            color=0x00ff00
+        )
+        embed.add_field(name="Match ID", value=f"`{match_id}`", inline=False)
+        embed.add_field(name="Added Player", value=f"{member.mention} was the final player needed!", inline=False)
+        embed.set_footer(text=f"Queue completed by admin: {interaction.user.display_name}")
+        await interaction.followup.send(embed=embed)
+
+        # Start voting for the match
+        channel_name = interaction.channel.name.lower()
+        if channel_name in system_coordinator.vote_systems:
+            await asyncio.sleep(1.0)  # Small delay to ensure proper order
+            try:
+                await system_coordinator.vote_systems[channel_name].start_vote(interaction.channel)
+            except Exception as vote_error:
+                print(f"Error starting vote after admin add: {vote_error}")
+
+
+@app_commands.command(name="removeplayer", description="Remove player(s) from the queue (Admin/Mod only)")
+@app_commands.describe(
+    member="The specific member to remove (leave empty to remove all players)",
+    remove_all="Set to 'yes' to remove all players from the queue"
+)
+@app_commands.choices(remove_all=[
+    app_commands.Choice(name="No - Remove specific player only", value="no"),
+    app_commands.Choice(name="Yes - Remove ALL players", value="yes")
+])
+async def removeplayer_slash(interaction: discord.Interaction, member: discord.Member = None, remove_all: str = "no"):
+    if bot_core.RESET_IN_PROGRESS:
+        duration = ""
+        if bot_core.RESET_START_TIME:
+            elapsed = datetime.datetime.now() - bot_core.RESET_START_TIME
+            duration = f" (Running for {elapsed.seconds // 60}m {elapsed.seconds % 60}s)"
+
+        embed = discord.Embed(
+            title="⛔ Admin Queue Commands Disabled",
+            description=f"A leaderboard reset is currently in progress{duration}",
+            color=0xff9900
+        )
+        embed.add_field(
+            name="Please Wait",
+            value="• Reset operations are running\n• Admin queue commands will be re-enabled automatically\n• Check back in a few minutes",
+            inline=False
+        )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+        return
+
+    # Check if command is used in an allowed channel
+    if not is_queue_channel(interaction.channel):
+        await interaction.response.send_message(
+            f"{interaction.user.mention}, this command can only be used in the rank-a, rank-b, rank-c, or global channels.",
+            ephemeral=True
+        )
+        return
+
+    # Check if user has admin permissions
+    if not has_admin_or_mod_permissions(interaction.user, interaction.guild):
+        await interaction.response.send_message(
+            "You need administrator permissions or the 6mod role to use this command.",
+            ephemeral=True)
+        return
+
+    # Defer response first to avoid interaction timeout issues
+    await interaction.response.defer()
+
+    # Validate parameters
+    if remove_all == "yes" and member is not None:
+        await interaction.followup.send(
+            "❌ Cannot specify both a member and 'remove all'. Choose one option.",
+            ephemeral=True
+        )
+        return
+
+    if remove_all == "no" and member is None:
+        await interaction.followup.send(
+            "❌ Please specify a member to remove, or set 'remove_all' to 'yes' to clear the entire queue.",
+            ephemeral=True
+        )
+        return
+
+    # Get current queue status
+    status_data = system_coordinator.queue_manager.get_queue_status(interaction.channel)
+    queue_count = status_data['queue_count']
+    queue_players = status_data['queue_players']
+
+    # If queue is empty
+    if queue_count == 0:
+        await interaction.followup.send("The queue is already empty!")
+        return
+
+    if remove_all == "yes":
+        # Remove all players from queue
+        player_mentions = [player['mention'] for player in queue_players]
+
+        embed = discord.Embed(
+            title="Queue Cleared",
+            description=f"Removed **{queue_count}** player(s) from the queue:",
+            color=0xff9900
+        )
+
+        if player_mentions:
+            # Split into chunks if too many players (Discord embed field limit)
+            if len(player_mentions) <= 10:
+                embed.add_field(name="Players Removed", value=", ".join(player_mentions), inline=False)
+            else:
+                # Show first 10 and indicate there are more
+                shown_mentions = player_mentions[:10]
+                embed.add_field(
+                    name="Players Removed",
+                    value=", ".join(shown_mentions) + f"\n... and {len(player_mentions) - 10} more",
+                    inline=False
+                )
+
+        embed.set_footer(text=f"Cleared by {interaction.user.display_name}")
+
+        # Clear players from this channel's queue
+        channel_id = str(interaction.channel.id)
+        system_coordinator.queue_manager.queue_collection.delete_many({"channel_id": channel_id})
+
+        # Update in-memory state
+        if channel_id in system_coordinator.queue_manager.channel_queues:
+            system_coordinator.queue_manager.channel_queues[channel_id] = []
+
+        await interaction.followup.send(embed=embed)
+
+    else:
+        # Remove specific player
+        player_id = str(member.id)
+
+        # Check if player is in this channel's queue
+        player_in_queue = False
+        channel_id = str(interaction.channel.id)
+
+        # Check in-memory queue first
+        if channel_id in system_coordinator.queue_manager.channel_queues:
+            for p in system_coordinator.queue_manager.channel_queues[channel_id]:
+                if p.get('id') == player_id:
+                    player_in_queue = True
+                    break
+
+        # Double-check in database if not found in memory
+        if not player_in_queue:
+            db_player = system_coordinator.queue_manager.queue_collection.find_one({
+                "id": player_id,
+                "channel_id": channel_id
+            })
+            if db_player:
+                player_in_queue = True
+                print(f"Found player {member.display_name} in database but not in memory - syncing issue")
+
+        if not player_in_queue:
+            # Check if they're in any other queue
+            in_other_queue = False
+            other_channel_name = None
+
+            # Check in-memory queues
+            for other_channel_id, players in system_coordinator.queue_manager.channel_queues.items():
+                if other_channel_id == channel_id:  # Skip current channel since we already checked
+                    continue
+                for p in players:
+                    if p.get('id') == player_id:
+                        in_other_queue = True
+                        try:
+                            other_channel = bot.get_channel(int(other_channel_id))
+                            if other_channel:
+                                other_channel_name = other_channel.name
+                        except:
+                            pass
+                        break
+                if in_other_queue:
+                    break
+
+            # Also check database for other queues if not found in memory
+            if not in_other_queue:
+                db_other_queue = system_coordinator.queue_manager.queue_collection.find_one({
+                    "id": player_id,
+                    "channel_id": {"$ne": channel_id}
+                })
+                if db_other_queue:
+                    in_other_queue = True
+                    try:
+                        other_channel = bot.get_channel(int(db_other_queue.get("channel_id")))
+                        if other_channel:
+                            other_channel_name = other_channel.name
+                    except:
+                        pass
+
+            if in_other_queue:
+                embed = discord.Embed(
+                    title="Player Not in This Queue",
+                    description=f"{member.mention} is not in this channel's queue.",
+                    color=0xf1c40f
+                )
+                if other_channel_name:
+                    embed.add_field(
+                        name="Current Location",
+                        value=f"They are in the **#{other_channel_name}** queue instead.",
+                        inline=False
+                    )
+                await interaction.followup.send(embed=embed)
+            else:
+                embed = discord.Embed(
+                    title="Player Not in Queue",
+                    description=f"{member.mention} is not in any queue.",
+                    color=0x95a5a6
+                )
+                await interaction.followup.send(embed=embed)
+            return
+
+        # Remove the specific player from database first
+        channel_id = str(interaction.channel.id)
+        result = system_coordinator.queue_manager.queue_collection.delete_one({
+            "id": player_id,
+            "channel_id": channel_id
+        })
+
+        # Update in-memory state regardless of database result (for sync)
+        removed_from_memory = False
+        if channel_id in system_coordinator.queue_manager.channel_queues:
+            original_count = len(system_coordinator.queue_manager.channel_queues[channel_id])
+            system_coordinator.queue_manager.channel_queues[channel_id] = [
+                p for p in system_coordinator.queue_manager.channel_queues[channel_id]
+                if p.get('id') != player_id
+            ]
+            new_count = len(system_coordinator.queue_manager.channel_queues[channel_id])
+            removed_from_memory = (new_count < original_count)
+
+        # Consider it successful if removed from either database OR memory
+        removal_successful = (result.deleted_count > 0) or removed_from_memory
+
+        if removal_successful:
+            # Get updated queue status
+            updated_status = system_coordinator.queue_manager.get_queue_status(interaction.channel)
+            updated_count = updated_status['queue_count']
+
+            embed = discord.Embed(
+                title="Player Removed from Queue",
+                description=f"Successfully removed {member.mention} from the queue.",
+                color=0xff9900
+            )
+            embed.add_field(name="Updated Queue", value=f"**{updated_count}/6** players remaining", inline=False)
+
+            if updated_count > 0:
+                embed.add_field(name="Queue Progress",
+                                value=f"{'▰' * updated_count}{'▱' * (6 - updated_count)} ({updated_count}/6)",
+                                inline=False)
+                embed.add_field(name="Status", value=f"Waiting for **{6 - updated_count}** more player(s)",
+                                inline=False)
+            else:
+                embed.add_field(name="Status", value="Queue is now empty", inline=False)
+
+            embed.set_footer(text=f"Removed by {interaction.user.display_name}")
+
+            # Add debug info if there was a sync issue
+            if removed_from_memory and result.deleted_count == 0:
+                embed.add_field(name="⚠️ Note", value="Player was removed from memory (sync issue resolved)",
+                                inline=False)
+            elif result.deleted_count > 0 and not removed_from_memory:
+                embed.add_field(name="⚠️ Note", value="Player was removed from database (memory already synced)",
+                                inline=False)
+
+            await interaction.followup.send(embed=embed)
+        else:
+            embed = discord.Embed(
+                title="Removal Failed",
+                description=f"Failed to remove {member.mention} from the queue. They may have already left or been removed.",
+                color=0xe74c3c
+            )
+            # Add debug info
+            embed.add_field(name="Debug Info",
+                            value=f"DB result: {result.deleted_count}, Memory removal: {removed_from_memory}",
+                            inline=False)
+            await interaction.followup.send(embed=embed)
+
+@app_commands.command(name="forcestart",
+                  description="Force start the team selection process with dummy players if needed (Admin only)")
+async def forcestart_slash(interaction: discord.Interaction):
+    # Check if command is used in an allowed channel
+    if not is_queue_channel(interaction.channel):
+        await interaction.response.send_message(
+            f"{interaction.user.mention}, this command can only be used in the rank-a, rank-b, rank-c, or global channels.",
+            ephemeral=True
+        )
+        return
+
+    # Check if user has admin permissions
+    if not has_admin_or_mod_permissions(interaction.user, interaction.guild):
+        await interaction.response.send_message(
+            "You need administrator permissions or the 6mod role to use this command.",
+            ephemeral=True)
+        return
+
+    channel_id = str(interaction.channel.id)
+
+    # Check if there's already an active match in selection phase
+    active_match = system_coordinator.queue_manager.get_match_by_channel(channel_id, status="voting") or \
+                   system_coordinator.queue_manager.get_match_by_channel(channel_id, status="selection")
+
+    if active_match:
+        await interaction.response.send_message("A team selection is already in progress in this channel!")
+        return
+
+    # Defer response as this might take some time
+    await interaction.response.defer()
+
+    # Get players from queue
+    status_data = system_coordinator.queue_manager.get_queue_status(interaction.channel)
+    queue_count = status_data['queue_count']
+    queue_players = status_data['queue_players'].copy()  # Make a copy of the list to avoid modifying original
+
+    # If queue is empty, we need to add 6 dummy players
+    if queue_count == 0:
+        await interaction.followup.send("Queue is empty. Adding 6 dummy players...")
+        await add_dummy_players(interaction.channel, 6)
+        # Update queue status after adding dummies
+        status_data = system_coordinator.queue_manager.get_queue_status(interaction.channel)
+        queue_count = status_data['queue_count']
+        queue_players = status_data['queue_players'].copy()
+    # If fewer than 6 players, add dummies to fill
+    elif queue_count < 6:
+        dummies_needed = 6 - queue_count
+        await interaction.followup.send(
+            f"Only {queue_count}/6 players in queue. Adding {dummies_needed} dummy players...")
+        await add_dummy_players(interaction.channel, dummies_needed)
+        # Update queue status after adding dummies
+        status_data = system_coordinator.queue_manager.get_queue_status(interaction.channel)
+        queue_count = status_data['queue_count']
+        queue_players = status_data['queue_players'].copy()
+
+    # Force start by creating a match and starting vote
+    match_id = await system_coordinator.queue_manager.create_match(interaction.channel, interaction.user.mention)
+
+    # Start the voting process for this match
+    channel_name = interaction.channel.name.lower()
+    if channel_name in system_coordinator.vote_systems:
+        # Just send one complete message instead of multiple
+        # Create an embed showing the players in the match
+        embed = discord.Embed(
+            title="Match Players",
+            description=f"Match ID: `{match_id}`\n\nForce starting team selection with the following players:",
+            color=0x3498db
+        )
+
+        # List players, indicating which ones are dummies
+        player_list = []
+        for player in queue_players[:6]:  # Take the first 6 players
+            player_id = player.get('id', '')
+            player_mention = player.get('mention', player.get('name', 'Unknown'))
+            is_dummy = player_id.startswith('9000')
+            player_list.append(f"{player_mention}{' [BOT]' if is_dummy else ''}")
+
+        embed.add_field(
+            name="Players",
+            value="\n".join(player_list),
+            inline=False
+        )
+
+        await interaction.followup.send(embed=embed)
+
+        # Now start the vote system - without additional messages
+        await system_coordinator.vote_systems[channel_name].start_vote(interaction.channel)
+    else:
+        await interaction.followup.send("Error: No vote system found for this channel.")
+
+
+async def add_dummy_players(channel, count):
+    """Add dummy players to the queue"""
+    channel_id = str(channel.id)
+    is_global = channel.name.lower() == "global"
+
+    # Determine MMR range based on channel
+    if channel.name.lower() == "rank-a":
+        mmr_range = (1600, 2100)
+    elif channel.name.lower() == "rank-b":
+        mmr_range = (1100, 1599)
+    else:  # rank-c or global
+        mmr_range = (600, 1099)
+
+    # Create dummy players and add to queue
+    for i in range(count):
+        # Generate a unique dummy ID
+        dummy_id = f"9000{i + 1}"
+
+        # Generate a random MMR within the range for this channel
+        dummy_mmr = random.randint(mmr_range[0], mmr_range[1])
+
+        # Create dummy player data
+        dummy_data = {
+            "id": dummy_id,
+            "name": f"TestDummy{i + 1}",
+            "mention": f"TestDummy{i + 1}",
+            "channel_id": channel_id,
+            "is_global": is_global,
+            "joined_at": datetime.datetime.utcnow(),
+            "dummy_mmr": dummy_mmr  # Store MMR directly in player data
+        }
+
+        # Add to database
+        system_coordinator.queue_manager.queue_collection.insert_one(dummy_data)
+
+        # Add to in-memory queue
+        if channel_id not in system_coordinator.queue_manager.channel_queues:
+            system_coordinator.queue_manager.channel_queues[channel_id] = []
+
+        system_coordinator.queue_manager.channel_queues[channel_id].append(dummy_data)
+
+# 4. Sub Command
+@app_commands.command(name="sub", description="Substitute or swap players in an active match")
+@app_commands.describe(
+    match_id="The ID of the match",
+    action="Choose to substitute a player or swap two players",
+    player_out="The player to remove (for substitute) or first player (for swap)",
+    player_in="The player to add (for substitute) or second player (for swap)"
+)
+@app_commands.choices(action=[
+    app_commands.Choice(name="Substitute Player", value="substitute"),
+    app_commands.Choice(name="Swap Players", value="swap")
+])
+async def sub_slash(interaction: discord.Interaction, match_id: str, action: str, player_out: discord.Member,
+                    player_in: discord.Member):
+    # Check if command is used in an allowed channel
+    if not is_command_channel(interaction.channel):
+        await interaction.response.send_message(
+            f"{interaction.user.mention}, this command can only be used in the rank-a, rank-b, rank-c, global, or sixgents channels.",
+            ephemeral=True
+        )
+        return
+
+    # Check if user has permissions
+    if not has_admin_or_mod_permissions(interaction.user, interaction.guild):
+        await interaction.response.send_message(
+            "You need administrator permissions or the 6mod role to use this command.",
+            ephemeral=True)
+        return
+
+    # Look up the match
+    match = system_coordinator.match_system.matches.find_one({"match_id": match_id})
+
+    if not match:
+        await interaction.response.send_message(f"Match with ID `{match_id}` not found.", ephemeral=True)
+        return
+
+    # Check if match is in progress
+    if match.get("status") != "in_progress":
+        await interaction.response.send_message(
+            f"Match with ID `{match_id}` is not in progress (status: {match.get('status')}). " +
+            "Substitutions and swaps are only available for in-progress matches.",
+            ephemeral=True
+        )
+        return
+
+    # Route to appropriate function based on action
+    if action == "substitute":
+        await handle_substitute(interaction, match_id, match, player_out, player_in)
+    elif action == "swap":
+        await handle_swap(interaction, match_id, match, player_out, player_in)
+
+
+async def handle_substitute(interaction, match_id, match, player_out, player_in):
+    """Handle player substitution (replace player_out with player_in)"""
+
+    # Get player data
+    player_out_id = str(player_out.id)
+    player_in_id = str(player_in.id)
+    player_out_name = player_out.display_name
+    player_in_name = player_in.display_name
+    player_out_mention = player_out.mention
+    player_in_mention = player_in.mention
+
+    # Get teams
+    team1 = match.get("team1", [])
+    team2 = match.get("team2", [])
+
+    # Check which team player_out is on
+    player_found = False
+    team_num = 0
+    team_index = -1
+
+    # Check team1
+    for i, player in enumerate(team1):
+        if player.get("id") == player_out_id:
+            team_num = 1
+            team_index = i
+            player_found = True
+            break
+
+    # Check team2 if not found in team1
+    if not player_found:
+        for i, player in enumerate(team2):
+            if player.get("id") == player_out_id:
+                team_num = 2
+                team_index = i
+                player_found = True
+                break
+
+    if not player_found:
+        await interaction.response.send_message(
+            f"{player_out_mention} is not part of match `{match_id}`.",
+            ephemeral=True
+        )
+        return
+
+    # Check if player_in is already in a match
+    player_in_match = system_coordinator.queue_manager.get_player_match(player_in_id)
+
+    if player_in_match and player_in_match.get("match_id") != match_id:
+        await interaction.response.send_message(
+            f"{player_in_mention} is already in another active match and cannot be substituted.",
+            ephemeral=True
+        )
+        return
+
+    # Check if player_in is already in this match
+    player_in_this_match = any(p.get("id") == player_in_id for p in team1 + team2)
+
+    if player_in_this_match:
+        await interaction.response.send_message(
+            f"{player_in_mention} is already part of match `{match_id}`. Use the 'Swap Players' action instead.",
+            ephemeral=True
+        )
+        return
+
+    # Create new player data
+    new_player_data = {
+        "id": player_in_id,
+        "name": player_in_name,
+        "mention": player_in_mention
+    }
+
+    # Update the match in the database AND memory
+    if team_num == 1:
+        # Replace in team1
+        team1[team_index] = new_player_data
+
+        # CRITICAL FIX: Update in the MAIN database (matches collection)
+        system_coordinator.match_system.matches.update_one(
+            {"match_id": match_id},
+            {"$set": {"team1": team1}}
+        )
+
+        # Update in the queue manager's active matches
+        if match_id in system_coordinator.queue_manager.active_matches:
+            system_coordinator.queue_manager.active_matches[match_id]["team1"] = team1
+
+        # Update in active_matches collection (for consistency)
+        system_coordinator.queue_manager.active_matches_collection.update_one(
+            {"match_id": match_id},
+            {"$set": {"team1": team1}}
+        )
+
+        # Update player-match mapping
+        system_coordinator.queue_manager.player_matches.pop(player_out_id, None)
+        system_coordinator.queue_manager.player_matches[player_in_id] = match_id
+    else:
+        # Replace in team2
+        team2[team_index] = new_player_data
+
+        # CRITICAL FIX: Update in the MAIN database (matches collection)
+        system_coordinator.match_system.matches.update_one(
+            {"match_id": match_id},
+            {"$set": {"team2": team2}}
+        )
+
+        # Update in the queue manager's active matches
+        if match_id in system_coordinator.queue_manager.active_matches:
+            system_coordinator.queue_manager.active_matches[match_id]["team2"] = team2
+
+        # Update in active_matches collection (for consistency)
+        system_coordinator.queue_manager.active_matches_collection.update_one(
+            {"match_id": match_id},
+            {"$set": {"team2": team2}}
+        )
+
+        # Update player-match mapping
+        system_coordinator.queue_manager.player_matches.pop(player_out_id, None)
+        system_coordinator.queue_manager.player_matches[player_in_id] = match_id
+
+    # Create embed response
+    embed = discord.Embed(
+        title="Player Substitution",
+        description=f"Match ID: `{match_id}`",
+        color=0x00aaff  # Blue for substitutions
+    )
+
+    embed.add_field(
+        name="Team",
+        value=f"Team {team_num}",
+        inline=False
+    )
+
+    embed.add_field(
+        name="Substitution",
+        value=f"OUT: {player_out_mention}\nIN: {player_in_mention}",
+        inline=False
+    )
+
+    embed.add_field(
+        name="Updated Team",
+        value=", ".join([p.get('mention', p.get('name')) for p in (team1 if team_num == 1 else team2)]),
+        inline=False
+    )
+
+    embed.set_footer(
+        text=f"Substitution by {interaction.user.display_name} | {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+
+    await interaction.response.send_message(embed=embed)
+
+
+async def handle_swap(interaction, match_id, match, player1, player2):
+    """Handle player swap between teams"""
+
+    # Get player data
+    player1_id = str(player1.id)
+    player2_id = str(player2.id)
+    player1_mention = player1.mention
+    player2_mention = player2.mention
+
+    # Get teams
+    team1 = match.get("team1", [])
+    team2 = match.get("team2", [])
+
+    # Find both players in the match
+    player1_team = None
+    player1_index = -1
+    player2_team = None
+    player2_index = -1
+
+    # Check team1
+    for i, player in enumerate(team1):
+        if player.get("id") == player1_id:
+            player1_team = 1
+            player1_index = i
+        elif player.get("id") == player2_id:
+            player2_team = 1
+            player2_index = i
+
+    # Check team2
+    for i, player in enumerate(team2):
+        if player.get("id") == player1_id:
+            player1_team = 2
+            player1_index = i
+        elif player.get("id") == player2_id:
+            player2_team = 2
+            player2_index = i
+
+    # Validate both players are in the match
+    if player1_team is None:
+        await interaction.response.send_message(f"{player1_mention} is not in match `{match_id}`.", ephemeral=True)
+        return
+
+    if player2_team is None:
+        await interaction.response.send_message(f"{player2_mention} is not in match `{match_id}`.", ephemeral=True)
+        return
+
+    # Check they're on different teams
+    if player1_team == player2_team:
+        await interaction.response.send_message(
+            f"Both {player1_mention} and {player2_mention} are on Team {player1_team}. Can only swap players between different teams.",
+            ephemeral=True
+        )
+        return
+
+    # Perform the swap
+    if player1_team == 1:  # player1 on team1, player2 on team2
+        player1_data = team1[player1_index]
+        player2_data = team2[player2_index]
+
+        team1[player1_index] = player2_data
+        team2[player2_index] = player1_data
+
+        swap_description = f"{player1_mention} (Team 1 → Team 2) ↔ {player2_mention} (Team 2 → Team 1)"
+    else:  # player1 on team2, player2 on team1
+        player1_data = team2[player1_index]
+        player2_data = team1[player2_index]
+
+        team2[player1_index] = player2_data
+        team1[player2_index] = player1_data
+
+        swap_description = f"{player1_mention} (Team 2 → Team 1) ↔ {player2_mention} (Team 1 → Team 2)"
+
+    # CRITICAL FIX: Update MAIN database (matches collection)
+    system_coordinator.match_system.matches.update_one(
+        {"match_id": match_id},
+        {"$set": {"team1": team1, "team2": team2}}
+    )
+
+    # Update in memory (queue manager)
+    if match_id in system_coordinator.queue_manager.active_matches:
+        system_coordinator.queue_manager.active_matches[match_id]["team1"] = team1
+        system_coordinator.queue_manager.active_matches[match_id]["team2"] = team2
+
+    # Update in active_matches collection (for consistency)
+    system_coordinator.queue_manager.active_matches_collection.update_one(
+        {"match_id": match_id},
+        {"$set": {"team1": team1, "team2": team2}}
+    )
+
+    # Create response embed
+    embed = discord.Embed(
+        title="Players Swapped Between Teams",
+        description=f"Match ID: `{match_id}`",
+        color=0xff9500  # Orange for swaps
+    )
+
+    embed.add_field(
+        name="Team Swap",
+        value=swap_description,
+        inline=False
+    )
+
+    embed.add_field(
+        name="Updated Teams",
+        value=(
+            f"**Team 1:** {', '.join([p.get('mention', p.get('name')) for p in team1])}\n"
+            f"**Team 2:** {', '.join([p.get('mention', p.get('name')) for p in team2])}"
+        ),
+        inline=False
+    )
+
+    embed.set_footer(
+        text=f"Swap by {interaction.user.display_name} | {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+
+    await interaction.response.send_message(embed=embed)
+
+
+# Slash commands registered by this extension
+COMMANDS = [
+    queue_slash,
+    leave_slash,
+    status_slash,
+    addplayer_slash,
+    removeplayer_slash,
+    forcestart_slash,
+    sub_slash,
+]
+
+
+async def setup(bot):
+    add_extension_commands(bot, COMMANDS)
+
+
+async def teardown(bot):
+    remove_extension_commands(bot, COMMANDS)
@@ -0,0 +1,960 @@
+"""
+Reset commands - leaderboard resets, reset previews, player resets and reset recovery
+"""
+import discord
+from discord import app_commands
+import datetime
+import asyncio
+import random
+from cooldowns import cooldown
+from season_reset import (
+    calculate_soft_reset_mmr,
+    apply_soft_reset,
+    backup_collection,
+    preview_soft_reset
+)
+from replay_engine import MatchReplayEngine
+import bot_core
+from bot_core import (
+    add_extension_commands,
+    bot,
+    db,
+    get_rank_from_mmr,
+    has_admin_or_mod_permissions,
+    is_command_channel,
+    rate_limiter,
+    remove_extension_commands,
+    safe_role_operation,
+    safe_send_followup,
+    safe_send_message,
+    report_pipeline,
+    set_reset_status,
+    system_coordinator
+)
+
+
+# 3. Reset Leaderboard Command
+@cooldown(60, scope="guild")
+@app_commands.command(name="resetleaderboard", description="Reset the leaderboard (Admin only)")
+@app_commands.describe(
+    confirmation="Type 'CONFIRM' to confirm the reset",
+    reset_type="Type of reset to perform"
+)
+@app_commands.choices(reset_type=[
+    app_commands.Choice(name="Global Only", value="global"),
+    app_commands.Choice(name="Ranked Only", value="ranked"),
+    app_commands.Choice(name="Complete Reset", value="all")
+])
+async def resetleaderboard_slash(interaction: discord.Interaction, confirmation: str, reset_type: str = "all"):
+    # Check if command is used in an allowed channel
+    if not is_command_channel(interaction.channel):
+        await interaction.response.send_message(
+            f"{interaction.user.mention}, this command can only be used in the rank-a, rank-b, rank-c, global, or sixgents channels.",
+            ephemeral=True
+        )
+        return
+
+    # Check if user has admin permissions
+    if not has_admin_or_mod_permissions(interaction.user, interaction.guild):
+        await interaction.response.send_message(
+            "You need administrator permissions or the 6mod role to use this command.",
+            ephemeral=True)
+        return
+
+    if bot_core.RESET_IN_PROGRESS:
+        await interaction.response.send_message(
+            "❌ A reset is already in progress! Please wait for it to complete.",
+            ephemeral=True
+        )
+        return
+
+    # Check confirmation
+    if confirmation != "CONFIRM":
+        await interaction.response.send_message(
+            "❌ Leaderboard reset canceled. You must type 'CONFIRM' (all caps) to confirm this action.",
+            ephemeral=True
+        )
+        return
+
+    await set_reset_status(True, interaction)
+
+    # IMMEDIATE response to prevent timeout
+    await interaction.response.send_message(
+        f"🔄 Starting {reset_type} leaderboard reset... This will take several minutes. Please wait.",
+        ephemeral=True
+    )
+
+    # Run the actual reset in a background task to avoid interaction timeouts
+    asyncio.create_task(perform_reset_background_enhanced(interaction, reset_type))
+
+
+@app_commands.command(name="resetpreview", description="Preview a soft reset without changing anything (Admin only)")
+@app_commands.describe(reset_type="Type of soft reset to preview")
+@app_commands.choices(reset_type=[
+    app_commands.Choice(name="Ranked", value="ranked"),
+    app_commands.Choice(name="Global", value="global")
+])
+async def resetpreview_slash(interaction: discord.Interaction, reset_type: str = "ranked"):
+    # Check if command is used in an allowed channel
+    if not is_command_channel(interaction.channel):
+        await interaction.response.send_message(
+            f"{interaction.user.mention}, this command can only be used in the rank-a, rank-b, rank-c, global, or sixgents channels.",
+            ephemeral=True
+        )
+        return
+
+    # Check if user has admin permissions
+    if not has_admin_or_mod_permissions(interaction.user, interaction.guild):
+        await interaction.response.send_message(
+            "You need administrator permissions or the 6mod role to use this command.",
+            ephemeral=True)
+        return
+
+    await interaction.response.defer(ephemeral=True)
+
+    try:
+        # Column load + curve run off the event loop
+        preview = await asyncio.to_thread(
+            preview_soft_reset, system_coordinator.match_system.players, reset_type,
+            200 if reset_type == "ranked" else 100
+        )
+
+        embed = discord.Embed(
+            title=f"🔍 {reset_type.title()} Soft Reset Preview",
+            description=f"Dry run over **{preview['player_count']}** players - nothing has been changed.",
+            color=0x3498db
+        )
+
+        if preview["player_count"] == 0:
+            embed.add_field(name="No Players", value="There are no players to reset.", inline=False)
+            await interaction.followup.send(embed=embed, ephemeral=True)
+            return
+
+        # Before/after histogram
+        peak = max(max(before, after) for _, before, after in preview["histogram"])
+        rows = []
+        for bucket, before, after in preview["histogram"]:
+            bar = "█" * max(1 if after else 0, round(after / peak * 10))
+            rows.append(f"{bucket:>5} {before:>6} → {after:<6}{bar}")
+        embed.add_field(
+            name="📊 MMR Distribution (before → after)",
+            value="```\n" + "\n".join(rows[:20]) + "\n```",
+            inline=False
+        )
+
+        if preview["tiers"]:
+            tier_lines = []
+            for tier_name, counts in preview["tiers"].items():
+                shift = counts["after"] - counts["before"]
+                tier_lines.append(f"**{tier_name}:** {counts['before']} → {counts['after']} ({shift:+d})")
+            if preview["tier_changes"]:
+                for (old_tier, new_tier), count in preview["tier_changes"].items():
+                    tier_lines.append(f"{old_tier} → {new_tier}: {count} players")
+            else:
+                tier_lines.append("No players change tier")
+            embed.add_field(name="🏆 Tier Populations", value="\n".join(tier_lines), inline=False)
+
+        if preview["movers"]:
+            embed.add_field(
+                name="📉 Biggest Movers",
+                value="\n".join(f"{name}: {old} → {new} ({new - old:+d})" for name, old, new in preview["movers"]),
+                inline=False
+            )
+
+        embed.add_field(
+            name="📈 Average MMR",
+            value=f"{preview['mean_before']:.0f} → {preview['mean_after']:.0f}",
+            inline=True
+        )
+
+        embed.set_footer(text=f"Computed in {preview['elapsed_ms']:.0f}ms ({preview['engine']}) | "
+                              f"Run /resetleaderboard to apply")
+
+        await interaction.followup.send(embed=embed, ephemeral=True)
+
+    except Exception as e:
+        print(f"Error in reset preview: {e}")
+        await interaction.followup.send(f"❌ Error generating reset preview: {str(e)}", ephemeral=True)
+
+
+async def perform_reset_background_enhanced(interaction: discord.Interaction, reset_type: str):
+    """ENHANCED reset with ULTRA-SAFE rate limiting for Discord roles"""
+    try:
+        channel = interaction.channel
+        user = interaction.user
+        guild = interaction.guild
+
+        # Create backup collection name with timestamp
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        backup_collection_name = f"players_backup_{timestamp}"
+
+        # Create a backup of the current players collection server-side
+        players_collection = system_coordinator.match_system.players
+        player_count = backup_collection(players_collection, backup_collection_name)
+        backup_players = db.get_collection(backup_collection_name)
+
+        # Initialize counters
+        reset_count = 0
+        roles_removed_count = 0
+        role_removal_errors = []
+        matches_removed = 0
+
+        if reset_type == "global":
+            # Soft reset only global stats
+            await safe_send_message(channel, "🔄 (2/5) Performing global soft reset...")
+
+            # Whole curve runs inside MongoDB as one pipeline update
+            reset_count = apply_soft_reset(players_collection, "global")
+            print(f"Global soft reset applied to {reset_count} players")
+
+            # A few examples for the summary, computed from the backup
+            reset_summary = []
+            for player in backup_players.find({}, {"name": 1, "global_mmr": 1}).limit(5):
+                player_name = player.get("name", "Unknown")
+                old_global_mmr = player.get("global_mmr", 300)
+                new_global_mmr = calculate_soft_reset_mmr(old_global_mmr, "global")
+                reset_summary.append((player_name, old_global_mmr, new_global_mmr, old_global_mmr - new_global_mmr))
+
+            # Archive global matches instead of deleting them
+            matches_result = system_coordinator.match_system.matches.update_many(
+                {"is_global": True},
+                {"$set": {"status": "archived_global_reset"}}
+            )
+            matches_removed = matches_result.modified_count
+
+        elif reset_type == "ranked":
+            # Soft reset only ranked stats
+            await safe_send_message(channel, "🔄 (2/5) Performing ranked soft reset...")
+
+            # Whole curve runs inside MongoDB as one pipeline update
+            reset_count = apply_soft_reset(players_collection, "ranked")
+            print(f"Ranked soft reset applied to {reset_count} players")
+
+            # A few examples for the summary, computed from the backup
+            reset_summary = []
+            for player in backup_players.find({}, {"name": 1, "mmr": 1}).limit(5):
+                player_name = player.get("name", "Unknown")
+                old_mmr = player.get("mmr", 600)
+                new_mmr = calculate_soft_reset_mmr(old_mmr, "ranked")
+                reset_summary.append((player_name, old_mmr, new_mmr, old_mmr - new_mmr,
+                                      get_rank_from_mmr(old_mmr), get_rank_from_mmr(new_mmr)))
+
+            # Archive ranked matches instead of deleting them
+            matches_result = system_coordinator.match_system.matches.update_many(
+                {"is_global": {"$ne": True}},
+                {"$set": {"status": "archived_ranked_reset"}}
+            )
+            matches_removed = matches_result.modified_count
+
+        else:  # "all" - Complete reset including Discord roles
+            # Send initial progress message
+            await safe_send_message(channel, "🔄 Starting complete reset... (1/5) Creating backups")
+
+            # 1. Make backup of rank verification data
+            ranks_collection = db.get_collection('ranks')
+            backup_collection(ranks_collection, f"ranks_backup_{timestamp}")
+
+            # 2. ULTRA-SAFE DISCORD ROLE REMOVAL with extensive rate limiting protection
+            await safe_send_message(channel, "🔄 (2/5) Removing Discord roles... This may take 10+ minutes")
+
+            # Get rank roles
+            rank_role_names = ["Rank A", "Rank B", "Rank C"]
+            rank_roles = [discord.utils.get(guild.roles, name=name) for name in rank_role_names]
+            rank_roles = [role for role in rank_roles if role is not None]
+
+            if rank_roles:
+                try:
+                    # ENHANCED: Use the ULTRA-SAFE approach with extreme delays
+                    removal_result = await ultra_safe_bulk_role_removal(guild, rank_roles, channel)
+                    roles_removed_count = removal_result['success_count']
+                    role_removal_errors = removal_result['errors']
+
+                except Exception as role_error:
+                    print(f"Error in role removal: {role_error}")
+                    role_removal_errors.append(f"Role removal failed: {str(role_error)}")
+                    await safe_send_message(channel, f"⚠️ Role removal encountered errors: {str(role_error)}")
+
+            await safe_send_message(channel, "🔄 (3/5) Clearing player records...")
+
+            # 3. DELETE all player records
+            players_removed = system_coordinator.match_system.players.delete_many({}).deleted_count
+            reset_count = players_removed
+
+            await safe_send_message(channel, "🔄 (4/5) Clearing rank verifications...")
+
+            # 4. Delete all rank verification records
+            ranks_removed = ranks_collection.delete_many({}).deleted_count
+
+            await safe_send_message(channel, "🔄 (5/5) Clearing match history...")
+
+            # 5. Delete all matches
+            matches_result = system_coordinator.match_system.matches.delete_many({})
+            matches_removed = matches_result.deleted_count
+
+        # Record the reset in the resets collection
+        resets_collection = db.get_collection('resets')
+        resets_collection.insert_one({
+            "type": "leaderboard_reset",
+            "reset_type": reset_type,
+            "timestamp": datetime.datetime.utcnow(),
+            "admin_id": str(user.id),
+            "admin_name": user.display_name,
+            "backup_collection": backup_collection_name,
+            "roles_removed_count": roles_removed_count,
+            "role_removal_errors_count": len(role_removal_errors) if reset_type == "all" else 0
+        })
+
+        # Send completion message
+        embed = discord.Embed(
+            title="🔄 Leaderboard Reset Complete",
+            description=f"Reset type: **{reset_type.upper()}**",
+            color=0x00ff00  # Green for success
+        )
+
+        if reset_type == "all":
+            # Keep existing complete reset embed logic
+            embed.add_field(
+                name="Database Reset",
+                value=f"Players affected: {reset_count}/{player_count}\nMatches removed: {matches_removed}",
+                inline=False
+            )
+
+            embed.add_field(
+                name="Backup Created",
+                value=f"Collection: `{backup_collection_name}`",
+                inline=False
+            )
+
+            if reset_type == "all":
+                embed.add_field(
+                    name="Discord Role Removal",
+                    value=f"✅ Success: **{roles_removed_count}** members\n❌ Errors: **{len(role_removal_errors)}** members",
+                    inline=False
+                )
+
+                embed.add_field(
+                    name="Important",
+                    value="**All players must re-verify their ranks** before joining queues again.",
+                    inline=False
+                )
+
+        else:
+            # NEW: Soft reset embed
+            embed.add_field(
+                name="🎯 Soft Reset Applied",
+                value=f"Players reset: {reset_count}/{player_count}\nMatches archived: {matches_removed}",
+                inline=False
+            )
+
+            embed.add_field(
+                name="✅ What Was Reset",
+                value="• MMR (compressed toward tier benchmarks)\n• Current streaks → 0\n• Promotion protection removed",
+                inline=True
+            )
+
+            embed.add_field(
+                name="❌ What Was Preserved",
+                value="• Win/loss records\n• Match history\n• Longest streak records\n• Player accounts",
+                inline=True
+            )
+
+            # Show some example resets
+            if reset_summary and reset_count <= 10:
+                if reset_type == "ranked":
+                    examples = []
+                    for name, old, new, reduction, old_rank, new_rank in reset_summary[:5]:
+                        if old_rank == new_rank:
+                            examples.append(f"{name}: {old} → {new} [{new_rank}]")
+                        else:
+                            examples.append(f"{name}: {old} → {new} [{old_rank}→{new_rank}]")
+
+                    embed.add_field(
+                        name="📊 Example Resets",
+                        value="\n".join(examples) + (
+                            f"\n... and {reset_count - 5} more" if reset_count > 5 else ""),
+                        inline=False
+                    )
+                else:  # global
+                    examples = []
+                    for name, old, new, reduction in reset_summary[:5]:
+                        examples.append(f"{name}: {old} → {new} Global MMR")
+
+                    embed.add_field(
+                        name="📊 Example Resets",
+                        value="\n".join(examples) + (
+                            f"\n... and {reset_count - 5} more" if reset_count > 5 else ""),
+                        inline=False
+                    )
+
+            embed.add_field(
+                name="Backup Created",
+                value=f"Collection: `{backup_collection_name}`",
+                inline=False
+            )
+
+        embed.set_footer(
+            text=f"Reset by {user.display_name} | {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+
+        await safe_send_message(channel, embed=embed)
+
+        await set_reset_status(False, interaction)
+
+    except Exception as e:
+        print(f"Error in background reset: {e}")
+        import traceback
+        traceback.print_exc()
+
+        await set_reset_status(False, interaction)
+
+        error_embed = discord.Embed(
+            title="❌ Reset Error",
+            description=f"An error occurred during the reset: {str(e)}",
+            color=0xff0000
+        )
+        await safe_send_message(interaction.channel, embed=error_embed)
+
+
+async def ultra_safe_bulk_role_removal(guild, roles_to_remove, progress_channel=None):
+    """ULTRA-SAFE role removal with EXTREME rate limiting protection"""
+    print(f"🚀 Starting ULTRA-SAFE bulk role removal for {len(roles_to_remove)} roles")
+
+    # Find members with these roles
+    members_with_roles = []
+    for member in guild.members:
+        if member.bot:
+            continue
+        member_roles = [role for role in member.roles if role in roles_to_remove]
+        if member_roles:
+            members_with_roles.append((member, member_roles))
+
+    if not members_with_roles:
+        return {"success_count": 0, "errors": [], "message": "No members with roles found"}
+
+    print(f"Found {len(members_with_roles)} members with roles to remove")
+
+    success_count = 0
+    errors = []
+
+    # ENHANCED: Use the batch processing system for maximum safety
+    from rate_limiter import batch_role_operations_with_extreme_safety
+
+    # Convert to batch operations format
+    operations = []
+    for member, member_roles in members_with_roles:
+        operations.append({
+            'member': member,
+            'operation': 'remove',
+            'roles': member_roles,
+            'reason': 'Complete leaderboard reset'
+        })
+
+    # Progress callback
+    async def progress_callback(message):
+        if progress_channel:
+            try:
+                await rate_limiter.send_message_with_limit(
+                    progress_channel, f"🔄 Bulk Role Removal: {message}", max_retries=1
+                )
+            except:
+                pass  # Ignore progress message errors
+
+    print(f"🚀 Starting batch role removal with extreme safety...")
+
+    # Execute with extreme safety
+    results = await batch_role_operations_with_extreme_safety(
+        rate_limiter, operations, progress_callback
+    )
+
+    return {
+        "success_count": results['successful'],
+        "errors": results['errors'],
+        "message": f"Completed: {results['successful']} successful, {results['failed']} errors"
+    }
+
+
+async def remove_discord_role_rate_limited(member, *roles, reason=None):
+    """
+    Rate-limited role removal using the existing rate limiter
+    """
+    try:
+        # Use the rate limiter from your main.py
+        await rate_limiter.remove_role_with_limit(member, *roles, reason=reason)
+        return True
+    except Exception as e:
+        print(f"Error removing roles from {member.display_name}: {e}")
+        raise  # Re-raise to be caught by the calling code
+
+
+@app_commands.command(name="resetplayer", description="Reset all data for a specific player (Admin only)")
+@app_commands.describe(
+    member="The member whose data you want to reset",
+    confirmation="Type 'CONFIRM' to confirm the reset"
+)
+async def resetplayer_slash(interaction: discord.Interaction, member: discord.Member, confirmation: str):
+    # Check permissions and confirmation
+    if not is_command_channel(interaction.channel):
+        await interaction.response.send_message(
+            f"{interaction.user.mention}, this command can only be used in the rank-a, rank-b, rank-c, global, or sixgents channels.",
+            ephemeral=True
+        )
+        return
+
+    if not has_admin_or_mod_permissions(interaction.user, interaction.guild):
+        await interaction.response.send_message(
+            "You need administrator permissions or the 6mod role to use this command.",
+            ephemeral=True)
+        return
+
+    if confirmation != "CONFIRM":
+        await interaction.response.send_message(
+            "❌ Player reset canceled. You must type 'CONFIRM' (all caps) to confirm this action.",
+            ephemeral=True
+        )
+        return
+
+    # ENHANCED: Defer with longer timeout consideration
+    await interaction.response.defer()
+
+    # Add initial delay to prevent rapid successive commands
+    await asyncio.sleep(random.uniform(1.0, 3.0))
+
+    player_id = str(member.id)
+    player_name = member.display_name
+
+    # Check if player is currently in an active match
+    if player_id in system_coordinator.queue_manager.player_matches:
+        match_id = system_coordinator.queue_manager.player_matches[player_id]
+        await interaction.followup.send(
+            f"❌ Cannot reset {member.mention} - they are currently in an active match (ID: `{match_id}`). "
+            "Please wait for the match to complete or use `/removeactivematches` first.",
+            ephemeral=True
+        )
+        return
+
+    # Check if player is in any queue
+    player_in_queue = False
+    queue_channel = None
+    for channel_id, players in system_coordinator.queue_manager.channel_queues.items():
+        for p in players:
+            if p.get('id') == player_id:
+                player_in_queue = True
+                try:
+                    queue_channel = bot.get_channel(int(channel_id))
+                except:
+                    queue_channel = None
+                break
+        if player_in_queue:
+            break
+
+    if player_in_queue:
+        # Remove player from queue first
+        try:
+            result = system_coordinator.queue_manager.queue_collection.delete_one({
+                "id": player_id
+            })
+
+            # Update in-memory state
+            for channel_id, players in system_coordinator.queue_manager.channel_queues.items():
+                system_coordinator.queue_manager.channel_queues[channel_id] = [
+                    p for p in players if p.get('id') != player_id
+                ]
+
+            queue_info = f" (removed from queue in {queue_channel.mention if queue_channel else 'unknown channel'})"
+        except Exception as e:
+            queue_info = f" (warning: could not remove from queue - {str(e)})"
+    else:
+        queue_info = ""
+
+    # Initialize counters for what we're resetting
+    reset_summary = {
+        "player_data": False,
+        "rank_verification": False,
+        "discord_roles": False,
+        "queue_removal": player_in_queue,
+        "errors": []
+    }
+
+    try:
+        # Get current player data before deletion (for summary)
+        player_data = system_coordinator.match_system.players.find_one({"id": player_id})
+
+        current_stats = {}
+        if player_data:
+            current_stats = {
+                "ranked_mmr": player_data.get("mmr", 0),
+                "global_mmr": player_data.get("global_mmr", 300),
+                "ranked_matches": player_data.get("matches", 0),
+                "global_matches": player_data.get("global_matches", 0),
+                "ranked_wins": player_data.get("wins", 0),
+                "global_wins": player_data.get("global_wins", 0),
+                "ranked_losses": player_data.get("losses", 0),
+                "global_losses": player_data.get("global_losses", 0),
+                "current_streak": player_data.get("current_streak", 0),
+                "global_current_streak": player_data.get("global_current_streak", 0)
+            }
+
+        # Delete player data from players collection
+        try:
+            result = system_coordinator.match_system.players.delete_one({"id": player_id})
+            if result.deleted_count > 0:
+                reset_summary["player_data"] = True
+                bot_core.leaderboard_ranks.remove_player(player_id)
+                system_coordinator.match_system.note_players_written()
+                print(f"Deleted player data for {player_name} (ID: {player_id})")
+            else:
+                print(f"No player data found for {player_name} (ID: {player_id})")
+        except Exception as e:
+            reset_summary["errors"].append(f"Failed to delete player data: {str(e)}")
+
+        # Delete rank verification from ranks collection
+        try:
+            ranks_collection = db.get_collection('ranks')
+            result = ranks_collection.delete_one({"discord_id": player_id})
+            if result.deleted_count > 0:
+                reset_summary["rank_verification"] = True
+                print(f"Deleted rank verification for {player_name} (ID: {player_id})")
+            else:
+                print(f"No rank verification found for {player_name} (ID: {player_id})")
+        except Exception as e:
+            reset_summary["errors"].append(f"Failed to delete rank verification: {str(e)}")
+
+        # ENHANCED: Remove Discord rank roles with ULTRA-SAFE operations and better error handling
+        try:
+            # Get rank roles
+            rank_a_role = discord.utils.get(interaction.guild.roles, name="Rank A")
+            rank_b_role = discord.utils.get(interaction.guild.roles, name="Rank B")
+            rank_c_role = discord.utils.get(interaction.guild.roles, name="Rank C")
+            rank_roles = [role for role in [rank_a_role, rank_b_role, rank_c_role] if role]
+
+            # Check if member has any rank roles
+            member_rank_roles = [role for role in member.roles if role in rank_roles]
+
+            if member_rank_roles:
+                print(f"🔄 Removing {len(member_rank_roles)} rank roles from {player_name}")
+
+                # ENHANCED: Use safe role removal with comprehensive error handling
+                role_removal_success = False
+
+                try:
+                    # Add pre-operation delay
+                    await asyncio.sleep(random.uniform(2.0, 5.0))
+
+                    # Use safe role operation method
+                    success = await safe_role_operation(
+                        member, 'remove', *member_rank_roles,
+                        reason=f"Player reset by {interaction.user.display_name}"
+                    )
+
+                    if success:
+                        role_removal_success = True
+                        print(f"✅ Successfully removed {len(member_rank_roles)} rank role(s) from {player_name}")
+                    else:
+                        print(f"❌ Failed to remove roles from {player_name}")
+
+                except Exception as role_error:
+                    print(f"❌ Critical error removing roles from {player_name}: {role_error}")
+
+                reset_summary["discord_roles"] = role_removal_success
+
+            else:
+                print(f"ℹ️ No rank roles found for {player_name}")
+                reset_summary["discord_roles"] = True  # No roles to remove
+
+        except Exception as e:
+            reset_summary["discord_roles"] = False
+            reset_summary["errors"].append(f"Unexpected error removing roles: {str(e)}")
+
+        # Create response embed
+        embed = discord.Embed(
+            title=f"🔄 Player Reset Complete",
+            description=f"Reset data for {member.mention} ({member.display_name})",
+            color=0xff9900 if reset_summary["errors"] else 0x00ff00
+        )
+
+        # Add what was reset
+        reset_items = []
+        if reset_summary["player_data"]:
+            reset_items.append("✅ Player statistics and MMR data")
+        if reset_summary["rank_verification"]:
+            reset_items.append("✅ Rank verification record")
+        if reset_summary["discord_roles"]:
+            reset_items.append("✅ Discord rank roles")
+        else:
+            reset_items.append("⚠️ Discord roles (may need manual removal)")
+
+        embed.add_field(name="Data Reset", value="\n".join(reset_items), inline=False)
+
+        # Add errors if any
+        if reset_summary["errors"]:
+            error_text = "\n".join([f"❌ {error}" for error in reset_summary["errors"]])
+            embed.add_field(name="Issues Encountered", value=error_text, inline=False)
+
+        embed.set_footer(
+            text=f"Reset by {interaction.user.display_name} | {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        )
+
+        # Send response with enhanced safety
+        try:
+            await safe_send_followup(interaction, embed=embed)
+        except Exception as e:
+            print(f"Error sending reset completion message: {e}")
+            # Fallback simple message
+            try:
+                await interaction.followup.send(f"Player reset completed for {member.mention}", ephemeral=True)
+            except:
+                pass
+
+        # ENHANCED: Send DM to player with ultra-safe messaging
+        try:
+            dm_embed = discord.Embed(
+                title="Your 6 Mans Data Has Been Reset",
+                description="An administrator has reset your 6 Mans player data.",
+                color=0xffa500
+            )
+
+            dm_embed.add_field(
+                name="What This Means",
+                value=(
+                    "• All your match history and MMR have been cleared\n"
+                    "• Your rank verification has been removed\n"
+                    "• Your Discord rank role may have been removed"
+                ),
+                inline=False
+            )
+
+            dm_embed.add_field(
+                name="To Play Again",
+                value=(
+                    "1. Visit the rank verification page on our website\n"
+                    "2. Re-verify your Rocket League rank\n"
+                    "3. You'll get your Discord role and starting MMR back\n"
+                    "4. You can then join queues again"
+                ),
+                inline=False
+            )
+
+            dm_embed.set_footer(text="If you have questions, contact a server administrator")
+
+            # ENHANCED: Use rate limiter for DM with multiple fallbacks
+            dm_success = False
+
+            # Method 1: Rate limiter approach
+            if rate_limiter:
+                try:
+                    await asyncio.sleep(random.uniform(2.0, 5.0))  # Delay before DM
+                    await rate_limiter.send_message_with_limit(member, embed=dm_embed, max_retries=1)
+                    dm_success = True
+                    print(f"✅ DM sent to {player_name} via rate limiter")
+                except discord.Forbidden:
+                    print(f"⚠️ Cannot DM {player_name} - DMs disabled")
+                except Exception as e:
+                    print(f"⚠️ Rate limiter DM failed for {player_name}: {e}")
+
+            # Method 2: Manual approach with longer delay if rate limiter failed
+            if not dm_success:
+                try:
+                    await asyncio.sleep(random.uniform(5.0, 8.0))  # Longer delay for manual method
+                    await member.send(embed=dm_embed)
+                    dm_success = True
+                    print(f"✅ DM sent to {player_name} via manual method")
+                except discord.Forbidden:
+                    print(f"⚠️ Cannot DM {player_name} - DMs disabled")
+                except Exception as e:
+                    print(f"⚠️ Manual DM failed for {player_name}: {e}")
+
+            if not dm_success:
+                print(f"❌ Could not send DM to {player_name} via any method")
+
+        except Exception as dm_error:
+            print(f"❌ Critical error in DM handling for {player_name}: {str(dm_error)}")
+
+        print(f"✅ Player reset completed for {player_name} by {interaction.user.display_name}")
+
+        # FINAL: Add a delay at the end to prevent rapid successive commands
+        await asyncio.sleep(random.uniform(2.0, 5.0))
+
+    except Exception as e:
+        await interaction.followup.send(f"❌ Error resetting player: {str(e)}")
+        print(f"Error in resetplayer command: {e}")
+        import traceback
+        traceback.print_exc()
+
+
+@app_commands.command(name="clearreset", description="Clear stuck reset status (Emergency Admin only)")
+async def clearreset_slash(interaction: discord.Interaction):
+    # Check if command is used in an allowed channel
+    if not is_command_channel(interaction.channel):
+        await interaction.response.send_message(
+            f"{interaction.user.mention}, this command can only be used in the rank-a, rank-b, rank-c, global, or sixgents channels.",
+            ephemeral=True
+        )
+        return
+
+    # Check if user has admin permissions
+    if not has_admin_or_mod_permissions(interaction.user, interaction.guild):
+        await interaction.response.send_message(
+            "You need administrator permissions or the 6mod role to use this command.",
+            ephemeral=True
+        )
+        return
+
+
+    # Store previous state for logging
+    was_in_progress = bot_core.RESET_IN_PROGRESS
+
+    # Clear the reset state
+    bot_core.RESET_IN_PROGRESS = False
+    bot_core.RESET_START_TIME = None
+
+    embed = discord.Embed(
+        title="🔧 Reset Status Cleared",
+        description="Emergency reset status clearance completed.",
+        color=0x00ff00
+    )
+
+    embed.add_field(
+        name="Previous State",
+        value=f"Reset in progress: {'Yes' if was_in_progress else 'No'}",
+        inline=False
+    )
+
+    embed.add_field(
+        name="Current State",
+        value="Reset in progress: No",
+        inline=False
+    )
+
+    embed.add_field(
+        name="What This Does",
+        value="• Clears the stuck reset flag\n• Re-enables all reset commands\n• Re-enables queue commands\n• Allows normal bot operation",
+        inline=False
+    )
+
+    embed.add_field(
+        name="Next Steps",
+        value="• Test with `/status` command\n• Try reset commands again\n• Use `/debugserver` to check setup",
+        inline=False
+    )
+
+    embed.set_footer(text=f"Cleared by {interaction.user.display_name}")
+
+    await interaction.response.send_message(embed=embed)
+
+    # Log the action
+    print(f"🔧 RESET STATUS CLEARED by {interaction.user.display_name} (ID: {interaction.user.id})")
+    print(f"   Previous state: RESET_IN_PROGRESS = {was_in_progress}")
+    print(f"   New state: RESET_IN_PROGRESS = False")
+
+
+# Slash commands registered by this extension
+@cooldown(30, scope="guild")
+@app_commands.command(name="rebuildratings",
+                      description="Rebuild ratings by replaying match history - dry run unless applied (Admin only)")
+@app_commands.describe(
+    since_match="Replay from this match onwards (blank replays the whole history, or the season after a soft reset)",
+    apply="Write the rebuilt ratings (players are backed up first)"
+)
+async def rebuildratings_slash(interaction: discord.Interaction, since_match: str = None, apply: bool = False):
+    # Check if user has admin permissions
+    if not has_admin_or_mod_permissions(interaction.user, interaction.guild):
+        await interaction.response.send_message(
+            "You need administrator permissions or the 6mod role to use this command.",
+            ephemeral=True)
+        return
+
+    await interaction.response.defer(ephemeral=True)
+
+    since = None
+    if since_match:
+        match = await asyncio.to_thread(
+            system_coordinator.match_system.matches.find_one, {"match_id": since_match.strip()},
+            {"completed_at": 1, "status": 1}
+        )
+        if not match or not match.get("completed_at"):
+            await interaction.followup.send(f"❌ No completed match found with ID `{since_match}`.", ephemeral=True)
+            return
+        since = match["completed_at"]
+
+    engine = MatchReplayEngine(system_coordinator.match_system)
+
+    try:
+        if apply:
+            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            await asyncio.to_thread(backup_collection, system_coordinator.match_system.players,
+                                    f"players_backup_{timestamp}")
+            # Queues stay closed and reported matches wait while the rebuilt ratings are written
+            await set_reset_status(True)
+            try:
+                await report_pipeline.pause()
+                try:
+                    summary = await asyncio.to_thread(engine.rebuild, since, False, True, 10)
+                finally:
+                    report_pipeline.resume()
+            finally:
+                await set_reset_status(False)
+        else:
+            summary = await asyncio.to_thread(engine.rebuild, since, True, True, 10)
+    except Exception as e:
+        print(f"Error rebuilding ratings: {e}")
+        await interaction.followup.send(f"❌ Error rebuilding ratings: {str(e)}", ephemeral=True)
+        return
+
+    if since_match:
+        scope = f"from match `{since_match}`"
+    elif summary["season_start"]:
+        scope = f"since the season reset on {summary['season_start'].strftime('%Y-%m-%d')}"
+    else:
+        scope = "over the whole match history"
+    embed = discord.Embed(
+        title="🔄 Ratings Rebuilt" if apply else "🔍 Rating Rebuild Preview",
+        description=f"Replayed **{summary['matches_replayed']}** matches {scope} for "
+                    f"**{summary['players_replayed']}** players in {summary['duration_seconds']:.2f}s."
+                    + ("" if apply else "\nDry run - nothing has been changed."),
+        color=0x00ff00 if apply else 0x3498db
+    )
+    embed.add_field(name="Players Changed", value=str(summary["players_changed"]), inline=True)
+    embed.add_field(name="Matches With New Deltas", value=str(summary["matches_changed"]), inline=True)
+
+    if summary["players"]:
+        lines = []
+        for row in summary["players"]:
+            parts = []
+            for field, label in (("mmr", "MMR"), ("global_mmr", "Global")):
+                if field in row["changes"]:
+                    old, new = row["changes"][field]
+                    parts.append(f"{label} {old if old is not None else '-'} → {new}")
+            other = [field for field in row["changes"] if field not in ("mmr", "global_mmr")]
+            if other:
+                parts.append(", ".join(other))
+            lines.append(f"**{row['name']}**: {'; '.join(parts)}")
+        value = "\n".join(lines)
+        embed.add_field(name="📊 Biggest Changes",
+                        value=value[:1020] + "..." if len(value) > 1024 else value, inline=False)
+    else:
+        embed.add_field(name="📊 Biggest Changes", value="Stored ratings already match the match history",
+                        inline=False)
+
+    if apply:
+        embed.set_footer(text=f"{summary['players_written']} players and {summary['matches_written']} "
+                              f"matches written | Players backed up first")
+    else:
+        embed.set_footer(text="Run again with apply:True to write these ratings")
+
+    await interaction.followup.send(embed=embed, ephemeral=True)
+
+
+COMMANDS = [
+    resetleaderboard_slash,
+    resetpreview_slash,
+    resetplayer_slash,
+    clearreset_slash,
+    rebuildratings_slash,
+]
+
+
+async def setup(bot):
+    add_extension_commands(bot, COMMANDS)
+
+
+async def teardown(bot):
+    remove_extension_commands(bot, COMMANDS)
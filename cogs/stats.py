@@ -0,0 +1,1321 @@
+"""
+Stats commands - rank cards, leaderboard link, streaks and help
+"""
+import discord
+from discord import app_commands
+import datetime
+import os
+import asyncio
+import bot_core
+from leaderboard_ranks import format_position
+from tiers import RANKED_FILTER, TIER_FLOOR, TIER_STARTING_MMR, tier_for_mmr
+from bot_core import (
+    add_extension_commands,
+    bot,
+    db,
+    has_admin_or_mod_permissions,
+    is_command_channel,
+    rate_limiter,
+    remove_extension_commands,
+    system_coordinator
+)
+
+
+@app_commands.command(name="leaderboard", description="Shows a link to the leaderboard website")
+async def leaderboard_slash(interaction: discord.Interaction):
+    # Check if command is used in an allowed channel
+    if not is_command_channel(interaction.channel):
+        await interaction.response.send_message(
+            f"{interaction.user.mention}, this command can only be used in the rank-a, rank-b, rank-c, global, or sixgents channels.",
+            ephemeral=True
+        )
+        return
+
+    # Replace this URL with your actual leaderboard website URL from Render
+    leaderboard_url = os.environ.get('PUBLIC_URL', '')
+
+    embed = discord.Embed(
+        title="🏆 Rocket League 6 Mans Leaderboard 🏆",
+        description="View the complete leaderboard with player rankings, MMR, and stats!",
+        color=0x00aaff,
+        url=leaderboard_url  # This makes the title clickable
+    )
+
+    embed.add_field(
+        name="Click to View Leaderboard",
+        value=f"[View Full Leaderboard]({leaderboard_url})",
+        inline=False
+    )
+
+    embed.add_field(
+        name="Features",
+        value="• Player rankings\n• MMR tracking\n• Win/Loss records\n• Win percentages",
+        inline=False
+    )
+
+    embed.set_footer(text="Updated after each match")
+
+    await interaction.response.send_message(embed=embed)
+
+
+@app_commands.command(name="rank", description="Check your rank and stats (or another member's)", extras={"defer_budget": 0})
+@app_commands.describe(member="The member whose rank you want to check (optional)")
+async def rank_slash_enhanced(interaction: discord.Interaction, member: discord.Member = None):
+    if bot_core.RESET_IN_PROGRESS:
+        duration = ""
+        if bot_core.RESET_START_TIME:
+            elapsed = datetime.datetime.now() - bot_core.RESET_START_TIME
+            duration = f" (Running for {elapsed.seconds // 60}m {elapsed.seconds % 60}s)"
+
+        embed = discord.Embed(
+            title="⛔ Rank Stats Unavailable",
+            description=f"A leaderboard reset is currently in progress{duration}",
+            color=0xff9900
+        )
+        embed.add_field(
+            name="Please Wait",
+            value="• Reset operations are running\n• Player stats are being updated\n• Rank information will be available after reset",
+            inline=False
+        )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+        return
+
+    # Check if command is used in an allowed channel
+    if not is_command_channel(interaction.channel):
+        await interaction.response.send_message(
+            f"{interaction.user.mention}, this command can only be used in the rank-a, rank-b, rank-c, global, or sixgents channels.",
+            ephemeral=True
+        )
+        return
+
+    # ENHANCED: Defer response as this might involve fetching member data
+    await interaction.response.defer()
+
+    if member is None:
+        member = interaction.user
+
+    player_id = str(member.id)
+
+    # Get player data
+    player_data = system_coordinator.match_system.players.find_one({"id": player_id})
+
+    # Check if this is the user checking their own rank
+    is_self_check = member.id == interaction.user.id
+
+    # If no player data exists, check for rank verification
+    if not player_data:
+        # Check if player has a rank verification or role
+        rank_record = db.get_collection('ranks').find_one({"discord_id": player_id})
+
+        # ENHANCED: Get rank roles with rate limiting protection
+        try:
+            if rate_limiter:
+                # Use rate limiter to get member data if needed
+                await asyncio.sleep(0.1)  # Small delay to prevent rapid fetches
+
+            rank_a_role = discord.utils.get(interaction.guild.roles, name="Rank A")
+            rank_b_role = discord.utils.get(interaction.guild.roles, name="Rank B")
+            rank_c_role = discord.utils.get(interaction.guild.roles, name="Rank C")
+        except Exception as e:
+            print(f"Error getting rank roles for /rank command: {e}")
+            rank_a_role = rank_b_role = rank_c_role = None
+
+        # Determine tier and MMR based on roles if no rank record exists
+        if not rank_record:
+            if rank_a_role in member.roles:
+                tier = "Rank A"
+                mmr = TIER_STARTING_MMR[tier]
+            elif rank_b_role in member.roles:
+                tier = "Rank B"
+                mmr = TIER_STARTING_MMR[tier]
+            elif rank_c_role in member.roles:
+                tier = "Rank C"
+                mmr = TIER_STARTING_MMR[tier]
+            else:
+                # No role or verification found
+                if is_self_check:
+                    embed = discord.Embed(
+                        title="Rank Verification Required",
+                        description="You need to verify your Rocket League rank to see your stats.",
+                        color=0xf1c40f
+                    )
+                    embed.add_field(
+                        name="How to Verify",
+                        value="Visit the rank check page on the website to complete verification.",
+                        inline=False
+                    )
+                    embed.add_field(
+                        name="What You Get",
+                        value="• Your starting MMR based on your Rocket League rank\n• Access to all queues\n• Stat tracking\n• Leaderboard placement",
+                        inline=False
+                    )
+                    # FIX: Use followup instead of response
+                    await interaction.followup.send(embed=embed, ephemeral=True)
+                else:
+                    embed = discord.Embed(
+                        title="No Rank Data",
+                        description=f"{member.mention} hasn't verified their rank yet.",
+                        color=0x95a5a6
+                    )
+                    # FIX: Use followup instead of response
+                    await interaction.followup.send(embed=embed, ephemeral=True)
+                return
+        else:
+            # Use data from rank record
+            tier = rank_record.get("tier", "Rank C")
+            mmr = rank_record.get("mmr", 600)
+
+        # Create a temporary player_data object for display with ALL streak fields
+        player_data = {
+            "name": member.display_name,
+            "mmr": mmr,
+            "wins": 0,
+            "losses": 0,
+            "matches": 0,
+            "tier": tier,
+            "is_new": True,
+            "global_mmr": 300,
+            "global_wins": 0,
+            "global_losses": 0,
+            "global_matches": 0,
+            "current_streak": 0,
+            "longest_win_streak": 0,
+            "longest_loss_streak": 0,
+            "global_current_streak": 0,
+            "global_longest_win_streak": 0,
+            "global_longest_loss_streak": 0,
+            "last_promotion": None
+        }
+
+    # Calculate stats - add global stats
+    mmr = player_data.get("mmr", 0)
+    global_mmr = player_data.get("global_mmr", 300)
+    wins = player_data.get("wins", 0)
+    global_wins = player_data.get("global_wins", 0)
+    losses = player_data.get("losses", 0)
+    global_losses = player_data.get("global_losses", 0)
+    matches = player_data.get("matches", 0)
+    global_matches = player_data.get("global_matches", 0)
+    is_new = player_data.get("is_new", False)
+
+    # Get ALL streak information
+    current_streak = player_data.get("current_streak", 0)
+    longest_win_streak = player_data.get("longest_win_streak", 0)
+    longest_loss_streak = player_data.get("longest_loss_streak", 0)
+    global_current_streak = player_data.get("global_current_streak", 0)
+    global_longest_win_streak = player_data.get("global_longest_win_streak", 0)
+    global_longest_loss_streak = player_data.get("global_longest_loss_streak", 0)
+
+    # Get rank protection information
+    last_promotion = player_data.get("last_promotion")
+    has_promotion_protection = False
+    games_since_promotion = 0
+
+    if last_promotion and not is_new:
+        current_matches = player_data.get("matches", 0)
+        matches_at_promotion = last_promotion.get("matches_at_promotion", 0)
+        games_since_promotion = current_matches - matches_at_promotion
+        has_promotion_protection = games_since_promotion < 3
+
+    # Calculate win rates
+    win_rate = 0
+    if matches > 0:
+        win_rate = (wins / matches) * 100
+
+    global_win_rate = 0
+    if global_matches > 0:
+        global_win_rate = (global_wins / global_matches) * 100
+
+    # Leaderboard positions come from the in-memory index (a reload, if due, runs off the loop)
+    positions = {}
+    if matches > 0 or global_matches > 0:
+        try:
+            positions = await asyncio.to_thread(bot_core.leaderboard_ranks.positions, player_id)
+        except Exception as e:
+            print(f"Error getting leaderboard positions for {player_id}: {e}")
+
+    # Create embed
+    embed = discord.Embed(
+        title=f"Stats for {member.display_name}",
+        color=member.color
+    )
+
+    # Determine player tier based on MMR
+    tier = tier_for_mmr(mmr)
+
+    tier_color = 0x12b51a  # Default color for Rank C (green)
+    if tier == "Rank A":
+        tier_color = 0xC41E3A  # Red color for Rank A
+    elif tier == "Rank B":
+        tier_color = 0x1E90FF  # Blue color for Rank B
+
+    embed.color = tier_color
+
+    # Add ranked section
+    embed.add_field(name="__Ranked Stats__", value="", inline=False)
+
+    # Enhanced rank display with protection status
+    rank_display = tier
+    if has_promotion_protection:
+        rank_display += f" 🛡️ (Protected: {3 - games_since_promotion} games left)"
+    elif last_promotion and games_since_promotion < 10:
+        rank_display += f" ⭐ (Promoted {games_since_promotion} games ago)"
+
+    embed.add_field(name="Rank", value=rank_display, inline=True)
+
+    if matches > 0:
+        leaderboard_display = format_position(positions.get("ranked"))
+        tier_position = positions.get(tier.lower().replace(" ", "-"))
+        if tier_position:
+            leaderboard_display += f"\n#{tier_position['rank']} of {tier_position['total']} in {tier}"
+        embed.add_field(name="Leaderboard", value=leaderboard_display, inline=True)
+    else:
+        embed.add_field(name="Leaderboard", value="Unranked (0 games)", inline=True)
+
+    embed.add_field(name="MMR", value=str(mmr), inline=True)
+    embed.add_field(name="Win Rate", value=f"{win_rate:.1f}%" if matches > 0 else "N/A", inline=True)
+    embed.add_field(name="Record", value=f"{wins}W - {losses}L", inline=True)
+    embed.add_field(name="Matches", value=str(matches), inline=True)
+
+    # Add ranked streak information
+    if current_streak != 0:
+        streak_display = ""
+        if current_streak > 0:
+            if current_streak >= 3:
+                streak_display = f"🔥 {current_streak} Win Streak"
+            else:
+                streak_display = f"{current_streak} Win Streak"
+        else:
+            if current_streak <= -3:
+                streak_display = f"❄️ {abs(current_streak)} Loss Streak"
+            else:
+                streak_display = f"{abs(current_streak)} Loss Streak"
+
+        embed.add_field(name="Current Streak", value=streak_display, inline=True)
+
+    # Add global section
+    embed.add_field(name="__Global Stats__", value="", inline=False)
+
+    if global_matches > 0:
+        embed.add_field(name="Global Rank", value=format_position(positions.get("global")), inline=True)
+    else:
+        embed.add_field(name="Global Rank", value="Unranked (0 games)", inline=True)
+
+    embed.add_field(name="Global MMR", value=str(global_mmr), inline=True)
+    embed.add_field(name="Win Rate", value=f"{global_win_rate:.1f}%" if global_matches > 0 else "N/A", inline=True)
+    embed.add_field(name="Record", value=f"{global_wins}W - {global_losses}L", inline=True)
+    embed.add_field(name="Matches", value=str(global_matches), inline=True)
+
+    # Add global streak information
+    if global_current_streak != 0:
+        global_streak_display = ""
+        if global_current_streak > 0:
+            if global_current_streak >= 3:
+                global_streak_display = f"🔥 {global_current_streak} Win Streak"
+            else:
+                global_streak_display = f"{global_current_streak} Win Streak"
+        else:
+            if global_current_streak <= -3:
+                global_streak_display = f"❄️ {abs(global_current_streak)} Loss Streak"
+            else:
+                global_streak_display = f"{abs(global_current_streak)} Loss Streak"
+
+        embed.add_field(name="Global Streak", value=global_streak_display, inline=True)
+
+    # Enhanced MMR System section
+    if not is_new and matches > 0:
+        embed.add_field(name="__🎯 Enhanced MMR System__", value="", inline=False)
+
+        system_info = []
+
+        # Streak bonuses
+        if abs(current_streak) >= 2 or abs(global_current_streak) >= 2:
+            system_info.append("🔥 **Active Streak Bonuses**: 2x multiplier at 3+ streak")
+
+        # Momentum system
+        if matches >= 10:
+            system_info.append("⚡ **Momentum Tracking**: Recent performance affects MMR")
+
+        # Rank protection
+        if has_promotion_protection:
+            system_info.append(f"🛡️ **Promotion Protection**: {3 - games_since_promotion} games of 50% loss reduction")
+        elif mmr >= TIER_FLOOR["Rank B"]:  # Check for demotion protection
+            if mmr < TIER_FLOOR["Rank B"] + 50:  # Close to Rank B/C boundary
+                system_info.append("🛡️ **Demotion Protection**: Reduced losses near rank boundary")
+            elif TIER_FLOOR["Rank A"] <= mmr < TIER_FLOOR["Rank A"] + 50:  # Close to Rank A/B boundary
+                system_info.append("🛡️ **Demotion Protection**: Reduced losses near rank boundary")
+        elif TIER_FLOOR["Rank B"] - 50 <= mmr < TIER_FLOOR["Rank B"]:  # Close to promotion to Rank B
+            system_info.append("🚀 **Promotion Assistance**: Bonus MMR gains near rank up")
+        elif TIER_FLOOR["Rank A"] - 50 <= mmr < TIER_FLOOR["Rank A"]:  # Close to promotion to Rank A
+            system_info.append("🚀 **Promotion Assistance**: Bonus MMR gains near rank up")
+
+        if system_info:
+            embed.add_field(name="Active Bonuses", value="\n".join(system_info), inline=False)
+        else:
+            embed.add_field(name="Available Features",
+                            value="• 2x streak multipliers (3+ wins/losses)\n• Momentum bonuses (10+ games)\n• Rank boundary protection",
+                            inline=False)
+
+    # Add note for new players
+    if is_new:
+        embed.set_footer(
+            text="⭐ New player - this is your starting MMR based on rank verification. Play matches to earn your spot on the leaderboard!")
+    else:
+        # Add comprehensive streak info in footer
+        footer_info = []
+        if longest_win_streak >= 3:
+            footer_info.append(f"Best ranked streak: {longest_win_streak} wins")
+        if abs(longest_loss_streak) >= 3:
+            footer_info.append(f"Worst ranked streak: {abs(longest_loss_streak)} losses")
+        if global_longest_win_streak >= 3:
+            footer_info.append(f"Best global streak: {global_longest_win_streak} wins")
+        if abs(global_longest_loss_streak) >= 3:
+            footer_info.append(f"Worst global streak: {abs(global_longest_loss_streak)} losses")
+
+        if footer_info:
+            embed.set_footer(text=" | ".join(footer_info))
+        else:
+            embed.set_footer(text="Enhanced MMR system with streak bonuses, momentum tracking, and rank protection")
+
+    embed.set_thumbnail(url=member.avatar.url if member.avatar else member.default_avatar.url)
+
+    # FIX: Use followup instead of response since we already deferred
+    await interaction.followup.send(embed=embed)
+
+    # Add final delay to prevent rapid successive /rank commands
+    await asyncio.sleep(0.5)
+
+@app_commands.command(name="help", description="Shows command information")
+@app_commands.describe(command_name="Get details about a specific command")
+async def help_slash(interaction: discord.Interaction, command_name: str = None):
+    # Check if command is used in an allowed channel
+    if not is_command_channel(interaction.channel):
+        await interaction.response.send_message(
+            f"{interaction.user.mention}, this command can only be used in the rank-a, rank-b, rank-c, global, or sixgents channels.",
+            ephemeral=True
+        )
+        return
+
+    # If a specific command is requested, show details for that command
+    if command_name:
+        # Look for the command in the slash commands
+        for cmd in bot.tree.get_commands():
+            if cmd.name == command_name:
+                embed = discord.Embed(
+                    title=f"Command: /{cmd.name}",
+                    description=cmd.description or "No description available",
+                    color=0x00ff00
+                )
+
+                # Add parameter info if available
+                if hasattr(cmd, 'parameters') and cmd.parameters:
+                    params_str = "\n".join([f"**{p.name}**: {p.description}" for p in cmd.parameters])
+                    embed.add_field(name="Parameters", value=params_str, inline=False)
+
+                await interaction.response.send_message(embed=embed)
+                return
+
+        await interaction.response.send_message(f"Command `{command_name}` not found.", ephemeral=True)
+        return
+
+    # Create an embed for the command list
+    embed = discord.Embed(
+        title="🚀 Rocket League 6 Mans Bot Commands",
+        description="Your complete guide to 6 Mans commands. Use `/help <command>` for detailed information on any specific command.",
+        color=0x00ff00
+    )
+
+    # Define commands and descriptions with updated activematches command
+    commands_dict = {
+        # Queue Commands
+        'queue': 'Join the queue for 6 mans matches in your current channel',
+        'leave': 'Leave the current queue if you\'re in one',
+        'status': 'View current queue status, players waiting, and active matches',
+
+        # Match Commands
+        'report': 'Report your match results (win/loss) using your match ID',
+        'leaderboard': 'View a link to the full leaderboard website with rankings and stats',
+        'rank': 'Check your personal stats, MMR, and rank (or view another player\'s)',
+        'streak': 'View your current win/loss streak and streak history',
+
+        # Admin/Mod Queue Management
+        'addplayer': 'Add a specific player to the current queue (Admin/Mod only)',
+        'removeplayer': 'Remove a specific player or clear the entire queue (Admin/Mod only)',
+
+        # Admin/Mod Match Management
+        'adminreport': 'Force report match results by specifying the winning team (Admin/Mod only)',
+        'sub': 'Substitute or swap players in an active match (Admin/Mod only)',
+        'forcestart': 'Force start a match with dummy players if needed (Admin/Mod only)',
+        'activematches': 'Interactive management of active matches - stop, report, or view details (Admin/Mod only)',
+        'removematch': 'Remove/reverse the results of a completed match (Admin/Mod only)',
+
+        # Admin/Mod Player Management
+        'adjustmmr': 'Manually adjust a player\'s MMR (ranked or global) (Admin/Mod only)',
+        'resetplayer': 'Completely reset all data for a specific player (Admin/Mod only)',
+        'resetstreak': 'Reset a player\'s current streak or all streak records (Admin/Mod only)',
+
+        # Admin/Mod System Management
+        'resetleaderboard': 'Reset leaderboard data (global, ranked, or complete reset) (Admin/Mod only)',
+        'resetpreview': 'Dry-run a ranked or global soft reset and see the new distribution (Admin/Mod only)',
+        'rebuildratings': 'Replay match history to rebuild ratings after corrections, dry run by default (Admin/Mod only)',
+        'topstreaks': 'View leaderboards for highest win/loss streaks (Admin/Mod only)',
+        'streakstats': 'View server-wide streak statistics and analytics (Admin/Mod only)',
+        'checkpending': 'Check pending role updates waiting for the reconciler (Admin/Mod only)',
+        'forceprocess': 'Force process a player\'s role update immediately (Admin/Mod only)',
+        'synccommands': 'Force a slash command sync when commands look out of date (Admin/Mod only)',
+        'reloadext': 'Reload a command module without restarting the bot (Admin/Mod only)',
+        'perf': 'Event loop lag and blocking calls (/perf loop), the match report pipeline (/perf reports) and runtime log levels (/perf logs) (Admin/Mod only)',
+        'perfstats': 'Slash command latency percentiles, histograms and DB/Discord/sleep breakdowns (Admin/Mod only)',
+
+        # Debug Commands (Admin/Mod only)
+        'debugmmr': 'Debug MMR storage issues for a specific match (Admin/Mod only)',
+        'testmmr': 'Test MMR calculation manually for a match (Admin/Mod only)',
+
+        # Utility
+        'help': 'Display this help menu or get details about specific commands'
+    }
+
+    # Group commands by category
+    queue_commands = ['queue', 'leave', 'status']
+    match_commands = ['report', 'leaderboard', 'rank', 'streak']
+    queue_admin_commands = ['addplayer', 'removeplayer']
+    match_admin_commands = ['adminreport', 'sub', 'forcestart', 'activematches', 'removematch']  # Updated here
+    player_admin_commands = ['adjustmmr', 'resetplayer', 'resetstreak']
+    system_admin_commands = ['resetleaderboard', 'resetpreview', 'rebuildratings', 'topstreaks', 'streakstats', 'checkpending', 'forceprocess', 'synccommands', 'reloadext', 'perf', 'perfstats']
+    debug_commands = ['debugmmr', 'testmmr']
+    utility_commands = ['help']
+
+    # Add command fields grouped by category with improved formatting
+    embed.add_field(
+        name="📋 Queue Management",
+        value="\n".join([f"`/{cmd}` - {commands_dict[cmd]}" for cmd in queue_commands]),
+        inline=False
+    )
+
+    embed.add_field(
+        name="🎮 Match & Player Commands",
+        value="\n".join([f"`/{cmd}` - {commands_dict[cmd]}" for cmd in match_commands]),
+        inline=False
+    )
+
+    embed.add_field(
+        name="👥 Admin: Queue Management",
+        value="\n".join([f"`/{cmd}` - {commands_dict[cmd]}" for cmd in queue_admin_commands]),
+        inline=False
+    )
+
+    embed.add_field(
+        name="⚔️ Admin: Match Management",
+        value="\n".join([f"`/{cmd}` - {commands_dict[cmd]}" for cmd in match_admin_commands]),
+        inline=False
+    )
+
+    embed.add_field(
+        name="🎯 Admin: Player Management",
+        value="\n".join([f"`/{cmd}` - {commands_dict[cmd]}" for cmd in player_admin_commands]),
+        inline=False
+    )
+
+    embed.add_field(
+        name="🔧 Admin: System Management",
+        value="\n".join([f"`/{cmd}` - {commands_dict[cmd]}" for cmd in system_admin_commands]),
+        inline=False
+    )
+
+    embed.add_field(
+        name="🐛 Admin: Debug Tools",
+        value="\n".join([f"`/{cmd}` - {commands_dict[cmd]}" for cmd in debug_commands]),
+        inline=False
+    )
+
+    embed.add_field(
+        name="🛠️ Utility Commands",
+        value="\n".join([f"`/{cmd}` - {commands_dict[cmd]}" for cmd in utility_commands]),
+        inline=False
+    )
+
+    # Add "How 6 Mans Works" section with improved formatting
+    embed.add_field(
+        name="📖 How 6 Mans Works:",
+        value=(
+            "**1.** Use `/queue` in a rank channel (rank-a, rank-b, rank-c, or global)\n"
+            "**2.** When 6 players join, automated team voting begins\n"
+            "**3.** Vote for team setup: ⚖️ Balanced, 🎲 Random, or 👑 Captains\n"
+            "**4.** Teams are finalized based on community votes\n"
+            "**5.** Play your match and report results with `/report <match_id> win/loss`\n"
+            "**6.** Check updated rankings with `/leaderboard` or personal stats with `/rank`\n"
+            "**7.** Track your performance streaks with `/streak`"
+        ),
+        inline=False
+    )
+
+    # Enhanced streak system section
+    embed.add_field(
+        name="🔥 Advanced Streak System:",
+        value=(
+            "**Enhanced Streak Tracking**\n"
+            "• **Win Streaks (3+)**: Bonus MMR with 🔥 indicator\n"
+            "• **Loss Streaks (3+)**: MMR penalties with ❄️ indicator\n"
+            "• **Streak Multipliers**: Up to 2x MMR impact (100% bonus at long streaks)\n"
+            "• **Dual Tracking**: Separate streaks for ranked and global matches\n"
+            "• **Live Monitoring**: Use `/streak` to check current status\n"
+            "• **Admin Analytics**: `/topstreaks` and `/streakstats` for insights"
+        ),
+        inline=False
+    )
+
+    # Enhanced MMR system section
+    embed.add_field(
+        name="⚡ Enhanced MMR System:",
+        value=(
+            "**Dynamic MMR Changes**: Based on team balance, streaks, and experience\n"
+            "**Placement Period**: First 15 games have higher MMR changes\n"
+            "**Momentum Tracking**: Recent performance affects MMR gains/losses\n"
+            "**Rank Protection**: Promotion protection (3 games) + demotion buffers\n"
+            "**Promotion Assistance**: Bonus MMR gains near rank boundaries\n"
+            "**Global vs Ranked**: Separate MMR systems with different starting values"
+        ),
+        inline=False
+    )
+
+    # Updated admin tools section with new activematches command
+    embed.add_field(
+        name="👑 Admin/Moderator Tools:",
+        value=(
+            "**Queue Control**: Add/remove players, force start matches\n"
+            "**Match Management**: Interactive match control with `/activematches` - stop, report, or view any active match\n"
+            "**Player Management**: Adjust MMR, reset player data, manage streaks\n"
+            "**System Control**: Reset leaderboards, view analytics, debug tools\n"
+            "**Role Management**: Check pending updates, force process roles\n"
+            "**Requires**: Administrator permissions or '6mod' role"
+        ),
+        inline=False
+    )
+
+    # Add rank system explanation
+    embed.add_field(
+        name="🏆 Dual MMR System:",
+        value=(
+            "**Ranked Queues**:\n"
+            f"• **Rank A** ({TIER_FLOOR['Rank A']}+ MMR) - Expert players\n"
+            f"• **Rank B** ({TIER_FLOOR['Rank B']}-{TIER_FLOOR['Rank A'] - 1} MMR) - Intermediate players\n"
+            f"• **Rank C** (600-{TIER_FLOOR['Rank B'] - 1} MMR) - Developing players\n\n"
+            "**Global Queue**: Mixed ranks, separate MMR system (300+ MMR)\n"
+            "*Players must verify their Rocket League rank before joining*"
+        ),
+        inline=False
+    )
+
+    # Add role update system explanation
+    embed.add_field(
+        name="🕒 Role Update System:",
+        value=(
+            "**Automated Processing**: Discord roles sync continuously within minutes of a match\n"
+            "**Immediate Notifications**: One combined rank change message per match\n"
+            "**Paced Processing**: Updates drip out at the rate limit budget to avoid 429s\n"
+            "**Admin Override**: Use `/forceprocess` for immediate role updates\n"
+            "**Status Checking**: Use `/checkpending` to see queued updates"
+        ),
+        inline=False
+    )
+
+    # Enhanced footer with command count
+    total_commands = len(commands_dict)
+    admin_commands = len(queue_admin_commands + match_admin_commands + player_admin_commands +
+                        system_admin_commands + debug_commands)
+    user_commands = total_commands - admin_commands
+
+    embed.set_footer(
+        text=f"💡 {total_commands} total commands • {user_commands} user commands • {admin_commands} admin commands • Use /help <command> for details"
+    )
+
+    await interaction.response.send_message(embed=embed)
+
+@app_commands.command(name="streak", description="Check your current streak or another player's streak", extras={"defer_budget": 0})
+@app_commands.describe(member="The member whose streak you want to check (optional)")
+async def streak_slash(interaction: discord.Interaction, member: discord.Member = None):
+    if bot_core.RESET_IN_PROGRESS:
+        duration = ""
+        if bot_core.RESET_START_TIME:
+            elapsed = datetime.datetime.now() - bot_core.RESET_START_TIME
+            duration = f" (Running for {elapsed.seconds // 60}m {elapsed.seconds % 60}s)"
+
+        embed = discord.Embed(
+            title="⛔ Streak Stats Unavailable",
+            description=f"A leaderboard reset is currently in progress{duration}",
+            color=0xff9900
+        )
+        embed.add_field(
+            name="Please Wait",
+            value="• Reset operations are running\n• Streak data is being updated\n• Streak information will be available after reset",
+            inline=False
+        )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+        return
+
+    # Check if command is used in an allowed channel
+    if not is_command_channel(interaction.channel):
+        await interaction.response.send_message(
+            f"{interaction.user.mention}, this command can only be used in the rank-a, rank-b, rank-c, global, or sixgents channels.",
+            ephemeral=True
+        )
+        return
+
+    if member is None:
+        member = interaction.user
+
+    player_id = str(member.id)
+    player_data = system_coordinator.match_system.players.find_one({"id": player_id})
+
+    if not player_data:
+        await interaction.response.send_message(
+            f"{member.mention} hasn't played any matches yet. No streak information available.",
+            ephemeral=True
+        )
+        return
+
+    # Extract streak information
+    # Ranked Streaks
+    current_streak = player_data.get("current_streak", 0)
+    longest_win_streak = player_data.get("longest_win_streak", 0)
+    longest_loss_streak = player_data.get("longest_loss_streak", 0)
+
+    # Global Streaks
+    global_current_streak = player_data.get("global_current_streak", 0)
+    global_longest_win_streak = player_data.get("global_longest_win_streak", 0)
+    global_longest_loss_streak = player_data.get("global_longest_loss_streak", 0)
+
+    # Get general player stats
+    mmr = player_data.get("mmr", 0)
+    global_mmr = player_data.get("global_mmr", 300)
+    matches = player_data.get("matches", 0)
+    global_matches = player_data.get("global_matches", 0)
+    wins = player_data.get("wins", 0)
+    losses = player_data.get("losses", 0)
+    global_wins = player_data.get("global_wins", 0)
+    global_losses = player_data.get("global_losses", 0)
+
+    # Calculate win rates
+    win_rate = round((wins / matches) * 100, 1) if matches > 0 else 0
+    global_win_rate = round((global_wins / global_matches) * 100, 1) if global_matches > 0 else 0
+
+    # Create embed for streaks
+    embed = discord.Embed(
+        title=f"{member.display_name}'s Streak Status",
+        description="View both ranked and global streak information below",
+        color=0x7289da  # Discord Blurple as default
+    )
+
+    # SAFE: Add player avatar with error handling
+    try:
+        embed.set_thumbnail(url=member.avatar.url if member.avatar else member.default_avatar.url)
+    except:
+        pass  # Skip thumbnail if there's an error
+
+    # RANKED STREAKS SECTION
+    embed.add_field(
+        name="📊 RANKED STREAKS",
+        value="",
+        inline=False
+    )
+
+    # Format ranked streak info
+    if current_streak > 0:
+        streak_color = 0x43b581  # Green
+        streak_icon = "🔥" if current_streak >= 3 else "↗️"
+        streak_text = f"{streak_icon} **{current_streak}** Win Streak"
+        streak_desc = "On fire! Each win gives bonus MMR."
+    elif current_streak < 0:
+        streak_color = 0xf04747  # Red
+        streak_icon = "❄️" if current_streak <= -3 else "↘️"
+        streak_text = f"{streak_icon} **{abs(current_streak)}** Loss Streak"
+        streak_desc = "In a slump. Each loss costs extra MMR."
+    else:
+        streak_color = 0x7289da  # Discord Blurple
+        streak_text = "No active streak"
+        streak_desc = "No active win or loss streak."
+
+    # Main ranked streak info
+    embed.add_field(
+        name="Current Ranked Streak",
+        value=f"{streak_text}\n{streak_desc}",
+        inline=False
+    )
+
+    # Ranked MMR impact info
+    if abs(current_streak) >= 3:
+        bonus_percent = min((abs(current_streak) - 3 + 1) * 10, 50)
+        embed.add_field(
+            name="Ranked MMR Impact",
+            value=f"**+{bonus_percent}%** {'bonus' if current_streak > 0 else 'penalty'} to MMR changes",
+            inline=False
+        )
+
+    # Ranked personal bests
+    embed.add_field(
+        name="Best Ranked Win Streak",
+        value=f"🏆 **{longest_win_streak}** wins" if longest_win_streak > 0 else "None yet",
+        inline=True
+    )
+
+    embed.add_field(
+        name="Worst Ranked Loss Streak",
+        value=f"📉 **{abs(longest_loss_streak)}** losses" if longest_loss_streak < 0 else "None yet",
+        inline=True
+    )
+
+    # Ranked stats
+    embed.add_field(
+        name="Ranked Stats",
+        value=f"MMR: **{mmr}**\nRecord: **{wins}W-{losses}L**\nWin Rate: **{win_rate}%**",
+        inline=False
+    )
+
+    # Add a separator
+    embed.add_field(
+        name="⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯",
+        value="",
+        inline=False
+    )
+
+    # GLOBAL STREAKS SECTION
+    embed.add_field(
+        name="🌐 GLOBAL STREAKS",
+        value="",
+        inline=False
+    )
+
+    # Format global streak info
+    if global_current_streak > 0:
+        global_streak_icon = "🔥" if global_current_streak >= 3 else "↗️"
+        global_streak_text = f"{global_streak_icon} **{global_current_streak}** Win Streak"
+        global_streak_desc = "On fire in global matches!"
+    elif global_current_streak < 0:
+        global_streak_icon = "❄️" if global_current_streak <= -3 else "↘️"
+        global_streak_text = f"{global_streak_icon} **{abs(global_current_streak)}** Loss Streak"
+        global_streak_desc = "In a global slump."
+    else:
+        global_streak_text = "No active global streak"
+        global_streak_desc = "No active global win or loss streak."
+
+    # Main global streak info
+    embed.add_field(
+        name="Current Global Streak",
+        value=f"{global_streak_text}\n{global_streak_desc}",
+        inline=False
+    )
+
+    # Global MMR impact info
+    if abs(global_current_streak) >= 3:
+        global_bonus_percent = min((abs(global_current_streak) - 3 + 1) * 10, 50)
+        embed.add_field(
+            name="Global MMR Impact",
+            value=f"**+{global_bonus_percent}%** {'bonus' if global_current_streak > 0 else 'penalty'} to Global MMR changes",
+            inline=False
+        )
+
+    # Global personal bests
+    embed.add_field(
+        name="Best Global Win Streak",
+        value=f"🏆 **{global_longest_win_streak}** wins" if global_longest_win_streak > 0 else "None yet",
+        inline=True
+    )
+
+    embed.add_field(
+        name="Worst Global Loss Streak",
+        value=f"📉 **{abs(global_longest_loss_streak)}** losses" if global_longest_loss_streak < 0 else "None yet",
+        inline=True
+    )
+
+    # Global stats
+    embed.add_field(
+        name="Global Stats",
+        value=f"Global MMR: **{global_mmr}**\nRecord: **{global_wins}W-{global_losses}L**\nWin Rate: **{global_win_rate}%**",
+        inline=False
+    )
+
+    # Tips based on streak
+    if current_streak >= 3 or global_current_streak >= 3:
+        embed.add_field(
+            name="💡 Tip",
+            value="Keep playing while you're hot! You're earning bonus MMR on each win.",
+            inline=False
+        )
+    elif current_streak <= -3 or global_current_streak <= -3:
+        embed.add_field(
+            name="💡 Tip",
+            value="Consider taking a short break or changing up your strategy. Each additional loss is costing you extra MMR.",
+            inline=False
+        )
+
+    # Add footer with explanation
+    embed.set_footer(
+        text="Streaks of 3+ affect MMR gains and losses. The longer the streak, the bigger the impact!")
+
+    # Set embed color based on most significant streak
+    if abs(current_streak) >= abs(global_current_streak):
+        # Ranked streak is more significant
+        if current_streak > 0:
+            embed.color = 0x43b581  # Green for win streak
+        elif current_streak < 0:
+            embed.color = 0xf04747  # Red for loss streak
+    else:
+        # Global streak is more significant
+        if global_current_streak > 0:
+            embed.color = 0x43b581  # Green for win streak
+        elif global_current_streak < 0:
+            embed.color = 0xf04747  # Red for loss streak
+
+    await interaction.response.send_message(embed=embed)
+
+
+@app_commands.command(name="topstreaks", description="Show players with the highest win or loss streaks (Admin only)")
+@app_commands.describe(
+    streak_type="Type of streak to view",
+    mode="Ranked or Global mode",
+    limit="Number of players to show (1-25)"
+)
+@app_commands.choices(streak_type=[
+    app_commands.Choice(name="Win Streaks", value="win"),
+    app_commands.Choice(name="Loss Streaks", value="loss"),
+    app_commands.Choice(name="Current Streaks", value="current")
+])
+@app_commands.choices(mode=[
+    app_commands.Choice(name="Ranked", value="ranked"),
+    app_commands.Choice(name="Global", value="global")
+])
+async def topstreaks_slash(
+        interaction: discord.Interaction,
+        streak_type: str,
+        mode: str = "ranked",
+        limit: int = 10
+):
+    # Check if command is used in an allowed channel
+    if not is_command_channel(interaction.channel):
+        await interaction.response.send_message(
+            f"{interaction.user.mention}, this command can only be used in the rank-a, rank-b, rank-c, global, or sixgents channels.",
+            ephemeral=True
+        )
+        return
+
+    # Check if user has admin permissions
+    if not has_admin_or_mod_permissions(interaction.user, interaction.guild):
+        await interaction.response.send_message(
+            "You need administrator permissions or the 6mod role to use this command.",
+            ephemeral=True)
+        return
+
+    # Validate limit
+    limit = max(1, min(25, limit))
+
+    # Start deferred response since this might take time
+    await interaction.response.defer()
+
+    try:
+        # Determine if we're looking at ranked or global mode
+        is_global = mode == "global"
+        mode_prefix = "Global " if is_global else "Ranked "
+
+        # Set up query based on streak type and mode
+        if streak_type == "win":
+            # Get players with highest win streaks
+            field_name = "global_longest_win_streak" if is_global else "longest_win_streak"
+            query = {field_name: {"$gt": 0}}
+            sort_field = field_name
+            sort_dir = -1  # Descending
+            title = f"Top {limit} {mode_prefix}Win Streaks"
+            embed_color = 0x43b581  # Green
+        elif streak_type == "loss":
+            # Get players with worst loss streaks
+            field_name = "global_longest_loss_streak" if is_global else "longest_loss_streak"
+            query = {field_name: {"$lt": 0}}
+            sort_field = field_name
+            sort_dir = 1  # Ascending (for negative values)
+            title = f"Top {limit} {mode_prefix}Loss Streaks"
+            embed_color = 0xf04747  # Red
+        else:  # current
+            # Get players with highest absolute current streaks
+            field_name = "global_current_streak" if is_global else "current_streak"
+            query = {field_name: {"$ne": 0}}
+            sort_field = field_name
+            sort_dir = -1
+            title = f"Top {limit} Current {mode_prefix}Streaks"
+            embed_color = 0x7289da  # Discord Blurple
+
+        # Get players from database
+        if streak_type == "current":
+            # For current streaks, we need to sort by absolute value
+            pipeline = [
+                {"$match": query},
+                {"$addFields": {
+                    "abs_streak": {"$abs": f"${field_name}"}
+                }},
+                {"$sort": {"abs_streak": -1}},
+                {"$limit": limit}
+            ]
+            players = list(system_coordinator.match_system.players.aggregate(pipeline))
+        else:
+            players = list(system_coordinator.match_system.players.find(query)
+                           .sort(sort_field, sort_dir)
+                           .limit(limit))
+
+        if not players:
+            await interaction.followup.send(f"No players found with {mode_prefix.lower()}{streak_type} streaks.")
+            return
+
+        # Create embed
+        embed = discord.Embed(
+            title=title,
+            color=embed_color
+        )
+
+        # Add fields for each player (limit to prevent embed size issues)
+        displayed_count = 0
+        for i, player in enumerate(players):
+            if displayed_count >= 10:  # Discord embed field limit
+                break
+
+            player_id = player.get("id")
+            if not player_id:
+                continue
+
+            player_name = player.get("name", "Unknown")
+
+            # Try to get Discord member name
+            try:
+                member = await interaction.guild.fetch_member(int(player_id))
+                if member:
+                    player_name = member.display_name
+            except:
+                pass  # Use name from database if member not found
+
+            # Format streak value safely
+            try:
+                if streak_type == "win":
+                    streak_value = player.get(field_name, 0)
+                    if streak_value is None:
+                        streak_value = 0
+                    streak_display = f"🏆 {streak_value} Wins"
+                elif streak_type == "loss":
+                    streak_value = player.get(field_name, 0)
+                    if streak_value is None:
+                        streak_value = 0
+                    streak_display = f"📉 {abs(streak_value)} Losses"
+                else:  # current
+                    streak_value = player.get(field_name, 0)
+                    if streak_value is None:
+                        streak_value = 0
+                    if streak_value > 0:
+                        icon = "🔥" if streak_value >= 3 else "↗️"
+                        streak_display = f"{icon} {streak_value} Win Streak"
+                    elif streak_value < 0:
+                        icon = "❄️" if streak_value <= -3 else "↘️"
+                        streak_display = f"{icon} {abs(streak_value)} Loss Streak"
+                    else:
+                        streak_display = "No Streak"
+
+                # Get player's MMR based on mode
+                if is_global:
+                    mmr = player.get("global_mmr", 300)
+                    if mmr is None:
+                        mmr = 300
+                    mmr_label = "Global MMR"
+                else:
+                    mmr = player.get("mmr", 0)
+                    if mmr is None:
+                        mmr = 0
+                    # Determine rank based on MMR
+                    rank = tier_for_mmr(mmr)
+                    mmr_label = f"MMR ({rank})"
+
+                # Add player field
+                embed.add_field(
+                    name=f"#{i + 1}: {player_name}",
+                    value=f"{streak_display}\n{mmr_label}: {mmr}",
+                    inline=False
+                )
+                displayed_count += 1
+
+            except Exception as field_error:
+                print(f"Error processing player {player_name}: {field_error}")
+                continue
+
+        # Add footer
+        embed.set_footer(text=f"Streak data as of {datetime.datetime.now().strftime('%Y-%m-%d %H:%M')}")
+
+        # If we have more players than displayed, add a note
+        if len(players) > displayed_count:
+            embed.add_field(
+                name="Note",
+                value=f"Showing top {displayed_count} of {len(players)} players with streaks.",
+                inline=False
+            )
+
+        # Send response
+        await interaction.followup.send(embed=embed)
+
+    except Exception as e:
+        print(f"Error in topstreaks command: {e}")
+        import traceback
+        traceback.print_exc()
+        await interaction.followup.send(f"Error retrieving streak data: {str(e)}")
+
+
+@app_commands.command(name="streakstats", description="Show server-wide streak statistics (Admin only)")
+async def streakstats_slash(interaction: discord.Interaction):
+    # Check if command is used in an allowed channel
+    if not is_command_channel(interaction.channel):
+        await interaction.response.send_message(
+            f"{interaction.user.mention}, this command can only be used in the rank-a, rank-b, rank-c, global, or sixgents channels.",
+            ephemeral=True
+        )
+        return
+
+    # Check if user has admin permissions
+    if not has_admin_or_mod_permissions(interaction.user, interaction.guild):
+        await interaction.response.send_message(
+            "You need administrator permissions or the 6mod role to use this command.",
+            ephemeral=True)
+        return
+
+    # Start deferred response since this might take time
+    await interaction.response.defer()
+
+    try:
+        # Get overall stats with aggregation pipeline
+        pipeline = [
+            {
+                "$group": {
+                    "_id": None,
+                    "total_players": {"$sum": 1},
+                    "players_with_win_streaks": {"$sum": {"$cond": [{"$gt": ["$current_streak", 0]}, 1, 0]}},
+                    "players_with_loss_streaks": {"$sum": {"$cond": [{"$lt": ["$current_streak", 0]}, 1, 0]}},
+                    "avg_win_streak": {
+                        "$avg": {"$cond": [{"$gt": ["$current_streak", 0]}, "$current_streak", None]}},
+                    "avg_loss_streak": {"$avg": {
+                        "$cond": [{"$lt": ["$current_streak", 0]}, {"$abs": "$current_streak"}, None]}},
+                    "max_win_streak": {"$max": "$longest_win_streak"},
+                    "max_loss_streak": {"$min": "$longest_loss_streak"},
+                    "avg_longest_win": {"$avg": "$longest_win_streak"},
+                    "avg_longest_loss": {"$avg": {"$abs": "$longest_loss_streak"}}
+                }
+            }
+        ]
+
+        stats = list(system_coordinator.match_system.players.aggregate(pipeline))
+
+        if not stats or not stats[0]:
+            await interaction.followup.send("No streak statistics available - no players found.")
+            return
+
+        stats = stats[0]  # Get the first (and only) result
+
+        # Calculate percentages safely
+        total_players = stats.get("total_players", 0)
+        if total_players == 0:
+            await interaction.followup.send("No players found to generate statistics.")
+            return
+
+        players_with_win_streaks = stats.get("players_with_win_streaks", 0) or 0
+        players_with_loss_streaks = stats.get("players_with_loss_streaks", 0) or 0
+
+        win_streak_percent = (players_with_win_streaks / total_players * 100) if total_players > 0 else 0
+        loss_streak_percent = (players_with_loss_streaks / total_players * 100) if total_players > 0 else 0
+
+        # Format values safely
+        avg_win_streak = stats.get("avg_win_streak") or 0
+        avg_loss_streak = stats.get("avg_loss_streak") or 0
+        max_win_streak = stats.get("max_win_streak") or 0
+        max_loss_streak = stats.get("max_loss_streak") or 0
+        avg_longest_win = stats.get("avg_longest_win") or 0
+        avg_longest_loss = stats.get("avg_longest_loss") or 0
+
+        # Round safely
+        avg_win_streak = round(float(avg_win_streak), 1) if avg_win_streak else 0
+        avg_loss_streak = round(float(avg_loss_streak), 1) if avg_loss_streak else 0
+        avg_longest_win = round(float(avg_longest_win), 1) if avg_longest_win else 0
+        avg_longest_loss = round(float(avg_longest_loss), 1) if avg_longest_loss else 0
+        max_loss_streak = abs(int(max_loss_streak)) if max_loss_streak else 0
+
+        # Create embed
+        embed = discord.Embed(
+            title="Server-wide Streak Statistics",
+            description=f"Statistics based on {total_players} players",
+            color=0x7289da
+        )
+
+        # Current streaks summary
+        no_streak_count = total_players - players_with_win_streaks - players_with_loss_streaks
+        embed.add_field(
+            name="Current Streaks",
+            value=(
+                f"**Win Streaks**: {players_with_win_streaks} players ({win_streak_percent:.1f}%)\n"
+                f"**Loss Streaks**: {players_with_loss_streaks} players ({loss_streak_percent:.1f}%)\n"
+                f"**No Streak**: {no_streak_count} players"
+            ),
+            inline=False
+        )
+
+        # Streak length stats
+        embed.add_field(
+            name="Win Streak Stats",
+            value=(
+                f"**Average Win Streak**: {avg_win_streak} wins\n"
+                f"**Longest Win Streak**: {max_win_streak} wins\n"
+                f"**Avg Longest Win Streak**: {avg_longest_win} wins"
+            ),
+            inline=True
+        )
+
+        embed.add_field(
+            name="Loss Streak Stats",
+            value=(
+                f"**Average Loss Streak**: {avg_loss_streak} losses\n"
+                f"**Longest Loss Streak**: {max_loss_streak} losses\n"
+                f"**Avg Longest Loss Streak**: {avg_longest_loss} losses"
+            ),
+            inline=True
+        )
+
+        # Get Rank A, B, C breakdowns
+        try:
+            rank_a_stats = await get_rank_stats_safe(system_coordinator.match_system.players, "Rank A")
+            rank_b_stats = await get_rank_stats_safe(system_coordinator.match_system.players, "Rank B")
+            rank_c_stats = await get_rank_stats_safe(system_coordinator.match_system.players, "Rank C")
+
+            embed.add_field(
+                name="Rank A Streaks",
+                value=(
+                    f"**Win Streak %**: {rank_a_stats.get('win_streak_percent', 0):.1f}%\n"
+                    f"**Loss Streak %**: {rank_a_stats.get('loss_streak_percent', 0):.1f}%\n"
+                    f"**Avg Win Streak**: {rank_a_stats.get('avg_win_streak', 0):.1f}\n"
+                    f"**Avg Loss Streak**: {rank_a_stats.get('avg_loss_streak', 0):.1f}"
+                ),
+                inline=True
+            )
+
+            embed.add_field(
+                name="Rank B Streaks",
+                value=(
+                    f"**Win Streak %**: {rank_b_stats.get('win_streak_percent', 0):.1f}%\n"
+                    f"**Loss Streak %**: {rank_b_stats.get('loss_streak_percent', 0):.1f}%\n"
+                    f"**Avg Win Streak**: {rank_b_stats.get('avg_win_streak', 0):.1f}\n"
+                    f"**Avg Loss Streak**: {rank_b_stats.get('avg_loss_streak', 0):.1f}"
+                ),
+                inline=True
+            )
+
+            embed.add_field(
+                name="Rank C Streaks",
+                value=(
+                    f"**Win Streak %**: {rank_c_stats.get('win_streak_percent', 0):.1f}%\n"
+                    f"**Loss Streak %**: {rank_c_stats.get('loss_streak_percent', 0):.1f}%\n"
+                    f"**Avg Win Streak**: {rank_c_stats.get('avg_win_streak', 0):.1f}\n"
+                    f"**Avg Loss Streak**: {rank_c_stats.get('avg_loss_streak', 0):.1f}"
+                ),
+                inline=True
+            )
+        except Exception as rank_error:
+            print(f"Error getting rank stats: {rank_error}")
+            embed.add_field(
+                name="Rank Breakdown",
+                value="Error calculating rank-specific statistics",
+                inline=False
+            )
+
+        # Add footer
+        embed.set_footer(text=f"Data as of {datetime.datetime.now().strftime('%Y-%m-%d %H:%M')}")
+
+        # Send response
+        await interaction.followup.send(embed=embed)
+
+    except Exception as e:
+        print(f"Error in streakstats command: {e}")
+        import traceback
+        traceback.print_exc()
+        await interaction.followup.send(f"Error retrieving streak statistics: {str(e)}")
+
+# Helper function for streak stats by rank (with safe None handling)
+async def get_rank_stats_safe(players_collection, tier):
+    """Get streak statistics for a tier's ranked players with safe None handling"""
+    try:
+        # Same filter as the tier's leaderboard, so it walks the (tier, mmr) index
+        query = dict(RANKED_FILTER, tier=tier)
+
+        # Run aggregation pipeline
+        pipeline = [
+            {"$match": query},
+            {
+                "$group": {
+                    "_id": None,
+                    "total_players": {"$sum": 1},
+                    "players_with_win_streaks": {"$sum": {"$cond": [{"$gt": ["$current_streak", 0]}, 1, 0]}},
+                    "players_with_loss_streaks": {"$sum": {"$cond": [{"$lt": ["$current_streak", 0]}, 1, 0]}},
+                    "avg_win_streak": {
+                        "$avg": {"$cond": [{"$gt": ["$current_streak", 0]}, "$current_streak", None]}},
+                    "avg_loss_streak": {
+                        "$avg": {"$cond": [{"$lt": ["$current_streak", 0]}, {"$abs": "$current_streak"}, None]}}
+                }
+            }
+        ]
+
+        stats = list(players_collection.aggregate(pipeline))
+
+        if not stats or not stats[0]:
+            return {
+                "total_players": 0,
+                "win_streak_percent": 0,
+                "loss_streak_percent": 0,
+                "avg_win_streak": 0,
+                "avg_loss_streak": 0
+            }
+
+        stats = stats[0]  # Get the first (and only) result
+
+        # Calculate percentages safely
+        total_players = stats.get("total_players", 0) or 0
+        players_with_win_streaks = stats.get("players_with_win_streaks", 0) or 0
+        players_with_loss_streaks = stats.get("players_with_loss_streaks", 0) or 0
+
+        win_streak_percent = (players_with_win_streaks / total_players * 100) if total_players > 0 else 0
+        loss_streak_percent = (players_with_loss_streaks / total_players * 100) if total_players > 0 else 0
+
+        # Safe value extraction
+        avg_win_streak = stats.get("avg_win_streak") or 0
+        avg_loss_streak = stats.get("avg_loss_streak") or 0
+
+        return {
+            "total_players": total_players,
+            "win_streak_percent": win_streak_percent,
+            "loss_streak_percent": loss_streak_percent,
+            "avg_win_streak": float(avg_win_streak) if avg_win_streak else 0,
+            "avg_loss_streak": float(avg_loss_streak) if avg_loss_streak else 0
+        }
+    except Exception as e:
+        print(f"Error in get_rank_stats_safe: {e}")
+        return {
+            "total_players": 0,
+            "win_streak_percent": 0,
+            "loss_streak_percent": 0,
+            "avg_win_streak": 0,
+            "avg_loss_streak": 0
+        }
+
+
+# Slash commands registered by this extension
+COMMANDS = [
+    leaderboard_slash,
+    rank_slash_enhanced,
+    help_slash,
+    streak_slash,
+    topstreaks_slash,
+    streakstats_slash,
+]
+
+
+async def setup(bot):
+    add_extension_commands(bot, COMMANDS)
+
+
+async def teardown(bot):
+    remove_extension_commands(bot, COMMANDS)
@@ -0,0 +1,133 @@
+import asyncio
+import datetime
+import hashlib
+import json
+import random
+import discord
+
+
+class CommandSyncManager:
+    """
+    Syncs the slash command tree only when it has actually changed.
+    A hash of each scope's serialized payload is stored in Mongo after a successful sync.
+    """
+
+    def __init__(self, db, bot):
+        self.db = db
+        self.bot = bot
+
+        # One document per scope: "global" or a guild ID
+        self.sync_state = db.get_collection('command_sync_state')
+
+        self.sync_lock = asyncio.Lock()
+
+    def _scope_name(self, guild=None):
+        return str(guild.id) if guild else "global"
+
+    def _command_payload(self, guild=None):
+        """The same payload discord.py sends on sync, sorted so the hash is stable"""
+        payload = []
+        for command in self.bot.tree.get_commands(guild=guild):
+            try:
+                data = command.to_dict()
+            except TypeError:
+                # Newer discord.py versions take the tree as an argument
+                data = command.to_dict(self.bot.tree)
+            payload.append(data)
+
+        return sorted(payload, key=lambda data: (data.get("type", 1), data.get("name", "")))
+
+    def compute_tree_hash(self, guild=None):
+        """Stable SHA-256 of a scope's command payload"""
+        payload = self._command_payload(guild)
+        serialized = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest(), len(payload)
+
+    def get_stored_hash(self, guild=None):
+        state = self.sync_state.find_one({"scope": self._scope_name(guild)})
+        return state.get("hash") if state else None
+
+    def record_sync(self, guild=None, tree_hash=None, command_count=None):
+        """Remember the hash that is now live on Discord for a scope"""
+        if tree_hash is None:
+            tree_hash, command_count = self.compute_tree_hash(guild)
+
+        self.sync_state.update_one(
+            {"scope": self._scope_name(guild)},
+            {"$set": {
+                "scope": self._scope_name(guild),
+                "guild_name": guild.name if guild else None,
+                "hash": tree_hash,
+                "command_count": command_count,
+                "synced_at": datetime.datetime.utcnow()
+            }},
+            upsert=True
+        )
+
+    def get_changed_scopes(self):
+        """Scopes (None for global, else guild) whose tree differs from the last sync"""
+        changed = []
+        for guild in [None] + list(self.bot.guilds):
+            tree_hash, _ = self.compute_tree_hash(guild)
+            if tree_hash != self.get_stored_hash(guild):
+                changed.append(guild)
+        return changed
+
+    def record_all(self):
+        """Record every scope as synced (after an external full sync)"""
+        for guild in [None] + list(self.bot.guilds):
+            self.record_sync(guild)
+
+    async def sync_scope(self, guild=None, force=False):
+        """Sync one scope if its hash changed. Returns 'synced', 'skipped' or 'failed'"""
+        scope_label = guild.name if guild else "global"
+        tree_hash, command_count = self.compute_tree_hash(guild)
+
+        if not force and tree_hash == self.get_stored_hash(guild):
+            print(f"⏭️ Commands unchanged for {scope_label} - skipping sync")
+            return "skipped"
+
+        try:
+            print(f"🔄 Syncing {command_count} commands to {scope_label}")
+            await self.bot.tree.sync(guild=guild)
+        except discord.HTTPException as e:
+            if e.status != 429:
+                print(f"❌ Error syncing commands to {scope_label}: {e}")
+                return "failed"
+
+            retry_after = max(getattr(e, 'retry_after', 30), 30)
+            print(f"⚠️ Rate limited syncing to {scope_label}, waiting {retry_after}s")
+            await asyncio.sleep(retry_after)
+            try:
+                await self.bot.tree.sync(guild=guild)
+            except Exception as retry_error:
+                print(f"❌ Retry failed syncing to {scope_label}: {retry_error}")
+                return "failed"
+        except Exception as e:
+            print(f"❌ Unexpected error syncing commands to {scope_label}: {e}")
+            return "failed"
+
+        self.record_sync(guild, tree_hash, command_count)
+        print(f"✅ Synced commands to {scope_label}")
+        return "synced"
+
+    async def sync_all(self, force=False, guild_delay=(15.0, 25.0)):
+        """Sync global then every guild, pausing only between syncs that actually ran"""
+        results = {"synced": [], "skipped": [], "failed": []}
+
+        async with self.sync_lock:
+            last_call_synced = False
+            for guild in [None] + list(self.bot.guilds):
+                if last_call_synced and guild is not None and (
+                        force or self.compute_tree_hash(guild)[0] != self.get_stored_hash(guild)):
+                    delay = random.uniform(*guild_delay)
+                    print(f"⏳ Waiting {delay:.1f}s before next command sync...")
+                    await asyncio.sleep(delay)
+
+                outcome = await self.sync_scope(guild, force=force)
+                results[outcome].append(guild.name if guild else "global")
+                last_call_synced = outcome != "skipped"
+
+        print(f"✅ Command sync: {len(results['synced'])} synced, {len(results['skipped'])} skipped, "
+              f"{len(results['failed'])} failed")
+        return results
@@ -0,0 +1,184 @@
+import os
+import time
+from discord import app_commands
+from logging_config import get_logger
+
+logger = get_logger("cooldowns")
+
+# Default per-command window (seconds) - repeats of the same command inside it are rejected
+DEFAULT_COOLDOWN = float(os.getenv("COMMAND_COOLDOWN", 2.0))
+
+# What a cooldown key is built from
+SCOPES = ("user", "channel", "user_channel", "guild", "global")
+DEFAULT_SCOPE = "user_channel"
+
+# How long an interaction ID is remembered so a redelivered interaction is only handled once
+INTERACTION_TTL = 30.0
+
+
+class TTLWheel:
+    """
+    Expiring key set on a timing wheel. Keys are filed in the slot of the tick they expire in,
+    so inserts are O(1) and expiry only visits the slots the clock has passed since the last call.
+    Keys that outlive one turn of the wheel are refiled when their slot comes round.
+    """
+
+    def __init__(self, resolution=0.25, slots=512):
+        self.resolution = resolution
+        self.slots = slots
+        # key -> monotonic expiry time
+        self.expiries = {}
+        self.buckets = [set() for _ in range(slots)]
+        self.current_tick = int(time.monotonic() / resolution)
+
+    def __len__(self):
+        return len(self.expiries)
+
+    def _file(self, key, expiry):
+        # One tick past the expiry tick, so a slot is only swept once everything in it has expired
+        self.buckets[(int(expiry / self.resolution) + 1) % self.slots].add(key)
+
+    def advance(self, now=None):
+        """Drop keys in the slots passed since the last call"""
+        now = time.monotonic() if now is None else now
+        tick = int(now / self.resolution)
+        steps = min(tick - self.current_tick, self.slots)
+
+        for step in range(1, steps + 1):
+            index = (self.current_tick + step) % self.slots
+            bucket = self.buckets[index]
+            if not bucket:
+                continue
+            self.buckets[index] = set()
+            for key in bucket:
+                expiry = self.expiries.get(key)
+                if expiry is None:
+                    continue
+                if expiry <= now:
+                    del self.expiries[key]
+                else:
+                    self._file(key, expiry)
+
+        self.current_tick = max(self.current_tick, tick)
+
+    def remaining(self, key, now=None):
+        """Seconds until key expires (0 when absent or expired)"""
+        now = time.monotonic() if now is None else now
+        expiry = self.expiries.get(key)
+        if expiry is None or expiry <= now:
+            return 0.0
+        return expiry - now
+
+    def set(self, key, ttl, now=None):
+        """Insert or refresh a key for ttl seconds"""
+        now = time.monotonic() if now is None else now
+        expiry = now + ttl
+        self.expiries[key] = expiry
+        self._file(key, expiry)
+
+
+def cooldown(seconds, scope=DEFAULT_SCOPE):
+    """
+    Set a command's cooldown window and scope, e.g. @cooldown(30, scope="guild").
+    Put it above @app_commands.command; cooldown(None) turns the cooldown off for that command.
+    """
+    if scope not in SCOPES:
+        raise ValueError(f"Unknown cooldown scope {scope!r} (expected one of {', '.join(SCOPES)})")
+
+    def decorator(command):
+        if isinstance(command, app_commands.Command):
+            command.extras["cooldown"] = seconds
+            command.extras["cooldown_scope"] = scope
+        else:
+            command.__cooldown__ = (seconds, scope)
+        return command
+
+    return decorator
+
+
+class CooldownEngine:
+    """
+    Dedup and cooldowns for every slash command, run by the command tree before dispatch.
+    Everything happens synchronously on the event loop, so no lock is needed.
+    """
+
+    def __init__(self, default_window=DEFAULT_COOLDOWN, default_scope=DEFAULT_SCOPE):
+        self.default_window = default_window
+        self.default_scope = default_scope
+        self.wheel = TTLWheel()
+        # command name -> rejected invocations since startup
+        self.blocked = {}
+        self.duplicates = 0
+
+    def settings_for(self, command):
+        """(window, scope) for a command from its extras, @cooldown or the defaults"""
+        window, scope = self.default_window, self.default_scope
+        if command is None:
+            return window, scope
+
+        callback_settings = getattr(getattr(command, "callback", None), "__cooldown__", None)
+        if callback_settings:
+            window, scope = callback_settings
+
+        extras = getattr(command, "extras", {})
+        if "cooldown" in extras:
+            window = extras["cooldown"]
+        return window, extras.get("cooldown_scope", scope)
+
+    @staticmethod
+    def scope_key(scope, name, interaction):
+        user_id = interaction.user.id if interaction.user else 0
+        channel_id = interaction.channel_id or 0
+        if scope == "user":
+            return (name, "user", user_id)
+        if scope == "channel":
+            return (name, "channel", channel_id)
+        if scope == "guild":
+            return (name, "guild", interaction.guild_id or 0)
+        if scope == "global":
+            return (name, "global")
+        return (name, "user_channel", user_id, channel_id)
+
+    def hit(self, key, window, now=None):
+        """
+        Record a use of key. Returns 0 when it was free (and starts its window)
+        or the seconds left when it is still cooling down
+        """
+        now = time.monotonic() if now is None else now
+        self.wheel.advance(now)
+        remaining = self.wheel.remaining(key, now)
+        if remaining:
+            return remaining
+        self.wheel.set(key, window, now)
+        return 0.0
+
+    def check(self, interaction):
+        """
+        Returns (allowed, retry_after). Redelivered interactions come back as (False, None)
+        and should be dropped without a reply
+        """
+        now = time.monotonic()
+        if self.hit(("interaction", interaction.id), INTERACTION_TTL, now):
+            self.duplicates += 1
+            logger.warning("🚫 Dropped duplicate interaction %s", interaction.id)
+            return False, None
+
+        command = interaction.command
+        window, scope = self.settings_for(command)
+        if not window:
+            return True, 0.0
+
+        name = getattr(command, "qualified_name", None) or (interaction.data or {}).get("name", "unknown")
+        retry_after = self.hit(self.scope_key(scope, name, interaction), window, now)
+        if retry_after:
+            self.blocked[name] = self.blocked.get(name, 0) + 1
+            logger.info("⏳ /%s on cooldown for %s (%.1fs left)", name, interaction.user, retry_after)
+            return False, retry_after
+        return True, 0.0
+
+    def get_stats(self):
+        return {
+            "tracked_keys": len(self.wheel),
+            "duplicates_dropped": self.duplicates,
+            "blocked": dict(self.blocked)
+        }
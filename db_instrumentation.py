@@ -0,0 +1,215 @@
+import collections
+import json
+import os
+import sys
+import threading
+import time
+from pymongo import monitoring
+from perf_tracker import add_command_time
+
+# Frames from these files count as the caller of a query
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Commands whose first field names the collection they run against
+COLLECTION_COMMANDS = {
+    "find", "insert", "update", "delete", "aggregate", "count", "distinct",
+    "findAndModify", "createIndexes", "listIndexes", "collStats"
+}
+
+
+def normalize_shape(value, depth=0):
+    """Replace literal values with "?" so queries that differ only in values share a shape"""
+    if depth > 6:
+        return "..."
+    if isinstance(value, dict):
+        return {key: normalize_shape(val, depth + 1) for key, val in sorted(value.items())}
+    if isinstance(value, (list, tuple)):
+        if value and all(isinstance(item, dict) for item in value):
+            return [normalize_shape(item, depth + 1) for item in value]
+        return "?"
+    return "?"
+
+
+def query_shape(command_name, command):
+    """The part of a command document that identifies its query pattern"""
+    if command_name == "find":
+        shape = {"filter": command.get("filter", {})}
+        if command.get("sort"):
+            shape["sort"] = command.get("sort")
+        return json.dumps(normalize_shape(shape), default=str)
+    if command_name == "aggregate":
+        stages = [next(iter(stage), "?") for stage in command.get("pipeline", [])]
+        return json.dumps({"pipeline": stages})
+    if command_name in ("update", "delete"):
+        statements = command.get("updates" if command_name == "update" else "deletes") or [{}]
+        return json.dumps({"filter": normalize_shape(statements[0].get("q", {})), "ops": len(statements)},
+                          default=str)
+    if command_name in ("count", "distinct"):
+        return json.dumps(normalize_shape({"filter": command.get("query", {}), "key": command.get("key")}),
+                          default=str)
+    if command_name == "findAndModify":
+        return json.dumps(normalize_shape({"filter": command.get("query", {})}), default=str)
+    return "{}"
+
+
+def find_caller():
+    """file:line function of the innermost project frame outside this module"""
+    frame = sys._getframe(1)
+    this_file = os.path.abspath(__file__)
+    while frame is not None:
+        filename = os.path.abspath(frame.f_code.co_filename)
+        if filename.startswith(PROJECT_ROOT) and filename != this_file and "site-packages" not in filename:
+            name = getattr(frame.f_code, "co_qualname", frame.f_code.co_name)
+            return f"{os.path.basename(filename)}:{frame.f_lineno} {name}"
+        frame = frame.f_back
+    return "unknown"
+
+
+class QueryStatsListener(monitoring.CommandListener):
+    """
+    Records count and latency per collection and command, groups queries by normalized shape,
+    and logs slow queries with the function that issued them.
+    """
+
+    def __init__(self, slow_query_ms=None, max_shapes=500, slow_log_size=100):
+        self.slow_query_ms = float(slow_query_ms or os.getenv('SLOW_QUERY_MS', 100))
+        self.max_shapes = max_shapes
+
+        self.lock = threading.Lock()
+        # (connection_id, request_id) -> (collection, command_name, shape)
+        self.in_flight = {}
+        # (collection, command_name) -> {"count", "total_ms", "max_ms", "failures"}
+        self.by_collection = {}
+        # (collection, command_name, shape) -> {"count", "total_ms", "max_ms", "caller"}
+        self.shapes = {}
+        self.slow_queries = collections.deque(maxlen=slow_log_size)
+        self.started_at = time.time()
+
+    def started(self, event):
+        command_name = event.command_name
+        if command_name in COLLECTION_COMMANDS:
+            collection = event.command.get(command_name)
+        elif command_name == "getMore":
+            collection = event.command.get("collection")
+        else:
+            collection = None
+
+        if not isinstance(collection, str):
+            collection = "(admin)"
+
+        try:
+            shape = query_shape(command_name, event.command)
+        except Exception:
+            shape = "{}"
+
+        with self.lock:
+            self.in_flight[(event.connection_id, event.request_id)] = (collection, command_name, shape)
+
+    def succeeded(self, event):
+        self._finish(event, failed=False)
+
+    def failed(self, event):
+        self._finish(event, failed=True)
+
+    def _finish(self, event, failed):
+        duration_ms = event.duration_micros / 1000
+        add_command_time("db", duration_ms / 1000)
+
+        with self.lock:
+            collection, command_name, shape = self.in_flight.pop(
+                (event.connection_id, event.request_id), ("(unknown)", event.command_name, "{}")
+            )
+
+        # Callers are only looked up for slow queries; pymongo publishes this on the calling thread
+        slow = duration_ms >= self.slow_query_ms
+        caller = find_caller() if slow else None
+
+        with self.lock:
+            stats = self.by_collection.setdefault(
+                (collection, command_name), {"count": 0, "total_ms": 0.0, "max_ms": 0.0, "failures": 0}
+            )
+            stats["count"] += 1
+            stats["total_ms"] += duration_ms
+            stats["max_ms"] = max(stats["max_ms"], duration_ms)
+            if failed:
+                stats["failures"] += 1
+
+            key = (collection, command_name, shape)
+            if key not in self.shapes and len(self.shapes) >= self.max_shapes:
+                key = (collection, command_name, "(other shapes)")
+            shape_stats = self.shapes.setdefault(key, {"count": 0, "total_ms": 0.0, "max_ms": 0.0, "caller": None})
+            shape_stats["count"] += 1
+            shape_stats["total_ms"] += duration_ms
+            shape_stats["max_ms"] = max(shape_stats["max_ms"], duration_ms)
+            if caller:
+                shape_stats["caller"] = caller
+
+            if slow:
+                self.slow_queries.append({
+                    "timestamp": time.time(),
+                    "collection": collection,
+                    "command": command_name,
+                    "shape": shape,
+                    "duration_ms": round(duration_ms, 1),
+                    "caller": caller
+                })
+
+        if slow:
+            print(f"🐢 Slow query ({duration_ms:.0f}ms): {collection}.{command_name} {shape} from {caller}")
+
+    def get_collection_stats(self, limit=20):
+        """Per collection and command totals, most total time first"""
+        with self.lock:
+            rows = [
+                dict(stats, collection=collection, command=command_name,
+                     avg_ms=round(stats["total_ms"] / stats["count"], 2), total_ms=round(stats["total_ms"], 1),
+                     max_ms=round(stats["max_ms"], 1))
+                for (collection, command_name), stats in self.by_collection.items()
+            ]
+        return sorted(rows, key=lambda row: row["total_ms"], reverse=True)[:limit]
+
+    def get_top_shapes(self, limit=10):
+        """Query shapes that took the most total time"""
+        with self.lock:
+            rows = [
+                dict(stats, collection=collection, command=command_name, shape=shape,
+                     avg_ms=round(stats["total_ms"] / stats["count"], 2), total_ms=round(stats["total_ms"], 1),
+                     max_ms=round(stats["max_ms"], 1))
+                for (collection, command_name, shape), stats in self.shapes.items()
+            ]
+        return sorted(rows, key=lambda row: row["total_ms"], reverse=True)[:limit]
+
+    def get_slow_queries(self, limit=20):
+        """Most recent slow queries first"""
+        with self.lock:
+            return list(self.slow_queries)[::-1][:limit]
+
+    def get_summary(self, limit=10):
+        """Everything the dashboards show, in one JSON-friendly dict"""
+        return {
+            "since": self.started_at,
+            "slow_query_ms": self.slow_query_ms,
+            "collections": self.get_collection_stats(limit * 2),
+            "top_shapes": self.get_top_shapes(limit),
+            "slow_queries": self.get_slow_queries(limit)
+        }
+
+    def reset(self):
+        with self.lock:
+            self.by_collection = {}
+            self.shapes = {}
+            self.slow_queries.clear()
+            self.started_at = time.time()
+
+
+query_stats = QueryStatsListener()
+_registered = False
+
+
+def register_query_stats():
+    """Register the shared listener with pymongo. Must run before any MongoClient is created"""
+    global _registered
+    if not _registered:
+        monitoring.register(query_stats)
+        _registered = True
+    return query_stats
@@ -0,0 +1,225 @@
+import asyncio
+import datetime
+import json
+import math
+import os
+import time
+from aiohttp import web
+
+
+class HealthServer:
+    """
+    Small HTTP server that runs on the bot's own event loop.
+    Serves a keepalive page at /, a JSON health report at /health and Prometheus metrics at /metrics.
+    """
+
+    def __init__(self, bot, db=None, rate_limiter=None, system_coordinator=None, loop_monitor=None,
+                 report_pipeline=None, port=None):
+        self.bot = bot
+        self.db = db
+        self.rate_limiter = rate_limiter
+        self.system_coordinator = system_coordinator
+        self.loop_monitor = loop_monitor
+        self.report_pipeline = report_pipeline
+        self.port = int(port or os.environ.get("PORT", 8080))
+
+        self.started_at = time.time()
+        self.runner = None
+
+        # The DB ping is cached so frequent health probes don't hammer Mongo
+        self.db_ping_interval = 10.0
+        self.last_db_ping = 0
+        self.db_latency = None
+        self.db_error = None
+
+        # Lag above this marks the bot as unhealthy
+        self.max_healthy_loop_lag = 1.0
+
+    async def start(self):
+        """Bind the port and start serving from the current event loop"""
+        if self.runner:
+            return
+
+        app = web.Application()
+        app.router.add_get('/', self.handle_root)
+        app.router.add_get('/health', self.handle_health)
+        app.router.add_get('/metrics', self.handle_metrics)
+
+        self.runner = web.AppRunner(app, access_log=None)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, '0.0.0.0', self.port)
+        await site.start()
+        print(f"🩺 Health server listening on port {self.port} (/health, /metrics)")
+
+    async def stop(self):
+        if self.runner:
+            await self.runner.cleanup()
+            self.runner = None
+
+    async def measure_loop_lag(self):
+        """Latest lag from the loop monitor, or a one-off probe if it isn't running"""
+        if self.loop_monitor and self.loop_monitor.monitor_task:
+            return self.loop_monitor.current_lag
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await asyncio.sleep(0)
+        return loop.time() - started
+
+    async def measure_db_latency(self):
+        """Round trip of a Mongo ping, run off the loop and cached for db_ping_interval"""
+        if self.db is None:
+            return None
+
+        if time.time() - self.last_db_ping < self.db_ping_interval:
+            return self.db_latency
+
+        self.last_db_ping = time.time()
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(asyncio.to_thread(self.db.client.admin.command, 'ping'), timeout=5.0)
+            self.db_latency = time.perf_counter() - started
+            self.db_error = None
+        except Exception as e:
+            self.db_latency = None
+            self.db_error = str(e) or type(e).__name__
+
+        return self.db_latency
+
+    def get_queue_counts(self):
+        """Players waiting and active matches by status, from the queue manager's memory"""
+        counts = {"players_queued": 0, "matches": {}}
+        if not self.system_coordinator:
+            return counts
+
+        queue_manager = self.system_coordinator.queue_manager
+        counts["players_queued"] = sum(len(players) for players in queue_manager.channel_queues.values())
+        for match in queue_manager.active_matches.values():
+            status = match.get("status", "unknown")
+            counts["matches"][status] = counts["matches"].get(status, 0) + 1
+
+        return counts
+
+    def get_lane_depths(self):
+        if not self.rate_limiter:
+            return {}
+        return self.rate_limiter.get_lane_depths()
+
+    async def collect(self):
+        """Gather every health value into one snapshot"""
+        gateway_latency = self.bot.latency
+        if gateway_latency is None or math.isinf(gateway_latency) or math.isnan(gateway_latency):
+            gateway_latency = None
+
+        loop_lag = await self.measure_loop_lag()
+        db_latency = await self.measure_db_latency()
+
+        ready = self.bot.is_ready() and not self.bot.is_closed()
+        healthy = ready and self.db_error is None and loop_lag < self.max_healthy_loop_lag
+
+        return {
+            "status": "ok" if healthy else "degraded",
+            "ready": ready,
+            "uptime_seconds": round(time.time() - self.started_at, 1),
+            "guilds": len(self.bot.guilds),
+            "gateway_latency_seconds": gateway_latency,
+            "loop_lag_seconds": loop_lag,
+            "loop_monitor": self.loop_monitor.get_status() if self.loop_monitor else None,
+            "pending_tasks": len(asyncio.all_tasks()),
+            "rate_limiter_lanes": self.get_lane_depths(),
+            "db_latency_seconds": db_latency,
+            "db_error": self.db_error,
+            "queues": self.get_queue_counts(),
+            "report_pipeline": self.report_pipeline.get_stats() if self.report_pipeline else None,
+            "timestamp": datetime.datetime.utcnow().isoformat()
+        }
+
+    def format_prometheus(self, snapshot):
+        """Render a snapshot in the Prometheus text exposition format"""
+        lines = []
+
+        def escape_label(value):
+            return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+        def metric(name, help_text, value, labels=None, metric_type="gauge"):
+            if value is None:
+                return
+            if not any(line.startswith(f"# TYPE {name} ") for line in lines):
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {metric_type}")
+            label_text = ""
+            if labels:
+                label_text = "{" + ",".join(f'{key}="{escape_label(val)}"' for key, val in labels.items()) + "}"
+            lines.append(f"{name}{label_text} {float(value):.6g}")
+
+        metric("sixgents_up", "1 if the bot is connected and ready", 1 if snapshot["ready"] else 0)
+        metric("sixgents_uptime_seconds", "Seconds since the health server started", snapshot["uptime_seconds"])
+        metric("sixgents_guilds", "Guilds the bot is in", snapshot["guilds"])
+        metric("sixgents_gateway_latency_seconds", "Discord gateway heartbeat latency",
+               snapshot["gateway_latency_seconds"])
+        metric("sixgents_loop_lag_seconds", "Event loop scheduling delay", snapshot["loop_lag_seconds"])
+        monitor = snapshot.get("loop_monitor")
+        if monitor:
+            metric("sixgents_loop_lag_p99_seconds", "99th percentile loop lag over the monitor window",
+                   monitor["p99_lag_seconds"])
+            metric("sixgents_loop_lag_max_seconds", "Worst loop lag since the last reset", monitor["max_lag_seconds"])
+            metric("sixgents_loop_stalls_total", "Ticks where loop lag crossed the stall threshold",
+                   monitor["stall_count"], metric_type="counter")
+            for offender in monitor["top_offenders"]:
+                metric("sixgents_loop_blocked_seconds_total", "Time the loop spent blocked, by call site",
+                       offender["blocked_seconds"], {"call": offender["call"]}, metric_type="counter")
+
+        metric("sixgents_pending_tasks", "Asyncio tasks not yet finished", snapshot["pending_tasks"])
+        metric("sixgents_db_latency_seconds", "MongoDB ping round trip", snapshot["db_latency_seconds"])
+        metric("sixgents_db_up", "1 if the last MongoDB ping succeeded", 0 if snapshot["db_error"] else 1)
+
+        for lane, depth in snapshot["rate_limiter_lanes"].items():
+            metric("sixgents_rate_limiter_lane_depth", "Operations waiting or running in a rate limiter lane",
+                   depth, {"lane": lane})
+
+        metric("sixgents_players_queued", "Players waiting in queues", snapshot["queues"]["players_queued"])
+        for status, count in snapshot["queues"]["matches"].items():
+            metric("sixgents_active_matches", "Active matches by status", count, {"status": status})
+
+        reports = snapshot.get("report_pipeline")
+        if reports:
+            metric("sixgents_report_queue_depth", "Reported matches waiting for a rating worker", reports["queue_depth"])
+            metric("sixgents_report_in_flight", "Reported matches being rated", reports["in_flight"])
+            for outcome in ("completed", "failed", "retried", "recovered"):
+                metric("sixgents_reports_total", "Reported matches handled by the pipeline, by outcome",
+                       reports[outcome], {"outcome": outcome}, metric_type="counter")
+            metric("sixgents_report_backpressure_total", "Reports that waited for room in a full queue",
+                   reports["backpressure_waits"], metric_type="counter")
+            metric("sixgents_report_wait_p95_seconds", "95th percentile time a report waited for a worker",
+                   reports["wait_p95_seconds"])
+            metric("sixgents_report_process_p95_seconds", "95th percentile time to rate a reported match",
+                   reports["process_p95_seconds"])
+
+        return "\n".join(lines) + "\n"
+
+    async def handle_root(self, request):
+        return web.Response(
+            text="Discord bot is running! For the leaderboard, please visit the main leaderboard site."
+        )
+
+    async def handle_health(self, request):
+        try:
+            snapshot = await self.collect()
+        except Exception as e:
+            print(f"❌ Error collecting health snapshot: {e}")
+            return web.json_response({"status": "error", "error": str(e)}, status=500)
+
+        status = 200 if snapshot["status"] == "ok" else 503
+        return web.json_response(snapshot, status=status, dumps=lambda data: json.dumps(data, default=str))
+
+    async def handle_metrics(self, request):
+        try:
+            snapshot = await self.collect()
+        except Exception as e:
+            print(f"❌ Error collecting metrics: {e}")
+            return web.Response(status=500, text=f"# error collecting metrics: {e}\n")
+
+        return web.Response(
+            text=self.format_prometheus(snapshot),
+            headers={"Content-Type": "text/plain; version=0.0.4; charset=utf-8"}
+        )
@@ -17,6 +17,11 @@ import threading
 
 # Import our Discord OAuth integration
 from discord_oauth import DiscordOAuth, login_required, get_current_user
+from season_reset import backup_collection
+from db_instrumentation import query_stats, register_query_stats
+from leaderboard_ranks import LeaderboardRanks
+from leaderboard_snapshot import LeaderboardSnapshotReader
+from tiers import TIER_FLOOR, TIER_STARTING_MMR, board_query
 
 # Initialize Flask app
 app = Flask(__name__)
@@ -108,7 +113,8 @@ def cached(timeout=5 * 60, key_prefix='view/%s'):
     return decorator
 
 
-# Connect to MongoDB with error handling
+# Connect to MongoDB with error handling - query stats have to be registered before the client is created
+register_query_stats()
 try:
     client = MongoClient(MONGO_URI, server_api=ServerApi('1'))
     client.admin.command('ping')
@@ -163,6 +169,25 @@ except Exception as e:
     ranks_collection = db['ranks']
     resets_collection = db['resets']
 
+# Leaderboard positions for player lookups - the bot does the rating, so this side just reloads
+# on the same schedule the cached leaderboard pages expire
+leaderboard_ranks = LeaderboardRanks(players_collection, reload_interval=60)
+
+# Leaderboard pages and positions from the bot's snapshot file, when this host can see it
+leaderboard_snapshot = LeaderboardSnapshotReader()
+
+
+def get_leaderboard_positions(player_id):
+    """Player's positions on the ranked, global and tier boards ({} if they can't be worked out)"""
+    try:
+        snapshot = leaderboard_snapshot.current()
+        if snapshot:
+            return snapshot.positions(player_id)
+        return leaderboard_ranks.positions(player_id)
+    except Exception as e:
+        print(f"Error getting leaderboard positions for {player_id}: {e}")
+        return {}
+
 
 @app.template_filter('tojsonfilter')
 def to_json_filter(obj):
@@ -193,6 +218,12 @@ def inject_user():
     return dict(current_user=get_current_user())
 
 
+# Tier boundaries for the rank cards and progress bars
+@app.context_processor
+def inject_tiers():
+    return dict(rank_a_floor=TIER_FLOOR["Rank A"], rank_b_floor=TIER_FLOOR["Rank B"])
+
+
 # Discord OAuth Routes
 @app.route('/auth/discord/login')
 def discord_login():
@@ -527,6 +558,19 @@ def get_admin_stats():
         return jsonify({"error": "Internal server error"}), 500
 
 
+@app.route('/api/admin/query-stats')
+@admin_required
+def get_admin_query_stats():
+    """Database query counts, latencies and slow queries recorded by this web process"""
+    try:
+        limit = min(int(request.args.get('limit', 10)), 50)
+        return jsonify(query_stats.get_summary(limit))
+
+    except Exception as e:
+        print(f"Error getting query stats: {e}")
+        return jsonify({"error": "Internal server error"}), 500
+
+
 @app.context_processor
 def inject_admin_check():
     """Inject admin permission check into all templates"""
@@ -1356,7 +1400,6 @@ def profile_rank_check():
 
 # API Routes
 @app.route('/api/leaderboard/<board_type>')
-@cached(timeout=60)
 def get_leaderboard_by_type(board_type):
     """API endpoint to get leaderboard data with pagination for specific type - FIXED VERSION"""
     page = request.args.get('page', 1, type=int)
@@ -1365,27 +1408,48 @@ def get_leaderboard_by_type(board_type):
     if per_page > 100:
         per_page = 100
 
+    if board_type not in ("all", "global", "rank-a", "rank-b", "rank-c"):
+        board_type = "global"
+
+    # The bot's snapshot answers without touching the database; Mongo is the fallback
+    snapshot = leaderboard_snapshot.current()
+    if snapshot:
+        top_players, total_players = snapshot.page(board_type, page, per_page)
+        for player in top_players:
+            ranked_change = player.pop("recent_change")
+            global_change = player.pop("global_recent_change")
+            recent_change = global_change if board_type == "global" else ranked_change
+            format_leaderboard_player(player, board_type, format_recent_mmr_change(recent_change))
+        return leaderboard_page(top_players, board_type, page, per_page, total_players)
+
+    return get_leaderboard_from_db(board_type)
+
+
+@cached(timeout=60)
+def get_leaderboard_from_db(board_type):
+    """Leaderboard page straight from MongoDB, for when there is no snapshot to map"""
+    page = request.args.get('page', 1, type=int)
+    per_page = min(request.args.get('per_page', 25, type=int), 100)
+
     query = {}
     sort_field = "mmr"
-    mmr_field = "mmr"
 
     if board_type == "global":
         query = {"global_matches": {"$gt": 0}}
         sort_field = "global_mmr"
-        mmr_field = "global_mmr"
-    elif board_type == "rank-a":
-        query = {"mmr": {"$gte": 1600}, "matches": {"$gt": 0}}
-    elif board_type == "rank-b":
-        query = {"mmr": {"$gte": 1100, "$lt": 1600}, "matches": {"$gt": 0}}
-    elif board_type == "rank-c":
-        query = {"mmr": {"$lt": 1100}, "matches": {"$gt": 0}}
-    elif board_type != "all":
-        board_type = "global"
-        query = {"global_matches": {"$gt": 0}}
-        sort_field = "global_mmr"
-        mmr_field = "global_mmr"
+    elif board_query(board_type):
+        # Persisted tier + matches filter - a walk of the partial (tier, mmr) index
+        query = board_query(board_type)
 
-    total_players = players_collection.count_documents(query)
+    # Board sizes come from the in-memory position counts rather than a count per page view
+    try:
+        if board_type == "all":
+            total_players = players_collection.estimated_document_count()
+        else:
+            total_players = leaderboard_ranks.board_size(board_type)
+    except Exception as e:
+        print(f"Error getting board size from leaderboard positions: {e}")
+        total_players = players_collection.count_documents(query)
     skip = (page - 1) * per_page
 
     # FIXED: Include ALL streak fields in projection
@@ -1415,61 +1479,16 @@ def get_leaderboard_by_type(board_type):
                        .sort(sort_field, -1)
                        .skip(skip).limit(per_page))
 
-    # Process players for display
     for player in top_players:
-        player_id = player.get("id")
-
-        if board_type == "global":
-            matches = player.get("global_matches", 0)
-            wins = player.get("global_wins", 0)
-            # FIXED: Use global streak for global leaderboard
-            current_streak = player.get("global_current_streak", 0)
-            longest_win_streak = player.get("global_longest_win_streak", 0)
-            longest_loss_streak = player.get("global_longest_loss_streak", 0)
-            player["mmr_display"] = player.get(mmr_field, 0)
-        else:
-            matches = player.get("matches", 0)
-            wins = player.get("wins", 0)
-            # FIXED: Use ranked streak for ranked leaderboards
-            current_streak = player.get("current_streak", 0)
-            longest_win_streak = player.get("longest_win_streak", 0)
-            longest_loss_streak = player.get("longest_loss_streak", 0)
-            player["mmr_display"] = player.get(mmr_field, 0)
+        recent_mmr_change = get_recent_mmr_change(player.get("id"), board_type == "global")
+        format_leaderboard_player(player, board_type, recent_mmr_change)
 
-        player["win_rate"] = round((wins / matches) * 100, 2) if matches > 0 else 0
+    return leaderboard_page(top_players, board_type, page, per_page, total_players)
 
-        if "last_updated" in player and player["last_updated"]:
-            player["last_match"] = player["last_updated"].strftime("%Y-%m-%d")
-        else:
-            player["last_match"] = "Unknown"
-
-        # FIXED: Format streak for display with proper logic
-        if current_streak > 0:
-            if current_streak >= 3:
-                player["streak_display"] = f" {current_streak}"
-            else:
-                player["streak_display"] = f"{current_streak}"
-        elif current_streak < 0:
-            if current_streak <= -3:
-                player["streak_display"] = f" {abs(current_streak)}"
-            else:
-                player["streak_display"] = f"{abs(current_streak)}"
-        else:
-            player["streak_display"] = ""
-
-        # FIXED: Add longest streak info for tooltips/details
-        player["longest_win_streak_display"] = f"{longest_win_streak} Wins" if longest_win_streak > 0 else "None"
-        player["longest_loss_streak_display"] = f"{abs(longest_loss_streak)} Losses" if longest_loss_streak < 0 else "None"
-
-        # Get recent MMR change (existing code)
-        recent_mmr_change = get_recent_mmr_change(player_id, board_type == "global")
-        player["recent_mmr_change"] = recent_mmr_change
-
-        if "last_updated" in player:
-            del player["last_updated"]
 
+def leaderboard_page(players, board_type, page, per_page, total_players):
     return jsonify({
-        "players": top_players,
+        "players": players,
         "board_type": board_type,
         "pagination": {
             "total": total_players,
@@ -1480,6 +1499,104 @@ def get_leaderboard_by_type(board_type):
     })
 
 
+def format_leaderboard_player(player, board_type, recent_mmr_change):
+    """Add the display fields a leaderboard row needs"""
+    if board_type == "global":
+        matches = player.get("global_matches", 0)
+        wins = player.get("global_wins", 0)
+        # FIXED: Use global streak for global leaderboard
+        current_streak = player.get("global_current_streak", 0)
+        longest_win_streak = player.get("global_longest_win_streak", 0)
+        longest_loss_streak = player.get("global_longest_loss_streak", 0)
+        player["mmr_display"] = player.get("global_mmr", 0)
+    else:
+        matches = player.get("matches", 0)
+        wins = player.get("wins", 0)
+        # FIXED: Use ranked streak for ranked leaderboards
+        current_streak = player.get("current_streak", 0)
+        longest_win_streak = player.get("longest_win_streak", 0)
+        longest_loss_streak = player.get("longest_loss_streak", 0)
+        player["mmr_display"] = player.get("mmr", 0)
+
+    player["win_rate"] = round((wins / matches) * 100, 2) if matches > 0 else 0
+
+    if "last_updated" in player and player["last_updated"]:
+        player["last_match"] = player["last_updated"].strftime("%Y-%m-%d")
+    else:
+        player["last_match"] = "Unknown"
+
+    # FIXED: Format streak for display with proper logic
+    if current_streak > 0:
+        if current_streak >= 3:
+            player["streak_display"] = f" {current_streak}"
+        else:
+            player["streak_display"] = f"{current_streak}"
+    elif current_streak < 0:
+        if current_streak <= -3:
+            player["streak_display"] = f" {abs(current_streak)}"
+        else:
+            player["streak_display"] = f"{abs(current_streak)}"
+    else:
+        player["streak_display"] = ""
+
+    # FIXED: Add longest streak info for tooltips/details
+    player["longest_win_streak_display"] = f"{longest_win_streak} Wins" if longest_win_streak > 0 else "None"
+    player["longest_loss_streak_display"] = f"{abs(longest_loss_streak)} Losses" if longest_loss_streak < 0 else "None"
+
+    player["recent_mmr_change"] = recent_mmr_change
+
+    if "last_updated" in player:
+        del player["last_updated"]
+
+
+def format_recent_mmr_change(recent_change):
+    """Display info for a player's latest (mmr_change, streak), or None when they have no rated match"""
+    if recent_change is None:
+        return {
+            "change": 0,
+            "display": "",
+            "class": "text-muted",
+            "streak": ""
+        }
+
+    # FIXED: Get streak info from MMR change record
+    change, streak = recent_change
+    if streak > 0:
+        if streak >= 3:
+            streak_display = f" {streak}W"
+        else:
+            streak_display = f"{streak}W"
+    elif streak < 0:
+        if streak <= -3:
+            streak_display = f" {abs(streak)}L"
+        else:
+            streak_display = f"{abs(streak)}L"
+    else:
+        streak_display = ""
+
+    if change > 0:
+        return {
+            "change": change,
+            "display": f"+{change}",
+            "class": "text-success",
+            "streak": streak_display
+        }
+    elif change < 0:
+        return {
+            "change": change,
+            "display": str(change),
+            "class": "text-danger",
+            "streak": streak_display
+        }
+    else:
+        return {
+            "change": 0,
+            "display": "0",
+            "class": "text-muted",
+            "streak": streak_display
+        }
+
+
 def get_recent_mmr_change(player_id, is_global=False):
     """Get the most recent MMR change for a player - FIXED VERSION"""
     try:
@@ -1519,42 +1636,7 @@ def get_recent_mmr_change(player_id, is_global=False):
                 else:
                     continue
 
-                # FIXED: Get streak info from MMR change record
-                streak = mmr_change.get("streak", 0)
-                if streak > 0:
-                    if streak >= 3:
-                        streak_display = f" {streak}W"
-                    else:
-                        streak_display = f"{streak}W"
-                elif streak < 0:
-                    if streak <= -3:
-                        streak_display = f" {abs(streak)}L"
-                    else:
-                        streak_display = f"{abs(streak)}L"
-                else:
-                    streak_display = ""
-
-                if change > 0:
-                    return {
-                        "change": change,
-                        "display": f"+{change}",
-                        "class": "text-success",
-                        "streak": streak_display
-                    }
-                elif change < 0:
-                    return {
-                        "change": change,
-                        "display": str(change),
-                        "class": "text-danger",
-                        "streak": streak_display
-                    }
-                else:
-                    return {
-                        "change": 0,
-                        "display": "0",
-                        "class": "text-muted",
-                        "streak": streak_display
-                    }
+                return format_recent_mmr_change((change, mmr_change.get("streak", 0)))
 
         return {
             "change": 0,
@@ -1573,6 +1655,51 @@ def get_recent_mmr_change(player_id, is_global=False):
         }
 
 
+# Player document fields returned by /api/player/<id>
+PLAYER_API_FIELDS = {
+    "_id": 0, "id": 1, "name": 1, "tier": 1,
+    "mmr": 1, "wins": 1, "losses": 1, "matches": 1,
+    "current_streak": 1, "longest_win_streak": 1, "longest_loss_streak": 1,
+    "global_mmr": 1, "global_wins": 1, "global_losses": 1, "global_matches": 1,
+    "global_current_streak": 1, "global_longest_win_streak": 1, "global_longest_loss_streak": 1
+}
+
+
+def player_match_projection(player_id):
+    """Match fields for a player's history row - team names only, and just their own MMR change"""
+    return {
+        "_id": 0, "match_id": 1, "winner": 1, "is_global": 1, "completed_at": 1,
+        "team1.id": 1, "team1.name": 1, "team2.id": 1, "team2.name": 1,
+        "mmr_changes": {"$elemMatch": {"player_id": player_id}}
+    }
+
+
+def format_history_match(match, player_id):
+    """Add result, date and the player's MMR change/streak to a projected match"""
+    player_in_team1 = any(p.get("id") == player_id for p in match.get("team1", []))
+    winner = match.get("winner")
+    match["player_result"] = "Win" if (player_in_team1 and winner == 1) or (
+        not player_in_team1 and winner == 2) else "Loss"
+    match["is_global"] = match.get("is_global", False)
+
+    completed_at = match.get("completed_at")
+    try:
+        match["date"] = completed_at.strftime("%Y-%m-%d") if completed_at else "Unknown"
+    except (AttributeError, ValueError):
+        match["date"] = "Unknown"
+    if completed_at:
+        match["completed_at"] = str(completed_at)
+
+    # $elemMatch leaves at most the player's own entry
+    change = (match.pop("mmr_changes", None) or [None])[0]
+    if change:
+        streak = change.get("streak", 0)
+        match["mmr_change"] = change.get("mmr_change", 0)
+        match["streak"] = streak
+        match["streak_display"] = str(abs(streak)) if streak else "No streak"
+    return match
+
+
 @app.route('/api/player/<player_id>')
 def get_player(player_id):
     """API endpoint to get player data with improved error handling and proper ObjectId serialization"""
@@ -1588,17 +1715,13 @@ def get_player(player_id):
         if not player_id or not isinstance(player_id, str):
             return jsonify({"error": "Invalid player ID format"}), 400
 
-        # Try to find the player
-        player = players_collection.find_one({"id": player_id})
+        # Only the fields the player modals show; match history comes from /api/player/<id>/matches
+        player = players_collection.find_one({"id": player_id}, PLAYER_API_FIELDS)
 
         if not player:
             print(f"Player not found: {player_id}")
             return jsonify({"error": "Player not found"}), 404
 
-        # Remove MongoDB _id field which is not JSON serializable
-        if '_id' in player:
-            del player['_id']
-
         # Ensure player has global MMR fields
         if "global_mmr" not in player:
             player["global_mmr"] = 300
@@ -1611,6 +1734,9 @@ def get_player(player_id):
         wins = player.get("wins", 0)
         player["win_rate"] = round((wins / matches) * 100, 2) if matches > 0 else 0
 
+        # Board positions ({"ranked": {"rank", "total", "percentile"}, "global": ..., "rank-a": ...})
+        player["leaderboard_positions"] = get_leaderboard_positions(player_id)
+
         # Calculate global win rate
         global_matches = player.get("global_matches", 0)
         global_wins = player.get("global_wins", 0)
@@ -1665,106 +1791,6 @@ def get_player(player_id):
         player[
             "global_longest_loss_streak_display"] = f"{abs(global_longest_loss_streak)} Losses" if global_longest_loss_streak < 0 else "None"
 
-        # Get recent matches for this player - handle potential errors
-        try:
-            query = {"$or": [
-                {"team1.id": player_id},
-                {"team2.id": player_id}
-            ], "status": "completed"}
-
-            recent_matches = list(matches_collection.find(
-                query
-            ).sort("completed_at", -1).limit(20))  # Increased limit to get more matches
-
-            print(f"Found {len(recent_matches)} recent matches for player {player_id}")
-        except Exception as match_error:
-            print(f"Error fetching matches for player {player_id}: {str(match_error)}")
-            recent_matches = []
-
-        # Format match data and include is_global flag
-        formatted_matches = []
-        for match in recent_matches:
-            try:
-                # Remove MongoDB _id from match
-                if '_id' in match:
-                    del match['_id']
-
-                # Remove MongoDB _id from team members
-                if 'team1' in match and isinstance(match['team1'], list):
-                    for team_member in match['team1']:
-                        if '_id' in team_member:
-                            del team_member['_id']
-
-                if 'team2' in match and isinstance(match['team2'], list):
-                    for team_member in match['team2']:
-                        if '_id' in team_member:
-                            del team_member['_id']
-
-                # Determine if the player won or lost
-                player_in_team1 = False
-                for p in match.get("team1", []):
-                    if p.get("id") == player_id:
-                        player_in_team1 = True
-                        break
-
-                winner = match.get("winner")
-
-                if (player_in_team1 and winner == 1) or (not player_in_team1 and winner == 2):
-                    match["player_result"] = "Win"
-                else:
-                    match["player_result"] = "Loss"
-
-                # Add is_global flag if missing
-                if "is_global" not in match:
-                    # For backwards compatibility, determine based on channel
-                    channel_id = match.get("channel_id")
-                    # Default to non-global
-                    match["is_global"] = False
-
-                # Format date - protect against missing/invalid dates
-                if "completed_at" in match and match["completed_at"]:
-                    try:
-                        match["date"] = match["completed_at"].strftime("%Y-%m-%d")
-                    except (AttributeError, ValueError) as e:
-                        match["date"] = "Unknown"
-                    # Convert completed_at to string to avoid serialization issues
-                    match["completed_at"] = str(match["completed_at"])
-                else:
-                    match["date"] = "Unknown"
-
-                # Add MMR change info if available
-                for change in match.get("mmr_changes", []):
-                    if change.get("player_id") == player_id:
-                        # Add MMR change and streak info to match data
-                        match["mmr_change"] = change.get("mmr_change", 0)
-                        match["streak"] = change.get("streak", 0)
-
-                        # Format streak with emojis for display
-                        streak = change.get("streak", 0)
-                        if streak > 0:
-                            if streak >= 3:
-                                match["streak_display"] = f" {streak}"
-                            else:
-                                match["streak_display"] = f"{streak}"
-                        elif streak < 0:
-                            if streak <= -3:
-                                match["streak_display"] = f" {abs(streak)}"
-                            else:
-                                match["streak_display"] = f"{abs(streak)}"
-                        else:
-                            match["streak_display"] = "No streak"
-
-                        break
-
-                formatted_matches.append(match)
-            except Exception as format_error:
-                print(f"Error formatting match {match.get('match_id', 'unknown')}: {str(format_error)}")
-                # Skip this match if there's an error formatting it
-                continue
-
-        # Add match history
-        player["recent_matches"] = formatted_matches
-
         # Use Flask's jsonify which properly handles serialization
         return jsonify(player)
     except Exception as e:
@@ -1775,6 +1801,59 @@ def get_player(player_id):
         return jsonify({"error": "Internal server error", "message": str(e)}), 500
 
 
+@app.route('/api/player/<player_id>/matches')
+def get_player_matches(player_id):
+    """
+    A page of a player's completed matches, newest first (type=ranked|global, or both if omitted).
+    Pages continue from the previous one's next_before cursor rather than skipping, so each one
+    walks the (team1.id|team2.id, completed_at) history indexes the bot creates
+    """
+    per_page = min(max(request.args.get('per_page', 10, type=int), 1), 50)
+    match_type = request.args.get('type', '')
+
+    query = {"$or": [{"team1.id": player_id}, {"team2.id": player_id}], "status": "completed"}
+    if match_type == "global":
+        query["is_global"] = True
+    elif match_type == "ranked":
+        query["is_global"] = {"$ne": True}
+
+    before = request.args.get('before')
+    if before:
+        try:
+            query["completed_at"] = {"$lt": datetime.datetime.fromisoformat(before)}
+        except ValueError:
+            return jsonify({"error": "Invalid before cursor"}), 400
+
+    try:
+        # One extra row tells us whether there's another page without counting
+        matches = list(matches_collection.find(query, player_match_projection(player_id))
+                       .sort("completed_at", -1).limit(per_page + 1))
+    except Exception as e:
+        print(f"Error fetching matches for player {player_id}: {str(e)}")
+        return jsonify({"error": "Internal server error"}), 500
+
+    has_more = len(matches) > per_page
+    matches = matches[:per_page]
+    last_completed = matches[-1].get("completed_at") if matches else None
+    return jsonify({
+        "matches": [format_history_match(match, player_id) for match in matches],
+        "pagination": {
+            "per_page": per_page,
+            "has_more": has_more,
+            "next_before": last_completed.isoformat() if has_more and last_completed else None
+        }
+    })
+
+
+@app.route('/api/player/<player_id>/position')
+def get_player_position(player_id):
+    """A player's leaderboard positions without the rest of their profile"""
+    positions = get_leaderboard_positions(player_id)
+    if not positions and not players_collection.find_one({"id": player_id}, {"_id": 1}):
+        return jsonify({"error": "Player not found"}), 404
+    return jsonify({"player_id": player_id, "positions": positions})
+
+
 @app.route('/api/search')
 def search_players():
     """Search for players by name"""
@@ -1911,14 +1990,7 @@ def get_tier_from_rank(rank):
 
 def get_mmr_from_rank(rank):
     """Determine starting MMR from Rocket League rank"""
-    rank_lower = rank.lower()
-
-    if "grand champion" in rank_lower or "supersonic" in rank_lower or "gc" in rank_lower or "ssl" in rank_lower:
-        return 1850
-    elif "champion" in rank_lower:
-        return 1350
-    else:
-        return 600  # Default MMR for Diamond and below
+    return TIER_STARTING_MMR[get_tier_from_rank(rank)]
 
 
 def assign_discord_role(username, role_name=None, role_id=None, discord_id=None):
@@ -2409,27 +2481,31 @@ def reset_leaderboard():
         match_count = matches_collection.count_documents({})
         rank_count = ranks_collection.count_documents({})
 
-        # Create backup collections with timestamp
+        # Create backup collections with timestamp ($merge runs server-side)
         timestamp = datetime.datetime.utcnow()  # Fixed: Use datetime.datetime
         timestamp_str = timestamp.strftime("%Y%m%d_%H%M%S")
 
         # Backup players
         if player_count > 0:
-            db[f'players_backup_{timestamp_str}'].insert_many(players_collection.find())
+            backup_collection(players_collection, f'players_backup_{timestamp_str}')
 
         # Backup matches
         if match_count > 0:
-            db[f'matches_backup_{timestamp_str}'].insert_many(matches_collection.find())
+            backup_collection(matches_collection, f'matches_backup_{timestamp_str}')
 
         # Backup ranks
         if rank_count > 0:
-            db[f'ranks_backup_{timestamp_str}'].insert_many(ranks_collection.find())
+            backup_collection(ranks_collection, f'ranks_backup_{timestamp_str}')
 
         # Clear collections
         players_collection.delete_many({})
         matches_collection.delete_many({})
         ranks_collection.delete_many({})
 
+        # The bot's snapshot still lists the wiped players until it writes a new one
+        leaderboard_snapshot.discard()
+        leaderboard_ranks.invalidate()
+
         # Record the reset event
         resets_collection.insert_one({
             "type": "leaderboard_reset",
@@ -2676,12 +2752,27 @@ def debug_database():
             ("resets", resets_collection)
         ]:
             try:
-                count = collection.count_documents({})
+                # collStats reads collection metadata instead of scanning to count
+                try:
+                    coll_stats = db.command("collStats", collection_name)
+                    count = coll_stats.get("count", 0)
+                    storage = {
+                        "size_bytes": coll_stats.get("size"),
+                        "avg_obj_size": coll_stats.get("avgObjSize"),
+                        "storage_size_bytes": coll_stats.get("storageSize"),
+                        "index_count": coll_stats.get("nindexes"),
+                        "index_size_bytes": coll_stats.get("totalIndexSize")
+                    }
+                except Exception:
+                    count = collection.estimated_document_count()
+                    storage = {}
+
                 # Get a sample document if available
                 sample = collection.find_one({}, {"_id": 0}) if count > 0 else None
 
                 collections_info[collection_name] = {
                     "count": count,
+                    **storage,
                     "sample_fields": list(sample.keys()) if sample else []
                 }
             except Exception as e:
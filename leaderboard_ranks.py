@@ -0,0 +1,200 @@
+import math
+import threading
+import time
+from logging_config import get_logger
+from tiers import BOARD_TIERS, tier_range
+
+logger = get_logger("leaderboard_ranks")
+
+# MMR is counted in whole-point buckets; anything above the top bucket shares it
+MMR_BUCKETS = 10000
+
+# Full reload interval, so writes made outside the report path (admin edits, resets) are picked up
+RELOAD_INTERVAL = 600
+
+# Boards backed by a counter: board -> (MMR field, games field that has to be above zero)
+BOARDS = {
+    "ranked": ("mmr", "matches"),
+    "global": ("global_mmr", "global_matches")
+}
+
+# Tier boards are MMR slices of the ranked board, named like the website's board types
+TIER_BOARDS = {
+    board: (tier_range(tier)[0], tier_range(tier)[1] or MMR_BUCKETS) for board, tier in BOARD_TIERS.items()
+}
+
+
+def mmr_bucket(mmr):
+    return min(max(int(math.floor(mmr or 0)), 0), MMR_BUCKETS - 1)
+
+
+class MMRCounter:
+    """Fenwick tree of player counts per MMR bucket - O(log n) updates and range counts"""
+
+    def __init__(self, size=MMR_BUCKETS):
+        self.size = size
+        self.tree = [0] * (size + 1)
+        self.total = 0
+
+    def add(self, bucket, delta=1):
+        self.total += delta
+        index = bucket + 1
+        while index <= self.size:
+            self.tree[index] += delta
+            index += index & -index
+
+    def count_below(self, bucket):
+        """Players in buckets lower than this one"""
+        count = 0
+        index = min(bucket, self.size)
+        while index > 0:
+            count += self.tree[index]
+            index -= index & -index
+        return count
+
+    def count_between(self, low, high):
+        """Players in buckets low..high-1"""
+        return self.count_below(high) - self.count_below(low)
+
+
+class LeaderboardRanks:
+    """
+    Leaderboard positions without sorting the players collection. Ranked and global boards each keep
+    a count of players per MMR bucket, so a position is the number of players above plus one (tied
+    players share a position) and the tier boards are ranges of the ranked counts.
+
+    Loaded once from the players collection, then kept current by apply_mmr_changes after every rated
+    match; invalidate() forces a reload after bulk writes such as a season reset.
+    """
+
+    def __init__(self, players_collection, reload_interval=RELOAD_INTERVAL):
+        self.players = players_collection
+        self.reload_interval = reload_interval
+        self.lock = threading.Lock()
+        self.counters = {board: MMRCounter() for board in BOARDS}
+        # board -> {player_id: bucket} for players currently on it
+        self.buckets = {board: {} for board in BOARDS}
+        self.loaded_at = None
+
+    def load(self):
+        """Rebuild every board from the players collection (one projected scan)"""
+        started = time.perf_counter()
+        projection = {"_id": 0, "id": 1}
+        for mmr_field, games_field in BOARDS.values():
+            projection[mmr_field] = 1
+            projection[games_field] = 1
+
+        counters = {board: MMRCounter() for board in BOARDS}
+        buckets = {board: {} for board in BOARDS}
+        for player in self.players.find({}, projection):
+            player_id = player.get("id")
+            if not player_id:
+                continue
+            for board, (mmr_field, games_field) in BOARDS.items():
+                if (player.get(games_field) or 0) > 0:
+                    bucket = mmr_bucket(player.get(mmr_field))
+                    buckets[board][player_id] = bucket
+                    counters[board].add(bucket)
+
+        with self.lock:
+            self.counters = counters
+            self.buckets = buckets
+            self.loaded_at = time.time()
+
+        logger.info("📊 Leaderboard positions loaded: %s ranked, %s global in %.0fms",
+                    counters["ranked"].total, counters["global"].total, (time.perf_counter() - started) * 1000)
+
+    def invalidate(self):
+        """Reload on the next lookup"""
+        self.loaded_at = None
+
+    def ensure_loaded(self):
+        if self.loaded_at is None or time.time() - self.loaded_at > self.reload_interval:
+            self.load()
+
+    def set_player(self, board, player_id, mmr):
+        """Move a player to their new MMR on a board (adding them if they weren't on it yet)"""
+        bucket = mmr_bucket(mmr)
+        with self.lock:
+            counter = self.counters[board]
+            old_bucket = self.buckets[board].get(player_id)
+            if old_bucket == bucket:
+                return
+            if old_bucket is not None:
+                counter.add(old_bucket, -1)
+            counter.add(bucket)
+            self.buckets[board][player_id] = bucket
+
+    def remove_player(self, player_id):
+        with self.lock:
+            for board, counter in self.counters.items():
+                bucket = self.buckets[board].pop(player_id, None)
+                if bucket is not None:
+                    counter.add(bucket, -1)
+
+    def apply_mmr_changes(self, mmr_changes, is_global=False):
+        """Update the boards from a rated match's mmr_changes (everyone in it now has games played)"""
+        if self.loaded_at is None:
+            return
+        for change in mmr_changes:
+            if change.get("player_id") and change.get("new_mmr") is not None:
+                board = "global" if change.get("is_global", is_global) else "ranked"
+                self.set_player(board, change["player_id"], change["new_mmr"])
+
+    def position(self, board, player_id):
+        """
+        Player's position on a board ("ranked", "global", "rank-a", "rank-b" or "rank-c") as
+        {"rank", "total", "percentile"}, or None if they aren't on it. percentile is the share of
+        the board below the player
+        """
+        self.ensure_loaded()
+        counter_board = "ranked" if board in TIER_BOARDS else board
+        with self.lock:
+            bucket = self.buckets[counter_board].get(player_id)
+            if bucket is None:
+                return None
+            counter = self.counters[counter_board]
+            low, high = TIER_BOARDS.get(board, (0, MMR_BUCKETS))
+            if not low <= bucket < high:
+                return None
+            total = counter.count_between(low, high)
+            above = counter.count_between(bucket + 1, high)
+            below = counter.count_between(low, bucket)
+
+        return {
+            "rank": above + 1,
+            "total": total,
+            "percentile": round(below / total * 100, 1) if total else 0.0
+        }
+
+    def positions(self, player_id):
+        """Positions on the ranked, global and tier boards (only the boards the player is on)"""
+        results = {}
+        for board in list(BOARDS) + list(TIER_BOARDS):
+            position = self.position(board, player_id)
+            if position:
+                results[board] = position
+        return results
+
+    def board_size(self, board):
+        self.ensure_loaded()
+        counter_board = "ranked" if board in TIER_BOARDS else board
+        low, high = TIER_BOARDS.get(board, (0, MMR_BUCKETS))
+        with self.lock:
+            return self.counters[counter_board].count_between(low, high)
+
+    def get_stats(self):
+        return {
+            "loaded": self.loaded_at is not None,
+            "loaded_at": self.loaded_at,
+            "ranked_players": self.counters["ranked"].total,
+            "global_players": self.counters["global"].total
+        }
+
+
+def format_position(position):
+    """'#37 of 812 (top 5%)' for embeds"""
+    if not position:
+        return "Unranked"
+    top = max(1, math.ceil(position["rank"] / position["total"] * 100))
+    return f"#{position['rank']} of {position['total']} (top {top}%)"
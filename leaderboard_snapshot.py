@@ -0,0 +1,443 @@
+import asyncio
+import datetime
+import mmap
+import os
+import struct
+import threading
+import time
+from leaderboard_ranks import TIER_BOARDS, mmr_bucket
+from logging_config import get_logger
+
+logger = get_logger("leaderboard_snapshot")
+
+# Where the bot writes the snapshot and the website maps it from (both need to see the same file)
+SNAPSHOT_PATH = os.getenv("LEADERBOARD_SNAPSHOT_PATH", "leaderboard_snapshot.bin")
+
+# Reports are batched - a new snapshot is written at most this often while ratings keep changing
+SNAPSHOT_INTERVAL = float(os.getenv("LEADERBOARD_SNAPSHOT_INTERVAL", 5))
+
+# The website stops trusting a snapshot older than this; the bot rewrites an unchanged one well before
+SNAPSHOT_MAX_AGE = float(os.getenv("LEADERBOARD_SNAPSHOT_MAX_AGE", 300))
+
+MAGIC = b"SGLB"
+FORMAT_VERSION = 1
+
+# Boards in the order of the board directory, named like the website's board types
+BOARD_NAMES = ("all", "global", "rank-a", "rank-b", "rank-c")
+
+# File layout: header, board directory, player records, board index arrays, string table.
+# Every board is an array of uint32 player indexes sorted by that board's MMR; the "ids" array
+# is sorted by player ID so lookups can binary search it
+HEADER = struct.Struct("<4sHHQdIIQ")  # magic, format, boards, version, created_at, players, ranked, strings offset
+BOARD_ENTRY = struct.Struct("<8sQI")  # name, offset, count
+INDEX = struct.Struct("<I")
+
+PLAYER_FIELDS = (
+    "id_offset", "id_length", "name_offset", "name_length",
+    "mmr", "global_mmr",
+    "wins", "losses", "matches", "global_wins", "global_losses", "global_matches",
+    "current_streak", "longest_win_streak", "longest_loss_streak",
+    "global_current_streak", "global_longest_win_streak", "global_longest_loss_streak",
+    "last_updated",
+    "recent_change", "recent_streak", "global_recent_change", "global_recent_streak",
+    "ranked_rank", "global_rank", "tier_rank",
+    "flags"
+)
+PLAYER = struct.Struct("<IHIHdd6i6iq4i3IB")
+
+# flags bits
+HAS_RECENT_CHANGE = 1
+HAS_GLOBAL_RECENT_CHANGE = 2
+
+# Stats copied straight from the player document
+COUNT_FIELDS = (
+    "wins", "losses", "matches", "global_wins", "global_losses", "global_matches",
+    "current_streak", "longest_win_streak", "longest_loss_streak",
+    "global_current_streak", "global_longest_win_streak", "global_longest_loss_streak"
+)
+
+PLAYER_PROJECTION = dict({"_id": 0, "id": 1, "name": 1, "mmr": 1, "global_mmr": 1, "last_updated": 1},
+                         **{field: 1 for field in COUNT_FIELDS})
+
+
+def competition_ranks(players, mmr_field):
+    """Positions for players sorted by MMR - tied players (same MMR bucket) share one"""
+    ranks = {}
+    previous = None
+    for index, player in enumerate(players):
+        bucket = mmr_bucket(player.get(mmr_field))
+        if bucket != previous:
+            rank = index + 1
+            previous = bucket
+        ranks[player["id"]] = rank
+    return ranks
+
+
+def build_snapshot(players, recent_changes, version):
+    """
+    Encode players (documents with PLAYER_PROJECTION fields) into snapshot bytes. recent_changes maps
+    (player_id, is_global) to the (mmr_change, streak) of the player's latest rated match
+    """
+    players = [player for player in players if player.get("id")]
+
+    def by_mmr(field):
+        return lambda player: (-(player.get(field) or 0), player["id"])
+
+    everyone = sorted(players, key=by_mmr("mmr"))
+    ranked = [player for player in everyone if (player.get("matches") or 0) > 0]
+    boards = {
+        "all": everyone,
+        "global": sorted([player for player in players if (player.get("global_matches") or 0) > 0],
+                         key=by_mmr("global_mmr"))
+    }
+    for board, (low, high) in TIER_BOARDS.items():
+        boards[board] = [player for player in ranked if low <= mmr_bucket(player.get("mmr")) < high]
+
+    ranked_ranks = competition_ranks(ranked, "mmr")
+    global_ranks = competition_ranks(boards["global"], "global_mmr")
+    tier_ranks = {}
+    for board in TIER_BOARDS:
+        tier_ranks.update(competition_ranks(boards[board], "mmr"))
+
+    # Player records in ID order, so the "ids" board is just 0..n-1
+    players.sort(key=lambda player: player["id"])
+    index_of = {player["id"]: index for index, player in enumerate(players)}
+
+    strings = bytearray()
+
+    def add_string(text):
+        encoded = str(text or "").encode("utf-8")[:65535]
+        offset = len(strings)
+        strings.extend(encoded)
+        return offset, len(encoded)
+
+    records = bytearray()
+    for player in players:
+        player_id = player["id"]
+        id_offset, id_length = add_string(player_id)
+        name_offset, name_length = add_string(player.get("name", "Unknown"))
+
+        last_updated = player.get("last_updated")
+        if isinstance(last_updated, datetime.datetime):
+            last_updated = int(last_updated.replace(tzinfo=datetime.timezone.utc).timestamp())
+        else:
+            last_updated = -1
+
+        flags = 0
+        recent_change, recent_streak = recent_changes.get((player_id, False), (0, 0))
+        if (player_id, False) in recent_changes:
+            flags |= HAS_RECENT_CHANGE
+        global_recent_change, global_recent_streak = recent_changes.get((player_id, True), (0, 0))
+        if (player_id, True) in recent_changes:
+            flags |= HAS_GLOBAL_RECENT_CHANGE
+
+        records.extend(PLAYER.pack(
+            id_offset, id_length, name_offset, name_length,
+            float(player.get("mmr") or 0), float(player.get("global_mmr", 300) or 0),
+            *(int(player.get(field) or 0) for field in COUNT_FIELDS),
+            last_updated,
+            int(recent_change or 0), int(recent_streak or 0),
+            int(global_recent_change or 0), int(global_recent_streak or 0),
+            ranked_ranks.get(player_id, 0), global_ranks.get(player_id, 0), tier_ranks.get(player_id, 0),
+            flags
+        ))
+
+    board_arrays = [(name, [index_of[player["id"]] for player in boards[name]]) for name in BOARD_NAMES]
+    board_arrays.append(("ids", list(range(len(players)))))
+
+    directory = bytearray()
+    arrays = bytearray()
+    offset = HEADER.size + BOARD_ENTRY.size * len(board_arrays) + len(records)
+    for name, indexes in board_arrays:
+        directory.extend(BOARD_ENTRY.pack(name.encode(), offset + len(arrays), len(indexes)))
+        arrays.extend(struct.pack(f"<{len(indexes)}I", *indexes))
+
+    strings_offset = offset + len(arrays)
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, len(board_arrays), version, time.time(),
+                         len(players), len(ranked), strings_offset)
+    return b"".join((header, bytes(directory), bytes(records), bytes(arrays), bytes(strings)))
+
+
+class LeaderboardSnapshotWriter:
+    """
+    Bot side of the leaderboard snapshot. Rated matches mark it dirty (and update each player's latest
+    MMR change), and a background task rewrites the file at most every SNAPSHOT_INTERVAL seconds:
+    one projected scan of the players collection, then an atomic replace so the website never maps
+    a half-written file
+    """
+
+    def __init__(self, players_collection, matches_collection, path=SNAPSHOT_PATH, interval=SNAPSHOT_INTERVAL):
+        self.players = players_collection
+        self.matches = matches_collection
+        self.path = path
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.task = None
+
+        # (player_id, is_global) -> (mmr_change, streak) of the latest rated match
+        self.recent_changes = {}
+        self.recent_loaded = False
+        self.dirty = True
+
+        self.version = 0
+        self.writes = 0
+        self.last_write_at = 0
+        self.last_write_ms = None
+        self.last_size = 0
+        self.last_error = None
+
+    def start(self):
+        """Start the background writer (call from the running loop)"""
+        if not self.task or self.task.done():
+            self.task = asyncio.get_running_loop().create_task(self._snapshot_loop())
+            print(f"✅ Leaderboard snapshot writer started ({self.path}, every {self.interval}s when changed)")
+
+    async def stop(self):
+        if self.task:
+            self.task.cancel()
+
+    def mark_dirty(self):
+        self.dirty = True
+
+    def invalidate(self):
+        """Rebuild the latest MMR changes from match history too (after resets and rebuilds)"""
+        with self.lock:
+            self.recent_loaded = False
+        self.dirty = True
+
+    def note_mmr_changes(self, mmr_changes, is_global=False):
+        with self.lock:
+            for change in mmr_changes:
+                if change.get("player_id"):
+                    key = (change["player_id"], change.get("is_global", is_global))
+                    self.recent_changes[key] = (change.get("mmr_change", 0), change.get("streak", 0))
+        self.dirty = True
+
+    def load_recent_changes(self):
+        """Every player's latest ranked and global MMR change, newest match first"""
+        pipeline = [
+            {"$match": {"status": "completed", "mmr_changes": {"$exists": True, "$ne": []}}},
+            {"$sort": {"completed_at": -1}},
+            {"$project": {"_id": 0, "is_global": {"$ifNull": ["$is_global", False]}, "mmr_changes": 1}},
+            {"$unwind": "$mmr_changes"},
+            {"$group": {
+                "_id": {"player_id": "$mmr_changes.player_id", "is_global": "$is_global"},
+                "change": {"$first": "$mmr_changes.mmr_change"},
+                "streak": {"$first": "$mmr_changes.streak"}
+            }}
+        ]
+        recent_changes = {}
+        for row in self.matches.aggregate(pipeline, allowDiskUse=True):
+            recent_changes[(row["_id"]["player_id"], row["_id"]["is_global"])] = (row.get("change") or 0,
+                                                                                  row.get("streak") or 0)
+        with self.lock:
+            self.recent_changes = recent_changes
+            self.recent_loaded = True
+
+    def write(self):
+        """Write a new snapshot now"""
+        started = time.perf_counter()
+        self.dirty = False
+        try:
+            if not self.recent_loaded:
+                self.load_recent_changes()
+            players = list(self.players.find({}, PLAYER_PROJECTION))
+            with self.lock:
+                recent_changes = dict(self.recent_changes)
+
+            version = max(time.time_ns(), self.version + 1)
+            data = build_snapshot(players, recent_changes, version)
+
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, "wb") as snapshot_file:
+                snapshot_file.write(data)
+                snapshot_file.flush()
+                os.fsync(snapshot_file.fileno())
+            os.replace(temp_path, self.path)
+        except Exception as e:
+            self.dirty = True
+            self.last_error = str(e)
+            raise
+
+        self.version = version
+        self.last_write_at = time.time()
+        self.writes += 1
+        self.last_size = len(data)
+        self.last_write_ms = (time.perf_counter() - started) * 1000
+        logger.debug("Wrote leaderboard snapshot v%s: %s players, %s bytes in %.0fms",
+                     version, len(players), len(data), self.last_write_ms)
+
+    async def _snapshot_loop(self):
+        while True:
+            try:
+                # Quiet periods still get a fresh file so the website keeps treating it as current
+                if self.dirty or time.time() - self.last_write_at > SNAPSHOT_MAX_AGE / 3:
+                    await asyncio.to_thread(self.write)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                print(f"❌ Error writing leaderboard snapshot: {e}")
+            await asyncio.sleep(self.interval)
+
+    def get_stats(self):
+        return {
+            "path": self.path,
+            "version": self.version,
+            "writes": self.writes,
+            "dirty": self.dirty,
+            "size_bytes": self.last_size,
+            "last_write_ms": self.last_write_ms,
+            "last_error": self.last_error
+        }
+
+
+class LeaderboardSnapshot:
+    """One mapped snapshot file. Read-only; dropped (and unmapped) once nothing references it"""
+
+    def __init__(self, path):
+        with open(path, "rb") as snapshot_file:
+            self.map = mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (magic, file_format, board_count, self.version, self.created_at, self.player_count,
+         self.ranked_count, self.strings_offset) = HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC or file_format != FORMAT_VERSION:
+            raise ValueError(f"{path} is not a format {FORMAT_VERSION} leaderboard snapshot")
+
+        self.boards = {}
+        for index in range(board_count):
+            name, offset, count = BOARD_ENTRY.unpack_from(self.map, HEADER.size + index * BOARD_ENTRY.size)
+            self.boards[name.rstrip(b"\0").decode()] = (offset, count)
+        self.players_offset = HEADER.size + board_count * BOARD_ENTRY.size
+
+    def string(self, offset, length):
+        start = self.strings_offset + offset
+        return self.map[start:start + length].decode("utf-8", errors="replace")
+
+    def record(self, index):
+        return dict(zip(PLAYER_FIELDS, PLAYER.unpack_from(self.map, self.players_offset + index * PLAYER.size)))
+
+    def board_index(self, board, position):
+        offset, _ = self.boards[board]
+        return INDEX.unpack_from(self.map, offset + position * INDEX.size)[0]
+
+    def board_size(self, board):
+        return self.boards.get(board, (0, 0))[1]
+
+    def player(self, index):
+        """Player at a record index, shaped like a players document (plus the latest MMR changes)"""
+        record = self.record(index)
+        player = {
+            "id": self.string(record["id_offset"], record["id_length"]),
+            "name": self.string(record["name_offset"], record["name_length"])
+        }
+        for field in ("mmr", "global_mmr"):
+            value = record[field]
+            player[field] = int(value) if value.is_integer() else value
+        for field in COUNT_FIELDS:
+            player[field] = record[field]
+        if record["last_updated"] >= 0:
+            player["last_updated"] = datetime.datetime.fromtimestamp(
+                record["last_updated"], datetime.timezone.utc).replace(tzinfo=None)
+        player["recent_change"] = ((record["recent_change"], record["recent_streak"])
+                                   if record["flags"] & HAS_RECENT_CHANGE else None)
+        player["global_recent_change"] = ((record["global_recent_change"], record["global_recent_streak"])
+                                          if record["flags"] & HAS_GLOBAL_RECENT_CHANGE else None)
+        return player
+
+    def page(self, board, page, per_page):
+        """(players on the page, board size) for one page of a board"""
+        total = self.board_size(board)
+        start = max(page - 1, 0) * per_page
+        players = [self.player(self.board_index(board, position))
+                   for position in range(start, min(start + per_page, total))]
+        return players, total
+
+    def find(self, player_id):
+        """Record index of a player (binary search of the ID-sorted records), or None"""
+        low, high = 0, self.player_count
+        while low < high:
+            middle = (low + high) // 2
+            record = self.record(middle)
+            current = self.string(record["id_offset"], record["id_length"])
+            if current == player_id:
+                return middle
+            if current < player_id:
+                low = middle + 1
+            else:
+                high = middle
+        return None
+
+    def positions(self, player_id):
+        """Same shape as LeaderboardRanks.positions"""
+        index = self.find(player_id)
+        if index is None:
+            return {}
+        record = self.record(index)
+        mmr_tier = next((board for board, (low, high) in TIER_BOARDS.items()
+                         if low <= mmr_bucket(record["mmr"]) < high), None)
+
+        results = {}
+        for board, rank, total in (("ranked", record["ranked_rank"], self.ranked_count),
+                                   ("global", record["global_rank"], self.board_size("global")),
+                                   (mmr_tier, record["tier_rank"], self.board_size(mmr_tier))):
+            if rank and total:
+                results[board] = {"rank": rank, "total": total,
+                                  "percentile": round((total - rank) / total * 100, 1)}
+        return results
+
+
+class LeaderboardSnapshotReader:
+    """
+    Website side: maps the newest snapshot the bot has written. Each lookup stats the file and
+    remaps it only when it was replaced and carries a new version; pages already being served keep
+    their own mapping until they finish. Snapshots older than max_age, or written before the last
+    discard(), aren't served
+    """
+
+    def __init__(self, path=SNAPSHOT_PATH, max_age=SNAPSHOT_MAX_AGE):
+        self.path = path
+        self.max_age = max_age
+        self.snapshot = None
+        self.file_id = None
+        self.discarded_at = 0
+        self.lock = threading.Lock()
+
+    def discard(self):
+        """Stop serving the current snapshot until the bot writes a newer one (after the website edits players itself)"""
+        with self.lock:
+            self.discarded_at = time.time()
+            self.snapshot = None
+            self.file_id = None
+        try:
+            # Other website workers see the file gone and drop their mapping too
+            os.remove(self.path)
+        except OSError:
+            pass
+
+    def current(self):
+        """The latest snapshot, or None if there isn't a current, readable one"""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            self.snapshot = None
+            self.file_id = None
+            return None
+
+        file_id = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if file_id != self.file_id:
+            with self.lock:
+                if file_id != self.file_id:
+                    try:
+                        snapshot = LeaderboardSnapshot(self.path)
+                        if not self.snapshot or snapshot.version != self.snapshot.version:
+                            self.snapshot = snapshot
+                            logger.info("📊 Mapped leaderboard snapshot v%s (%s players)",
+                                        snapshot.version, snapshot.player_count)
+                    except Exception as e:
+                        print(f"⚠️ Could not map leaderboard snapshot {self.path}: {e}")
+                    self.file_id = file_id
+
+        snapshot = self.snapshot
+        if snapshot and (snapshot.created_at < self.discarded_at or time.time() - snapshot.created_at > self.max_age):
+            return None
+        return snapshot
@@ -0,0 +1,771 @@
+"""
+Offline load test - drives QueueManager, VoteSystem, CaptainsSystem, MatchSystem and the report
+pipeline through fake Discord objects, so hot-path regressions show up without a bot token or network.
+
+    python loadtest.py                      # local mongod (LOADTEST_MONGO_URI, default mongodb://localhost:27017)
+    python loadtest.py --memory             # in-memory mongomock instead (pip install mongomock)
+    python loadtest.py --scenario reports --reports 100 --discord-latency 80
+
+Scenarios:
+    joins    hundreds of players joining the four queues at once, then team selection for every full queue
+    reports  N matches reported at the same moment, rated by the report pipeline
+    reset    the reports scenario plus a wave of joins while a ranked soft reset runs
+
+Each scenario prints throughput, p50/p95/p99 latency and the DB calls it made, per collection.
+The run uses its own database (sixgents_loadtest by default), which is dropped before every scenario.
+"""
+import argparse
+import asyncio
+import contextlib
+import datetime
+import io
+import json
+import logging
+import os
+import random
+import sys
+import threading
+import time
+
+import discord
+from pymongo import MongoClient
+
+from captainssystem import CaptainsSystem
+from bulk_role_manager import BulkRoleManager
+from matchsystem import MatchSystem
+from queue_manager import QueueManager
+from report_pipeline import ReportPipeline, REPORT_WORKERS
+from season_reset import apply_soft_reset
+from votesystem import VoteSystem
+
+DEFAULT_MONGO_URI = os.getenv("LOADTEST_MONGO_URI", "mongodb://localhost:27017")
+DEFAULT_DB_NAME = "sixgents_loadtest"
+
+# The bot's own database - never dropped by the load test
+PROTECTED_DB_NAMES = {"sixgents_db"}
+
+CHANNEL_NAMES = ["rank-a", "rank-b", "rank-c", "global"]
+TEAM_MODES = ["random", "balanced", "captains"]
+
+# Collection methods counted as DB calls. find() is counted when it is issued, not per batch fetched
+COUNTED_METHODS = {
+    "find", "find_one", "find_one_and_update", "insert_one", "insert_many", "update_one", "update_many",
+    "replace_one", "delete_one", "delete_many", "bulk_write", "aggregate", "count_documents", "distinct",
+    "create_index"
+}
+
+
+class OpStats:
+    """DB call counts and time per (collection, method), shared by every wrapped collection"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.ops = {}
+
+    def record(self, collection, method, seconds):
+        with self.lock:
+            entry = self.ops.setdefault((collection, method), {"count": 0, "seconds": 0.0})
+            entry["count"] += 1
+            entry["seconds"] += seconds
+
+    def reset(self):
+        with self.lock:
+            self.ops = {}
+
+    def total(self):
+        return sum(entry["count"] for entry in self.ops.values())
+
+    def summary(self):
+        return sorted(
+            ({"op": f"{collection}.{method}", "count": entry["count"], "ms": round(entry["seconds"] * 1000, 1)}
+             for (collection, method), entry in self.ops.items()),
+            key=lambda row: row["count"], reverse=True
+        )
+
+
+class CountingCollection:
+    """Collection wrapper that records every DB call the bot makes through it"""
+
+    def __init__(self, collection, stats):
+        self._collection = collection
+        self._stats = stats
+
+    def __getattr__(self, name):
+        attribute = getattr(self._collection, name)
+        if name not in COUNTED_METHODS:
+            return attribute
+
+        def counted(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return attribute(*args, **kwargs)
+            finally:
+                self._stats.record(self._collection.name, name, time.perf_counter() - started)
+
+        return counted
+
+
+class CountingDatabase:
+    """Stands in for database.Database - every collection handed out is a CountingCollection"""
+
+    def __init__(self, db, stats):
+        self.db = db
+        self.stats = stats
+
+    def get_collection(self, name):
+        return CountingCollection(self.db[name], self.stats)
+
+    def __getitem__(self, name):
+        return self.get_collection(name)
+
+
+# ---------------------------------------------------------------- fake Discord
+
+
+class FakeDiscord:
+    """Shared clock for the fake API: every send/edit/response waits `latency` seconds and is counted"""
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.calls = 0
+        self.next_id = 1
+
+    async def call(self):
+        self.calls += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        else:
+            await asyncio.sleep(0)
+
+    def new_id(self):
+        self.next_id += 1
+        return 500000000000000000 + self.next_id
+
+
+class FakeRole:
+    def __init__(self, role_id, name):
+        self.id = role_id
+        self.name = name
+        self.mention = f"<@&{role_id}>"
+
+
+class FakeMember:
+    def __init__(self, api, member_id, name, guild=None):
+        self.api = api
+        self.id = member_id
+        self.name = name
+        self.display_name = name
+        self.mention = f"<@{member_id}>"
+        self.guild = guild
+        self.roles = []
+        self.bot = False
+        self.avatar = None
+        self.display_avatar = None
+
+    async def send(self, content=None, **kwargs):
+        await self.api.call()
+        return FakeMessage(self.api, None, content, **kwargs)
+
+    async def add_roles(self, *roles, **kwargs):
+        await self.api.call()
+        self.roles.extend(role for role in roles if role not in self.roles)
+
+    async def remove_roles(self, *roles, **kwargs):
+        await self.api.call()
+        self.roles = [role for role in self.roles if role not in roles]
+
+    def __str__(self):
+        return self.name
+
+
+class FakeMessage:
+    def __init__(self, api, channel, content=None, embed=None, view=None, **kwargs):
+        self.api = api
+        self.id = api.new_id()
+        self.channel = channel
+        self.content = content
+        self.embed = embed
+        self.embeds = [embed] if embed else []
+        self.view = view
+
+    async def edit(self, content=None, embed=None, **kwargs):
+        await self.api.call()
+        if content is not None:
+            self.content = content
+        if embed is not None:
+            self.embed = embed
+            self.embeds = [embed]
+
+    async def add_reaction(self, emoji):
+        await self.api.call()
+
+    async def delete(self):
+        await self.api.call()
+
+
+class FakeTextChannel:
+    def __init__(self, api, channel_id, name, guild):
+        self.api = api
+        self.id = channel_id
+        self.name = name
+        self.guild = guild
+        self.mention = f"<#{channel_id}>"
+        self.messages = []
+
+    async def send(self, content=None, **kwargs):
+        await self.api.call()
+        message = FakeMessage(self.api, self, content, **kwargs)
+        self.messages.append(message)
+        return message
+
+    async def fetch_message(self, message_id):
+        await self.api.call()
+        for message in self.messages:
+            if message.id == message_id:
+                return message
+        raise discord.NotFound(FakeHTTPResponse(404), "Unknown Message")
+
+
+class FakeHTTPResponse:
+    """Just enough of aiohttp's response for discord.HTTPException's constructor"""
+
+    def __init__(self, status):
+        self.status = status
+        self.reason = "fake"
+
+
+class FakeGuild:
+    def __init__(self, api, guild_id=400000000000000000, name="Load Test"):
+        self.api = api
+        self.id = guild_id
+        self.name = name
+        self.members = {}
+        self.channels = []
+        self.text_channels = self.channels
+        self.roles = [FakeRole(410000000000000000 + index, name)
+                      for index, name in enumerate(["Rank A", "Rank B", "Rank C", "Admin"])]
+
+    def add_channel(self, channel_id, name):
+        channel = FakeTextChannel(self.api, channel_id, name, self)
+        self.channels.append(channel)
+        return channel
+
+    def add_member(self, member_id, name):
+        member = FakeMember(self.api, member_id, name, self)
+        self.members[member_id] = member
+        return member
+
+    def get_member(self, member_id):
+        return self.members.get(int(member_id))
+
+    async def fetch_member(self, member_id):
+        await self.api.call()
+        member = self.get_member(member_id)
+        if not member:
+            raise discord.NotFound(FakeHTTPResponse(404), "Unknown Member")
+        return member
+
+    def get_role(self, role_id):
+        return next((role for role in self.roles if role.id == role_id), None)
+
+    def get_channel(self, channel_id):
+        return next((channel for channel in self.channels if channel.id == int(channel_id)), None)
+
+
+class FakeResponse:
+    def __init__(self, interaction):
+        self.interaction = interaction
+        self.done = False
+
+    def is_done(self):
+        return self.done
+
+    async def send_message(self, content=None, **kwargs):
+        await self.interaction.api.call()
+        self.done = True
+        self.interaction.responded_at = time.perf_counter()
+        self.interaction.message = FakeMessage(self.interaction.api, self.interaction.channel, content, **kwargs)
+
+    async def defer(self, **kwargs):
+        await self.interaction.api.call()
+        self.done = True
+        self.interaction.responded_at = time.perf_counter()
+
+
+class FakeFollowup:
+    def __init__(self, interaction):
+        self.interaction = interaction
+
+    async def send(self, content=None, **kwargs):
+        await self.interaction.api.call()
+        return FakeMessage(self.interaction.api, self.interaction.channel, content, **kwargs)
+
+
+class FakeInteraction:
+    """A slash command invocation by `user` in `channel`"""
+
+    def __init__(self, api, user, channel):
+        self.api = api
+        self.id = api.new_id()
+        self.user = user
+        self.channel = channel
+        self.channel_id = channel.id
+        self.guild = channel.guild
+        self.guild_id = channel.guild.id
+        self.command = None
+        self.data = {}
+        self.response = FakeResponse(self)
+        self.followup = FakeFollowup(self)
+        self.message = None
+        self.created_at = time.perf_counter()
+        self.responded_at = None
+
+    async def original_response(self):
+        await self.api.call()
+        return self.message
+
+    async def edit_original_response(self, content=None, **kwargs):
+        await self.api.call()
+        if self.message:
+            await self.message.edit(content=content, **kwargs)
+
+
+class FakeBot:
+    def __init__(self, api, guild):
+        self.api = api
+        self.guild = guild
+        self.guilds = [guild]
+        self.user = FakeMember(api, 1, "SixGents")
+        self.loop = asyncio.get_running_loop()
+
+    def get_channel(self, channel_id):
+        return self.guild.get_channel(channel_id)
+
+    def get_guild(self, guild_id):
+        return self.guild if int(guild_id) == self.guild.id else None
+
+
+# ---------------------------------------------------------------- harness
+
+
+def percentile(values, pct):
+    return ReportPipeline.percentile(values, pct)
+
+
+def latency_summary(samples):
+    """p50/p95/p99/max in milliseconds"""
+    return {
+        "count": len(samples),
+        **{name: round(percentile(samples, pct) * 1000, 2) if samples else None
+           for name, pct in (("p50_ms", 50), ("p95_ms", 95), ("p99_ms", 99), ("max_ms", 100))}
+    }
+
+
+class LoadTest:
+    """One scenario run: a fresh database, fresh systems and a fake guild wired together like bot_core does"""
+
+    def __init__(self, args):
+        self.args = args
+        self.rng = random.Random(args.seed)
+        self.stats = OpStats()
+        self.api = FakeDiscord(args.discord_latency / 1000)
+        self.raw_db = None
+        self.client = None
+
+    def connect(self):
+        if self.args.memory:
+            try:
+                import mongomock
+            except ImportError:
+                print("❌ --memory needs mongomock (pip install mongomock)")
+                sys.exit(1)
+            self.client = mongomock.MongoClient()
+        else:
+            self.client = MongoClient(self.args.mongo_uri, serverSelectionTimeoutMS=3000)
+            try:
+                self.client.admin.command("ping")
+            except Exception as e:
+                print(f"❌ Could not reach mongod at {self.args.mongo_uri}: {e}")
+                print("   Start a local mongod or run with --memory")
+                sys.exit(1)
+
+        self.client.drop_database(self.args.db_name)
+        self.raw_db = self.client[self.args.db_name]
+
+    def build_systems(self):
+        """QueueManager/MatchSystem/VoteSystem/CaptainsSystem/ReportPipeline as SystemCoordinator links them"""
+        db = CountingDatabase(self.raw_db, self.stats)
+        self.guild = FakeGuild(self.api)
+        self.bot = FakeBot(self.api, self.guild)
+        self.channels = [self.guild.add_channel(420000000000000000 + index, name)
+                         for index, name in enumerate(CHANNEL_NAMES)]
+
+        self.queue_manager = QueueManager(db)
+        self.match_system = MatchSystem(db, self.queue_manager)
+        self.queue_manager.set_match_system(self.match_system)
+        # Attribute only - set_bot would start the background sync tasks
+        self.queue_manager.bot = self.bot
+        self.match_system.set_bot(self.bot)
+        self.match_system.set_bulk_role_manager(BulkRoleManager(db, self.bot))
+
+        self.vote_systems = {}
+        self.captains_systems = {}
+        for channel in self.channels:
+            captains = CaptainsSystem(db, self.queue_manager, self.match_system)
+            captains.set_bot(self.bot)
+            votes = VoteSystem(db, self.queue_manager, captains, self.match_system)
+            votes.set_bot(self.bot)
+            self.captains_systems[channel.name] = captains
+            self.vote_systems[channel.name] = votes
+            self.queue_manager.set_vote_system(channel.id, votes)
+            self.queue_manager.set_captains_system(channel.id, captains)
+
+        self.pipeline = ReportPipeline(self.match_system, workers=self.args.workers)
+        self.pipeline.set_bot(self.bot)
+        self.report_done = {}
+        self.pipeline.set_result_handler(self.show_report_result)
+
+    def seed_population(self):
+        """Leaderboard-sized players collection and match history, written straight to the raw DB (not counted)"""
+        players = []
+        for index in range(self.args.population):
+            players.append({
+                "id": str(300000000000000000 + index),
+                "name": f"Regular{index}",
+                "mmr": self.rng.randint(300, 2200),
+                "global_mmr": self.rng.randint(200, 1200),
+                "wins": 0, "losses": 0, "matches": self.rng.randint(0, 200),
+                "global_wins": 0, "global_losses": 0, "global_matches": self.rng.randint(0, 100),
+                "current_streak": self.rng.randint(-4, 4), "global_current_streak": 0,
+                "last_updated": datetime.datetime.utcnow()
+            })
+        if players:
+            self.raw_db.players.insert_many(players)
+
+        started = datetime.datetime.utcnow() - datetime.timedelta(days=30)
+        ids = [player["id"] for player in players]
+        history = []
+        for index in range(self.args.history if len(ids) >= 6 else 0):
+            sample = self.rng.sample(ids, 6)
+            history.append({
+                "match_id": f"h{index:05d}",
+                "status": "completed",
+                "is_global": self.rng.random() < 0.25,
+                "team1": [{"id": player_id} for player_id in sample[:3]],
+                "team2": [{"id": player_id} for player_id in sample[3:]],
+                "winner": self.rng.choice([1, 2]),
+                "completed_at": started + datetime.timedelta(minutes=index)
+            })
+        if history:
+            self.raw_db.matches.insert_many(history)
+
+    def make_members(self, count, known_share=0.85):
+        """Fresh guild members; most get a player document, the rest are rated for the first time"""
+        first = 100000000000000000 + len(self.guild.members)
+        members = [self.guild.add_member(first + index, f"Player{len(self.guild.members)}")
+                   for index in range(count)]
+        docs = [{
+            "id": str(member.id), "name": member.name,
+            "mmr": self.rng.randint(400, 2000), "global_mmr": self.rng.randint(200, 900),
+            "wins": 0, "losses": 0, "matches": 0, "global_wins": 0, "global_losses": 0, "global_matches": 0,
+            "current_streak": 0, "global_current_streak": 0, "last_updated": datetime.datetime.utcnow()
+        } for member in members if self.rng.random() < known_share]
+        if docs:
+            self.raw_db.players.insert_many(docs)
+        return members
+
+    async def join(self, member, channel, latencies):
+        """What /queue does: add the player, reply, and hand back the match ID when the queue filled"""
+        interaction = FakeInteraction(self.api, member, channel)
+        started = time.perf_counter()
+        result = await self.queue_manager.add_player(member, channel)
+        await interaction.response.send_message(result)
+        latencies.append(time.perf_counter() - started)
+
+        if isinstance(result, str) and not result.startswith(("SUCCESS", "QUEUE_ERROR", "ERROR", "Not enough")):
+            return channel, result
+        return None
+
+    async def pick_teams(self, channel, match_id, mode):
+        """Team selection for a full queue - random, balanced or a scripted captains draft"""
+        if mode == "random":
+            await self.vote_systems[channel.name].create_random_teams(channel, match_id)
+        elif mode == "balanced":
+            await self.vote_systems[channel.name].create_balanced_teams(channel, match_id)
+        else:
+            captains = self.captains_systems[channel.name]
+            match = self.queue_manager.get_match_by_id(match_id)
+            captains.start_captains_selection(list(match.get("players", [])), match_id, channel)
+            selection = captains.active_selections[match_id]
+            remaining = list(selection["remaining_players"])
+            # Captain 1 picks one, captain 2 picks two, the last player goes to captain 1
+            selection["captain1_team"].append(remaining.pop(0))
+            selection["captain2_team"].extend([remaining.pop(0), remaining.pop(0)])
+            selection["captain1_team"].append(remaining.pop(0))
+            selection["remaining_players"] = []
+            await captains.finalize_captain_match(channel, match_id)
+
+    async def fill_queues(self, members, join_latencies, team_latencies):
+        """Everyone joins at once (spread over the four channels), then every full queue picks teams"""
+        tasks = [self.join(member, self.channels[index % len(self.channels)], join_latencies)
+                 for index, member in enumerate(members)]
+        created = [match for match in await asyncio.gather(*tasks) if match]
+
+        async def timed_pick(index, channel, match_id):
+            started = time.perf_counter()
+            await self.pick_teams(channel, match_id, TEAM_MODES[index % len(TEAM_MODES)])
+            team_latencies.append(time.perf_counter() - started)
+
+        await asyncio.gather(*(timed_pick(index, channel, match_id)
+                               for index, (channel, match_id) in enumerate(created)))
+        return [match_id for _, match_id in created]
+
+    async def show_report_result(self, job, match_result, error):
+        """Result handler in place of cogs.match.show_report_result - edits the /report reply"""
+        if job.interaction:
+            await job.interaction.edit_original_response(content=error or f"Match {job.match_id} rated")
+        self.report_done[job.match_id] = (time.perf_counter(), error)
+
+    async def report(self, match_id, claim_latencies, submitted_at):
+        """What /report does: claim the match, reply, and queue the rating"""
+        match = self.queue_manager.get_match_by_id(match_id)
+        reporter = self.guild.get_member(int(self.rng.choice(match["team1"] + match["team2"])["id"]))
+        channel = self.guild.get_channel(int(match["channel_id"]))
+        interaction = FakeInteraction(self.api, reporter, channel)
+
+        started = time.perf_counter()
+        claimed_match_id, error = self.match_system.claim_match_report(
+            match_id, str(reporter.id), self.rng.choice(["win", "loss"]))
+        if error:
+            await interaction.response.send_message(f"Error: {error}", ephemeral=True)
+            self.report_done[match_id] = (time.perf_counter(), error)
+            return
+        await interaction.response.send_message(f"Match {claimed_match_id} reported")
+        claim_latencies.append(time.perf_counter() - started)
+
+        submitted_at[claimed_match_id] = time.perf_counter()
+        await self.pipeline.submit(claimed_match_id, self.pipeline.team_player_ids(match),
+                                   interaction=interaction, ctx=interaction)
+
+    async def report_all(self, match_ids):
+        """Report every match at the same moment and wait until the pipeline has rated them all"""
+        claim_latencies, submitted_at = [], {}
+        started = time.perf_counter()
+        await asyncio.gather(*(self.report(match_id, claim_latencies, submitted_at) for match_id in match_ids))
+        await self.pipeline.queue.join()
+        elapsed = time.perf_counter() - started
+
+        end_to_end = [self.report_done[match_id][0] - submitted
+                      for match_id, submitted in submitted_at.items() if match_id in self.report_done]
+        errors = [error for _, error in self.report_done.values() if error]
+        return {
+            "reports": len(match_ids),
+            "elapsed_seconds": round(elapsed, 3),
+            "throughput_per_second": round(len(match_ids) / elapsed, 1) if elapsed else None,
+            "claim_latency": latency_summary(claim_latencies),
+            "rated_latency": latency_summary(end_to_end),
+            "errors": errors[:5],
+            "error_count": len(errors),
+            "pipeline": {key: self.pipeline.get_stats()[key]
+                         for key in ("completed", "failed", "retried", "max_depth", "backpressure_waits")}
+        }
+
+    def expected_counts(self, match_ids):
+        """(ranked, global) matches each reported player should have gained"""
+        expected = {}
+        for match in self.raw_db.matches.find({"match_id": {"$in": match_ids}}):
+            field = 1 if match.get("is_global") else 0
+            for player in match.get("team1", []) + match.get("team2", []):
+                counts = expected.setdefault(player["id"], [0, 0])
+                counts[field] += 1
+        return expected
+
+    def check_consistency(self, match_ids, baseline):
+        """Every reported match rated exactly once: no job left behind and match counts add up"""
+        unfinished = self.raw_db.matches.count_documents(
+            {"match_id": {"$in": match_ids}, "rating_status": {"$exists": True}})
+        mismatched = 0
+        for player_id, (ranked, global_) in self.expected_counts(match_ids).items():
+            doc = self.raw_db.players.find_one({"id": player_id}) or {}
+            before = baseline.get(player_id, (0, 0))
+            if (doc.get("matches", 0) - before[0], doc.get("global_matches", 0) - before[1]) != (ranked, global_):
+                mismatched += 1
+        return {"unfinished_ratings": unfinished, "players_with_wrong_counts": mismatched}
+
+    def match_counts(self):
+        return {doc["id"]: (doc.get("matches", 0), doc.get("global_matches", 0))
+                for doc in self.raw_db.players.find({}, {"id": 1, "matches": 1, "global_matches": 1})}
+
+    def finish(self, name, result):
+        self.match_system.bulk_role_manager.flush_pending_writes()
+        result["scenario"] = name
+        result["discord_calls"] = self.api.calls
+        result["db_ops_total"] = self.stats.total()
+        result["db_ops"] = self.stats.summary()
+        return result
+
+    # ------------------------------------------------------------ scenarios
+
+    async def scenario_joins(self):
+        members = self.make_members(self.args.players)
+        self.stats.reset()
+        join_latencies, team_latencies = [], []
+
+        started = time.perf_counter()
+        match_ids = await self.fill_queues(members, join_latencies, team_latencies)
+        elapsed = time.perf_counter() - started
+
+        return self.finish("joins", {
+            "joins": len(members),
+            "matches_created": len(match_ids),
+            "elapsed_seconds": round(elapsed, 3),
+            "throughput_per_second": round(len(members) / elapsed, 1) if elapsed else None,
+            "join_latency": latency_summary(join_latencies),
+            "team_selection_latency": latency_summary(team_latencies)
+        })
+
+    async def ready_matches(self, count):
+        """Setup for the report scenarios: `count` in-progress matches (not measured)"""
+        per_channel = -(-count // len(self.channels))
+        match_ids = await self.fill_queues(self.make_members(per_channel * len(self.channels) * 6), [], [])
+        return match_ids[:count]
+
+    async def scenario_reports(self):
+        match_ids = await self.ready_matches(self.args.reports)
+        baseline = self.match_counts()
+        self.stats.reset()
+        self.api.calls = 0
+
+        result = await self.report_all(match_ids)
+        result["consistency"] = self.check_consistency(match_ids, baseline)
+        return self.finish("reports", result)
+
+    async def scenario_reset(self):
+        match_ids = await self.ready_matches(self.args.reports)
+        joiners = self.make_members(self.args.players)
+        baseline = self.match_counts()
+        self.stats.reset()
+        self.api.calls = 0
+        join_latencies, team_latencies = [], []
+
+        async def soft_reset():
+            # Let the first reports get claimed so the reset lands while ratings are being written
+            await asyncio.sleep(0)
+            started = time.perf_counter()
+            matched = await asyncio.to_thread(apply_soft_reset, CountingCollection(self.raw_db.players, self.stats))
+            return matched, time.perf_counter() - started
+
+        started = time.perf_counter()
+        report_result, _, (reset_players, reset_seconds) = await asyncio.gather(
+            self.report_all(match_ids),
+            self.fill_queues(joiners, join_latencies, team_latencies),
+            soft_reset()
+        )
+        elapsed = time.perf_counter() - started
+
+        report_result.update({
+            "elapsed_seconds": round(elapsed, 3),
+            "reset_players": reset_players,
+            "reset_seconds": round(reset_seconds, 3),
+            "joins": len(joiners),
+            "join_latency": latency_summary(join_latencies),
+            "team_selection_latency": latency_summary(team_latencies),
+            "consistency": self.check_consistency(match_ids, baseline)
+        })
+        return self.finish("reset", report_result)
+
+    async def run(self, name):
+        self.connect()
+        self.build_systems()
+        self.seed_population()
+        self.pipeline.start()
+        try:
+            return await getattr(self, f"scenario_{name}")()
+        finally:
+            await self.pipeline.stop()
+
+
+def format_latency(label, summary):
+    if not summary or not summary["count"]:
+        return f"   {label}: -"
+    return (f"   {label}: n={summary['count']}  p50 {summary['p50_ms']}ms  p95 {summary['p95_ms']}ms  "
+            f"p99 {summary['p99_ms']}ms  max {summary['max_ms']}ms")
+
+
+def print_result(result):
+    print(f"\n📊 {result['scenario']} - {result['elapsed_seconds']}s, "
+          f"{result['throughput_per_second']}/s, {result['discord_calls']} Discord calls")
+    for key, label in (("join_latency", "Join"), ("team_selection_latency", "Team selection"),
+                       ("claim_latency", "Report reply"), ("rated_latency", "Report rated")):
+        if key in result:
+            print(format_latency(label, result[key]))
+    if "matches_created" in result:
+        print(f"   Matches created: {result['matches_created']}")
+    if "pipeline" in result:
+        print(f"   Pipeline: {result['pipeline']}  errors: {result['error_count']}")
+        for error in result["errors"]:
+            print(f"     ❌ {error}")
+    if "reset_seconds" in result:
+        print(f"   Soft reset: {result['reset_players']} players in {result['reset_seconds']}s")
+    if "consistency" in result:
+        consistency = result["consistency"]
+        ok = not consistency["unfinished_ratings"] and not consistency["players_with_wrong_counts"]
+        print(f"   {'✅' if ok else '❌'} Consistency: {consistency}")
+    print(f"   🗄️ DB calls: {result['db_ops_total']}")
+    for row in result["db_ops"][:12]:
+        print(f"     {row['count']:>6}  {row['op']:<40} {row['ms']}ms")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Offline load test for the queue, team selection and report paths")
+    parser.add_argument("--scenario", choices=["all", "joins", "reports", "reset"], default="all")
+    parser.add_argument("--memory", action="store_true", help="Use mongomock instead of a local mongod")
+    parser.add_argument("--mongo-uri", default=DEFAULT_MONGO_URI)
+    parser.add_argument("--db-name", default=DEFAULT_DB_NAME, help="Scratch database, dropped before each scenario")
+    parser.add_argument("--players", type=int, default=300, help="Players joining at once")
+    parser.add_argument("--reports", type=int, default=50, help="Matches reported at once")
+    parser.add_argument("--population", type=int, default=2000, help="Other players already in the DB")
+    parser.add_argument("--history", type=int, default=2000, help="Completed matches already in the DB")
+    parser.add_argument("--workers", type=int, default=REPORT_WORKERS, help="Report pipeline workers")
+    parser.add_argument("--discord-latency", type=float, default=0.0, help="Simulated Discord API latency (ms)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", help="Also write the results to this file")
+    parser.add_argument("--verbose", action="store_true", help="Show the bot's own prints and logs")
+    return parser.parse_args(argv)
+
+
+async def main(argv=None):
+    args = parse_args(argv)
+    if args.db_name in PROTECTED_DB_NAMES:
+        print(f"❌ Refusing to use {args.db_name} - the load test drops its database")
+        return 1
+
+    backend = "mongomock" if args.memory else args.mongo_uri
+    print(f"🏋️ Load test against {backend} ({args.db_name}), {args.workers} report workers, "
+          f"{args.discord_latency:.0f}ms Discord latency")
+
+    if not args.verbose:
+        logging.disable(logging.WARNING)
+
+    scenarios = ["joins", "reports", "reset"] if args.scenario == "all" else [args.scenario]
+    results = []
+    for name in scenarios:
+        # The systems print on every join and match - keep them out of the report
+        output = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(io.StringIO())
+        with output:
+            result = await LoadTest(args).run(name)
+        print_result(result)
+        results.append(result)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2, default=str)
+        print(f"\n💾 Results written to {args.json}")
+
+    failed = any(result.get("error_count") or
+                 any(result.get("consistency", {}).values()) for result in results)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
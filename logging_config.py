@@ -0,0 +1,176 @@
+import contextlib
+import contextvars
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import zlib
+from perf_tracker import current_command
+
+APP_LOGGER = "sixgents"
+AUDIT_LOGGER = f"{APP_LOGGER}.mmr_audit"
+
+# Structured fields shown after the message when a record carries them
+STRUCTURED_FIELDS = ("match_id", "player_id", "command")
+
+# Fields bound for everything logged from the current task (e.g. the match being reported)
+log_context = contextvars.ContextVar('log_context', default={})
+
+_listener = None
+
+
+def get_logger(name):
+    """Module logger under the app namespace, e.g. get_logger("matchsystem")"""
+    return logging.getLogger(f"{APP_LOGGER}.{name}")
+
+
+def get_audit_logger():
+    """Sampled MMR audit channel - written as JSON lines to its own file"""
+    return logging.getLogger(AUDIT_LOGGER)
+
+
+@contextlib.contextmanager
+def bind_log_context(**fields):
+    """Attach fields like match_id to every record logged inside the block (including subtasks)"""
+    token = log_context.set({**log_context.get(), **fields})
+    try:
+        yield
+    finally:
+        log_context.reset(token)
+
+
+def set_log_fields(**fields):
+    """Attach fields to every record logged for the rest of the current task"""
+    log_context.set({**log_context.get(), **fields})
+
+
+class ContextFilter(logging.Filter):
+    """Copies bound context and the running slash command onto each record"""
+
+    def filter(self, record):
+        for key, value in log_context.get().items():
+            if not hasattr(record, key):
+                setattr(record, key, value)
+
+        if not hasattr(record, "command"):
+            timing = current_command.get()
+            if timing is not None:
+                record.command = timing.name
+        return True
+
+
+class MatchSampleFilter(logging.Filter):
+    """Keeps a fixed fraction of matches - every record for a sampled match, none for the rest"""
+
+    def __init__(self, rate):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record):
+        if self.rate >= 1:
+            return True
+        if self.rate <= 0:
+            return False
+
+        key = (getattr(record, "match_id", None) or log_context.get().get("match_id")
+               or getattr(record, "player_id", None))
+        if key is None:
+            return False
+        return zlib.crc32(str(key).encode()) % 10000 < self.rate * 10000
+
+
+class StructuredFormatter(logging.Formatter):
+    """Plain text line with any structured fields appended as key=value"""
+
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)-7s %(name)s: %(message)s", "%Y-%m-%d %H:%M:%S")
+
+    def format(self, record):
+        line = super().format(record)
+        fields = [f"{key}={getattr(record, key)}" for key in STRUCTURED_FIELDS
+                  if getattr(record, key, None) is not None]
+        return f"{line} [{' '.join(fields)}]" if fields else line
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record - every non-standard attribute becomes a field"""
+
+    STANDARD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+    def format(self, record):
+        data = {
+            "time": self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
+            "level": record.levelname,
+            "event": record.getMessage()
+        }
+        for key, value in vars(record).items():
+            if key not in self.STANDARD_ATTRS and not key.startswith("_"):
+                data[key] = value
+        return json.dumps(data, default=str)
+
+
+def parse_levels(spec):
+    """Parse "matchsystem=DEBUG,rate_limiter=WARNING" into {"matchsystem": "DEBUG", ...}"""
+    levels = {}
+    for part in (spec or "").split(","):
+        if "=" in part:
+            name, level = part.split("=", 1)
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def set_log_level(name, level):
+    """Change one module's level at runtime ("" for the whole app)"""
+    logger = get_logger(name) if name else logging.getLogger(APP_LOGGER)
+    logger.setLevel(level.upper())
+    return logger
+
+
+def setup_logging(level=None):
+    """
+    Route app logs through a queue so the event loop never waits on stdout or disk.
+    LOG_LEVEL sets the app level (INFO by default, so hot-path debug traces are off),
+    LOG_LEVELS overrides single modules, MMR_AUDIT_SAMPLE_RATE sets the share of matches audited.
+    """
+    global _listener
+    if _listener:
+        return
+
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(StructuredFormatter())
+    console.addFilter(lambda record: not record.name.startswith(AUDIT_LOGGER))
+
+    audit_file = logging.handlers.RotatingFileHandler(
+        os.getenv("MMR_AUDIT_LOG", "mmr_audit.log"), maxBytes=10 * 1024 * 1024, backupCount=3, encoding="utf-8"
+    )
+    audit_file.setFormatter(JsonFormatter())
+    audit_file.addFilter(lambda record: record.name.startswith(AUDIT_LOGGER))
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.addFilter(ContextFilter())
+
+    app_logger = logging.getLogger(APP_LOGGER)
+    app_logger.setLevel((level or os.getenv("LOG_LEVEL", "INFO")).upper())
+    app_logger.addHandler(queue_handler)
+    app_logger.propagate = False
+
+    for name, module_level in parse_levels(os.getenv("LOG_LEVELS")).items():
+        set_log_level(name, module_level)
+
+    audit_logger = get_audit_logger()
+    audit_logger.setLevel(logging.INFO)
+    audit_logger.addFilter(MatchSampleFilter(float(os.getenv("MMR_AUDIT_SAMPLE_RATE", 0.05))))
+
+    _listener = logging.handlers.QueueListener(log_queue, console, audit_file, respect_handler_level=True)
+    _listener.start()
+
+
+def stop_logging():
+    """Flush anything still queued (call on shutdown)"""
+    global _listener
+    if _listener:
+        _listener.stop()
+        _listener = None
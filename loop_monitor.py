@@ -0,0 +1,202 @@
+import asyncio
+import collections
+import os
+import sys
+import threading
+import time
+
+# Frames from these files count as "our code" when attributing a stall
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+class LoopLagMonitor:
+    """
+    Measures event loop lag continuously and attributes stalls to the code that caused them.
+    A coroutine ticks on the loop; a sampling thread grabs the loop thread's stack whenever the ticks stop.
+    """
+
+    def __init__(self, tick_interval=0.1, lag_threshold=0.25, sample_interval=0.05, history_size=600):
+        self.tick_interval = tick_interval
+        self.lag_threshold = lag_threshold
+        self.sample_interval = sample_interval
+
+        self.recent_lags = collections.deque(maxlen=history_size)
+        self.current_lag = 0.0
+        self.max_lag = 0.0
+        self.stall_count = 0
+        self.started_at = None
+
+        self.last_heartbeat = time.perf_counter()
+        self.loop_thread_id = None
+        self.monitor_task = None
+        self.sampler_thread = None
+        self.stop_event = threading.Event()
+
+        # "Owner.function → callee" -> {"count", "blocked_seconds", "max_stall", "location", "stack", "last_seen"}
+        self.offenders = {}
+        self.offenders_lock = threading.Lock()
+        self._sampled_heartbeat = None
+        self._stall_keys = set()
+
+    def start(self):
+        """Start the tick coroutine and the sampling thread (call from the running loop)"""
+        if self.monitor_task and not self.monitor_task.done():
+            return
+
+        self.loop_thread_id = threading.get_ident()
+        self.last_heartbeat = time.perf_counter()
+        self.started_at = time.time()
+        self.stop_event.clear()
+
+        self.monitor_task = asyncio.get_running_loop().create_task(self._monitor_loop())
+        self.sampler_thread = threading.Thread(target=self._sample_loop, name="loop-lag-sampler", daemon=True)
+        self.sampler_thread.start()
+        print(f"🩺 Loop lag monitor started (threshold {self.lag_threshold * 1000:.0f}ms)")
+
+    def stop(self):
+        self.stop_event.set()
+        if self.monitor_task:
+            self.monitor_task.cancel()
+
+    async def _monitor_loop(self):
+        loop = asyncio.get_running_loop()
+        try:
+            while not self.stop_event.is_set():
+                expected = loop.time() + self.tick_interval
+                await asyncio.sleep(self.tick_interval)
+                lag = max(0.0, loop.time() - expected)
+                self.last_heartbeat = time.perf_counter()
+
+                self.current_lag = lag
+                self.recent_lags.append(lag)
+                self.max_lag = max(self.max_lag, lag)
+
+                if lag >= self.lag_threshold:
+                    self.stall_count += 1
+                    print(f"⚠️ Event loop stalled for {lag * 1000:.0f}ms"
+                          f"{' in ' + ', '.join(sorted(self._stall_keys)) if self._stall_keys else ''}")
+                self._stall_keys = set()
+
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            print(f"❌ Error in loop lag monitor: {e}")
+
+    def _sample_loop(self):
+        """Runs in its own thread - samples the loop thread's stack while it is stalled"""
+        while not self.stop_event.wait(self.sample_interval):
+            heartbeat = self.last_heartbeat
+            stalled_for = time.perf_counter() - heartbeat - self.tick_interval
+            if stalled_for < self.lag_threshold:
+                continue
+
+            frame = sys._current_frames().get(self.loop_thread_id)
+            if frame is None:
+                continue
+
+            try:
+                key, location, stack = self._attribute(frame)
+            finally:
+                del frame
+
+            new_stall = heartbeat != self._sampled_heartbeat or key not in self._stall_keys
+            self._sampled_heartbeat = heartbeat
+            self._stall_keys.add(key)
+            self._record_offender(key, location, stack, stalled_for, new_stall)
+
+    def _attribute(self, frame):
+        """Name the innermost project function on the stack and whatever it was calling"""
+        frames = []
+        while frame is not None:
+            frames.append(frame)
+            frame = frame.f_back
+
+        owner_index = None
+        for index, candidate in enumerate(frames):
+            filename = os.path.abspath(candidate.f_code.co_filename)
+            if (filename.startswith(PROJECT_ROOT) and "site-packages" not in filename
+                    and filename != os.path.abspath(__file__)):
+                owner_index = index
+                break
+
+        if owner_index is None:
+            owner = frames[0]
+            key = self._qualname(owner)
+        else:
+            owner = frames[owner_index]
+            key = self._qualname(owner)
+            if owner_index > 0:
+                key = f"{key} → {self._qualname(frames[owner_index - 1])}"
+
+        location = f"{os.path.basename(owner.f_code.co_filename)}:{owner.f_lineno}"
+        stack = [
+            f"{os.path.basename(f.f_code.co_filename)}:{f.f_lineno} {self._qualname(f)}"
+            for f in frames[:8]
+        ]
+        return key, location, stack
+
+    def _qualname(self, frame):
+        return getattr(frame.f_code, "co_qualname", frame.f_code.co_name)
+
+    def _record_offender(self, key, location, stack, stalled_for, new_stall):
+        with self.offenders_lock:
+            offender = self.offenders.setdefault(key, {
+                "count": 0,
+                "blocked_seconds": 0.0,
+                "max_stall": 0.0,
+                "location": location,
+                "stack": stack,
+                "last_seen": None
+            })
+            if new_stall:
+                offender["count"] += 1
+            offender["blocked_seconds"] += self.sample_interval
+            offender["max_stall"] = max(offender["max_stall"], stalled_for)
+            offender["location"] = location
+            offender["stack"] = stack
+            offender["last_seen"] = time.time()
+
+    def get_top_offenders(self, limit=10):
+        """Worst blocking call sites by total time blocked"""
+        with self.offenders_lock:
+            ranked = sorted(self.offenders.items(), key=lambda item: item[1]["blocked_seconds"], reverse=True)
+            return [dict(offender, key=key) for key, offender in ranked[:limit]]
+
+    def percentile(self, pct):
+        if not self.recent_lags:
+            return 0.0
+        ordered = sorted(self.recent_lags)
+        index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def get_status(self, limit=5):
+        """Summary for the health endpoint and /perf loop"""
+        return {
+            "running": bool(self.monitor_task and not self.monitor_task.done()),
+            "threshold_seconds": self.lag_threshold,
+            "current_lag_seconds": self.current_lag,
+            "p50_lag_seconds": self.percentile(50),
+            "p99_lag_seconds": self.percentile(99),
+            "max_lag_seconds": self.max_lag,
+            "stall_count": self.stall_count,
+            "window_seconds": round(len(self.recent_lags) * self.tick_interval, 1),
+            "top_offenders": [
+                {
+                    "call": offender["key"],
+                    "location": offender["location"],
+                    "count": offender["count"],
+                    "blocked_seconds": round(offender["blocked_seconds"], 3),
+                    "max_stall_seconds": round(offender["max_stall"], 3)
+                }
+                for offender in self.get_top_offenders(limit)
+            ]
+        }
+
+    def reset(self):
+        """Clear lag history and offenders"""
+        self.recent_lags.clear()
+        self.max_lag = 0.0
+        self.stall_count = 0
+        with self.offenders_lock:
+            self.offenders = {}
+        print("🔄 Loop lag monitor stats reset")
@@ -1,10 +1,24 @@
 import math
-import discord
+import logging
 import datetime
 import uuid
-import asyncio
-import random
-from rate_limiter import DiscordRateLimiter, ultra_safe_role_operation
+import mmr_engine
+from mmr_engine import PlayerState
+from pymongo import UpdateOne
+from rate_limiter import DiscordRateLimiter
+from rank_announcer import RankAnnouncer
+from tiers import TIER_FLOORS, TIER_BOUNDARIES, TIER_STARTING_MMR, tier_for_mmr
+from logging_config import get_logger, get_audit_logger, set_log_fields
+
+logger = get_logger("matchsystem")
+mmr_audit = get_audit_logger()
+
+# /rank flags players within this much MMR of a tier boundary as close to promotion or demotion
+BOUNDARY_WARNING_MARGIN = 50
+
+
+class RatingPending(Exception):
+    """A claimed match is still unrated after rate_reported_match gave up for now - retry it later"""
 
 
 class MatchSystem:
@@ -16,19 +30,19 @@ class MatchSystem:
         self.bot = None
         self.rate_limiter = None
         self.bulk_role_manager = None
+        self.leaderboard_ranks = None
+        self.leaderboard_snapshot = None
+
+        # Combines rank change announcements per match/channel
+        self.rank_announcer = RankAnnouncer()
 
         # Tier-based MMR values
-        self.TIER_MMR = {
-            "Rank A": 1850,
-            "Rank B": 1350,
-            "Rank C": 600
-        }
+        self.TIER_MMR = dict(TIER_STARTING_MMR)
 
         # Rank boundaries for protection system
         self.RANK_BOUNDARIES = {
-            "Rank C": {"min": 0, "max": 1099},
-            "Rank B": {"min": 1100, "max": 1599},
-            "Rank A": {"min": 1600, "max": 9999}
+            name: {"min": floor, "max": TIER_FLOORS[index - 1][1] - 1 if index else 9999}
+            for index, (name, floor) in enumerate(TIER_FLOORS)
         }
 
     def set_bot(self, bot):
@@ -38,11 +52,37 @@ class MatchSystem:
     def set_rate_limiter(self, rate_limiter):
         """Set the rate limiter instance"""
         self.rate_limiter = rate_limiter
+        self.rank_announcer.set_rate_limiter(rate_limiter)
 
     def set_bulk_role_manager(self, bulk_role_manager):
         """Set the bulk role manager instance"""
         self.bulk_role_manager = bulk_role_manager
 
+    def set_leaderboard_ranks(self, leaderboard_ranks):
+        """Set the leaderboard position index kept current after each rated match"""
+        self.leaderboard_ranks = leaderboard_ranks
+
+    def set_leaderboard_snapshot(self, leaderboard_snapshot):
+        """Set the writer of the leaderboard snapshot the website serves"""
+        self.leaderboard_snapshot = leaderboard_snapshot
+
+    def publish_mmr_changes(self, mmr_changes, is_global=False):
+        """Pass a rated match's MMR changes on to the leaderboard positions and snapshot"""
+        if self.leaderboard_ranks:
+            self.leaderboard_ranks.apply_mmr_changes(mmr_changes, is_global)
+        if self.leaderboard_snapshot:
+            self.leaderboard_snapshot.note_mmr_changes(mmr_changes, is_global)
+
+    def note_players_written(self, history_changed=False):
+        """Refresh the leaderboard snapshot after players were written outside a rated match"""
+        if not self.leaderboard_snapshot:
+            return
+        if history_changed:
+            # Match edits also change each player's latest MMR change
+            self.leaderboard_snapshot.invalidate()
+        else:
+            self.leaderboard_snapshot.mark_dirty()
+
     def set_queue_manager(self, queue_manager):
         """Set the queue manager reference"""
         self.queue_manager = queue_manager
@@ -55,16 +95,18 @@ class MatchSystem:
         """Check if a player ID belongs to a real Discord user"""
         return not str(player_id).startswith('9000')
 
-    async def update_discord_role_with_queue(self, ctx, player_id, new_mmr, old_mmr=None, immediate_announcement=True):
+    async def update_discord_role_with_queue(self, ctx, player_id, new_mmr, old_mmr=None, immediate_announcement=True,
+                                             match_id=None):
         """
-        Queue a role update for 3am processing while sending immediate promotion feedback
+        Queue a role update for the reconciler while sending immediate promotion feedback
 
         Args:
             ctx: Discord context (can be interaction or regular context)
             player_id: Player's Discord ID
             new_mmr: New MMR value
             old_mmr: Previous MMR value (for promotion detection)
-            immediate_announcement: Whether to send rank change message immediately
+            immediate_announcement: Whether to announce the rank change (combined per match)
+            match_id: Match that caused the change, shown on the combined announcement
         """
         try:
             # Skip dummy players
@@ -134,7 +176,7 @@ class MatchSystem:
                 elif demotion:
                     print(f"📉 Demotion detected for player {player_id}: {old_rank} → {new_rank}")
 
-            # Queue the role update for 3am
+            # Hand the desired role to the reconciler
             success = self.bulk_role_manager.queue_role_update(
                 player_id=player_id,
                 guild_id=str(guild.id),
@@ -149,34 +191,11 @@ class MatchSystem:
             else:
                 print(f"❌ Failed to queue role update for {player_id}")
 
-            # FIXED: Send immediate announcement for ANY rank change (promotion or demotion)
+            # Announce ANY rank change (promotion or demotion) - combined into one embed per match
             if immediate_announcement and (promotion or demotion) and old_rank and new_rank and channel:
-                try:
-                    print(f"📢 Sending immediate rank change message for player {player_id}")
-
-                    # Fetch member for mention with safety checks
-                    member = None
-                    try:
-                        if self.rate_limiter:
-                            await asyncio.sleep(random.uniform(1.0, 2.0))
-                            member = await self.rate_limiter.fetch_member_with_limit(guild, int(player_id))
-                        else:
-                            await asyncio.sleep(random.uniform(2.0, 4.0))
-                            member = await guild.fetch_member(int(player_id))
-                    except Exception as member_error:
-                        print(f"⚠️ Could not fetch member {player_id}: {member_error}")
-                        return
-
-                    if member:
-                        # FIXED: Send the actual promotion/demotion message
-                        await self.send_immediate_rank_change_message(
-                            channel, member, old_rank, new_rank, new_mmr, old_mmr, promotion
-                        )
-                    else:
-                        print(f"⚠️ Could not find member {player_id} to send rank change message")
-
-                except Exception as e:
-                    print(f"⚠️ Could not send immediate rank change announcement: {e}")
+                self.rank_announcer.add_rank_change(
+                    channel, player_id, old_rank, new_rank, old_mmr, new_mmr, promotion, match_id=match_id
+                )
 
         except Exception as e:
             print(f"❌ Error in update_discord_role_with_queue: {e}")
@@ -184,344 +203,6 @@ class MatchSystem:
             traceback.print_exc()
             # Don't let role update errors break the match reporting process
 
-    async def send_immediate_rank_change_message(self, channel, member, old_rank, new_rank, new_mmr, old_mmr,
-                                                 is_promotion):
-        """Send immediate rank change message with enhanced formatting"""
-        try:
-            # Determine message type and color
-            if is_promotion:
-                title = "🎉 RANK PROMOTION!"
-                description = f"Congratulations {member.mention}! You've been promoted!"
-                color = 0x00ff00  # Green
-            else:
-                title = "📉 Rank Change"
-                description = f"{member.mention}, your rank has changed."
-                color = 0xff9900  # Orange
-
-            # Create embed
-            embed = discord.Embed(
-                title=title,
-                description=description,
-                color=color
-            )
-
-            # Add rank change info
-            embed.add_field(
-                name="🔄 Rank Change",
-                value=f"**{old_rank}** → **{new_rank}**",
-                inline=True
-            )
-
-            embed.add_field(
-                name="📊 MMR Change",
-                value=f"{old_mmr} → **{new_mmr}** ({new_mmr - old_mmr:+d})",
-                inline=True
-            )
-
-            embed.add_field(
-                name="👑 Discord Role",
-                value="Will be updated at 3:00 AM",
-                inline=True
-            )
-
-            # Add motivational message based on change type and new rank
-            if is_promotion:
-                if new_rank == "Rank A":
-                    embed.add_field(
-                        name="🏆 Achievement Unlocked",
-                        value="You've reached the highest rank! Elite tier achieved!",
-                        inline=False
-                    )
-                elif new_rank == "Rank B":
-                    embed.add_field(
-                        name="📈 Great Progress",
-                        value="You're climbing the ranks! Rank A is within reach!",
-                        inline=False
-                    )
-                else:
-                    embed.add_field(
-                        name="🚀 Keep Going",
-                        value="Great improvement! Keep playing to climb higher!",
-                        inline=False
-                    )
-            else:
-                # Demotion - be encouraging
-                embed.add_field(
-                    name="💪 Stay Strong",
-                    value="Every setback is a setup for a comeback! You've got this!",
-                    inline=False
-                )
-
-            # Add protection info if applicable
-            if is_promotion:
-                embed.add_field(
-                    name="🛡️ Promotion Protection",
-                    value="Next 3 games: 50% loss reduction",
-                    inline=False
-                )
-
-            embed.set_thumbnail(url=member.avatar.url if member.avatar else member.default_avatar.url)
-            embed.set_footer(text="Role update scheduled for 3:00 AM daily")
-            embed.timestamp = datetime.datetime.utcnow()
-
-            # Send with rate limiting
-            if self.rate_limiter:
-                await self.rate_limiter.send_message_with_limit(channel, embed=embed)
-                print(f"✅ Sent immediate rank change message for {member.display_name}: {old_rank} → {new_rank}")
-            else:
-                await asyncio.sleep(random.uniform(1.0, 2.0))
-                await channel.send(embed=embed)
-                print(f"✅ Sent rank change message for {member.display_name}: {old_rank} → {new_rank}")
-
-        except Exception as e:
-            print(f"❌ Error sending rank change message for {member.display_name}: {e}")
-            # Don't let this error break the match reporting process
-
-    async def update_discord_role_ultra_safe(self, ctx, player_id, new_mmr):
-        """ULTRA-SAFE Discord role update method with extreme rate limiting protection"""
-        try:
-            # CRITICAL: Triple-check this is not a dummy player
-            if self.is_dummy_player(player_id):
-                print(f"🚨 SAFETY CHECK: Attempted to update role for dummy player {player_id} - BLOCKED")
-                return
-
-            # Skip if no rate limiter is available
-            if not self.rate_limiter:
-                print(f"⚠️ No rate limiter available - skipping role update for player {player_id}")
-                return
-
-            print(f"🔄 Starting ULTRA-SAFE role update for player {player_id} (MMR: {new_mmr})")
-
-            # Define MMR thresholds for ranks
-            RANK_A_THRESHOLD = 1600
-            RANK_B_THRESHOLD = 1100
-
-            # ULTRA-SAFE member fetching with extensive delays and retries
-            member = None
-            max_retries = 3  # Reduced retries to prevent hammering
-
-            for attempt in range(max_retries):
-                try:
-                    print(f"🔍 Attempt {attempt + 1}/{max_retries}: Fetching member {player_id}")
-
-                    # Pre-fetch delay that increases with each attempt
-                    delay = random.uniform(3.0, 5.0) * (attempt + 1)
-                    await asyncio.sleep(delay)
-
-                    member = await self.rate_limiter.fetch_member_with_limit(ctx.guild, int(player_id))
-
-                    if member:
-                        print(f"✅ Successfully fetched member: {member.display_name}")
-                        break
-
-                except discord.HTTPException as e:
-                    if e.status == 429:
-                        wait_time = random.uniform(20.0, 30.0) * (attempt + 1)  # 20-30s, escalating
-                        print(f"⚠️ Rate limited on attempt {attempt + 1}, waiting {wait_time:.1f}s")
-                        await asyncio.sleep(wait_time)
-                        continue
-                    elif e.status == 404:
-                        print(f"❌ Member {player_id} not found - user may have left server")
-                        return
-                    elif e.status == 403:
-                        print(f"❌ No permission to fetch member {player_id}")
-                        return
-                    else:
-                        print(f"❌ HTTP error fetching member {player_id}: {e}")
-                        if attempt == max_retries - 1:
-                            return
-                        await asyncio.sleep(random.uniform(5.0, 10.0))
-                except Exception as e:
-                    print(f"❌ Unexpected error fetching member {player_id}: {e}")
-                    if attempt == max_retries - 1:
-                        return
-                    await asyncio.sleep(random.uniform(5.0, 10.0))
-
-            if not member:
-                print(f"❌ Could not fetch member {player_id} after {max_retries} attempts")
-                return
-
-            # Get roles with error protection
-            try:
-                rank_a_role = discord.utils.get(ctx.guild.roles, name="Rank A")
-                rank_b_role = discord.utils.get(ctx.guild.roles, name="Rank B")
-                rank_c_role = discord.utils.get(ctx.guild.roles, name="Rank C")
-            except Exception as e:
-                print(f"❌ Error getting guild roles: {e}")
-                return
-
-            if not all([rank_a_role, rank_b_role, rank_c_role]):
-                print(f"❌ One or more rank roles not found")
-                return
-
-            # Determine new role
-            if new_mmr >= RANK_A_THRESHOLD:
-                new_role = rank_a_role
-            elif new_mmr >= RANK_B_THRESHOLD:
-                new_role = rank_b_role
-            else:
-                new_role = rank_c_role
-
-            # Check current role
-            current_rank_role = None
-            for role in member.roles:
-                if role in [rank_a_role, rank_b_role, rank_c_role]:
-                    current_rank_role = role
-                    break
-
-            # If no change needed, skip
-            if current_rank_role == new_role:
-                print(f"ℹ️ No role change needed for {member.display_name} (already has {new_role.name})")
-                return
-
-            print(
-                f"🔄 Updating role for {member.display_name}: {current_rank_role.name if current_rank_role else 'None'} -> {new_role.name}")
-
-            # ULTRA-SAFE role updates with EXTREME delays
-            try:
-                # Import the enhanced safe operation function
-                from rate_limiter import ultra_safe_role_operation
-
-                # Remove old role if exists
-                if current_rank_role:
-                    print(f"🗑️ Removing old role: {current_rank_role.name}")
-                    success, error = await ultra_safe_role_operation(
-                        self.rate_limiter, member, 'remove', current_rank_role,
-                        reason="MMR rank update"
-                    )
-
-                    if not success:
-                        print(f"❌ Failed to remove old role: {error}")
-                        return
-
-                    # Long delay between operations
-                    await asyncio.sleep(random.uniform(8.0, 12.0))
-
-                # Add new role
-                print(f"➕ Adding new role: {new_role.name}")
-                success, error = await ultra_safe_role_operation(
-                    self.rate_limiter, member, 'add', new_role,
-                    reason=f"MMR update: {new_mmr}"
-                )
-
-                if success:
-                    print(f"✅ Successfully updated role for {member.display_name}")
-
-                    # Handle promotion announcement (with additional safety and delay)
-                    if not current_rank_role or (
-                            (current_rank_role == rank_c_role and new_role in [rank_b_role, rank_a_role]) or
-                            (current_rank_role == rank_b_role and new_role == rank_a_role)
-                    ):
-                        try:
-                            print(f"🎉 Sending promotion message for {member.display_name}")
-                            await asyncio.sleep(random.uniform(8.0, 12.0))  # Long delay before promotion message
-
-                            await self.rate_limiter.send_message_with_limit(
-                                ctx.channel,
-                                f"🎉 Congratulations {member.mention}! You've been promoted to **{new_role.name}**!",
-                                max_retries=2
-                            )
-                        except Exception as msg_error:
-                            print(f"⚠️ Could not send promotion message: {msg_error}")
-                else:
-                    print(f"❌ Failed to add new role: {error}")
-
-            except Exception as role_error:
-                print(f"❌ Critical error during role update for {member.display_name}: {role_error}")
-
-            # Final safety delay (longer than before)
-            await asyncio.sleep(random.uniform(8.0, 15.0))
-
-        except Exception as e:
-            print(f"❌ Critical error in ultra safe role update for {player_id}: {e}")
-            await asyncio.sleep(random.uniform(5.0, 10.0))
-
-    async def update_discord_role_safe(self, ctx, player_id, new_mmr):
-        """Safe Discord role update with enhanced error handling"""
-        try:
-            # Skip dummy players
-            if self.is_dummy_player(player_id):
-                print(f"Skipping role update for dummy player {player_id}")
-                return
-
-            # Skip if no rate limiter
-            if not self.rate_limiter:
-                print(f"No rate limiter available - skipping role update for {player_id}")
-                return
-
-            # Define thresholds
-            RANK_A_THRESHOLD = 1600
-            RANK_B_THRESHOLD = 1100
-
-            # Fetch member safely
-            try:
-                await asyncio.sleep(random.uniform(1.0, 3.0))  # Random delay
-                member = await self.rate_limiter.fetch_member_with_limit(ctx.guild, int(player_id))
-            except Exception as e:
-                print(f"Could not fetch member {player_id}: {e}")
-                return
-
-            if not member:
-                print(f"Member {player_id} not found")
-                return
-
-            # Get roles
-            rank_a_role = discord.utils.get(ctx.guild.roles, name="Rank A")
-            rank_b_role = discord.utils.get(ctx.guild.roles, name="Rank B")
-            rank_c_role = discord.utils.get(ctx.guild.roles, name="Rank C")
-
-            if not all([rank_a_role, rank_b_role, rank_c_role]):
-                print("Could not find all rank roles")
-                return
-
-            # Determine new role
-            if new_mmr >= RANK_A_THRESHOLD:
-                new_role = rank_a_role
-            elif new_mmr >= RANK_B_THRESHOLD:
-                new_role = rank_b_role
-            else:
-                new_role = rank_c_role
-
-            # Check current role
-            current_rank_role = None
-            for role in member.roles:
-                if role in [rank_a_role, rank_b_role, rank_c_role]:
-                    current_rank_role = role
-                    break
-
-            # If no change needed, skip
-            if current_rank_role == new_role:
-                return
-
-            print(
-                f"Updating role for {member.display_name}: {current_rank_role.name if current_rank_role else 'None'} -> {new_role.name}")
-
-            # Remove old role
-            if current_rank_role:
-                success, error = await ultra_safe_role_operation(
-                    self.rate_limiter, member, 'remove', current_rank_role,
-                    reason="MMR rank update"
-                )
-                if not success:
-                    print(f"Failed to remove role: {error}")
-                    return
-
-                await asyncio.sleep(random.uniform(2.0, 5.0))
-
-            # Add new role
-            success, error = await ultra_safe_role_operation(
-                self.rate_limiter, member, 'add', new_role,
-                reason=f"MMR update: {new_mmr}"
-            )
-
-            if success:
-                print(f"Successfully updated role for {member.display_name}")
-            else:
-                print(f"Failed to add role: {error}")
-
-        except Exception as e:
-            print(f"Error in safe role update: {e}")
-
     def create_match(self, match_id, team1, team2, channel_id, is_global=False):
         """Create a completed match entry in the database"""
         print(
@@ -569,149 +250,6 @@ class MatchSystem:
         print(f"Match {match_id} successfully created/updated in database")
         return match_id
 
-    async def update_discord_role_ultra_safe_fixed(self, guild, player_id, new_mmr):
-        """FIXED version that takes guild directly instead of ctx"""
-        try:
-            # CRITICAL: Triple-check this is not a dummy player
-            if self.is_dummy_player(player_id):
-                print(f"🚨 SAFETY CHECK: Attempted to update role for dummy player {player_id} - BLOCKED")
-                return
-
-            # Skip if no rate limiter is available
-            if not self.rate_limiter:
-                print(f"⚠️ No rate limiter available - skipping role update for player {player_id}")
-                return
-
-            print(f"🔄 Starting ULTRA-SAFE role update for player {player_id} (MMR: {new_mmr})")
-
-            # Define MMR thresholds for ranks
-            RANK_A_THRESHOLD = 1600
-            RANK_B_THRESHOLD = 1100
-
-            # ULTRA-SAFE member fetching with extensive delays and retries
-            member = None
-            max_retries = 3  # Reduced retries to prevent hammering
-
-            for attempt in range(max_retries):
-                try:
-                    print(f"🔍 Attempt {attempt + 1}/{max_retries}: Fetching member {player_id}")
-
-                    # Pre-fetch delay that increases with each attempt
-                    delay = random.uniform(3.0, 5.0) * (attempt + 1)
-                    await asyncio.sleep(delay)
-
-                    # FIX: Use guild directly instead of ctx.guild
-                    member = await self.rate_limiter.fetch_member_with_limit(guild, int(player_id))
-
-                    if member:
-                        print(f"✅ Successfully fetched member: {member.display_name}")
-                        break
-
-                except discord.HTTPException as e:
-                    if e.status == 429:
-                        wait_time = random.uniform(20.0, 30.0) * (attempt + 1)  # 20-30s, escalating
-                        print(f"⚠️ Rate limited on attempt {attempt + 1}, waiting {wait_time:.1f}s")
-                        await asyncio.sleep(wait_time)
-                        continue
-                    elif e.status == 404:
-                        print(f"❌ Member {player_id} not found - user may have left server")
-                        return
-                    elif e.status == 403:
-                        print(f"❌ No permission to fetch member {player_id}")
-                        return
-                    else:
-                        print(f"❌ HTTP error fetching member {player_id}: {e}")
-                        if attempt == max_retries - 1:
-                            return
-                        await asyncio.sleep(random.uniform(5.0, 10.0))
-                except Exception as e:
-                    print(f"❌ Unexpected error fetching member {player_id}: {e}")
-                    if attempt == max_retries - 1:
-                        return
-                    await asyncio.sleep(random.uniform(5.0, 10.0))
-
-            if not member:
-                print(f"❌ Could not fetch member {player_id} after {max_retries} attempts")
-                return
-
-            # Get roles with error protection
-            try:
-                rank_a_role = discord.utils.get(guild.roles, name="Rank A")
-                rank_b_role = discord.utils.get(guild.roles, name="Rank B")
-                rank_c_role = discord.utils.get(guild.roles, name="Rank C")
-            except Exception as e:
-                print(f"❌ Error getting guild roles: {e}")
-                return
-
-            if not all([rank_a_role, rank_b_role, rank_c_role]):
-                print(f"❌ One or more rank roles not found")
-                return
-
-            # Determine new role
-            if new_mmr >= RANK_A_THRESHOLD:
-                new_role = rank_a_role
-            elif new_mmr >= RANK_B_THRESHOLD:
-                new_role = rank_b_role
-            else:
-                new_role = rank_c_role
-
-            # Check current role
-            current_rank_role = None
-            for role in member.roles:
-                if role in [rank_a_role, rank_b_role, rank_c_role]:
-                    current_rank_role = role
-                    break
-
-            # If no change needed, skip
-            if current_rank_role == new_role:
-                print(f"ℹ️ No role change needed for {member.display_name} (already has {new_role.name})")
-                return
-
-            print(
-                f"🔄 Updating role for {member.display_name}: {current_rank_role.name if current_rank_role else 'None'} -> {new_role.name}")
-
-            # ULTRA-SAFE role updates with EXTREME delays
-            try:
-                # Import the enhanced safe operation function
-                from rate_limiter import ultra_safe_role_operation
-
-                # Remove old role if exists
-                if current_rank_role:
-                    print(f"🗑️ Removing old role: {current_rank_role.name}")
-                    success, error = await ultra_safe_role_operation(
-                        self.rate_limiter, member, 'remove', current_rank_role,
-                        reason="MMR rank update"
-                    )
-
-                    if not success:
-                        print(f"❌ Failed to remove old role: {error}")
-                        return
-
-                    # Long delay between operations
-                    await asyncio.sleep(random.uniform(8.0, 12.0))
-
-                # Add new role
-                print(f"➕ Adding new role: {new_role.name}")
-                success, error = await ultra_safe_role_operation(
-                    self.rate_limiter, member, 'add', new_role,
-                    reason=f"MMR update: {new_mmr}"
-                )
-
-                if success:
-                    print(f"✅ Successfully updated role for {member.display_name}")
-                else:
-                    print(f"❌ Failed to add new role: {error}")
-
-            except Exception as role_error:
-                print(f"❌ Critical error during role update for {member.display_name}: {role_error}")
-
-            # Final safety delay (longer than before)
-            await asyncio.sleep(random.uniform(8.0, 15.0))
-
-        except Exception as e:
-            print(f"❌ Critical error in ultra safe role update for {player_id}: {e}")
-            await asyncio.sleep(random.uniform(5.0, 10.0))
-
     def get_active_match_by_channel(self, channel_id):
         """Get active match by channel ID (delegates to queue_manager)"""
         if self.queue_manager:
@@ -719,29 +257,55 @@ class MatchSystem:
         return None
 
     async def report_match_by_id(self, match_id, reporter_id, result, ctx=None):
-        """Report a match result by match ID and win/loss"""
+        """Report a match result by match ID and win/loss, rating it inline"""
+        match_id, error = self.claim_match_report(match_id, reporter_id, result)
+        if error:
+            return None, error
+
+        try:
+            match_result = self.rate_reported_match(match_id)
+        except RatingPending as e:
+            # Still claimed - the report pipeline's recovery sweep finishes it
+            logger.warning("⏳ %s", e)
+            return None, "The MMR update is still in progress and will finish automatically."
+        if ctx:
+            await self.queue_match_role_updates(ctx, match_result)
+        else:
+            logger.debug("ℹ️ No context provided - skipping role update queueing")
+
+        return match_result, None
+
+    def claim_match_report(self, match_id, reporter_id, result, winner=None):
+        """
+        Validate a report and mark the match completed in one conditional update - only the first
+        report of a match gets through. Returns (match_id, None) or (None, error message).
+        Admin reports pass the winning team as winner instead of a result for the reporter's team.
+        The players aren't rated yet: that is rate_reported_match's job
+        """
         # Clean the match ID first (remove any potential long format)
         match_id = match_id.strip()
         if len(match_id) > 8:  # If it's longer than our standard format
             match_id = match_id[:6]  # Take just the first 6 characters
 
+        set_log_fields(match_id=match_id)
+
         # Debug print match ID being searched
-        print(f"Looking for match with ID: {match_id}")
+        logger.debug("Looking for match with ID: %s", match_id)
 
         # Check if this is an active match in the queue manager
         active_match = None
         if self.queue_manager:
             active_match = self.queue_manager.get_match_by_id(match_id)
             if active_match:
-                print(f"Found active match with ID {match_id}")
+                logger.debug("Found active match with ID %s", match_id)
             else:
-                print(f"No active match found with ID {match_id}")
+                logger.debug("No active match found with ID %s", match_id)
 
         # If not found in active matches, check the completed matches
         if not active_match:
             completed_match = self.matches.find_one({"match_id": match_id})
             if completed_match:
-                print(f"Found match in completed matches collection: {match_id}")
+                logger.debug("Found match in completed matches collection: %s", match_id)
 
             if not completed_match:
                 return None, "No match found with that ID."
@@ -757,74 +321,75 @@ class MatchSystem:
             match = active_match
 
         # Debug print to troubleshoot
-        print(f"Reporting match {match_id}, current status: {match.get('status')}")
-        print(f"Reporter ID: {reporter_id}")
+        logger.debug("Reporting match %s, current status: %s", match_id, match.get('status'))
+        logger.debug("Reporter ID: %s", reporter_id)
 
         team1 = match.get("team1", [])
         team2 = match.get("team2", [])
 
         # Check if teams are empty and try to get them from the database
         if (not team1 or not team2) and self.matches is not None:
-            print(f"Teams are empty or missing. Looking up match in database: {match_id}")
+            logger.debug("Teams are empty or missing. Looking up match in database: %s", match_id)
             db_match = self.matches.find_one({"match_id": match_id})
             if db_match:
                 db_team1 = db_match.get("team1", [])
                 db_team2 = db_match.get("team2", [])
                 if db_team1 and db_team2:
-                    print(f"Found match in database with teams. Using that data instead.")
+                    logger.debug("Found match in database with teams. Using that data instead.")
                     team1 = db_team1
                     team2 = db_team2
                     match = db_match
 
-        # Convert IDs to strings for consistent comparison
-        team1_ids = [str(p.get("id", "")) for p in team1]
-        team2_ids = [str(p.get("id", "")) for p in team2]
-
-        # Debug print team members and their IDs
-        print(f"Team 1 IDs: {team1_ids}")
-        print(f"Team 2 IDs: {team2_ids}")
-        print(f"Checking if reporter ID: {reporter_id} is in either team")
-
-        # Fix: Convert reporter_id to string to ensure consistent comparison
-        reporter_id = str(reporter_id)
-
-        # Check both teams for reporter's ID
-        reporter_in_team1 = reporter_id in team1_ids
-        reporter_in_team2 = reporter_id in team2_ids
-
-        if reporter_in_team1:
-            reporter_team = 1
-            print(f"Reporter found in team 1")
-        elif reporter_in_team2:
-            reporter_team = 2
-            print(f"Reporter found in team 2")
-        else:
-            print(f"Reporter {reporter_id} not found in either team")
-
-            # Check if reporter is in player_matches tracking
-            if self.queue_manager and reporter_id in self.queue_manager.player_matches:
-                player_match_id = self.queue_manager.player_matches[reporter_id]
-                if player_match_id == match_id:
-                    print(f"Reporter found in player_matches tracking for this match. Allowing report.")
-                    # Determine team based on other evidence
-                    if len(team1) > 0 and len(team2) > 0:
-                        # If there are players in both teams, just assign to team 1 for now
-                        reporter_team = 1
+        if winner is None:
+            # Convert IDs to strings for consistent comparison
+            team1_ids = [str(p.get("id", "")) for p in team1]
+            team2_ids = [str(p.get("id", "")) for p in team2]
+
+            # Debug print team members and their IDs
+            logger.debug("Team 1 IDs: %s", team1_ids)
+            logger.debug("Team 2 IDs: %s", team2_ids)
+            logger.debug("Checking if reporter ID: %s is in either team", reporter_id)
+
+            # Fix: Convert reporter_id to string to ensure consistent comparison
+            reporter_id = str(reporter_id)
+
+            # Check both teams for reporter's ID
+            reporter_in_team1 = reporter_id in team1_ids
+            reporter_in_team2 = reporter_id in team2_ids
+
+            if reporter_in_team1:
+                reporter_team = 1
+                logger.debug("Reporter found in team 1")
+            elif reporter_in_team2:
+                reporter_team = 2
+                logger.debug("Reporter found in team 2")
+            else:
+                logger.debug("Reporter %s not found in either team", reporter_id)
+
+                # Check if reporter is in player_matches tracking
+                if self.queue_manager and reporter_id in self.queue_manager.player_matches:
+                    player_match_id = self.queue_manager.player_matches[reporter_id]
+                    if player_match_id == match_id:
+                        logger.debug("Reporter found in player_matches tracking for this match. Allowing report.")
+                        # Determine team based on other evidence
+                        if len(team1) > 0 and len(team2) > 0:
+                            # If there are players in both teams, just assign to team 1 for now
+                            reporter_team = 1
+                        else:
+                            return None, "Match teams are not properly set up. Please contact an admin."
                     else:
-                        return None, "Match teams are not properly set up. Please contact an admin."
+                        return None, f"You are in a different match (ID: {player_match_id})."
                 else:
-                    return None, f"You are in a different match (ID: {player_match_id})."
+                    # If we got here, the reporter is not found anywhere
+                    return None, "You must be a player in this match to report results."
+
+            # Determine winner based on reporter's team and their reported result
+            if result.lower() == "win":
+                winner = reporter_team
+            elif result.lower() == "loss":
+                winner = 2 if reporter_team == 1 else 1
             else:
-                # If we got here, the reporter is not found anywhere
-                return None, "You must be a player in this match to report results."
-
-        # Determine winner based on reporter's team and their reported result
-        if result.lower() == "win":
-            winner = reporter_team
-        elif result.lower() == "loss":
-            winner = 2 if reporter_team == 1 else 1
-        else:
-            return None, "Invalid result. Please use 'win' or 'loss'."
+                return None, "Invalid result. Please use 'win' or 'loss'."
 
         # Set scores (simplified to 1-0 or 0-1)
         if winner == 1:
@@ -845,7 +410,14 @@ class MatchSystem:
                 "winner": winner,
                 "score": {"team1": team1_score, "team2": team2_score},
                 "completed_at": now,
-                "reported_by": reporter_id
+                "reported_by": reporter_id,
+                # The teams and MMR preview move over from the active match so the rating step
+                # only needs this document
+                "team1": team1,
+                "team2": team2,
+                "is_global": match.get("is_global", False),
+                "mmr_preview": match.get("mmr_preview"),
+                "rating_status": "pending"
             }}
         )
 
@@ -862,9 +434,20 @@ class MatchSystem:
         if self.queue_manager:
             self.queue_manager.remove_match(match_id)
 
+        return match_id, None
+
+    def build_rating_job(self, match):
+        """
+        Work out every player write for a claimed match and save them on it as a rating job,
+        together with the MMR changes. Players aren't touched until the job is saved
+        """
+        match_id = match["match_id"]
+        winner = match.get("winner")
+        player_writes = []
+
         # Check if this is a global match
         is_global_match = match.get("is_global", False)
-        print(f"Match is global: {is_global_match}")
+        logger.debug("Match is global: %s", is_global_match)
 
         # Determine winning and losing teams
         if winner == 1:
@@ -874,70 +457,32 @@ class MatchSystem:
             winning_team = match.get("team2", [])
             losing_team = match.get("team1", [])
 
-        print(f"Processing MMR updates for {len(winning_team)} winners and {len(losing_team)} losers")
+        logger.debug("Processing MMR updates for %s winners and %s losers", len(winning_team), len(losing_team))
+
+        # Fetch every player (and the rank verification of anyone without a player entry) up front
+        players_by_id, rank_records = self.fetch_match_players(match.get("team1", []) + match.get("team2", []))
 
         # Calculate team average MMRs for MMR adjustment calculation
-        team1_mmrs = []
-        team2_mmrs = []
-
-        # Determine which MMR to use based on match type
-        if is_global_match:
-            # For global matches, use global MMR for calculations
-            for player in match.get("team1", []):
-                player_id = player.get("id")
-                if player_id and not player_id.startswith('9000'):  # Skip dummy players
-                    player_data = self.players.find_one({"id": player_id})
-                    if player_data and "global_mmr" in player_data:
-                        team1_mmrs.append(player_data.get("global_mmr", 300))
-                    else:
-                        team1_mmrs.append(300)  # Default global MMR
-
-            for player in match.get("team2", []):
-                player_id = player.get("id")
-                if player_id and not player_id.startswith('9000'):  # Skip dummy players
-                    player_data = self.players.find_one({"id": player_id})
-                    if player_data and "global_mmr" in player_data:
-                        team2_mmrs.append(player_data.get("global_mmr", 300))
-                    else:
-                        team2_mmrs.append(300)  # Default global MMR
-        else:
-            # For ranked matches, use regular MMR for calculations
-            for player in match.get("team1", []):
-                player_id = player.get("id")
-                if player_id and not player_id.startswith('9000'):  # Skip dummy players
-                    player_data = self.players.find_one({"id": player_id})
-                    if player_data:
-                        team1_mmrs.append(player_data.get("mmr", 600))
-                    else:
-                        # For new players, check rank record or use default
-                        rank_record = self.db.get_collection('ranks').find_one({"discord_id": player_id})
-                        if rank_record:
-                            tier = rank_record.get("tier", "Rank C")
-                            team1_mmrs.append(self.TIER_MMR.get(tier, 600))
-                        else:
-                            team1_mmrs.append(600)  # Default MMR
-
-            for player in match.get("team2", []):
-                player_id = player.get("id")
-                if player_id and not player_id.startswith('9000'):  # Skip dummy players
-                    player_data = self.players.find_one({"id": player_id})
-                    if player_data:
-                        team2_mmrs.append(player_data.get("mmr", 600))
-                    else:
-                        # For new players, check rank record or use default
-                        rank_record = self.db.get_collection('ranks').find_one({"discord_id": player_id})
-                        if rank_record:
-                            tier = rank_record.get("tier", "Rank C")
-                            team2_mmrs.append(self.TIER_MMR.get(tier, 600))
-                        else:
-                            team2_mmrs.append(600)  # Default MMR
+        team1_mmrs = self.team_mmrs(match.get("team1", []), is_global_match, players_by_id, rank_records)
+        team2_mmrs = self.team_mmrs(match.get("team2", []), is_global_match, players_by_id, rank_records)
 
         # Calculate average MMRs
         team1_avg_mmr = sum(team1_mmrs) / len(team1_mmrs) if team1_mmrs else 0
         team2_avg_mmr = sum(team2_mmrs) / len(team2_mmrs) if team2_mmrs else 0
 
-        print(f"Team 1 avg MMR: {team1_avg_mmr}")
-        print(f"Team 2 avg MMR: {team2_avg_mmr}")
+        logger.debug("Team 1 avg MMR: %s", team1_avg_mmr)
+        logger.debug("Team 2 avg MMR: %s", team2_avg_mmr)
+
+        team1_states = self.build_player_states(match.get("team1", []), is_global_match, players_by_id, rank_records)
+        team2_states = self.build_player_states(match.get("team2", []), is_global_match, players_by_id, rank_records)
+
+        # Use the deltas worked out at team assignment when nobody's rating has moved since,
+        # otherwise every player's change comes from one engine call on the pre-match state
+        deltas = self.precomputed_deltas(match.get("mmr_preview"), winner, team1_states, team2_states, players_by_id)
+        if deltas is None:
+            # Momentum only looks at results up to this match, however long it waited to be rated
+            deltas = self.rate_match(team1_states, team2_states, winner, team1_avg_mmr, team2_avg_mmr,
+                                     as_of=match.get("completed_at"))
 
         # Initialize MMR changes list to track all changes
         mmr_changes = []
@@ -956,7 +501,7 @@ class MatchSystem:
             opponent_avg = team2_avg_mmr if is_team1 else team1_avg_mmr
 
             # Get player data or create new
-            player_data = self.players.find_one({"id": player_id})
+            player_data = players_by_id.get(player_id)
 
             if player_data:
                 # Existing player logic
@@ -974,24 +519,17 @@ class MatchSystem:
                     # FIXED: Calculate MMR gain with player's individual MMR vs match average
                     match_avg_mmr = (team1_avg_mmr + team2_avg_mmr) / 2
 
-                    mmr_gain = self.calculate_dynamic_mmr(
-                        old_mmr,  # Individual player MMR
-                        team1_avg_mmr if player in match.get("team1", []) else team2_avg_mmr,  # Player's team average
-                        team2_avg_mmr if player in match.get("team1", []) else team1_avg_mmr,  # Opponent team average
-                        global_matches,
-                        is_win=True,
-                        streak=new_global_streak,
-                        player_data=player_data
-                    )
+                    mmr_gain = deltas[player_id]
 
                     new_mmr = old_mmr + mmr_gain
-                    print(
-                        f"Player {player.get('name', 'Unknown')} GLOBAL MMR update: {old_mmr} + {mmr_gain} = {new_mmr} (Individual calculation)")
+                    logger.debug(
+                        "Player %s GLOBAL MMR update: %s + %s = %s (Individual calculation)",
+                        player.get('name', 'Unknown'), old_mmr, mmr_gain, new_mmr)
 
                     # Update database...
-                    self.players.update_one(
-                        {"id": player_id},
-                        {"$set": {
+                    player_writes.append({
+                        "filter": {"id": player_id},
+                        "set": {
                             "global_mmr": new_mmr,
                             "global_wins": global_wins,
                             "global_matches": global_matches,
@@ -999,8 +537,8 @@ class MatchSystem:
                             "global_longest_win_streak": global_longest_win_streak,
                             "global_longest_loss_streak": player_data.get("global_longest_loss_streak", 0),
                             "last_updated": datetime.datetime.utcnow()
-                        }}
-                    )
+                        }
+                    })
 
                     # FIXED: Track MMR change for global (THIS WAS MISSING!)
                     mmr_changes.append({
@@ -1012,7 +550,7 @@ class MatchSystem:
                         "is_global": True,
                         "streak": new_global_streak
                     })
-                    print(f"Added global MMR change for {player.get('name', 'Unknown')}: +{mmr_gain}")
+                    logger.debug("Added global MMR change for %s: +%s", player.get('name', 'Unknown'), mmr_gain)
 
                 else:
                     # Regular ranked match win handling
@@ -1026,19 +564,12 @@ class MatchSystem:
                     longest_win_streak = max(player_data.get("longest_win_streak", 0), new_streak)
 
                     # FIXED: Calculate MMR gain with individual consideration
-                    mmr_gain = self.calculate_dynamic_mmr(
-                        old_mmr,  # Individual player MMR
-                        team1_avg_mmr if player in match.get("team1", []) else team2_avg_mmr,  # Player's team average
-                        team2_avg_mmr if player in match.get("team1", []) else team1_avg_mmr,  # Opponent team average
-                        matches_played,
-                        is_win=True,
-                        streak=new_streak,
-                        player_data=player_data
-                    )
+                    mmr_gain = deltas[player_id]
 
                     new_mmr = old_mmr + mmr_gain
-                    print(
-                        f"Player {player.get('name', 'Unknown')} RANKED MMR update: {old_mmr} + {mmr_gain} = {new_mmr} (Individual calculation)")
+                    logger.debug(
+                        "Player %s RANKED MMR update: %s + %s = %s (Individual calculation)",
+                        player.get('name', 'Unknown'), old_mmr, mmr_gain, new_mmr)
 
                     # Check for rank changes and track promotions
                     old_rank_tier = self.get_rank_tier_from_mmr(old_mmr)
@@ -1046,6 +577,7 @@ class MatchSystem:
 
                     update_data = {
                         "mmr": new_mmr,
+                        "tier": tier_for_mmr(new_mmr),
                         "wins": wins,
                         "matches": matches_played,
                         "current_streak": new_streak,
@@ -1068,12 +600,13 @@ class MatchSystem:
                                 "to_rank": new_rank_tier,
                                 "mmr_at_promotion": new_mmr
                             }
-                            print(
-                                f"🎉 Player {player.get('name', 'Unknown')} promoted from {old_rank_tier} to {new_rank_tier}!")
-                            print(f"🛡️ Promotion protection activated for 3 games")
+                            logger.info(
+                                "🎉 Player %s promoted from %s to %s!",
+                                player.get('name', 'Unknown'), old_rank_tier, new_rank_tier)
+                            logger.debug("🛡️ Promotion protection activated for 3 games")
 
                     # Update player data
-                    self.players.update_one({"id": player_id}, {"$set": update_data})
+                    player_writes.append({"filter": {"id": player_id}, "set": update_data})
 
                     # Track MMR change for ranked
                     mmr_changes.append({
@@ -1085,31 +618,24 @@ class MatchSystem:
                         "is_global": False,
                         "streak": new_streak
                     })
-                    print(f"Added ranked MMR change for {player.get('name', 'Unknown')}: +{mmr_gain}")
+                    logger.debug("Added ranked MMR change for %s: +%s", player.get('name', 'Unknown'), mmr_gain)
             else:
                 # New player logic
                 if is_global_match:
                     # New player's first global match - win
-                    rank_record = self.db.get_collection('ranks').find_one({"discord_id": player_id})
+                    rank_record = rank_records.get(player_id)
                     starting_global_mmr = 300  # Default global MMR
 
                     if rank_record and "global_mmr" in rank_record:
                         starting_global_mmr = rank_record.get("global_mmr", 300)
 
                     # Calculate first win MMR with the enhanced algorithm
-                    mmr_gain = self.calculate_dynamic_mmr(
-                        starting_global_mmr,
-                        player_team_avg,
-                        opponent_avg,
-                        1,  # First match
-                        is_win=True,
-                        streak=1,
-                        player_data=None  # No existing data for new player
-                    )
+                    mmr_gain = deltas[player_id]
 
                     new_global_mmr = starting_global_mmr + mmr_gain
-                    print(
-                        f"NEW PLAYER {player.get('name', 'Unknown')} FIRST GLOBAL WIN: {starting_global_mmr} + {mmr_gain} = {new_global_mmr}")
+                    logger.debug(
+                        "NEW PLAYER %s FIRST GLOBAL WIN: %s + %s = %s",
+                        player.get('name', 'Unknown'), starting_global_mmr, mmr_gain, new_global_mmr)
 
                     # Get default ranked MMR from rank verification if available
                     starting_ranked_mmr = 600  # Default ranked MMR
@@ -1118,10 +644,11 @@ class MatchSystem:
                         starting_ranked_mmr = self.TIER_MMR.get(tier, 600)
 
                     # Initialize new global player with ALL streak fields
-                    self.players.insert_one({
+                    player_writes.append({"filter": {"id": player_id}, "insert": {
                         "id": player_id,
                         "name": player.get("name", "Unknown"),
                         "mmr": starting_ranked_mmr,  # Default ranked MMR
+                        "tier": tier_for_mmr(starting_ranked_mmr),
                         "global_mmr": new_global_mmr,  # Updated global MMR
                         "wins": 0,
                         "global_wins": 1,
@@ -1138,7 +665,7 @@ class MatchSystem:
                         "last_promotion": None,  # Initialize promotion tracking
                         "created_at": datetime.datetime.utcnow(),
                         "last_updated": datetime.datetime.utcnow()
-                    })
+                    }})
 
                     # Track MMR change for global
                     mmr_changes.append({
@@ -1150,10 +677,12 @@ class MatchSystem:
                         "is_global": True,
                         "streak": 1
                     })
-                    print(f"Added new player global MMR change for {player.get('name', 'Unknown')}: +{mmr_gain}")
+                    logger.debug(
+                        "Added new player global MMR change for %s: +%s",
+                        player.get('name', 'Unknown'), mmr_gain)
                 else:
                     # New player's first ranked match - win
-                    rank_record = self.db.get_collection('ranks').find_one({"discord_id": player_id})
+                    rank_record = rank_records.get(player_id)
                     starting_mmr = 600  # Default MMR
 
                     if rank_record:
@@ -1161,25 +690,19 @@ class MatchSystem:
                         starting_mmr = self.TIER_MMR.get(tier, 600)
 
                     # Calculate first win MMR with the enhanced algorithm
-                    mmr_gain = self.calculate_dynamic_mmr(
-                        starting_mmr,
-                        player_team_avg,
-                        opponent_avg,
-                        1,  # First match
-                        is_win=True,
-                        streak=1,
-                        player_data=None  # No existing data for new player
-                    )
+                    mmr_gain = deltas[player_id]
 
                     new_mmr = starting_mmr + mmr_gain
-                    print(
-                        f"NEW PLAYER {player.get('name', 'Unknown')} FIRST RANKED WIN: {starting_mmr} + {mmr_gain} = {new_mmr}")
+                    logger.debug(
+                        "NEW PLAYER %s FIRST RANKED WIN: %s + %s = %s",
+                        player.get('name', 'Unknown'), starting_mmr, mmr_gain, new_mmr)
 
                     # Initialize new ranked player with ALL streak fields
-                    self.players.insert_one({
+                    player_writes.append({"filter": {"id": player_id}, "insert": {
                         "id": player_id,
                         "name": player.get("name", "Unknown"),
                         "mmr": new_mmr,  # Updated ranked MMR
+                        "tier": tier_for_mmr(new_mmr),
                         "global_mmr": 300,  # Default global MMR
                         "wins": 1,
                         "global_wins": 0,
@@ -1196,7 +719,7 @@ class MatchSystem:
                         "last_promotion": None,  # Initialize promotion tracking
                         "created_at": datetime.datetime.utcnow(),
                         "last_updated": datetime.datetime.utcnow()
-                    })
+                    }})
 
                     # Track MMR change for ranked
                     mmr_changes.append({
@@ -1208,7 +731,9 @@ class MatchSystem:
                         "is_global": False,
                         "streak": 1
                     })
-                    print(f"Added new player ranked MMR change for {player.get('name', 'Unknown')}: +{mmr_gain}")
+                    logger.debug(
+                        "Added new player ranked MMR change for %s: +%s",
+                        player.get('name', 'Unknown'), mmr_gain)
 
         # Update MMR for losers
         for player in losing_team:
@@ -1224,7 +749,7 @@ class MatchSystem:
             opponent_avg = team2_avg_mmr if is_team1 else team1_avg_mmr
 
             # Get player data or create new
-            player_data = self.players.find_one({"id": player_id})
+            player_data = players_by_id.get(player_id)
 
             if player_data:
                 # Existing player logic
@@ -1241,24 +766,17 @@ class MatchSystem:
                                                      new_global_streak)
 
                     # FIXED: Calculate MMR loss with individual consideration
-                    mmr_loss = self.calculate_dynamic_mmr(
-                        old_mmr,  # Individual player MMR
-                        team1_avg_mmr if player in match.get("team1", []) else team2_avg_mmr,  # Player's team average
-                        team2_avg_mmr if player in match.get("team1", []) else team1_avg_mmr,  # Opponent team average
-                        global_matches,
-                        is_win=False,
-                        streak=new_global_streak,
-                        player_data=player_data
-                    )
+                    mmr_loss = -deltas[player_id]
 
                     new_mmr = max(0, old_mmr - mmr_loss)
-                    print(
-                        f"Player {player.get('name', 'Unknown')} GLOBAL MMR update: {old_mmr} - {mmr_loss} = {new_mmr} (Individual calculation)")
+                    logger.debug(
+                        "Player %s GLOBAL MMR update: %s - %s = %s (Individual calculation)",
+                        player.get('name', 'Unknown'), old_mmr, mmr_loss, new_mmr)
 
                     # FIXED: ADD MISSING DATABASE UPDATE FOR GLOBAL LOSSES
-                    self.players.update_one(
-                        {"id": player_id},
-                        {"$set": {
+                    player_writes.append({
+                        "filter": {"id": player_id},
+                        "set": {
                             "global_mmr": new_mmr,
                             "global_losses": global_losses,
                             "global_matches": global_matches,
@@ -1266,8 +784,8 @@ class MatchSystem:
                             "global_longest_loss_streak": global_longest_loss_streak,
                             "global_longest_win_streak": player_data.get("global_longest_win_streak", 0),
                             "last_updated": datetime.datetime.utcnow()
-                        }}
-                    )
+                        }
+                    })
 
                     # FIXED: ADD MISSING MMR CHANGE TRACKING FOR GLOBAL LOSSES
                     mmr_changes.append({
@@ -1279,7 +797,7 @@ class MatchSystem:
                         "is_global": True,
                         "streak": new_global_streak
                     })
-                    print(f"Added global MMR change for {player.get('name', 'Unknown')}: -{mmr_loss}")
+                    logger.debug("Added global MMR change for %s: -%s", player.get('name', 'Unknown'), mmr_loss)
 
                 else:
                     # Regular ranked match loss handling
@@ -1293,15 +811,7 @@ class MatchSystem:
                     longest_loss_streak = min(player_data.get("longest_loss_streak", 0), new_streak)
 
                     # FIXED: Calculate MMR loss with protection properly applied
-                    mmr_loss = self.calculate_dynamic_mmr(
-                        old_mmr,  # Individual player MMR
-                        team1_avg_mmr if player in match.get("team1", []) else team2_avg_mmr,  # Player's team average
-                        team2_avg_mmr if player in match.get("team1", []) else team1_avg_mmr,  # Opponent team average
-                        matches_played,
-                        is_win=False,
-                        streak=new_streak,
-                        player_data=player_data
-                    )
+                    mmr_loss = -deltas[player_id]
 
                     new_mmr = max(0, old_mmr - mmr_loss)
 
@@ -1315,12 +825,14 @@ class MatchSystem:
                         if games_since <= 3:
                             protection_applied = True
 
-                    print(
-                        f"Player {player.get('name', 'Unknown')} RANKED MMR update: {old_mmr} - {mmr_loss} = {new_mmr} (Individual calculation, Protection: {protection_applied})")
+                    logger.debug(
+                        "Player %s RANKED MMR update: %s - %s = %s (Individual calculation, Protection: %s)",
+                        player.get('name', 'Unknown'), old_mmr, mmr_loss, new_mmr, protection_applied)
 
                     # Update player data with rank change tracking
                     update_data = {
                         "mmr": new_mmr,
+                        "tier": tier_for_mmr(new_mmr),
                         "losses": losses,
                         "matches": matches_played,
                         "current_streak": new_streak,
@@ -1329,7 +841,7 @@ class MatchSystem:
                         "last_updated": datetime.datetime.utcnow()
                     }
 
-                    self.players.update_one({"id": player_id}, {"$set": update_data})
+                    player_writes.append({"filter": {"id": player_id}, "set": update_data})
 
                     # Track MMR change for ranked loss
                     mmr_changes.append({
@@ -1341,31 +853,24 @@ class MatchSystem:
                         "is_global": False,
                         "streak": new_streak
                     })
-                    print(f"Added ranked MMR change for {player.get('name', 'Unknown')}: -{mmr_loss}")
+                    logger.debug("Added ranked MMR change for %s: -%s", player.get('name', 'Unknown'), mmr_loss)
             else:
                 # New player logic for losers
                 if is_global_match:
                     # New player's first global match - loss
-                    rank_record = self.db.get_collection('ranks').find_one({"discord_id": player_id})
+                    rank_record = rank_records.get(player_id)
                     starting_global_mmr = 300  # Default global MMR
 
                     if rank_record and "global_mmr" in rank_record:
                         starting_global_mmr = rank_record.get("global_mmr", 300)
 
                     # Calculate first loss MMR with the enhanced algorithm
-                    mmr_loss = self.calculate_dynamic_mmr(
-                        starting_global_mmr,
-                        player_team_avg,
-                        opponent_avg,
-                        1,  # First match
-                        is_win=False,
-                        streak=-1,
-                        player_data=None  # No existing data for new player
-                    )
+                    mmr_loss = -deltas[player_id]
 
                     new_global_mmr = max(0, starting_global_mmr - mmr_loss)
-                    print(
-                        f"NEW PLAYER {player.get('name', 'Unknown')} FIRST GLOBAL LOSS: {starting_global_mmr} - {mmr_loss} = {new_global_mmr}")
+                    logger.debug(
+                        "NEW PLAYER %s FIRST GLOBAL LOSS: %s - %s = %s",
+                        player.get('name', 'Unknown'), starting_global_mmr, mmr_loss, new_global_mmr)
 
                     # Get default ranked MMR from rank verification if available
                     starting_ranked_mmr = 600  # Default ranked MMR
@@ -1374,10 +879,11 @@ class MatchSystem:
                         starting_ranked_mmr = self.TIER_MMR.get(tier, 600)
 
                     # Initialize new global player with ALL streak fields
-                    self.players.insert_one({
+                    player_writes.append({"filter": {"id": player_id}, "insert": {
                         "id": player_id,
                         "name": player.get("name", "Unknown"),
                         "mmr": starting_ranked_mmr,  # Default ranked MMR
+                        "tier": tier_for_mmr(starting_ranked_mmr),
                         "global_mmr": new_global_mmr,  # Updated global MMR
                         "wins": 0,
                         "global_wins": 0,
@@ -1394,7 +900,7 @@ class MatchSystem:
                         "last_promotion": None,  # Initialize promotion tracking
                         "created_at": datetime.datetime.utcnow(),
                         "last_updated": datetime.datetime.utcnow()
-                    })
+                    }})
 
                     # Track MMR change for global
                     mmr_changes.append({
@@ -1406,10 +912,12 @@ class MatchSystem:
                         "is_global": True,
                         "streak": -1
                     })
-                    print(f"Added new player global MMR change for {player.get('name', 'Unknown')}: -{mmr_loss}")
+                    logger.debug(
+                        "Added new player global MMR change for %s: -%s",
+                        player.get('name', 'Unknown'), mmr_loss)
                 else:
                     # New player's first ranked match - loss
-                    rank_record = self.db.get_collection('ranks').find_one({"discord_id": player_id})
+                    rank_record = rank_records.get(player_id)
                     starting_mmr = 600  # Default MMR
 
                     if rank_record:
@@ -1417,25 +925,19 @@ class MatchSystem:
                         starting_mmr = self.TIER_MMR.get(tier, 600)
 
                     # Calculate first loss MMR with the enhanced algorithm
-                    mmr_loss = self.calculate_dynamic_mmr(
-                        starting_mmr,
-                        player_team_avg,
-                        opponent_avg,
-                        1,  # First match
-                        is_win=False,
-                        streak=-1,
-                        player_data=None  # No existing data for new player
-                    )
+                    mmr_loss = -deltas[player_id]
 
                     new_mmr = max(0, starting_mmr - mmr_loss)
-                    print(
-                        f"NEW PLAYER {player.get('name', 'Unknown')} FIRST RANKED LOSS: {starting_mmr} - {mmr_loss} = {new_mmr}")
+                    logger.debug(
+                        "NEW PLAYER %s FIRST RANKED LOSS: %s - %s = %s",
+                        player.get('name', 'Unknown'), starting_mmr, mmr_loss, new_mmr)
 
                     # Initialize new ranked player with ALL streak fields
-                    self.players.insert_one({
+                    player_writes.append({"filter": {"id": player_id}, "insert": {
                         "id": player_id,
                         "name": player.get("name", "Unknown"),
                         "mmr": new_mmr,  # Updated ranked MMR
+                        "tier": tier_for_mmr(new_mmr),
                         "global_mmr": 300,  # Default global MMR
                         "wins": 0,
                         "global_wins": 0,
@@ -1452,7 +954,7 @@ class MatchSystem:
                         "last_promotion": None,  # Initialize promotion tracking
                         "created_at": datetime.datetime.utcnow(),
                         "last_updated": datetime.datetime.utcnow()
-                    })
+                    }})
 
                     # Track MMR change for ranked
                     mmr_changes.append({
@@ -1464,1036 +966,487 @@ class MatchSystem:
                         "is_global": False,
                         "streak": -1
                     })
-                    print(f"Added new player ranked MMR change for {player.get('name', 'Unknown')}: -{mmr_loss}")
-
-        # Store the MMR changes in the match document
-        print(f"Storing {len(mmr_changes)} MMR changes in match document")
+                    logger.debug(
+                        "Added new player ranked MMR change for %s: -%s",
+                        player.get('name', 'Unknown'), mmr_loss)
+
+        # Every write carries a last_rated_match guard: it only lands on the player version it was
+        # built from, so replaying a job can neither apply it twice nor overwrite a newer rating
+        already_applied = set(match.get("rating_applied", []))
+        guarded_writes = []
+        for write in player_writes:
+            player_id = write["filter"]["id"]
+            if player_id in already_applied:
+                continue
+            if "insert" in write:
+                write["insert"]["last_rated_match"] = match_id
+            else:
+                write["filter"]["last_rated_match"] = (players_by_id.get(player_id) or {}).get("last_rated_match")
+                write["set"]["last_rated_match"] = match_id
+            guarded_writes.append(write)
+
+        if already_applied:
+            # Rebuilding after a stale job - keep the changes of the players that did get them
+            mmr_changes = ([change for change in match.get("mmr_changes", []) if change["player_id"] in already_applied] +
+                           [change for change in mmr_changes if change["player_id"] not in already_applied])
+
+        # Store the MMR changes and the player writes in the match document
+        logger.debug("Storing %s MMR changes and %s player writes for match %s",
+                     len(mmr_changes), len(guarded_writes), match_id)
         self.matches.update_one(
-            {"match_id": match_id},
+            {"match_id": match_id, "rating_status": "pending"},
             {"$set": {
                 "mmr_changes": mmr_changes,
                 "team1_avg_mmr": team1_avg_mmr,
-                "team2_avg_mmr": team2_avg_mmr
+                "team2_avg_mmr": team2_avg_mmr,
+                "rating_job": {"writes": guarded_writes, "created_at": datetime.datetime.utcnow()},
+                "rating_status": "writing"
             }}
         )
 
-        print(f"MMR changes stored successfully for match {match_id}")
+    def run_rating_job(self, match):
+        """
+        Apply a match's saved player writes in one bulk write. Returns False when some players were rated
+        by another match since the job was built - the job goes back to pending to be rebuilt for them
+        """
+        match_id = match["match_id"]
+        writes = (match.get("rating_job") or {}).get("writes", [])
+        operations = [
+            UpdateOne(write["filter"], {"$setOnInsert": {key: value for key, value in write["insert"].items()
+                                                         if key != "id"}}, upsert=True)
+            if "insert" in write else UpdateOne(write["filter"], {"$set": write["set"]})
+            for write in writes
+        ]
+        if operations:
+            self.players.bulk_write(operations, ordered=False)
+
+        # Writes that didn't land were either applied by an earlier attempt or are stale
+        player_ids = [write["filter"]["id"] for write in writes]
+        applied = {doc["id"] for doc in self.players.find(
+            {"id": {"$in": player_ids}, "last_rated_match": match_id}, {"id": 1}
+        )}
+        stale = [player_id for player_id in player_ids if player_id not in applied]
+        if stale:
+            logger.warning("♻️ Rating job for match %s is stale for %s - rebuilding it for them", match_id, stale)
+            self.matches.update_one(
+                {"match_id": match_id},
+                {"$set": {"rating_status": "pending",
+                          "rating_applied": sorted(applied | set(match.get("rating_applied", [])))},
+                 "$unset": {"rating_job": ""}}
+            )
+            return False
 
-        # Queue Discord role updates for 3am processing (immediate announcements, delayed role changes)
-        if ctx:
-            print("Queueing Discord role updates for 3am processing...")
-
-            # Process all players - both winners and losers
-            all_players = winning_team + losing_team
-
-            for player in all_players:
-                player_id = player.get("id")
-
-                # Skip dummy players completely
-                if not player_id or self.is_dummy_player(player_id):
-                    print(f"Skipping dummy player role queue: {player.get('name', 'Unknown')} (ID: {player_id})")
-                    continue
-
-                # Only process real players for ranked matches (global matches don't affect Discord roles)
-                if not is_global_match:
-                    # Find the MMR change for this player from our tracked changes
-                    old_mmr = None
-                    new_mmr = None
-
-                    for mmr_change in mmr_changes:
-                        if mmr_change.get("player_id") == player_id:
-                            old_mmr = mmr_change.get("old_mmr")
-                            new_mmr = mmr_change.get("new_mmr")
-                            break
-
-                    if old_mmr is not None and new_mmr is not None:
-                        try:
-                            # FIXED: Safely get guild from context
-                            guild = None
-                            if hasattr(ctx, 'guild'):
-                                guild = ctx.guild
-                            elif hasattr(ctx, 'interaction') and hasattr(ctx.interaction, 'guild'):
-                                guild = ctx.interaction.guild
-
-                            if guild:
-                                # Queue the role update with old and new MMR for proper promotion detection
-                                await self.update_discord_role_with_queue(
-                                    ctx, player_id, new_mmr, old_mmr, immediate_announcement=True
-                                )
-                                print(
-                                    f"✅ Queued role update for {player.get('name', 'Unknown')} (MMR: {old_mmr} → {new_mmr})")
-                            else:
-                                print(
-                                    f"⚠️ Could not get guild from context - skipping role queue for {player.get('name', 'Unknown')}")
-
-                        except Exception as role_queue_error:
-                            print(
-                                f"❌ Error queueing role update for {player.get('name', 'Unknown')}: {role_queue_error}")
-                            import traceback
-                            traceback.print_exc()
-                            # Continue processing other players even if one fails
-                    else:
-                        print(
-                            f"⚠️ Could not find MMR change data for {player.get('name', 'Unknown')} (player_id: {player_id})")
-                        # Debug: Print available MMR changes
-                        print(f"Available MMR changes: {[change.get('player_id') for change in mmr_changes]}")
+        self.matches.update_one(
+            {"match_id": match_id},
+            {"$unset": {"rating_status": "", "rating_job": "", "rating_applied": ""}}
+        )
+        logger.debug("Applied %s player writes for match %s", len(operations), match_id)
+        return True
 
-            print("✅ All role updates queued for 3am processing")
-        else:
-            print("ℹ️ No context provided - skipping role update queueing")
+    def rate_reported_match(self, match_id):
+        """
+        Rate a match claimed by claim_match_report and return its result (None if it isn't completed).
+        Picks up wherever an earlier attempt stopped: a saved rating job is replayed rather than rebuilt,
+        so a retry after a crash never applies a match twice. rating_status is cleared once it's rated;
+        raises RatingPending if it is still set, so the caller retries instead of reporting stale changes
+        """
+        match = self.matches.find_one({"match_id": match_id})
+        if not match or match.get("status") != "completed":
+            return None
 
-        # CRITICAL: Ensure match is removed from queue manager AFTER all processing
-        if self.queue_manager:
-            self.queue_manager.remove_match(match_id)
-            print(f"✅ Match {match_id} removed from active matches")
+        # A stale job is rebuilt once for the players it missed; the second pass can't go stale
+        # while the report pipeline holds their locks
+        for _ in range(3):
+            if match.get("rating_status") == "pending":
+                self.build_rating_job(match)
+                match = self.matches.find_one({"match_id": match_id})
 
-        # Return a match result object that includes the MMR changes
-        match_result = {
+            if match.get("rating_status") != "writing" or self.run_rating_job(match):
+                break
+            match = self.matches.find_one({"match_id": match_id})
+
+        match = self.matches.find_one({"match_id": match_id})
+        if "rating_status" in match:
+            raise RatingPending(f"match {match_id} is still {match['rating_status']} after rebuilding its stale job")
+        self.publish_mmr_changes(match.get("mmr_changes", []), match.get("is_global", False))
+
+        return {
             "match_id": match_id,
-            "team1": team1,
-            "team2": team2,
-            "winner": winner,
-            "score": {"team1": team1_score, "team2": team2_score},
-            "completed_at": now,
-            "reported_by": reporter_id,
-            "is_global": is_global_match,
-            "mmr_changes": mmr_changes,
-            "team1_avg_mmr": team1_avg_mmr,
-            "team2_avg_mmr": team2_avg_mmr,
+            "team1": match.get("team1", []),
+            "team2": match.get("team2", []),
+            "winner": match.get("winner"),
+            "score": match.get("score"),
+            "completed_at": match.get("completed_at"),
+            "reported_by": match.get("reported_by"),
+            "is_global": match.get("is_global", False),
+            "mmr_changes": match.get("mmr_changes", []),
+            "team1_avg_mmr": match.get("team1_avg_mmr"),
+            "team2_avg_mmr": match.get("team2_avg_mmr"),
+            "channel_id": match.get("channel_id"),
             "status": "completed"
         }
 
-        return match_result, None
-
-    async def update_discord_role(self, ctx, player_id, new_mmr):
-        """Update a player's Discord role based on their new MMR - ENHANCED RATE LIMITING"""
-        try:
-            # Skip if no rate limiter is available
-            if not self.rate_limiter:
-                print("No rate limiter available - skipping Discord role update")
-                return
-
-            # Define MMR thresholds for ranks
-            RANK_A_THRESHOLD = 1600
-            RANK_B_THRESHOLD = 1100
-
-            # ENHANCED: Get the player's Discord member object with comprehensive error handling
-            try:
-                # Add a delay before fetching member to space out API calls
-                await asyncio.sleep(0.5)
-                member = await self.rate_limiter.fetch_member_with_limit(ctx.guild, int(player_id))
-            except discord.HTTPException as e:
-                if e.status == 429:
-                    print(f"Rate limited fetching member {player_id} for role update - waiting longer")
-                    await asyncio.sleep(5.0)  # Wait 5 seconds for rate limit
-                    try:
-                        member = await self.rate_limiter.fetch_member_with_limit(ctx.guild, int(player_id))
-                    except Exception as retry_error:
-                        print(f"Retry failed for member {player_id}: {retry_error}")
-                        return
-                elif e.status == 404:
-                    print(f"Member {player_id} not found - user may have left the server")
-                    return
-                elif e.status == 403:
-                    print(f"No permission to fetch member {player_id}")
-                    return
-                else:
-                    print(f"HTTP error fetching member {player_id}: {e}")
-                    return
-            except ValueError:
-                print(f"Invalid player ID format: {player_id}")
-                return
-            except Exception as e:
-                print(f"Unexpected error fetching member {player_id}: {e}")
-                return
-
-            if not member:
-                print(f"Could not find Discord member with ID {player_id}")
-                return
-
-            # Get the rank roles with error handling
-            try:
-                rank_a_role = discord.utils.get(ctx.guild.roles, name="Rank A")
-                rank_b_role = discord.utils.get(ctx.guild.roles, name="Rank B")
-                rank_c_role = discord.utils.get(ctx.guild.roles, name="Rank C")
-            except Exception as e:
-                print(f"Error getting guild roles: {e}")
-                return
-
-            if not rank_a_role or not rank_b_role or not rank_c_role:
-                print("Could not find one or more rank roles")
-                return
-
-            # Determine which role the player should have based on MMR
-            new_role = None
-            if new_mmr >= RANK_A_THRESHOLD:
-                new_role = rank_a_role
-            elif new_mmr >= RANK_B_THRESHOLD:
-                new_role = rank_b_role
-            else:
-                new_role = rank_c_role
-
-            # Check current roles
-            current_rank_role = None
-            for role in member.roles:
-                if role in [rank_a_role, rank_b_role, rank_c_role]:
-                    current_rank_role = role
-                    break
-
-            # If role hasn't changed, do nothing
-            if current_rank_role == new_role:
-                return
-
-            # ENHANCED: Update roles using rate limiter with proper delays
-            try:
-                # Remove current rank role if they have one
-                if current_rank_role:
-                    await self.rate_limiter.remove_role_with_limit(
-                        member, current_rank_role, reason="MMR rank update"
-                    )
-                    # IMPORTANT: Add delay between role operations
-                    await asyncio.sleep(1.0)  # 1 second delay
-
-                # Add the new role
-                await self.rate_limiter.add_role_with_limit(
-                    member, new_role, reason=f"MMR update: {new_mmr}"
-                )
-
-                # Log the role change
-                print(
-                    f"✅ Updated roles for {member.display_name}: {current_rank_role.name if current_rank_role else 'None'} -> {new_role.name}")
-
-                # ENHANCED: Announce the rank change if it's a promotion (with rate limiting and delay)
-                if not current_rank_role or (
-                        (current_rank_role == rank_c_role and new_role in [rank_b_role, rank_a_role]) or
-                        (current_rank_role == rank_b_role and new_role == rank_a_role)
-                ):
-                    try:
-                        # Add delay before sending promotion message
-                        await asyncio.sleep(1.0)
-                        # Use rate limiter for message sending too
-                        await self.rate_limiter.send_message_with_limit(
-                            ctx.channel,
-                            f"🎉 Congratulations {member.mention}! You've been promoted to **{new_role.name}**!"
-                        )
-                    except discord.HTTPException as msg_error:
-                        if msg_error.status == 429:
-                            print(f"Rate limited announcing promotion for {member.display_name}")
-                        else:
-                            print(f"Error announcing promotion for {member.display_name}: {msg_error}")
-                    except Exception as msg_error:
-                        print(f"Unexpected error announcing promotion for {member.display_name}: {msg_error}")
-
-            except discord.HTTPException as role_error:
-                if role_error.status == 429:
-                    print(f"Rate limited updating roles for {member.display_name} - this operation will be skipped")
-                    # Don't retry immediately to avoid further rate limiting
-                elif role_error.status == 403:
-                    print(f"No permission to update roles for {member.display_name}")
-                else:
-                    print(f"HTTP error updating roles for {member.display_name}: {role_error}")
-            except Exception as role_error:
-                print(f"Unexpected error updating roles for {member.display_name}: {role_error}")
-
-            # IMPORTANT: Add delay at the end of each role update to prevent rapid successive calls
-            await asyncio.sleep(1.0)
-
-        except Exception as e:
-            print(f"Critical error in update_discord_role: {str(e)}")
-            # Add delay even on error to prevent rapid retries
-            await asyncio.sleep(1.0)
-
-    async def update_discord_role_ultra_safe(self, ctx, player_id, new_mmr):
-        """ULTRA-SAFE Discord role update method with extreme rate limiting protection"""
-        try:
-            # CRITICAL: Triple-check this is not a dummy player
-            if self.is_dummy_player(player_id):
-                print(f"🚨 SAFETY CHECK: Attempted to update role for dummy player {player_id} - BLOCKED")
-                return
-
-            # Skip if no rate limiter is available
-            if not self.rate_limiter:
-                print(f"⚠️ No rate limiter available - skipping role update for player {player_id}")
-                return
+    async def queue_match_role_updates(self, ctx, match_result):
+        """Queue Discord role updates for a rated ranked match (immediate announcements, roles drip in shortly after)"""
+        match_id = match_result["match_id"]
+        is_global_match = match_result.get("is_global", False)
+        mmr_changes = match_result.get("mmr_changes", [])
+        if match_result["winner"] == 1:
+            winning_team, losing_team = match_result["team1"], match_result["team2"]
+        else:
+            winning_team, losing_team = match_result["team2"], match_result["team1"]
 
-            print(f"🔄 Starting ULTRA-SAFE role update for player {player_id} (MMR: {new_mmr})")
+        logger.debug("Queueing Discord role updates for reconciliation...")
 
-            # Define MMR thresholds for ranks
-            RANK_A_THRESHOLD = 1600
-            RANK_B_THRESHOLD = 1100
+        # Process all players - both winners and losers
+        all_players = winning_team + losing_team
 
-            # ULTRA-SAFE member fetching with extensive delays and retries
-            member = None
-            max_retries = 5
-            for attempt in range(max_retries):
-                try:
-                    print(f"🔍 Attempt {attempt + 1}/{max_retries}: Fetching member {player_id}")
+        for player in all_players:
+            player_id = player.get("id")
 
-                    # ENHANCED: Pre-fetch delay that increases with each attempt
-                    delay = 3.0 * (attempt + 1)  # 3s, 6s, 9s, 12s, 15s
-                    await asyncio.sleep(delay)
+            # Skip dummy players completely
+            if not player_id or self.is_dummy_player(player_id):
+                logger.debug(
+                    "Skipping dummy player role queue: %s (ID: %s)",
+                    player.get('name', 'Unknown'), player_id)
+                continue
 
-                    member = await self.rate_limiter.fetch_member_with_limit(ctx.guild, int(player_id))
+            # Only process real players for ranked matches (global matches don't affect Discord roles)
+            if not is_global_match:
+                # Find the MMR change for this player from our tracked changes
+                old_mmr = None
+                new_mmr = None
 
-                    if member:
-                        print(f"✅ Successfully fetched member: {member.display_name}")
+                for mmr_change in mmr_changes:
+                    if mmr_change.get("player_id") == player_id:
+                        old_mmr = mmr_change.get("old_mmr")
+                        new_mmr = mmr_change.get("new_mmr")
                         break
 
-                except discord.HTTPException as e:
-                    if e.status == 429:
-                        wait_time = max(15.0 * (attempt + 1), getattr(e, 'retry_after', 15))  # Minimum 15s, escalating
-                        print(f"⚠️ Rate limited on attempt {attempt + 1}, waiting {wait_time}s")
-                        await asyncio.sleep(wait_time)
-                        continue
-                    elif e.status == 404:
-                        print(f"❌ Member {player_id} not found - user may have left server")
-                        return
-                    elif e.status == 403:
-                        print(f"❌ No permission to fetch member {player_id}")
-                        return
-                    else:
-                        print(f"❌ HTTP error fetching member {player_id}: {e}")
-                        if attempt == max_retries - 1:
-                            return
-                        await asyncio.sleep(5.0)
-                except Exception as e:
-                    print(f"❌ Unexpected error fetching member {player_id}: {e}")
-                    if attempt == max_retries - 1:
-                        return
-                    await asyncio.sleep(5.0)
-
-            if not member:
-                print(f"❌ Could not fetch member {player_id} after {max_retries} attempts")
-                return
-
-            # Get roles with error protection
-            try:
-                rank_a_role = discord.utils.get(ctx.guild.roles, name="Rank A")
-                rank_b_role = discord.utils.get(ctx.guild.roles, name="Rank B")
-                rank_c_role = discord.utils.get(ctx.guild.roles, name="Rank C")
-            except Exception as e:
-                print(f"❌ Error getting guild roles: {e}")
-                return
-
-            if not all([rank_a_role, rank_b_role, rank_c_role]):
-                print(f"❌ One or more rank roles not found")
-                return
-
-            # Determine new role
-            if new_mmr >= RANK_A_THRESHOLD:
-                new_role = rank_a_role
-            elif new_mmr >= RANK_B_THRESHOLD:
-                new_role = rank_b_role
-            else:
-                new_role = rank_c_role
-
-            # Check current role
-            current_rank_role = None
-            for role in member.roles:
-                if role in [rank_a_role, rank_b_role, rank_c_role]:
-                    current_rank_role = role
-                    break
-
-            # If no change needed, skip
-            if current_rank_role == new_role:
-                print(f"ℹ️ No role change needed for {member.display_name} (already has {new_role.name})")
-                return
-
-            print(
-                f"🔄 Updating role for {member.display_name}: {current_rank_role.name if current_rank_role else 'None'} -> {new_role.name}")
-
-            # ULTRA-SAFE role updates with EXTREME delays and multiple approaches
-            try:
-                role_update_success = False
-
-                # Method 1: Rate limiter approach
-                try:
-                    # Remove old role with delay
-                    if current_rank_role:
-                        print(f"🗑️ Removing old role: {current_rank_role.name}")
-                        await self.rate_limiter.remove_role_with_limit(
-                            member, current_rank_role, reason="MMR rank update"
-                        )
-                        await asyncio.sleep(5.0)  # 5 second delay after removal
-
-                    # Add new role with delay
-                    print(f"➕ Adding new role: {new_role.name}")
-                    await self.rate_limiter.add_role_with_limit(
-                        member, new_role, reason=f"MMR update: {new_mmr}"
-                    )
-                    await asyncio.sleep(3.0)  # 3 second delay after addition
-
-                    role_update_success = True
-                    print(f"✅ Rate limiter method successful for {member.display_name}")
-
-                except Exception as rl_error:
-                    print(f"⚠️ Rate limiter method failed for {member.display_name}: {rl_error}")
-
-                # Method 2: Manual approach with EXTREME delays if rate limiter failed
-                if not role_update_success:
+                if old_mmr is not None and new_mmr is not None:
                     try:
-                        print(f"🔄 Trying manual method with extreme delays...")
-
-                        # Remove old role manually
-                        if current_rank_role:
-                            await asyncio.sleep(8.0)  # 8 second pre-delay
-                            await member.remove_roles(current_rank_role, reason="MMR rank update")
-                            await asyncio.sleep(8.0)  # 8 second post-delay
-
-                        # Add new role manually
-                        await asyncio.sleep(5.0)  # 5 second between operations
-                        await member.add_roles(new_role, reason=f"MMR update: {new_mmr}")
-                        await asyncio.sleep(5.0)  # 5 second post-delay
-
-                        role_update_success = True
-                        print(f"✅ Manual method successful for {member.display_name}")
-
-                    except discord.HTTPException as e:
-                        if e.status == 429:
-                            retry_after = max(getattr(e, 'retry_after', 20), 20)  # Minimum 20 second wait
-                            print(
-                                f"⚠️ Rate limited during manual method, waiting {retry_after}s for {member.display_name}")
-                            await asyncio.sleep(retry_after)
-
-                            # Single retry attempt with even longer delays
-                            try:
-                                if current_rank_role:
-                                    await asyncio.sleep(10.0)
-                                    await member.remove_roles(current_rank_role, reason="MMR rank update - retry")
-                                    await asyncio.sleep(10.0)
-
-                                await asyncio.sleep(10.0)
-                                await member.add_roles(new_role, reason=f"MMR update: {new_mmr} - retry")
-                                role_update_success = True
-                                print(f"✅ Manual retry successful for {member.display_name}")
-                            except Exception as retry_error:
-                                print(f"❌ Manual retry failed for {member.display_name}: {retry_error}")
-                        else:
-                            print(f"❌ Manual HTTP error for {member.display_name}: {e}")
-                    except Exception as e:
-                        print(f"❌ Manual unexpected error for {member.display_name}: {e}")
-
-                if role_update_success:
-                    print(f"✅ Successfully updated role for {member.display_name}")
-
-                    # Handle promotion announcement (with additional safety and delay)
-                    if not current_rank_role or (
-                            (current_rank_role == rank_c_role and new_role in [rank_b_role, rank_a_role]) or
-                            (current_rank_role == rank_b_role and new_role == rank_a_role)
-                    ):
-                        try:
-                            print(f"🎉 Sending promotion message for {member.display_name}")
-                            await asyncio.sleep(5.0)  # 5 second delay before promotion message
-                            await self.rate_limiter.send_message_with_limit(
-                                ctx.channel,
-                                f"🎉 Congratulations {member.mention}! You've been promoted to **{new_role.name}**!"
+                        # FIXED: Safely get guild from context
+                        guild = None
+                        if hasattr(ctx, 'guild'):
+                            guild = ctx.guild
+                        elif hasattr(ctx, 'interaction') and hasattr(ctx.interaction, 'guild'):
+                            guild = ctx.interaction.guild
+
+                        if guild:
+                            # Queue the role update with old and new MMR for proper promotion detection
+                            await self.update_discord_role_with_queue(
+                                ctx, player_id, new_mmr, old_mmr, immediate_announcement=True,
+                                match_id=match_id
                             )
-                        except Exception as msg_error:
-                            print(f"⚠️ Could not send promotion message: {msg_error}")
+                            logger.info(
+                                "✅ Queued role update for %s (MMR: %s → %s)",
+                                player.get('name', 'Unknown'), old_mmr, new_mmr)
+                        else:
+                            logger.warning(
+                                "⚠️ Could not get guild from context - skipping role queue for %s",
+                                player.get('name', 'Unknown'))
+
+                    except Exception as role_queue_error:
+                        logger.error(
+                            "❌ Error queueing role update for %s: %s",
+                            player.get('name', 'Unknown'), role_queue_error)
+                        import traceback
+                        traceback.print_exc()
+                        # Continue processing other players even if one fails
                 else:
-                    print(f"❌ Failed to update role for {member.display_name} - all methods failed")
+                    logger.warning(
+                        "⚠️ Could not find MMR change data for %s (player_id: %s)",
+                        player.get('name', 'Unknown'), player_id)
+                    # Debug: Print available MMR changes
+                    logger.debug("Available MMR changes: %s", [change.get('player_id') for change in mmr_changes])
 
-            except Exception as role_error:
-                print(f"❌ Critical error during role update for {member.display_name}: {role_error}")
+        logger.info("✅ All role updates queued for reconciliation")
 
-            # Final safety delay (longer than before)
-            await asyncio.sleep(5.0)
-
-        except Exception as e:
-            print(f"❌ Critical error in ultra safe role update for {player_id}: {e}")
-            await asyncio.sleep(3.0)
-
-    def update_player_mmr(self, winning_team, losing_team, match_id=None):
-        """Update MMR for all players in the match with enhanced dynamic MMR changes"""
-        # Retrieve match data if match_id is provided
-        match = None
-        if match_id:
-            match = self.matches.find_one({"match_id": match_id})
-
-        # Calculate team average MMRs
-        winning_team_mmrs = []
-        losing_team_mmrs = []
-
-        # Get MMRs for winning team
-        for player in winning_team:
-            player_id = player["id"]
-
-            # Check for dummy players with stored MMR
-            if player_id.startswith('9000') and "dummy_mmr" in player:
-                winning_team_mmrs.append(player["dummy_mmr"])
-                continue
-
-            # Skip dummy players without MMR
-            if player_id.startswith('9000'):
-                continue
-
-            # Get player MMR for real players
-            player_data = self.players.find_one({"id": player_id})
-            if player_data:
-                winning_team_mmrs.append(player_data.get("mmr", 0))
-            else:
-                # For new players, get MMR from rank verification or use default
-                rank_record = self.db.get_collection('ranks').find_one({"discord_id": player_id})
-                if rank_record:
-                    tier = rank_record.get("tier", "Rank C")
-                    winning_team_mmrs.append(self.TIER_MMR.get(tier, 600))
-                else:
-                    # Use tier-based default
-                    winning_team_mmrs.append(600)  # Default to Rank C MMR
-
-        # Get MMRs for losing team
-        for player in losing_team:
-            player_id = player["id"]
+    async def update_discord_role_ultra_safe(self, ctx, player_id, new_mmr):
+        """Hand a player's rank role to the role reconciler - the one path that changes rank roles"""
+        # CRITICAL: Triple-check this is not a dummy player
+        if self.is_dummy_player(player_id):
+            print(f"🚨 SAFETY CHECK: Attempted to update role for dummy player {player_id} - BLOCKED")
+            return
+
+        guild = getattr(ctx, 'guild', None)
+        if not self.bulk_role_manager or not guild:
+            print(f"⚠️ No role reconciler available - skipping role update for player {player_id}")
+            return
+
+        self.bulk_role_manager.queue_role_update(
+            player_id=str(player_id),
+            guild_id=str(guild.id),
+            new_mmr=new_mmr,
+            new_rank=self.get_rank_tier_from_mmr(new_mmr)
+        )
+        print(f"📋 Role update for player {player_id} handed to reconciler (MMR: {new_mmr})")
 
-            # Check for dummy players with stored MMR
-            if player_id.startswith('9000') and "dummy_mmr" in player:
-                losing_team_mmrs.append(player["dummy_mmr"])
+    def fetch_match_players(self, players):
+        """
+        Players documents for a match's real players plus the rank records of those without one,
+        as ({player_id: player}, {player_id: rank_record}) - two queries in total
+        """
+        player_ids = [p.get("id") for p in players if p.get("id") and not p.get("id").startswith('9000')]
+        if not player_ids:
+            return {}, {}
+
+        players_by_id = {doc["id"]: doc for doc in self.players.find({"id": {"$in": player_ids}})}
+        missing = [player_id for player_id in player_ids if player_id not in players_by_id]
+        rank_records = {}
+        if missing:
+            rank_records = {
+                doc["discord_id"]: doc
+                for doc in self.db.get_collection('ranks').find({"discord_id": {"$in": missing}})
+            }
+        return players_by_id, rank_records
+
+    def get_starting_mmr(self, rank_record, is_global=False):
+        """First-match MMR for a player without a players entry, from their rank verification"""
+        if is_global:
+            return rank_record.get("global_mmr", 300) if rank_record else 300
+        if rank_record:
+            return self.TIER_MMR.get(rank_record.get("tier", "Rank C"), 600)
+        return 600
+
+    def build_player_states(self, team, is_global, players_by_id, rank_records):
+        """Engine input for one team, skipping dummy players"""
+        states = []
+        for player in team:
+            player_id = player.get("id")
+            if not player_id or player_id.startswith('9000'):
                 continue
+            states.append(PlayerState.from_player(
+                player_id, players_by_id.get(player_id), is_global,
+                starting_mmr=self.get_starting_mmr(rank_records.get(player_id), is_global)
+            ))
+        return states
 
-            # Skip dummy players without MMR
-            if player_id.startswith('9000'):
+    def get_recent_results(self, player_ids, limit=mmr_engine.MOMENTUM_RECENT_GAMES, before=None, until=None):
+        """
+        {player_id: [won, ...]} over each player's last completed matches (optionally only those
+        completed before / up to a time), newest first. One limited query per player, each walking
+        the (teamN.id, completed_at) history indexes
+        """
+        match_filter = {"status": "completed"}
+        if before is not None:
+            match_filter["completed_at"] = {"$lt": before}
+        elif until is not None:
+            match_filter["completed_at"] = {"$lte": until}
+
+        results = {}
+        for player_id in player_ids:
+            if not player_id:
                 continue
-
-            # Get player MMR for real players
-            player_data = self.players.find_one({"id": player_id})
-            if player_data:
-                losing_team_mmrs.append(player_data.get("mmr", 0))
-            else:
-                # For new players, get MMR from rank verification or use default
-                rank_record = self.db.get_collection('ranks').find_one({"discord_id": player_id})
-                if rank_record:
-                    tier = rank_record.get("tier", "Rank C")
-                    losing_team_mmrs.append(self.TIER_MMR.get(tier, 600))
-                else:
-                    # Use tier-based default
-                    losing_team_mmrs.append(600)  # Default to Rank C MMR
-
-        # Calculate average MMRs for each team
-        winning_team_avg_mmr = sum(winning_team_mmrs) / len(winning_team_mmrs) if winning_team_mmrs else 0
-        losing_team_avg_mmr = sum(losing_team_mmrs) / len(losing_team_mmrs) if losing_team_mmrs else 0
-
-        print(f"Winning team avg MMR: {winning_team_avg_mmr}")
-        print(f"Losing team avg MMR: {losing_team_avg_mmr}")
-
-        # Add tracking for streak changes
-        mmr_changes = []
-
-        # Process winners
-        for player in winning_team:
-            player_id = player["id"]
-            # Skip dummy players
-            if player_id.startswith('9000'):
+            recent = self.matches.find(
+                dict(match_filter, **{"$or": [{"team1.id": player_id}, {"team2.id": player_id}]}),
+                {"_id": 0, "team1.id": 1, "team2.id": 1, "winner": 1}
+            ).sort("completed_at", -1).limit(limit)
+            results[player_id] = [self.did_player_win_match(match, player_id) for match in recent]
+        return results
+
+    def ensure_history_indexes(self):
+        """Per-player match history indexes - recent results, profiles and the website's match pages"""
+        for team in ("team1", "team2"):
+            self.matches.create_index([(f"{team}.id", 1), ("completed_at", -1)], name=f"{team}_history")
+
+    def team_mmrs(self, team, is_global, players_by_id, rank_records):
+        """MMRs a team's average is taken over (real players only, new players at 300 global / starting MMR)"""
+        mmrs = []
+        for player in team:
+            player_id = player.get("id")
+            if not player_id or player_id.startswith('9000'):
                 continue
-
-            # Get player data or create new
-            player_data = self.players.find_one({"id": player_id})
-
-            if player_data:
-                # Existing player logic
-                matches_played = player_data.get("matches", 0) + 1
-                wins = player_data.get("wins", 0) + 1
-                old_mmr = player_data.get("mmr", 600)
-
-                # Get current streak info or initialize
-                current_streak = player_data.get("current_streak", 0)
-                # Positive number means win streak, negative means loss streak
-
-                # Update streak - player won, so streak increases or resets from negative
-                new_streak = current_streak + 1 if current_streak >= 0 else 1
-                longest_win_streak = max(player_data.get("longest_win_streak", 0), new_streak)
-
-                # Calculate MMR gain with enhanced algorithm
-                mmr_gain = self.calculate_dynamic_mmr(
-                    old_mmr,
-                    winning_team_avg_mmr,
-                    losing_team_avg_mmr,
-                    matches_played,
-                    is_win=True,
-                    streak=new_streak,
-                    player_data=player_data
-                )
-
-                new_mmr = old_mmr + mmr_gain
-                print(f"Player {player['name']} MMR update: {old_mmr} + {mmr_gain} = {new_mmr} (Streak: {new_streak})")
-
-                # Check for rank changes and track promotions
-                old_rank_tier = self.get_rank_tier_from_mmr(old_mmr)
-                new_rank_tier = self.get_rank_tier_from_mmr(new_mmr)
-
-                update_data = {
-                    "mmr": new_mmr,
-                    "wins": wins,
-                    "matches": matches_played,
-                    "current_streak": new_streak,
-                    "longest_win_streak": longest_win_streak,
-                    "longest_loss_streak": player_data.get("longest_loss_streak", 0),
-                    "last_updated": datetime.datetime.utcnow()
-                }
-
-                # Track promotions for rank protection
-                if new_rank_tier != old_rank_tier and new_rank_tier > old_rank_tier:
-                    update_data["last_promotion"] = {
-                        "matches_at_promotion": matches_played,
-                        "promoted_at": datetime.datetime.utcnow(),
-                        "from_rank": old_rank_tier,
-                        "to_rank": new_rank_tier,
-                        "mmr_at_promotion": new_mmr
-                    }
-                    print(f"🎉 Player {player['name']} promoted from {old_rank_tier} to {new_rank_tier}!")
-
-                # Update with ALL streak fields for winners
-                self.players.update_one({"id": player_id}, {"$set": update_data})
-
-                # Track MMR change
-                mmr_changes.append({
-                    "player_id": player_id,
-                    "old_mmr": old_mmr,
-                    "new_mmr": new_mmr,
-                    "mmr_change": mmr_gain,
-                    "is_win": True,
-                    "streak": new_streak
-                })
+            player_data = players_by_id.get(player_id)
+            if is_global:
+                mmrs.append(player_data.get("global_mmr", 300) if player_data else 300)
+            elif player_data:
+                mmrs.append(player_data.get("mmr", 600))
             else:
-                # Look up player's rank in ranks collection
-                print(f"New player {player['name']} (ID: {player_id}), determining starting MMR")
-
-                # Try to find rank record
-                rank_record = self.db.get_collection('ranks').find_one({"discord_id": player_id})
-
-                # Default values
-                starting_mmr = 600  # Default MMR
-
-                if rank_record:
-                    print(f"Found rank record: {rank_record}")
-
-                    # Simplified logic - just use tier-based MMR
-                    tier = rank_record.get("tier", "Rank C")
-                    starting_mmr = self.TIER_MMR.get(tier, 600)
-                    print(f"Using tier-based MMR for {tier}: {starting_mmr}")
-                else:
-                    print(f"No rank record found, using default MMR: {starting_mmr}")
-
-                # Calculate first win MMR with the enhanced algorithm
-                mmr_gain = self.calculate_dynamic_mmr(
-                    starting_mmr,
-                    winning_team_avg_mmr,
-                    losing_team_avg_mmr,
-                    1,  # First match
-                    is_win=True,
-                    streak=1,
-                    player_data=None  # No existing data for new player
-                )
-
-                new_mmr = starting_mmr + mmr_gain
-                print(f"NEW PLAYER {player['name']} FIRST WIN: {starting_mmr} + {mmr_gain} = {new_mmr}")
-
-                # Initialize player record with ALL streak information
-                self.players.insert_one({
-                    "id": player_id,
-                    "name": player["name"],
-                    "mmr": new_mmr,
-                    "global_mmr": 300,  # Default global MMR
-                    "wins": 1,
-                    "global_wins": 0,
-                    "losses": 0,
-                    "global_losses": 0,
-                    "matches": 1,
-                    "global_matches": 0,
-                    "current_streak": 1,  # Start with a win streak of 1
-                    "longest_win_streak": 1,
-                    "longest_loss_streak": 0,
-                    "global_current_streak": 0,
-                    "global_longest_win_streak": 0,
-                    "global_longest_loss_streak": 0,
-                    "last_promotion": None,  # Initialize promotion tracking
-                    "created_at": datetime.datetime.utcnow(),
-                    "last_updated": datetime.datetime.utcnow()
-                })
-
-                # Track MMR change for new player
-                mmr_changes.append({
-                    "player_id": player_id,
-                    "old_mmr": starting_mmr,
-                    "new_mmr": new_mmr,
-                    "mmr_change": mmr_gain,
-                    "is_win": True,
-                    "streak": 1
-                })
-
-        # Process losers with enhanced logic
-        for player in losing_team:
-            player_id = player["id"]
-            # Skip dummy players
-            if player_id.startswith('9000'):
-                continue
-
-            # Get player data or create new
-            player_data = self.players.find_one({"id": player_id})
-
-            if player_data:
-                # Update existing player
-                matches_played = player_data.get("matches", 0) + 1
-                losses = player_data.get("losses", 0) + 1
-                old_mmr = player_data.get("mmr", 600)
-
-                # Get current streak info
-                current_streak = player_data.get("current_streak", 0)
-
-                # Update streak - player lost, so streak decreases or resets from positive
-                new_streak = current_streak - 1 if current_streak <= 0 else -1
-                longest_loss_streak = min(player_data.get("longest_loss_streak", 0), new_streak)
-
-                # Calculate MMR loss with enhanced algorithm
-                mmr_loss = self.calculate_dynamic_mmr(
-                    old_mmr,
-                    losing_team_avg_mmr,
-                    winning_team_avg_mmr,
-                    matches_played,
-                    is_win=False,
-                    streak=new_streak,
-                    player_data=player_data
-                )
+                mmrs.append(self.get_starting_mmr(rank_records.get(player_id)))
+        return mmrs
+
+    def load_recent_results(self, states, until=None):
+        """Fill in recent_results on the states that qualify for momentum, in a single query"""
+        needs_momentum = [state for state in states
+                          if state.has_history and state.matches + 1 > mmr_engine.MOMENTUM_MIN_MATCHES]
+        if not needs_momentum:
+            return
+        try:
+            recent_results = self.get_recent_results([state.player_id for state in needs_momentum], until=until)
+            for state in needs_momentum:
+                state.recent_results = recent_results.get(state.player_id, [])
+        except Exception as e:
+            logger.error("Error fetching recent results for momentum: %s", e)
 
-                new_mmr = max(0, old_mmr - mmr_loss)  # Don't go below 0
-                print(f"Player {player['name']} MMR update: {old_mmr} - {mmr_loss} = {new_mmr} (Streak: {new_streak})")
-
-                # Check for rank changes (demotions)
-                old_rank_tier = self.get_rank_tier_from_mmr(old_mmr)
-                new_rank_tier = self.get_rank_tier_from_mmr(new_mmr)
-
-                update_data = {
-                    "mmr": new_mmr,
-                    "losses": losses,
-                    "matches": matches_played,
-                    "current_streak": new_streak,
-                    "longest_win_streak": player_data.get("longest_win_streak", 0),
-                    "longest_loss_streak": longest_loss_streak,
-                    "last_updated": datetime.datetime.utcnow()
-                }
-
-                # Track demotions (though we don't give protection for demotions currently)
-                if new_rank_tier != old_rank_tier and new_rank_tier < old_rank_tier:
-                    print(f"📉 Player {player['name']} demoted from {old_rank_tier} to {new_rank_tier}")
-
-                # Update with ALL streak fields for losers
-                self.players.update_one({"id": player_id}, {"$set": update_data})
-
-                # Track MMR change
-                mmr_changes.append({
-                    "player_id": player_id,
-                    "old_mmr": old_mmr,
-                    "new_mmr": new_mmr,
-                    "mmr_change": -mmr_loss,  # Negative for loss
-                    "is_win": False,
-                    "streak": new_streak
-                })
-            else:
-                # Look up player's rank in ranks collection
-                print(f"New player {player['name']} (ID: {player_id}), determining starting MMR")
+    def rate_match(self, team1_states, team2_states, winner, team1_avg_mmr, team2_avg_mmr, as_of=None):
+        """
+        MMR change for every player in a match from one engine call ({player_id: delta}, losses negative).
+        Recent results for momentum (matches completed up to as_of, if given) are fetched in a single query first
+        """
+        self.load_recent_results(team1_states + team2_states, until=as_of)
+
+        results = mmr_engine.match_deltas(team1_states, team2_states, winner, team1_avg_mmr, team2_avg_mmr,
+                                          with_factors=True)
+        deltas = {}
+        for player_id, (delta, factors) in results.items():
+            self.audit_mmr_calculation(player_id, factors)
+            deltas[player_id] = delta
+        return deltas
+
+    @staticmethod
+    def rating_fingerprints(states, players_by_id):
+        """
+        {player_id: [...]} of everything a player's delta depends on. Total matches across both
+        queues is included since any completed match changes the recent results momentum uses
+        """
+        fingerprints = {}
+        for state in states:
+            player_data = players_by_id.get(state.player_id) or {}
+            fingerprints[state.player_id] = [
+                state.mmr, state.matches, state.streak, state.games_since_promotion, state.has_history,
+                player_data.get("matches", 0) + player_data.get("global_matches", 0)
+            ]
+        return fingerprints
+
+    def preview_match_deltas(self, team1, team2, is_global=False):
+        """
+        Win and loss deltas for every player, worked out when teams are assigned:
+        {"deltas": {player_id: {"win": +n, "loss": -n}}, "fingerprints": ..., team averages}
+        """
+        players_by_id, rank_records = self.fetch_match_players(team1 + team2)
+        team1_states = self.build_player_states(team1, is_global, players_by_id, rank_records)
+        team2_states = self.build_player_states(team2, is_global, players_by_id, rank_records)
+        if not team1_states and not team2_states:
+            return None
 
-                # Try to find rank record
-                rank_record = self.db.get_collection('ranks').find_one({"discord_id": player_id})
+        team1_mmrs = self.team_mmrs(team1, is_global, players_by_id, rank_records)
+        team2_mmrs = self.team_mmrs(team2, is_global, players_by_id, rank_records)
+        team1_avg_mmr = sum(team1_mmrs) / len(team1_mmrs) if team1_mmrs else 0
+        team2_avg_mmr = sum(team2_mmrs) / len(team2_mmrs) if team2_mmrs else 0
 
-                # Default values
-                starting_mmr = 600  # Default MMR
+        # At report time the match is already completed, so momentum sees its result first
+        self.load_recent_results(team1_states + team2_states)
+        prior_results = {state.player_id: state.recent_results for state in team1_states + team2_states}
+        outcomes = {}
+        for winner in (1, 2):
+            for team_number, states in ((1, team1_states), (2, team2_states)):
+                for state in states:
+                    prior = prior_results[state.player_id]
+                    state.recent_results = [team_number == winner] + prior[:mmr_engine.MOMENTUM_RECENT_GAMES - 1] \
+                        if prior else []
+            outcomes[winner] = mmr_engine.match_deltas(team1_states, team2_states, winner, team1_avg_mmr, team2_avg_mmr)
+        if_team1_wins, if_team2_wins = outcomes[1], outcomes[2]
+
+        deltas = {}
+        for state in team1_states:
+            deltas[state.player_id] = {"win": if_team1_wins[state.player_id], "loss": if_team2_wins[state.player_id]}
+        for state in team2_states:
+            deltas[state.player_id] = {"win": if_team2_wins[state.player_id], "loss": if_team1_wins[state.player_id]}
+
+        return {
+            "is_global": is_global,
+            "team1_ids": [state.player_id for state in team1_states],
+            "team2_ids": [state.player_id for state in team2_states],
+            "team1_avg_mmr": team1_avg_mmr,
+            "team2_avg_mmr": team2_avg_mmr,
+            "deltas": deltas,
+            "fingerprints": self.rating_fingerprints(team1_states + team2_states, players_by_id),
+            "computed_at": datetime.datetime.utcnow()
+        }
 
-                if rank_record:
-                    print(f"Found rank record: {rank_record}")
+    def precomputed_deltas(self, preview, winner, team1_states, team2_states, players_by_id):
+        """
+        {player_id: delta} from a match's preview, or None when it is missing or stale
+        (different teams, or any player's rating inputs have changed since it was made)
+        """
+        if not preview:
+            return None
 
-                    # Simplified logic - just use tier-based MMR
-                    tier = rank_record.get("tier", "Rank C")
-                    starting_mmr = self.TIER_MMR.get(tier, 600)
-                    print(f"Using tier-based MMR for {tier}: {starting_mmr}")
-                else:
-                    print(f"No rank record found, using default MMR: {starting_mmr}")
-
-                # Calculate first loss MMR with enhanced algorithm
-                mmr_loss = self.calculate_dynamic_mmr(
-                    starting_mmr,
-                    losing_team_avg_mmr,
-                    winning_team_avg_mmr,
-                    1,  # First match
-                    is_win=False,
-                    streak=-1,
-                    player_data=None  # No existing data for new player
-                )
+        if ([state.player_id for state in team1_states] != preview.get("team1_ids") or
+                [state.player_id for state in team2_states] != preview.get("team2_ids")):
+            logger.info("♻️ MMR preview is for different teams, recalculating")
+            return None
 
-                new_mmr = max(0, starting_mmr - mmr_loss)  # Don't go below 0
-                print(f"NEW PLAYER {player['name']} FIRST LOSS: {starting_mmr} - {mmr_loss} = {new_mmr}")
-
-                # Initialize player record with ALL streak information
-                self.players.insert_one({
-                    "id": player_id,
-                    "name": player["name"],
-                    "mmr": new_mmr,
-                    "global_mmr": 300,  # Default global MMR
-                    "wins": 0,
-                    "global_wins": 0,
-                    "losses": 1,
-                    "global_losses": 0,
-                    "matches": 1,
-                    "global_matches": 0,
-                    "current_streak": -1,  # Start with a loss streak of -1
-                    "longest_win_streak": 0,
-                    "longest_loss_streak": -1,
-                    "global_current_streak": 0,
-                    "global_longest_win_streak": 0,
-                    "global_longest_loss_streak": 0,
-                    "last_promotion": None,  # Initialize promotion tracking
-                    "created_at": datetime.datetime.utcnow(),
-                    "last_updated": datetime.datetime.utcnow()
-                })
-
-                # Track MMR change for new player
-                mmr_changes.append({
-                    "player_id": player_id,
-                    "old_mmr": starting_mmr,
-                    "new_mmr": new_mmr,
-                    "mmr_change": -mmr_loss,  # Negative for loss
-                    "is_win": False,
-                    "streak": -1
-                })
-
-        # Store the MMR changes and team average MMRs in the match document
-        if match_id:
-            self.matches.update_one(
-                {"match_id": match_id},
-                {"$set": {
-                    "mmr_changes": mmr_changes,
-                    "team1_avg_mmr": winning_team_avg_mmr,
-                    "team2_avg_mmr": losing_team_avg_mmr
-                }}
-            )
+        fingerprints = self.rating_fingerprints(team1_states + team2_states, players_by_id)
+        if fingerprints != preview.get("fingerprints"):
+            stale = [player_id for player_id, fingerprint in fingerprints.items()
+                     if fingerprint != preview.get("fingerprints", {}).get(player_id)]
+            logger.info("♻️ MMR preview is stale for %s, recalculating", stale)
+            return None
 
-            print(f"Stored MMR changes and team averages for match {match_id}")
+        deltas = {}
+        for state in team1_states:
+            deltas[state.player_id] = preview["deltas"][state.player_id]["win" if winner == 1 else "loss"]
+        for state in team2_states:
+            deltas[state.player_id] = preview["deltas"][state.player_id]["win" if winner == 2 else "loss"]
+        logger.debug("Using precomputed MMR deltas from %s", preview.get("computed_at"))
+        return deltas
+
+    @staticmethod
+    def format_mmr_preview(preview, player_id):
+        """Win / loss suffix for a player in a team announcement, e.g. (+24 / -18), empty without a preview"""
+        entry = (preview or {}).get("deltas", {}).get(str(player_id))
+        if not entry:
+            return ""
+        return f" (+{entry['win']} / {entry['loss']})"
+
+    def audit_mmr_calculation(self, player_id, factors):
+        """Sampled audit record with every factor that went into one player's change"""
+        if mmr_audit.isEnabledFor(logging.INFO):
+            mmr_audit.info("mmr_calculation", extra={"player_id": player_id, **factors})
 
     def calculate_dynamic_mmr(self, player_mmr, team_avg_mmr, opponent_avg_mmr, matches_played, is_win=True, streak=0,
                               player_data=None):
         """
-        ENHANCED Calculate dynamic MMR change based on:
-        1. INDIVIDUAL player MMR vs match average (NEW)
-        2. MMR difference between teams
-        3. Number of matches played (for decay)
-        4. Win/loss streak with 2x multiplier
-        5. FIXED Rank boundary protection
-        6. Momentum system (recent performance)
-
-        NEW: Each player gets different MMR based on their individual MMR relative to the match
+        MMR change for one player (see mmr_engine.calculate_change). matches_played and streak include
+        this match; player_data enables rank protection and momentum. Used for previews - reports rate
+        the whole match at once with rate_match
         """
-        # Base values for MMR changes
-        BASE_MMR_CHANGE = 30
-        FIRST_GAME_WIN = 110
-        FIRST_GAME_LOSS = 80
-        MAX_MMR_CHANGE = 200
-        MIN_MMR_CHANGE = 15  # Reduced minimum for weaker players
-
-        # Extended placement period
-        PLACEMENT_GAMES = 15
-        DECAY_RATE = 0.1
-
-        # Streak multiplier settings
-        MAX_STREAK_MULTIPLIER = 2.0
-        STREAK_THRESHOLD = 3
-        STREAK_SCALING = 0.1
-
-        # NEW: Individual MMR adjustment settings
-        INDIVIDUAL_MMR_FACTOR = 0.3  # How much individual MMR vs average affects gains/losses
-
-        # Calculate overall match average MMR
-        match_avg_mmr = (team_avg_mmr + opponent_avg_mmr) / 2
-
-        # NEW: Calculate individual adjustment factor
-        # WINS: Higher MMR players get less, lower MMR players get more
-        # LOSSES: Higher MMR players lose more, lower MMR players lose less
-        mmr_difference_from_match = player_mmr - match_avg_mmr
-
-        if is_win:
-            # For wins: Lower skill players get more MMR
-            individual_adjustment = 1.0 - (mmr_difference_from_match / match_avg_mmr) * INDIVIDUAL_MMR_FACTOR
-        else:
-            # For losses: Lower skill players lose less MMR (flip the logic)
-            individual_adjustment = 1.0 + (mmr_difference_from_match / match_avg_mmr) * INDIVIDUAL_MMR_FACTOR
-
-        individual_adjustment = max(0.7, min(1.4, individual_adjustment))  # Constrain between 70% and 140%
-
-        win_lose_text = "WINS" if is_win else "LOSES"
-        print(
-            f"Individual MMR adjustment ({win_lose_text}): Player {player_mmr} vs Match Avg {match_avg_mmr:.1f} = {individual_adjustment:.2f}x")
-
-        # Calculate team vs opponent difference factor
-        mmr_difference = opponent_avg_mmr - team_avg_mmr
-        difference_factor = 1 + (mmr_difference / 400)
-        difference_factor = max(0.5, min(1.5, difference_factor))
-
-        # Extended placement period (first 15 games)
-        if matches_played <= PLACEMENT_GAMES:
-            progress = (matches_played - 1) / (PLACEMENT_GAMES - 1)
-
-            if is_win:
-                base_value = FIRST_GAME_WIN * (1 - progress) + BASE_MMR_CHANGE * progress
-            else:
-                base_value = FIRST_GAME_LOSS * (1 - progress) + BASE_MMR_CHANGE * progress
-
-            if is_win:
-                base_change = base_value * difference_factor
-            else:
-                base_change = base_value * (2 - difference_factor)
-        else:
-            if is_win:
-                base_change = BASE_MMR_CHANGE * difference_factor
-            else:
-                base_change = BASE_MMR_CHANGE * (2 - difference_factor)
-
-        # Apply individual adjustment EARLY
-        base_change *= individual_adjustment
-
-        # Apply decay
-        if matches_played <= PLACEMENT_GAMES:
-            decay_multiplier = 1.0
-        else:
-            import math
-            decay_multiplier = 1.0 * math.exp(-DECAY_RATE * (matches_played - PLACEMENT_GAMES))
-            decay_multiplier = max(0.6, decay_multiplier)
-
-        mmr_change = base_change * decay_multiplier
-
-        # Streak multiplier system
-        streak_abs = abs(streak)
-        if streak_abs >= STREAK_THRESHOLD:
-            streak_bonus = min(
-                (streak_abs - STREAK_THRESHOLD + 1) * STREAK_SCALING,
-                MAX_STREAK_MULTIPLIER - 1.0
-            )
-            streak_multiplier = 1.0 + streak_bonus
-
-            if (is_win and streak > 0) or (not is_win and streak < 0):
-                mmr_change *= streak_multiplier
-                print(f"Streak multiplier applied: {streak_multiplier:.2f}x (Streak: {streak})")
-
-        # FIXED: Rank boundary protection - APPLY BEFORE FINAL BOUNDS CHECK
+        games_since_promotion = None
+        recent_results = None
         if player_data:
-            protection_modifier = self.calculate_rank_protection_fixed(
-                player_data, player_mmr, is_win, matches_played
-            )
-            if protection_modifier != 1.0:
-                print(f"PROTECTION APPLIED: {protection_modifier:.2f}x modifier for player MMR {player_mmr}")
-                mmr_change *= protection_modifier
-
-        # Momentum system bonus
-        if player_data and matches_played > 10:
-            momentum_bonus = self.calculate_momentum_bonus_enhanced(player_data, is_win, 0.5, 1.2)
-            if momentum_bonus > 1.0:
-                mmr_change *= momentum_bonus
-                print(f"Momentum bonus applied: {momentum_bonus:.2f}x")
-
-        # Ensure the change is within bounds
-        mmr_change = max(MIN_MMR_CHANGE, min(MAX_MMR_CHANGE, mmr_change))
+            promotion = player_data.get('last_promotion')
+            if promotion:
+                games_since_promotion = player_data.get('matches', 0) - promotion.get('matches_at_promotion', 0)
+            if matches_played > mmr_engine.MOMENTUM_MIN_MATCHES and player_data.get('id'):
+                try:
+                    recent_results = self.get_recent_results([player_data['id']]).get(player_data['id'], [])
+                except Exception as e:
+                    logger.error("Error fetching recent results for momentum: %s", e)
 
-        return round(mmr_change)
+        mmr_change, factors = mmr_engine.calculate_change(
+            player_mmr, team_avg_mmr, opponent_avg_mmr, matches_played, is_win=is_win, streak=streak,
+            games_since_promotion=games_since_promotion, recent_results=recent_results,
+            has_history=bool(player_data)
+        )
+        self.audit_mmr_calculation(player_data.get("id") if player_data else None, factors)
+        return mmr_change
 
     def calculate_momentum_bonus_enhanced(self, player_data, is_win, momentum_threshold, momentum_multiplier):
         """
-        Enhanced momentum calculation using the defined constants
+        Momentum multiplier from the player's last 10 completed matches
         """
         try:
-            # Get recent matches for this player
             player_id = player_data.get('id')
             if not player_id:
                 return 1.0
-
-            # Look at last 10 completed matches
-            recent_matches = list(self.matches.find(
-                {"$or": [
-                    {"team1.id": player_id},
-                    {"team2.id": player_id}
-                ], "status": "completed"}
-            ).sort("completed_at", -1).limit(10))
-
-            if len(recent_matches) < 5:  # Need at least 5 games for momentum
-                return 1.0
-
-            # Calculate win rate in recent matches
-            wins = 0
-            for match in recent_matches:
-                player_won = self.did_player_win_match(match, player_id)
-                if player_won:
-                    wins += 1
-
-            win_rate = wins / len(recent_matches)
-
-            # Apply momentum bonus using the defined constants
-            if win_rate >= (momentum_threshold + 0.2) and is_win:  # 70%+ win rate and currently winning
-                return momentum_multiplier  # 20% bonus
-            elif win_rate <= (momentum_threshold - 0.2) and not is_win:  # 30% or lower win rate and currently losing
-                return 1.1  # 10% penalty reduction (mercy)
-
-            return 1.0
+            recent_results = self.get_recent_results([player_id]).get(player_id, [])
+            return mmr_engine.momentum_bonus(recent_results, is_win, momentum_threshold, momentum_multiplier)
 
         except Exception as e:
-            print(f"Error calculating enhanced momentum bonus: {e}")
+            logger.error("Error calculating enhanced momentum bonus: %s", e)
             return 1.0
 
     def calculate_rank_protection_fixed(self, player_data, current_mmr, is_win, matches_played):
         """
-        FIXED rank protection calculation that actually works
+        Rank protection modifier (see mmr_engine.rank_protection)
         """
-        try:
-            print(f"Checking rank protection for player with MMR {current_mmr}, is_win: {is_win}")
-
-            # PRIORITY 1: Check for recent promotion protection (50% loss reduction for 3 games)
-            if not is_win:  # Only apply to losses
-                promotion_data = player_data.get('last_promotion')
-                if promotion_data:
-                    current_matches = player_data.get('matches', 0)
-                    matches_at_promotion = promotion_data.get('matches_at_promotion', 0)
-                    games_since_promotion = current_matches - matches_at_promotion
-
-                    print(
-                        f"Promotion data found: {games_since_promotion} games since promotion (current: {current_matches}, at promotion: {matches_at_promotion})")
-
-                    if games_since_promotion < 3:  # 3 games of protection
-                        print(
-                            f"APPLYING PROMOTION PROTECTION: 50% loss reduction ({3 - games_since_promotion} games left)")
-                        return 0.5  # 50% loss reduction - RETURN IMMEDIATELY, don't check other protections
-
-            # PRIORITY 2: Check for promotion assistance (close to ranking up)
-            if is_win:  # Only for wins
-                RANK_BOUNDARIES = [1100, 1600]  # Rank B and Rank A thresholds
-                BOUNDARY_RANGE = 100  # 100 MMR buffer
-
-                for boundary in RANK_BOUNDARIES:
-                    if current_mmr < boundary:  # Player is below this boundary
-                        distance_to_boundary = boundary - current_mmr
-                        if distance_to_boundary <= BOUNDARY_RANGE:
-                            # Boost gains when close to promotion
-                            assistance_factor = (BOUNDARY_RANGE - distance_to_boundary) / BOUNDARY_RANGE
-                            assistance_modifier = 1.0 + (0.2 * assistance_factor)  # 100-120% of normal gain
-                            print(
-                                f"Promotion assistance: {distance_to_boundary} MMR to boundary, {assistance_modifier:.2f}x modifier")
-                            return assistance_modifier
-
-            # PRIORITY 3: Check for demotion protection (close to losing a rank) - ONLY if no promotion protection
-            if not is_win:  # Only for losses
-                RANK_BOUNDARIES = [1100, 1600]  # Rank B and Rank A thresholds
-                BOUNDARY_RANGE = 100  # 100 MMR buffer
-
-                for boundary in RANK_BOUNDARIES:
-                    if current_mmr >= boundary:  # Player is above this boundary
-                        distance_from_boundary = current_mmr - boundary
-                        if distance_from_boundary <= BOUNDARY_RANGE:
-                            # Reduce loss when close to demotion
-                            protection_factor = distance_from_boundary / BOUNDARY_RANGE
-                            protection_modifier = 0.7 + (0.3 * protection_factor)  # 70-100% of normal loss
-                            print(
-                                f"Demotion protection: {distance_from_boundary} MMR from boundary, {protection_modifier:.2f}x modifier")
-                            return protection_modifier
-
-            print(f"No protection applied for player with MMR {current_mmr}")
-            return 1.0
-
-        except Exception as e:
-            print(f"Error in rank protection calculation: {e}")
-            return 1.0
+        games_since_promotion = None
+        promotion_data = player_data.get('last_promotion')
+        if promotion_data:
+            games_since_promotion = player_data.get('matches', 0) - promotion_data.get('matches_at_promotion', 0)
+        return mmr_engine.rank_protection(current_mmr, is_win, games_since_promotion)
 
     def check_recent_promotion_enhanced(self, player_data, promotion_protection_games):
         """
@@ -2513,7 +1466,7 @@ class MatchSystem:
             return None
 
         except Exception as e:
-            print(f"Error checking enhanced recent promotion: {e}")
+            logger.error("Error checking enhanced recent promotion: %s", e)
             return None
 
     def did_player_win_match(self, match, player_id):
@@ -2538,12 +1491,7 @@ class MatchSystem:
         """
         Helper function to determine rank tier from MMR
         """
-        if mmr >= 1600:
-            return "Rank A"
-        elif mmr >= 1100:
-            return "Rank B"
-        else:
-            return "Rank C"
+        return tier_for_mmr(mmr)
 
     def get_player_protection_status(self, player_data):
         """
@@ -2590,11 +1538,11 @@ class MatchSystem:
             current_mmr = player_data.get('mmr', 600)
 
             # Close to promotion
-            if 1050 <= current_mmr < 1100 or 1550 <= current_mmr < 1600:
+            if any(boundary - BOUNDARY_WARNING_MARGIN <= current_mmr < boundary for boundary in TIER_BOUNDARIES):
                 status["close_to_promotion"] = True
 
             # Close to demotion
-            if 1100 <= current_mmr <= 1150 or 1600 <= current_mmr <= 1650:
+            if any(boundary <= current_mmr <= boundary + BOUNDARY_WARNING_MARGIN for boundary in TIER_BOUNDARIES):
                 status["close_to_demotion"] = True
 
             return status
@@ -2,6 +2,7 @@ from pymongo import MongoClient
 import os
 from dotenv import load_dotenv
 import datetime
+from tiers import TIER_BOUNDARIES, TIER_FLOOR, tier_for_mmr
 
 # Load environment variables
 load_dotenv()
@@ -41,7 +42,7 @@ def migrate_to_rank_protection():
     # Get all players with Rank A or B MMR
     high_rank_players = list(players_collection.find({
         "$or": [
-            {"mmr": {"$gte": 1100}},  # Rank B or higher
+            {"mmr": {"$gte": TIER_FLOOR["Rank B"]}},  # Rank B or higher
         ]
     }))
 
@@ -83,8 +84,8 @@ def migrate_to_rank_protection():
             old_mmr = player_mmr_change.get('old_mmr', 0)
             new_mmr = player_mmr_change.get('new_mmr', 0)
 
-            # Check if they crossed 1100 (Rank C to B) or 1600 (Rank B to A)
-            if (old_mmr < 1100 <= new_mmr) or (old_mmr < 1600 <= new_mmr):
+            # Check if they crossed a tier boundary (Rank C to B or Rank B to A)
+            if any(old_mmr < boundary <= new_mmr for boundary in TIER_BOUNDARIES):
                 # They got promoted in this match!
                 matches_at_promotion = current_matches - i
                 promotion_data = {
@@ -107,7 +108,7 @@ def migrate_to_rank_protection():
                 promotion_found = True
                 break
 
-        if not promotion_found and current_mmr >= 1100:
+        if not promotion_found and current_mmr >= TIER_FLOOR["Rank B"]:
             # Player is high rank but we couldn't find recent promotion
             # This means they were probably promoted long ago, so no protection needed
             print(
@@ -135,12 +136,7 @@ def migrate_to_rank_protection():
 
 def get_rank_from_mmr(mmr):
     """Helper function to determine rank from MMR"""
-    if mmr >= 1600:
-        return "Rank A"
-    elif mmr >= 1100:
-        return "Rank B"
-    else:
-        return "Rank C"
+    return tier_for_mmr(mmr)
 
 
 def test_rank_protection():
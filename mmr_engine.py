@@ -0,0 +1,321 @@
+import math
+from tiers import TIER_BOUNDARIES
+
+# Base values for MMR changes
+BASE_MMR_CHANGE = 30
+FIRST_GAME_WIN = 110
+FIRST_GAME_LOSS = 80
+MAX_MMR_CHANGE = 200
+MIN_MMR_CHANGE = 15
+
+# Placement period and decay after it
+PLACEMENT_GAMES = 15
+DECAY_RATE = 0.1
+MIN_DECAY = 0.6
+
+# Streak multiplier settings
+MAX_STREAK_MULTIPLIER = 2.0
+STREAK_THRESHOLD = 3
+STREAK_SCALING = 0.1
+
+# How much a player's own MMR vs the match average affects gains/losses
+INDIVIDUAL_MMR_FACTOR = 0.3
+
+# Rank protection - Rank B and Rank A thresholds and the buffer around them
+RANK_BOUNDARIES = list(TIER_BOUNDARIES)
+BOUNDARY_RANGE = 100
+PROMOTION_PROTECTION_GAMES = 3
+
+# Momentum - recent win rate needed and the bonus it gives
+MOMENTUM_MIN_MATCHES = 10
+MOMENTUM_RECENT_GAMES = 10
+MOMENTUM_MIN_RECENT = 5
+MOMENTUM_THRESHOLD = 0.5
+MOMENTUM_MULTIPLIER = 1.2
+MOMENTUM_MERCY = 1.1
+
+
+class PlayerState:
+    """
+    What the rating formula needs to know about one player before a match.
+    matches and streak are the pre-match values for the MMR being rated (ranked or global),
+    recent_results is the player's last completed matches as booleans (won?), newest first
+    """
+
+    __slots__ = ("player_id", "mmr", "matches", "streak", "games_since_promotion", "recent_results", "has_history")
+
+    def __init__(self, player_id, mmr, matches=0, streak=0, games_since_promotion=None, recent_results=None,
+                 has_history=True):
+        self.player_id = player_id
+        self.mmr = mmr
+        self.matches = matches
+        self.streak = streak
+        self.games_since_promotion = games_since_promotion
+        self.recent_results = recent_results or []
+        self.has_history = has_history
+
+    @classmethod
+    def from_player(cls, player_id, player_data, is_global=False, starting_mmr=None, recent_results=None):
+        """State from a players document, or a first-match state at starting_mmr when there is none"""
+        if not player_data:
+            default_mmr = 300 if is_global else 600
+            return cls(player_id, starting_mmr if starting_mmr is not None else default_mmr, has_history=False)
+
+        # Promotion protection counts ranked games, even when rating a global match
+        games_since_promotion = None
+        promotion = player_data.get("last_promotion")
+        if promotion:
+            games_since_promotion = player_data.get("matches", 0) - promotion.get("matches_at_promotion", 0)
+
+        if is_global:
+            return cls(player_id, player_data.get("global_mmr", 300), player_data.get("global_matches", 0),
+                       player_data.get("global_current_streak", 0), games_since_promotion, recent_results)
+        return cls(player_id, player_data.get("mmr", 600), player_data.get("matches", 0),
+                   player_data.get("current_streak", 0), games_since_promotion, recent_results)
+
+    def __repr__(self):
+        return f"PlayerState({self.player_id!r}, mmr={self.mmr}, matches={self.matches}, streak={self.streak})"
+
+
+def next_streak(streak, is_win):
+    """Streak after a result - positive for wins, negative for losses"""
+    if is_win:
+        return streak + 1 if streak >= 0 else 1
+    return streak - 1 if streak <= 0 else -1
+
+
+def rank_protection(mmr, is_win, games_since_promotion=None):
+    """
+    Loss reduction after a promotion, gain boost near a promotion boundary,
+    or loss reduction near a demotion boundary (first that applies)
+    """
+    if not is_win and games_since_promotion is not None and games_since_promotion < PROMOTION_PROTECTION_GAMES:
+        return 0.5
+
+    for boundary in RANK_BOUNDARIES:
+        if is_win and mmr < boundary and boundary - mmr <= BOUNDARY_RANGE:
+            return 1.0 + 0.2 * ((BOUNDARY_RANGE - (boundary - mmr)) / BOUNDARY_RANGE)
+        if not is_win and mmr >= boundary and mmr - boundary <= BOUNDARY_RANGE:
+            return 0.7 + 0.3 * ((mmr - boundary) / BOUNDARY_RANGE)
+    return 1.0
+
+
+def momentum_bonus(recent_results, is_win, threshold=MOMENTUM_THRESHOLD, multiplier=MOMENTUM_MULTIPLIER):
+    """Bonus for winning while hot, mercy for losing while cold (needs 5+ recent results)"""
+    recent = recent_results[:MOMENTUM_RECENT_GAMES]
+    if len(recent) < MOMENTUM_MIN_RECENT:
+        return 1.0
+
+    win_rate = sum(1 for won in recent if won) / len(recent)
+    if win_rate >= (threshold + 0.2) and is_win:
+        return multiplier
+    if win_rate <= (threshold - 0.2) and not is_win:
+        return MOMENTUM_MERCY
+    return 1.0
+
+
+def calculate_change(player_mmr, team_avg_mmr, opponent_avg_mmr, matches_played, is_win=True, streak=0,
+                     games_since_promotion=None, recent_results=None, has_history=False):
+    """
+    MMR gained (or lost, as a positive number) by one player.
+    matches_played and streak already include this match. Rank protection and momentum
+    only apply to players with history. Returns (change, factors) - factors is what the audit log records
+    """
+    match_avg_mmr = (team_avg_mmr + opponent_avg_mmr) / 2
+
+    # Lower rated players gain more and lose less than the match average, higher rated the reverse
+    relative = (player_mmr - match_avg_mmr) / match_avg_mmr * INDIVIDUAL_MMR_FACTOR
+    individual_adjustment = 1.0 - relative if is_win else 1.0 + relative
+    individual_adjustment = max(0.7, min(1.4, individual_adjustment))
+
+    difference_factor = 1 + ((opponent_avg_mmr - team_avg_mmr) / 400)
+    difference_factor = max(0.5, min(1.5, difference_factor))
+
+    if matches_played <= PLACEMENT_GAMES:
+        progress = (matches_played - 1) / (PLACEMENT_GAMES - 1)
+        first_game = FIRST_GAME_WIN if is_win else FIRST_GAME_LOSS
+        base_value = first_game * (1 - progress) + BASE_MMR_CHANGE * progress
+    else:
+        base_value = BASE_MMR_CHANGE
+    base_change = base_value * (difference_factor if is_win else 2 - difference_factor)
+    base_change *= individual_adjustment
+
+    if matches_played <= PLACEMENT_GAMES:
+        decay_multiplier = 1.0
+    else:
+        decay_multiplier = max(MIN_DECAY, math.exp(-DECAY_RATE * (matches_played - PLACEMENT_GAMES)))
+
+    mmr_change = base_change * decay_multiplier
+
+    streak_multiplier = 1.0
+    if abs(streak) >= STREAK_THRESHOLD and (streak > 0) == is_win:
+        streak_multiplier = 1.0 + min((abs(streak) - STREAK_THRESHOLD + 1) * STREAK_SCALING,
+                                      MAX_STREAK_MULTIPLIER - 1.0)
+        mmr_change *= streak_multiplier
+
+    protection_modifier = 1.0
+    momentum = 1.0
+    if has_history:
+        protection_modifier = rank_protection(player_mmr, is_win, games_since_promotion)
+        mmr_change *= protection_modifier
+
+        if matches_played > MOMENTUM_MIN_MATCHES:
+            momentum = momentum_bonus(recent_results or [], is_win)
+            mmr_change *= momentum
+
+    unclamped_change = mmr_change
+    mmr_change = round(max(MIN_MMR_CHANGE, min(MAX_MMR_CHANGE, mmr_change)))
+
+    return mmr_change, {
+        "is_win": is_win,
+        "player_mmr": player_mmr,
+        "team_avg_mmr": team_avg_mmr,
+        "opponent_avg_mmr": opponent_avg_mmr,
+        "matches_played": matches_played,
+        "streak": streak,
+        "individual_adjustment": round(individual_adjustment, 4),
+        "difference_factor": round(difference_factor, 4),
+        "decay_multiplier": round(decay_multiplier, 4),
+        "streak_multiplier": round(streak_multiplier, 4),
+        "protection_modifier": round(protection_modifier, 4),
+        "momentum_bonus": round(momentum, 4),
+        "unclamped_change": round(unclamped_change, 2),
+        "mmr_change": mmr_change
+    }
+
+
+def team_average(states):
+    return sum(state.mmr for state in states) / len(states) if states else 0
+
+
+def match_deltas(team1, team2, winner, team1_avg=None, team2_avg=None, with_factors=False):
+    """
+    Signed MMR change for every player in a match: {player_id: delta}, losses negative.
+    team1/team2 are PlayerState lists (dummies left out); the averages default to the states' MMRs.
+    with_factors=True returns {player_id: (delta, factors)} instead
+    """
+    team1_avg = team_average(team1) if team1_avg is None else team1_avg
+    team2_avg = team_average(team2) if team2_avg is None else team2_avg
+
+    deltas = {}
+    for team_number, states, team_avg, opponent_avg in ((1, team1, team1_avg, team2_avg),
+                                                        (2, team2, team2_avg, team1_avg)):
+        is_win = team_number == winner
+        for state in states:
+            change, factors = calculate_change(
+                state.mmr, team_avg, opponent_avg, state.matches + 1, is_win=is_win,
+                streak=next_streak(state.streak, is_win), games_since_promotion=state.games_since_promotion,
+                recent_results=state.recent_results, has_history=state.has_history
+            )
+            delta = change if is_win else -change
+            deltas[state.player_id] = (delta, factors) if with_factors else delta
+    return deltas
+
+
+def batch_changes(player_mmr, team_avg_mmr, opponent_avg_mmr, matches_played, is_win, streak,
+                  games_since_promotion=None, has_history=None, recent_wins=None, recent_count=None):
+    """
+    calculate_change over NumPy arrays, one element per player-rating - same results as the scalar path.
+    games_since_promotion uses NaN for "never promoted"; recent_wins/recent_count are counts over
+    the last 10 completed matches. Returns an int64 array of positive changes
+    """
+    import numpy as np
+
+    player_mmr = np.asarray(player_mmr, dtype=np.float64)
+    team_avg_mmr = np.asarray(team_avg_mmr, dtype=np.float64)
+    opponent_avg_mmr = np.asarray(opponent_avg_mmr, dtype=np.float64)
+    matches_played = np.asarray(matches_played, dtype=np.int64)
+    is_win = np.asarray(is_win, dtype=bool)
+    streak = np.asarray(streak, dtype=np.int64)
+    size = player_mmr.shape
+    games_since_promotion = (np.full(size, np.nan) if games_since_promotion is None
+                             else np.asarray(games_since_promotion, dtype=np.float64))
+    has_history = np.zeros(size, dtype=bool) if has_history is None else np.asarray(has_history, dtype=bool)
+    recent_wins = np.zeros(size, dtype=np.int64) if recent_wins is None else np.asarray(recent_wins, dtype=np.int64)
+    recent_count = (np.zeros(size, dtype=np.int64) if recent_count is None
+                    else np.asarray(recent_count, dtype=np.int64))
+
+    match_avg_mmr = (team_avg_mmr + opponent_avg_mmr) / 2
+    relative = (player_mmr - match_avg_mmr) / match_avg_mmr * INDIVIDUAL_MMR_FACTOR
+    individual_adjustment = np.clip(np.where(is_win, 1.0 - relative, 1.0 + relative), 0.7, 1.4)
+
+    difference_factor = np.clip(1 + ((opponent_avg_mmr - team_avg_mmr) / 400), 0.5, 1.5)
+
+    in_placement = matches_played <= PLACEMENT_GAMES
+    progress = (matches_played - 1) / (PLACEMENT_GAMES - 1)
+    first_game = np.where(is_win, FIRST_GAME_WIN, FIRST_GAME_LOSS)
+    base_value = np.where(in_placement, first_game * (1 - progress) + BASE_MMR_CHANGE * progress, BASE_MMR_CHANGE)
+    base_change = base_value * np.where(is_win, difference_factor, 2 - difference_factor)
+    base_change = base_change * individual_adjustment
+
+    decay_multiplier = np.where(
+        in_placement, 1.0,
+        np.maximum(MIN_DECAY, np.exp(-DECAY_RATE * (matches_played - PLACEMENT_GAMES).astype(np.float64)))
+    )
+    mmr_change = base_change * decay_multiplier
+
+    streak_abs = np.abs(streak)
+    streak_applies = (streak_abs >= STREAK_THRESHOLD) & ((streak > 0) == is_win)
+    streak_multiplier = 1.0 + np.minimum((streak_abs - STREAK_THRESHOLD + 1) * STREAK_SCALING,
+                                         MAX_STREAK_MULTIPLIER - 1.0)
+    mmr_change = np.where(streak_applies, mmr_change * streak_multiplier, mmr_change)
+
+    # Rank protection, in the same priority order as rank_protection()
+    protection = np.ones(size)
+    decided = np.zeros(size, dtype=bool)
+    promoted = ~is_win & ~np.isnan(games_since_promotion) & (games_since_promotion < PROMOTION_PROTECTION_GAMES)
+    protection = np.where(promoted, 0.5, protection)
+    decided |= promoted
+    for boundary in RANK_BOUNDARIES:
+        near_promotion = ~decided & is_win & (player_mmr < boundary) & (boundary - player_mmr <= BOUNDARY_RANGE)
+        protection = np.where(
+            near_promotion, 1.0 + 0.2 * ((BOUNDARY_RANGE - (boundary - player_mmr)) / BOUNDARY_RANGE), protection
+        )
+        near_demotion = ~decided & ~is_win & (player_mmr >= boundary) & (player_mmr - boundary <= BOUNDARY_RANGE)
+        protection = np.where(near_demotion, 0.7 + 0.3 * ((player_mmr - boundary) / BOUNDARY_RANGE), protection)
+        decided |= near_promotion | near_demotion
+    mmr_change = np.where(has_history, mmr_change * protection, mmr_change)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        win_rate = recent_wins / recent_count
+    enough_recent = recent_count >= MOMENTUM_MIN_RECENT
+    momentum = np.where(enough_recent & is_win & (win_rate >= (MOMENTUM_THRESHOLD + 0.2)), MOMENTUM_MULTIPLIER, 1.0)
+    momentum = np.where(enough_recent & ~is_win & (win_rate <= (MOMENTUM_THRESHOLD - 0.2)), MOMENTUM_MERCY, momentum)
+    mmr_change = np.where(has_history & (matches_played > MOMENTUM_MIN_MATCHES), mmr_change * momentum, mmr_change)
+
+    return np.round(np.clip(mmr_change, MIN_MMR_CHANGE, MAX_MMR_CHANGE)).astype(np.int64)
+
+
+def batch_match_deltas(matches):
+    """
+    match_deltas for many independent matches in one vectorised pass.
+    matches is an iterable of (team1_states, team2_states, winner); returns one {player_id: delta} per match
+    """
+    import numpy as np
+
+    matches = list(matches)
+    results = [{} for _ in matches]
+
+    rows = []
+    for match_index, (team1, team2, winner) in enumerate(matches):
+        team1_avg, team2_avg = team_average(team1), team_average(team2)
+        for team_number, states, team_avg, opponent_avg in ((1, team1, team1_avg, team2_avg),
+                                                            (2, team2, team2_avg, team1_avg)):
+            is_win = team_number == winner
+            for state in states:
+                recent = state.recent_results[:MOMENTUM_RECENT_GAMES]
+                rows.append((
+                    match_index, state.player_id, state.mmr, team_avg, opponent_avg, state.matches + 1, is_win,
+                    next_streak(state.streak, is_win),
+                    np.nan if state.games_since_promotion is None else state.games_since_promotion,
+                    state.has_history, sum(1 for won in recent if won), len(recent)
+                ))
+
+    if not rows:
+        return results
+
+    columns = list(zip(*rows))
+    changes = batch_changes(*columns[2:])
+    for (match_index, player_id, *_), change, is_win in zip(rows, changes.tolist(), columns[6]):
+        results[match_index][player_id] = change if is_win else -change
+    return results
@@ -0,0 +1,235 @@
+import asyncio
+import collections
+import contextvars
+import datetime
+import time
+
+# Timing record of the slash command the current task is running for (copied into its subtasks and threads)
+current_command = contextvars.ContextVar('current_command', default=None)
+
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS = [0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, float("inf")]
+
+
+class CommandTiming:
+    """Time spent by one slash command invocation, split by where it went"""
+
+    def __init__(self, name):
+        self.name = name
+        self.started = time.perf_counter()
+        self.first_response = None
+        self.db = 0.0
+        self.discord = 0.0
+        self.sleep = 0.0
+        self.db_calls = 0
+        self.discord_calls = 0
+        self.auto_deferred = False
+
+
+def add_command_time(kind, seconds):
+    """Add time to the running command's breakdown ("db", "discord" or "sleep")"""
+    timing = current_command.get()
+    if timing is None:
+        return
+    setattr(timing, kind, getattr(timing, kind) + seconds)
+    if kind in ("db", "discord"):
+        setattr(timing, f"{kind}_calls", getattr(timing, f"{kind}_calls") + 1)
+
+
+async def timed_sleep(seconds):
+    """asyncio.sleep that counts as deliberate wait time for the running command"""
+    started = time.perf_counter()
+    await asyncio.sleep(seconds)
+    add_command_time("sleep", time.perf_counter() - started)
+
+
+class CommandPerfTracker:
+    """
+    Per-command latency percentiles, histograms and time breakdowns.
+    A rolling window is kept in memory for /perfstats and a summary of each interval is saved to Mongo.
+    """
+
+    def __init__(self, db=None, window_size=500, persist_interval=300, retention_days=30):
+        self.window_size = window_size
+        self.persist_interval = persist_interval
+
+        # command name -> deque of recent samples
+        self.samples = {}
+        # command name -> bucket counts since startup
+        self.histograms = {}
+        # command name -> samples since the last Mongo write
+        self.interval_samples = {}
+        self.interval_started = datetime.datetime.utcnow()
+
+        self.persist_task = None
+        self.perf_collection = None
+        if db is not None:
+            self.perf_collection = db.get_collection('command_perf')
+            try:
+                self.perf_collection.create_index("window_end", expireAfterSeconds=retention_days * 86400)
+                self.perf_collection.create_index([("command", 1), ("window_end", -1)])
+            except Exception as e:
+                print(f"⚠️ Could not create command_perf indexes: {e}")
+
+    def begin(self, name):
+        """Start timing a command in the current context. Returns (timing, token) for finish()"""
+        timing = CommandTiming(name)
+        return timing, current_command.set(timing)
+
+    def finish(self, timing, token, name=None, failed=False):
+        """Stop timing a command and record the sample"""
+        current_command.reset(token)
+
+        total = time.perf_counter() - timing.started
+        name = name or timing.name
+        sample = {
+            "total": total,
+            "first_response": timing.first_response,
+            "db": timing.db,
+            "discord": timing.discord,
+            "sleep": timing.sleep,
+            "db_calls": timing.db_calls,
+            "discord_calls": timing.discord_calls,
+            "auto_deferred": timing.auto_deferred,
+            "failed": failed
+        }
+
+        self.samples.setdefault(name, collections.deque(maxlen=self.window_size)).append(sample)
+        self.interval_samples.setdefault(name, []).append(sample)
+
+        histogram = self.histograms.setdefault(name, [0] * len(LATENCY_BUCKETS))
+        for index, bound in enumerate(LATENCY_BUCKETS):
+            if total <= bound:
+                histogram[index] += 1
+                break
+
+    def mark_first_response(self):
+        """Note when the running command first answered or deferred its interaction"""
+        timing = current_command.get()
+        if timing is not None and timing.first_response is None:
+            timing.first_response = time.perf_counter() - timing.started
+
+    def instrument_discord(self, bot):
+        """Charge Discord API calls (bot token and interaction webhooks) to the running command"""
+        from discord.webhook.async_ import async_context
+
+        def timed(original, marks_response=False):
+            async def request(route, *args, **kwargs):
+                started = time.perf_counter()
+                try:
+                    return await original(route, *args, **kwargs)
+                finally:
+                    add_command_time("discord", time.perf_counter() - started)
+                    if marks_response and route.path.endswith("/callback"):
+                        self.mark_first_response()
+            return request
+
+        bot.http.request = timed(bot.http.request)
+        adapter = async_context.get()
+        adapter.request = timed(adapter.request, marks_response=True)
+
+    def start(self):
+        """Start writing interval summaries to Mongo (call from the running loop)"""
+        if self.perf_collection is None:
+            return
+        if not self.persist_task or self.persist_task.done():
+            self.persist_task = asyncio.get_running_loop().create_task(self._persist_loop())
+
+    async def _persist_loop(self):
+        while True:
+            try:
+                await asyncio.sleep(self.persist_interval)
+                await self.persist()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                print(f"❌ Error saving command perf stats: {e}")
+
+    async def persist(self):
+        """Write one summary document per command for the interval that just ended"""
+        interval_samples = self.interval_samples
+        window_start = self.interval_started
+        self.interval_samples = {}
+        self.interval_started = datetime.datetime.utcnow()
+
+        documents = []
+        for name, samples in interval_samples.items():
+            summary = self.summarize(samples)
+            summary.update({
+                "command": name,
+                "window_start": window_start,
+                "window_end": self.interval_started
+            })
+            documents.append(summary)
+
+        if documents:
+            await asyncio.to_thread(self.perf_collection.insert_many, documents)
+        return len(documents)
+
+    @staticmethod
+    def percentile(values, pct):
+        if not values:
+            return None
+        ordered = sorted(values)
+        return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+    def summarize(self, samples):
+        """Percentiles and average breakdown for a list of samples (times in ms)"""
+        samples = list(samples)
+        count = len(samples)
+        totals = [s["total"] for s in samples]
+        first_responses = [s["first_response"] for s in samples if s["first_response"] is not None]
+
+        def ms(value):
+            return round(value * 1000, 1) if value is not None else None
+
+        def average(key):
+            return sum(s[key] for s in samples) / count if count else 0.0
+
+        avg_total = average("total")
+        avg_db = average("db")
+        avg_discord = average("discord")
+        avg_sleep = average("sleep")
+
+        return {
+            "count": count,
+            "failed": sum(1 for s in samples if s["failed"]),
+            "auto_deferred": sum(1 for s in samples if s.get("auto_deferred")),
+            "p50_ms": ms(self.percentile(totals, 50)),
+            "p95_ms": ms(self.percentile(totals, 95)),
+            "p99_ms": ms(self.percentile(totals, 99)),
+            "max_ms": ms(max(totals) if totals else None),
+            "avg_ms": ms(avg_total),
+            "first_response_p50_ms": ms(self.percentile(first_responses, 50)),
+            "first_response_p95_ms": ms(self.percentile(first_responses, 95)),
+            "avg_db_ms": ms(avg_db),
+            "avg_discord_ms": ms(avg_discord),
+            "avg_sleep_ms": ms(avg_sleep),
+            "avg_other_ms": ms(max(0.0, avg_total - avg_db - avg_discord - avg_sleep)),
+            "avg_db_calls": round(average("db_calls"), 1),
+            "avg_discord_calls": round(average("discord_calls"), 1)
+        }
+
+    def get_summaries(self):
+        """Summary of the in-memory window for every command, slowest p95 first"""
+        summaries = {name: self.summarize(samples) for name, samples in self.samples.items() if samples}
+        return dict(sorted(summaries.items(), key=lambda item: item[1]["p95_ms"] or 0, reverse=True))
+
+    def get_histogram(self, name):
+        """[(bucket label, count)] since startup for one command"""
+        counts = self.histograms.get(name)
+        if not counts:
+            return []
+        labels = [f"≤{bound * 1000:.0f}ms" if bound != float("inf") else f">{LATENCY_BUCKETS[-2] * 1000:.0f}ms"
+                  for bound in LATENCY_BUCKETS]
+        return list(zip(labels, counts))
+
+    def get_trend(self, name, hours=24):
+        """Saved interval summaries for one command over the last few hours, oldest first"""
+        if self.perf_collection is None:
+            return []
+        since = datetime.datetime.utcnow() - datetime.timedelta(hours=hours)
+        return list(self.perf_collection.find(
+            {"command": name, "window_end": {"$gte": since}},
+            {"_id": 0}
+        ).sort("window_end", 1))
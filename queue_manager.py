@@ -1,8 +1,12 @@
 import discord
 import asyncio
 import datetime
+import logging
 import uuid
 from typing import Dict, List, Set, Optional, Tuple, Any
+from logging_config import get_logger
+
+logger = get_logger("queue_manager")
 
 
 class QueueManager:
@@ -585,15 +589,25 @@ class QueueManager:
         return True
 
     def assign_teams_to_match(self, match_id, team1, team2):
-        """Assign teams to a match after selection"""
+        """Assign teams to a match after selection. Returns the match's MMR preview (or None)"""
         # Normalize match ID
         match_id = str(match_id).strip()
         if len(match_id) > 8:
             match_id = match_id[:6]
 
-        print(f"Assigning teams to match {match_id}")
-        print(f"Team 1: {[p.get('name', 'Unknown') + ' (ID: ' + str(p.get('id', 'None')) + ')' for p in team1]}")
-        print(f"Team 2: {[p.get('name', 'Unknown') + ' (ID: ' + str(p.get('id', 'None')) + ')' for p in team2]}")
+        logger.debug("Assigning teams to match %s", match_id)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Team 1: %s", [f"{p.get('name', 'Unknown')} (ID: {p.get('id', 'None')})" for p in team1])
+            logger.debug("Team 2: %s", [f"{p.get('name', 'Unknown')} (ID: {p.get('id', 'None')})" for p in team2])
+
+        # Work out every player's win/loss delta now so reporting only has to apply them
+        mmr_preview = None
+        if self.match_system:
+            is_global = self.active_matches.get(match_id, {}).get("is_global", False)
+            try:
+                mmr_preview = self.match_system.preview_match_deltas(team1, team2, is_global)
+            except Exception as e:
+                print(f"⚠️ Could not precompute MMR deltas for match {match_id}: {e}")
 
         # Update in database
         self.active_matches_collection.update_one(
@@ -601,7 +615,8 @@ class QueueManager:
             {"$set": {
                 "team1": team1,
                 "team2": team2,
-                "status": "in_progress"
+                "status": "in_progress",
+                "mmr_preview": mmr_preview
             }}
         )
 
@@ -610,12 +625,17 @@ class QueueManager:
             self.active_matches[match_id]["team1"] = team1
             self.active_matches[match_id]["team2"] = team2
             self.active_matches[match_id]["status"] = "in_progress"
+            self.active_matches[match_id]["mmr_preview"] = mmr_preview
 
             # Update player_matches mapping - convert all IDs to strings for consistency
             for player in team1 + team2:
                 player_id = str(player.get('id', ''))
                 if player_id:
                     self.player_matches[player_id] = match_id
-                    print(f"Added player {player.get('name', 'Unknown')} (ID: {player_id}) to match {match_id}")
+                    logger.debug(
+                        "Added player %s (ID: %s) to match %s",
+                        player.get('name', 'Unknown'), player_id, match_id)
         else:
-            print(f"Warning: Match {match_id} not found in active_matches during team assignment")
\ No newline at end of file
+            logger.warning("Match %s not found in active_matches during team assignment", match_id)
+
+        return mmr_preview
\ No newline at end of file
@@ -0,0 +1,193 @@
+import asyncio
+import datetime
+import time
+import discord
+from tiers import TIER_NAMES
+
+
+class RankAnnouncer:
+    """
+    Collects rank changes from match reports and posts one combined embed per channel.
+    Reports landing in the same channel within the debounce window share a single message.
+    """
+
+    def __init__(self, rate_limiter=None, debounce_seconds=3.0, max_wait_seconds=15.0):
+        self.rate_limiter = rate_limiter
+        self.debounce_seconds = debounce_seconds
+        self.max_wait_seconds = max_wait_seconds
+
+        # channel_id -> {"channel", "changes", "match_ids", "first_added", "last_added", "task"}
+        self.pending = {}
+
+    def set_rate_limiter(self, rate_limiter):
+        """Set the rate limiter instance"""
+        self.rate_limiter = rate_limiter
+
+    def add_rank_change(self, channel, player_id, old_rank, new_rank, old_mmr, new_mmr, is_promotion, match_id=None):
+        """Record a rank change and schedule the combined announcement for its channel"""
+        channel_id = str(channel.id)
+        now = time.time()
+
+        batch = self.pending.get(channel_id)
+        if not batch:
+            batch = {
+                "channel": channel,
+                "changes": {},
+                "match_ids": [],
+                "first_added": now,
+                "last_added": now,
+                "task": None
+            }
+            self.pending[channel_id] = batch
+
+        # A player who shows up twice in the window gets their net change: the first entry's old
+        # rank and MMR stay, and a promotion undone by a demotion (or vice versa) isn't announced
+        key = str(player_id)
+        earlier = batch["changes"].get(key)
+        if earlier:
+            old_rank, old_mmr = earlier["old_rank"], earlier["old_mmr"]
+            if old_rank in TIER_NAMES and new_rank in TIER_NAMES:
+                is_promotion = TIER_NAMES.index(new_rank) < TIER_NAMES.index(old_rank)
+
+        if old_rank == new_rank:
+            batch["changes"].pop(key, None)
+        else:
+            batch["changes"][key] = {
+                "player_id": key,
+                "old_rank": old_rank,
+                "new_rank": new_rank,
+                "old_mmr": old_mmr,
+                "new_mmr": new_mmr,
+                "is_promotion": is_promotion
+            }
+        if match_id and match_id not in batch["match_ids"]:
+            batch["match_ids"].append(match_id)
+        batch["last_added"] = now
+
+        if not batch["task"] or batch["task"].done():
+            batch["task"] = asyncio.create_task(self._flush_after_debounce(channel_id))
+
+    async def _flush_after_debounce(self, channel_id):
+        """Wait for the channel to go quiet (or the max wait to pass), then post"""
+        try:
+            while True:
+                batch = self.pending.get(channel_id)
+                if not batch:
+                    return
+
+                now = time.time()
+                quiet_for = now - batch["last_added"]
+                waited = now - batch["first_added"]
+
+                if quiet_for >= self.debounce_seconds or waited >= self.max_wait_seconds:
+                    break
+
+                await asyncio.sleep(min(self.debounce_seconds - quiet_for, self.max_wait_seconds - waited))
+
+            await self.flush_channel(channel_id)
+
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            print(f"❌ Error in rank announcement debounce for channel {channel_id}: {e}")
+
+    async def flush_channel(self, channel_id):
+        """Send the combined rank change embed for a channel right away"""
+        batch = self.pending.pop(str(channel_id), None)
+        if not batch or not batch["changes"]:
+            return False
+
+        changes = list(batch["changes"].values())
+        embed = self.build_embed(changes, batch["match_ids"])
+
+        try:
+            if self.rate_limiter:
+                await self.rate_limiter.send_message_with_limit(batch["channel"], embed=embed)
+            else:
+                await batch["channel"].send(embed=embed)
+
+            print(f"✅ Sent combined rank change message for {len(changes)} players "
+                  f"(matches: {', '.join(batch['match_ids']) or 'unknown'})")
+            return True
+
+        except Exception as e:
+            print(f"❌ Error sending combined rank change message: {e}")
+            return False
+
+    def build_embed(self, changes, match_ids=None):
+        """Build one embed listing every promotion and demotion in the batch"""
+        promotions = [c for c in changes if c["is_promotion"]]
+        demotions = [c for c in changes if not c["is_promotion"]]
+
+        if promotions and not demotions:
+            title = "🎉 RANK PROMOTION!" if len(promotions) == 1 else "🎉 RANK PROMOTIONS!"
+            color = 0x00ff00  # Green
+        elif demotions and not promotions:
+            title = "📉 Rank Change" if len(demotions) == 1 else "📉 Rank Changes"
+            color = 0xff9900  # Orange
+        else:
+            title = "🔄 Rank Changes"
+            color = 0x3498db  # Blue
+
+        embed = discord.Embed(
+            title=title,
+            description="Rank changes from the latest match results",
+            color=color
+        )
+
+        def format_change(change):
+            mmr_diff = change["new_mmr"] - change["old_mmr"]
+            return (f"<@{change['player_id']}> **{change['old_rank']}** → **{change['new_rank']}** "
+                    f"({change['old_mmr']} → {change['new_mmr']}, {mmr_diff:+d})")
+
+        self._add_line_fields(embed, "🎉 Promotions", [format_change(c) for c in promotions])
+        self._add_line_fields(embed, "📉 Demotions", [format_change(c) for c in demotions])
+
+        if any(c["new_rank"] == "Rank A" for c in promotions):
+            embed.add_field(
+                name="🏆 Achievement Unlocked",
+                value="Welcome to the highest rank! Elite tier achieved!",
+                inline=False
+            )
+
+        if promotions:
+            embed.add_field(
+                name="🛡️ Promotion Protection",
+                value="Promoted players: next 3 games have 50% loss reduction",
+                inline=False
+            )
+
+        if demotions:
+            embed.add_field(
+                name="💪 Stay Strong",
+                value="Every setback is a setup for a comeback!",
+                inline=False
+            )
+
+        embed.add_field(
+            name="👑 Discord Role",
+            value="Updating within a few minutes",
+            inline=False
+        )
+
+        if match_ids:
+            embed.set_footer(text=f"Match ID: {', '.join(match_ids)}")
+        embed.timestamp = datetime.datetime.utcnow()
+
+        return embed
+
+    def _add_line_fields(self, embed, name, lines):
+        """Add lines as one or more fields, staying under Discord's 1024-character field limit"""
+        chunk = []
+        chunk_length = 0
+        for line in lines:
+            if chunk and chunk_length + len(line) + 1 > 1024:
+                embed.add_field(name=name, value="\n".join(chunk), inline=False)
+                name = f"{name} (cont.)"
+                chunk = []
+                chunk_length = 0
+            chunk.append(line)
+            chunk_length += len(line) + 1
+
+        if chunk:
+            embed.add_field(name=name, value="\n".join(chunk), inline=False)
@@ -11,6 +11,10 @@ import discord
 from discord.ext import commands
 import logging
 import random
+from perf_tracker import timed_sleep
+from logging_config import get_logger
+
+logger = get_logger("rate_limiter")
 
 
 class DiscordRateLimiter:
@@ -63,6 +67,9 @@ class DiscordRateLimiter:
         # Add jitter to prevent thundering herd
         self.use_jitter = True
 
+        # Operations waiting on or running in each lane right now
+        self.lane_depths = {}
+
     async def remove_role_with_limit(self, member: discord.Member, *roles, reason: str = None, max_retries: int = 5):
         """Remove roles with enhanced rate limiting and retry logic"""
         return await self._enhanced_rate_limited_operation(
@@ -105,6 +112,14 @@ class DiscordRateLimiter:
     async def _enhanced_rate_limited_operation(self, operation_type: str, func: Callable, max_retries: int, *args,
                                                **kwargs):
         """Execute an operation with enhanced rate limiting and exponential backoff"""
+        self.lane_depths[operation_type] = self.lane_depths.get(operation_type, 0) + 1
+        try:
+            return await self._run_rate_limited_operation(operation_type, func, max_retries, *args, **kwargs)
+        finally:
+            self.lane_depths[operation_type] -= 1
+
+    async def _run_rate_limited_operation(self, operation_type: str, func: Callable, max_retries: int, *args,
+                                          **kwargs):
 
         # Initialize tracking if needed
         if operation_type not in self.rate_limit_state:
@@ -133,9 +148,10 @@ class DiscordRateLimiter:
                 if self.use_jitter:
                     wait_time += random.uniform(0, wait_time * 0.1)  # Add up to 10% jitter
 
-                print(
-                    f"⏳ Backoff wait for {operation_type}: {wait_time:.2f}s (failure count: {self.failure_counts[operation_type]})")
-                await asyncio.sleep(wait_time)
+                logger.warning(
+                    "⏳ Backoff wait for %s: %.2fs (failure count: %s)",
+                    operation_type, wait_time, self.failure_counts[operation_type])
+                await timed_sleep(wait_time)
 
         # Attempt the operation with retries
         for attempt in range(max_retries):
@@ -171,36 +187,39 @@ class DiscordRateLimiter:
                         jitter = random.uniform(0, retry_after * 0.2)  # Up to 20% jitter
                         retry_after += jitter
 
-                    print(
-                        f"🚫 Rate limited ({operation_type}, attempt {attempt + 1}/{max_retries}): waiting {retry_after:.2f}s")
+                    logger.warning(
+                        "🚫 Rate limited (%s, attempt %s/%s): waiting %.2fs",
+                        operation_type, attempt + 1, max_retries, retry_after)
 
                     if attempt < max_retries - 1:  # Don't wait on last attempt
-                        await asyncio.sleep(retry_after)
+                        await timed_sleep(retry_after)
                         continue
                     else:
-                        print(f"❌ {operation_type} failed after {max_retries} attempts due to rate limiting")
+                        logger.error("❌ %s failed after %s attempts due to rate limiting", operation_type, max_retries)
                         raise
 
                 elif e.status == 403:  # Forbidden
-                    print(f"❌ Permission denied for {operation_type}: {e}")
+                    logger.error("❌ Permission denied for %s: %s", operation_type, e)
                     raise
 
                 elif e.status == 404:  # Not found
-                    print(f"❌ Resource not found for {operation_type}: {e}")
+                    logger.error("❌ Resource not found for %s: %s", operation_type, e)
                     raise
 
                 else:  # Other HTTP errors
-                    print(f"❌ HTTP {e.status} error for {operation_type}: {e}")
+                    logger.error("❌ HTTP %s error for %s: %s", e.status, operation_type, e)
                     if attempt < max_retries - 1:
-                        await asyncio.sleep(2 ** attempt)  # Exponential backoff for other errors
+                        await timed_sleep(2 ** attempt)  # Exponential backoff for other errors
                         continue
                     else:
                         raise
 
             except Exception as e:
-                print(f"❌ Unexpected error in {operation_type} (attempt {attempt + 1}/{max_retries}): {e}")
+                logger.error(
+                    "❌ Unexpected error in %s (attempt %s/%s): %s",
+                    operation_type, attempt + 1, max_retries, e)
                 if attempt < max_retries - 1:
-                    await asyncio.sleep(1 + attempt)  # Linear backoff for unexpected errors
+                    await timed_sleep(1 + attempt)  # Linear backoff for unexpected errors
                     continue
                 else:
                     raise
@@ -225,7 +244,7 @@ class DiscordRateLimiter:
             if wait_time > 0:
                 if self.use_jitter:
                     wait_time += random.uniform(0, 0.1)  # Small jitter
-                await asyncio.sleep(wait_time)
+                await timed_sleep(wait_time)
                 # Reset after waiting
                 state['request_count'] = 0
                 state['reset_time'] = time.time()
@@ -242,7 +261,7 @@ class DiscordRateLimiter:
             wait_time = min_delay - time_since_last
             if self.use_jitter:
                 wait_time += random.uniform(0, wait_time * 0.1)
-            await asyncio.sleep(wait_time)
+            await timed_sleep(wait_time)
 
     def get_rate_limit_status(self) -> Dict:
         """Get current rate limiting status for debugging"""
@@ -267,6 +286,10 @@ class DiscordRateLimiter:
 
         return status
 
+    def get_lane_depths(self) -> Dict:
+        """Operations currently waiting or running per operation type"""
+        return {op_type: self.lane_depths.get(op_type, 0) for op_type in self.rate_limits}
+
     async def health_check(self) -> bool:
         """Check if the rate limiter is in a healthy state"""
         total_failures = sum(self.failure_counts.values())
@@ -276,7 +299,7 @@ class DiscordRateLimiter:
         """Reset all failure counts (for manual recovery)"""
         self.failure_counts = {op_type: 0 for op_type in self.rate_limits.keys()}
         self.last_failure_times = {op_type: 0 for op_type in self.rate_limits.keys()}
-        print("🔄 Rate limiter failure counts reset")
+        logger.info("🔄 Rate limiter failure counts reset")
 
 
 # Enhanced safe operation functions
@@ -300,7 +323,7 @@ async def ultra_safe_role_operation(rate_limiter: DiscordRateLimiter, member: di
 
     try:
         # Add extra safety delay before starting
-        await asyncio.sleep(random.uniform(0.5, 1.5))
+        await timed_sleep(random.uniform(0.5, 1.5))
 
         if operation == 'add':
             await rate_limiter.add_role_with_limit(member, *roles, reason=reason, max_retries=3)
@@ -310,10 +333,10 @@ async def ultra_safe_role_operation(rate_limiter: DiscordRateLimiter, member: di
             return False, f"Invalid operation: {operation}"
 
         # Add extra safety delay after completion
-        await asyncio.sleep(random.uniform(0.5, 1.0))
+        await timed_sleep(random.uniform(0.5, 1.0))
 
         elapsed = time.time() - start_time
-        print(f"✅ Ultra-safe {operation} operation completed in {elapsed:.2f}s for {member.display_name}")
+        logger.debug("✅ Ultra-safe %s operation completed in %.2fs for %s", operation, elapsed, member.display_name)
 
         return True, None
 
@@ -353,7 +376,7 @@ async def batch_role_operations_with_extreme_safety(rate_limiter: DiscordRateLim
         'errors': []
     }
 
-    print(f"🚀 Starting batch role operations for {len(operations)} members with extreme safety")
+    logger.debug("🚀 Starting batch role operations for %s members with extreme safety", len(operations))
 
     # Process one at a time with long delays for maximum safety
     for i, op in enumerate(operations):
@@ -377,33 +400,33 @@ async def batch_role_operations_with_extreme_safety(rate_limiter: DiscordRateLim
 
             if success:
                 results['successful'] += 1
-                print(f"✅ {i + 1}/{len(operations)}: {operation} roles for {member.display_name}")
+                logger.debug("✅ %s/%s: %s roles for %s", i + 1, len(operations), operation, member.display_name)
             else:
                 results['failed'] += 1
                 results['errors'].append(f"{member.display_name}: {error}")
-                print(f"❌ {i + 1}/{len(operations)}: Failed for {member.display_name} - {error}")
+                logger.error("❌ %s/%s: Failed for %s - %s", i + 1, len(operations), member.display_name, error)
 
             # CRITICAL: Long delay between each member (5-10 seconds)
             if i < len(operations) - 1:  # Don't wait after the last operation
                 delay = random.uniform(5.0, 10.0)  # 5-10 second random delay
-                print(f"⏳ Waiting {delay:.1f}s before next operation...")
-                await asyncio.sleep(delay)
+                logger.debug("⏳ Waiting %.1fs before next operation...", delay)
+                await timed_sleep(delay)
 
                 # Extra long delay every 10 operations
                 if (i + 1) % 10 == 0:
                     extra_delay = random.uniform(30.0, 60.0)  # 30-60 second break
-                    print(f"🛑 Taking extended break: {extra_delay:.1f}s (processed {i + 1} members)")
-                    await asyncio.sleep(extra_delay)
+                    logger.debug("🛑 Taking extended break: %.1fs (processed %s members)", extra_delay, i + 1)
+                    await timed_sleep(extra_delay)
 
         except Exception as e:
             results['failed'] += 1
             error_msg = f"Critical error processing {op.get('member', 'unknown')}: {str(e)}"
             results['errors'].append(error_msg)
-            print(f"❌ {error_msg}")
+            logger.error("❌ %s", error_msg)
 
             # Still wait on error to prevent rapid fire
-            await asyncio.sleep(random.uniform(3.0, 5.0))
+            await timed_sleep(random.uniform(3.0, 5.0))
 
-    print(f"🏁 Batch operations completed: {results['successful']} successful, {results['failed']} failed")
+    logger.info("🏁 Batch operations completed: %s successful, %s failed", results['successful'], results['failed'])
 
     return results
\ No newline at end of file
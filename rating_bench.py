@@ -0,0 +1,426 @@
+"""
+Golden-output regression check and microbenchmarks for the rating formulas.
+
+    python rating_bench.py                  # check every implementation against the corpus, then benchmark
+    python rating_bench.py check            # bit-for-bit check only
+    python rating_bench.py bench --scale 50 # ops/sec for every implementation, corpus repeated 50 times
+    python rating_bench.py record --force   # re-record golden/rating_corpus.json (only for intended rating changes)
+
+The corpus holds recorded inputs (seeded random cases plus the edges of every branch - placement games,
+streak threshold, rank boundaries, promotion protection, momentum cut-offs) with the outputs of the current
+formulas. Every implementation in IMPLEMENTATIONS must reproduce them exactly; a new batch, vectorized or
+cached version only needs an entry there to be verified and timed against the scalar one.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+import mmr_engine
+from matchsystem import MatchSystem
+from season_reset import calculate_soft_reset_mmr, soft_reset_array
+
+CORPUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "golden", "rating_corpus.json")
+CORPUS_VERSION = 1
+CORPUS_SEED = 2024
+
+# Player ID used in the recorded player documents
+CASE_PLAYER_ID = "p"
+
+
+class CorpusMatchSystem(MatchSystem):
+    """MatchSystem without a database - recent results come from the case being replayed"""
+
+    def __init__(self):
+        self.recent_results = []
+
+    def get_recent_results(self, player_ids, **kwargs):
+        return {player_id: list(self.recent_results) for player_id in player_ids if player_id}
+
+    def audit_mmr_calculation(self, player_id, factors):
+        pass
+
+
+# ---------------------------------------------------------------- corpus
+
+
+def player_document(matches_played, games_since_promotion):
+    """The fields of a players document the wrappers read"""
+    document = {"id": CASE_PLAYER_ID, "matches": matches_played}
+    if games_since_promotion is not None:
+        document["last_promotion"] = {"matches_at_promotion": matches_played - games_since_promotion}
+    return document
+
+
+def recent_list(rng, count, wins):
+    results = [True] * wins + [False] * (count - wins)
+    rng.shuffle(results)
+    return results
+
+
+def dynamic_cases(rng, random_count=1000):
+    """[player_mmr, team_avg_mmr, opponent_avg_mmr, matches_played, is_win, streak, player_data, recent_results]"""
+    cases = []
+
+    def add(mmr, team_avg, opponent_avg, matches_played, is_win, streak, history, games_since_promotion, recent):
+        player_data = player_document(matches_played, games_since_promotion) if history else None
+        cases.append([mmr, team_avg, opponent_avg, matches_played, is_win, streak, player_data, recent])
+
+    for _ in range(random_count):
+        team = [rng.randint(200, 2400) for _ in range(3)]
+        opponents = [rng.randint(200, 2400) for _ in range(3)]
+        recent_count = rng.randint(0, 12)
+        add(rng.choice(team), sum(team) / 3, sum(opponents) / 3, rng.randint(1, 80), rng.random() < 0.5,
+            rng.randint(-9, 9), rng.random() < 0.85, rng.choice([None, None, rng.randint(0, 6)]),
+            recent_list(rng, recent_count, rng.randint(0, recent_count)))
+
+    # Rank boundaries and promotion protection
+    for boundary in mmr_engine.RANK_BOUNDARIES:
+        for offset in (-101, -100, -99, -1, 0, 1, 99, 100, 101):
+            for is_win in (True, False):
+                for games_since_promotion in (None, 0, 2, 3):
+                    add(boundary + offset, 1350.0, 1400.0, 30, is_win, 1 if is_win else -1, True,
+                        games_since_promotion, [])
+
+    # Placement games, decay and the streak threshold
+    for matches_played in (1, 2, 14, 15, 16, 17, 20, 25, 40, 100):
+        for streak in (-12, -4, -3, -2, 2, 3, 4, 12):
+            for is_win in (True, False):
+                add(1000, 1000.0, 1000.0, matches_played, is_win, streak, False, None, [])
+
+    # Momentum cut-offs (only past 10 matches, with 5+ recent results)
+    for matches_played in (10, 11):
+        for count in (4, 5, 10, 12):
+            for wins in range(count + 1):
+                for is_win in (True, False):
+                    add(800, 800.0, 800.0, matches_played, is_win, 0, True, None, recent_list(rng, count, wins))
+
+    # Clamps: lopsided averages, extreme individual ratings
+    for mmr, team_avg, opponent_avg in ((2500, 2500.0, 200.0), (200, 200.0, 2500.0), (3000, 600.0, 600.0),
+                                        (50, 1800.0, 1800.0), (1, 1.0, 1.0)):
+        for matches_played in (1, 16, 60):
+            for is_win in (True, False):
+                add(mmr, team_avg, opponent_avg, matches_played, is_win, 0, True, None, [])
+    return cases
+
+
+def protection_cases(rng, random_count=600):
+    """[player_data, current_mmr, is_win, matches_played]"""
+    cases = []
+    for _ in range(random_count):
+        matches_played = rng.randint(1, 80)
+        cases.append([player_document(matches_played, rng.choice([None, rng.randint(-2, 6)])),
+                      rng.randint(900, 1800), rng.random() < 0.5, matches_played])
+    for boundary in mmr_engine.RANK_BOUNDARIES:
+        for offset in range(-102, 103, 3):
+            for is_win in (True, False):
+                for games_since_promotion in (None, 2, 3):
+                    cases.append([player_document(30, games_since_promotion), boundary + offset, is_win, 30])
+    return cases
+
+
+def momentum_cases(rng):
+    """[player_data, recent_results, is_win, threshold, multiplier]"""
+    cases = []
+    for count in (0, 3, 4, 5, 6, 9, 10, 11, 15):
+        for wins in range(count + 1):
+            for is_win in (True, False):
+                for threshold, multiplier in ((0.5, 1.2), (0.6, 1.3), (0.4, 1.15)):
+                    cases.append([{"id": CASE_PLAYER_ID}, recent_list(rng, count, wins), is_win,
+                                  threshold, multiplier])
+    return cases
+
+
+def soft_reset_cases(rng):
+    """[current_mmr, reset_type]"""
+    values = list(range(0, 2601, 7))
+    values += [299, 300, 301, 399, 400, 401, 599, 600, 601, 1099, 1100, 1101, 1599, 1600, 1601,
+               1833, 1834, 2000, 3000, 5000]
+    values += [round(rng.uniform(0, 2600), 2) for _ in range(100)]
+    return [[value, reset_type] for reset_type in ("ranked", "global") for value in values]
+
+
+def match_cases(rng, count=200):
+    """[team1, team2, winner] - teams as [player_id, mmr, matches, streak, games_since_promotion, recent, has_history]"""
+    cases = []
+    for index in range(count):
+        teams = []
+        for team_number in (1, 2):
+            team = []
+            for slot in range(3):
+                recent_count = rng.randint(0, 10)
+                team.append([f"m{index}t{team_number}p{slot}", rng.randint(200, 2400), rng.randint(0, 60),
+                             rng.randint(-6, 6), rng.choice([None, None, rng.randint(0, 5)]),
+                             recent_list(rng, recent_count, rng.randint(0, recent_count)), rng.random() < 0.85])
+            teams.append(team)
+        cases.append([teams[0], teams[1], rng.choice([1, 2])])
+    return cases
+
+
+def build_cases(seed=CORPUS_SEED):
+    rng = random.Random(seed)
+    return {
+        "dynamic_mmr": dynamic_cases(rng),
+        "rank_protection": protection_cases(rng),
+        "momentum": momentum_cases(rng),
+        "soft_reset": soft_reset_cases(rng),
+        "match_deltas": match_cases(rng)
+    }
+
+
+# ---------------------------------------------------------------- implementations
+
+
+def engine_args(case):
+    """calculate_change arguments for a dynamic_mmr case, derived the way calculate_dynamic_mmr does"""
+    player_mmr, team_avg, opponent_avg, matches_played, is_win, streak, player_data, recent = case
+    games_since_promotion = None
+    if player_data and player_data.get("last_promotion"):
+        games_since_promotion = player_data["matches"] - player_data["last_promotion"]["matches_at_promotion"]
+    return (player_mmr, team_avg, opponent_avg, matches_played, is_win, streak, games_since_promotion,
+            recent if matches_played > mmr_engine.MOMENTUM_MIN_MATCHES else None, bool(player_data))
+
+
+def dynamic_matchsystem(cases):
+    match_system = CorpusMatchSystem()
+    results = []
+    for player_mmr, team_avg, opponent_avg, matches_played, is_win, streak, player_data, recent in cases:
+        match_system.recent_results = recent
+        results.append(match_system.calculate_dynamic_mmr(
+            player_mmr, team_avg, opponent_avg, matches_played, is_win=is_win, streak=streak, player_data=player_data))
+    return results
+
+
+def dynamic_engine(cases):
+    return [mmr_engine.calculate_change(*engine_args(case))[0] for case in cases]
+
+
+def dynamic_batch(cases):
+    import numpy as np
+
+    rows = []
+    for case in cases:
+        mmr, team_avg, opponent_avg, matches_played, is_win, streak, promotion, recent, history = engine_args(case)
+        recent = (recent or [])[:mmr_engine.MOMENTUM_RECENT_GAMES]
+        rows.append((mmr, team_avg, opponent_avg, matches_played, is_win, streak,
+                     np.nan if promotion is None else promotion, history, sum(recent), len(recent)))
+    return mmr_engine.batch_changes(*zip(*rows)).tolist()
+
+
+def protection_matchsystem(cases):
+    match_system = CorpusMatchSystem()
+    return [match_system.calculate_rank_protection_fixed(player_data, mmr, is_win, matches_played)
+            for player_data, mmr, is_win, matches_played in cases]
+
+
+def protection_engine(cases):
+    results = []
+    for player_data, mmr, is_win, _ in cases:
+        promotion = player_data.get("last_promotion")
+        games_since_promotion = player_data["matches"] - promotion["matches_at_promotion"] if promotion else None
+        results.append(mmr_engine.rank_protection(mmr, is_win, games_since_promotion))
+    return results
+
+
+def momentum_matchsystem(cases):
+    match_system = CorpusMatchSystem()
+    results = []
+    for player_data, recent, is_win, threshold, multiplier in cases:
+        match_system.recent_results = recent
+        results.append(match_system.calculate_momentum_bonus_enhanced(player_data, is_win, threshold, multiplier))
+    return results
+
+
+def momentum_engine(cases):
+    return [mmr_engine.momentum_bonus(recent, is_win, threshold, multiplier)
+            for _, recent, is_win, threshold, multiplier in cases]
+
+
+def soft_reset_scalar(cases):
+    return [calculate_soft_reset_mmr(mmr, reset_type) for mmr, reset_type in cases]
+
+
+def soft_reset_batch(cases):
+    results = [None] * len(cases)
+    for reset_type in ("ranked", "global"):
+        indexes = [index for index, case in enumerate(cases) if case[1] == reset_type]
+        if indexes:
+            new_values = soft_reset_array([cases[index][0] for index in indexes], reset_type).tolist()
+            for index, value in zip(indexes, new_values):
+                results[index] = value
+    return results
+
+
+def match_states(case):
+    team1, team2, winner = case
+    return ([mmr_engine.PlayerState(*player) for player in team1],
+            [mmr_engine.PlayerState(*player) for player in team2], winner)
+
+
+def deltas_list(deltas):
+    return [[player_id, delta] for player_id, delta in sorted(deltas.items())]
+
+
+def match_deltas_scalar(cases):
+    return [deltas_list(mmr_engine.match_deltas(*match_states(case))) for case in cases]
+
+
+def match_deltas_batch(cases):
+    return [deltas_list(deltas) for deltas in mmr_engine.batch_match_deltas(match_states(case) for case in cases)]
+
+
+# formula -> [(name, implementation)]. The first entry is the reference that `record` writes
+IMPLEMENTATIONS = {
+    "dynamic_mmr": [
+        ("MatchSystem.calculate_dynamic_mmr", dynamic_matchsystem),
+        ("mmr_engine.calculate_change", dynamic_engine),
+        ("mmr_engine.batch_changes", dynamic_batch)
+    ],
+    "rank_protection": [
+        ("MatchSystem.calculate_rank_protection_fixed", protection_matchsystem),
+        ("mmr_engine.rank_protection", protection_engine)
+    ],
+    "momentum": [
+        ("MatchSystem.calculate_momentum_bonus_enhanced", momentum_matchsystem),
+        ("mmr_engine.momentum_bonus", momentum_engine)
+    ],
+    "soft_reset": [
+        ("season_reset.calculate_soft_reset_mmr", soft_reset_scalar),
+        ("season_reset.soft_reset_array", soft_reset_batch)
+    ],
+    "match_deltas": [
+        ("mmr_engine.match_deltas", match_deltas_scalar),
+        ("mmr_engine.batch_match_deltas", match_deltas_batch)
+    ]
+}
+
+
+# ---------------------------------------------------------------- commands
+
+
+def same(got, expected):
+    """Bit-for-bit: same JSON type and the exact float repr"""
+    return json.dumps(got) == json.dumps(expected)
+
+
+def load_corpus(path=CORPUS_PATH):
+    with open(path) as f:
+        corpus = json.load(f)
+    if corpus.get("version") != CORPUS_VERSION:
+        raise ValueError(f"Corpus version {corpus.get('version')} - expected {CORPUS_VERSION}, re-record it")
+    return corpus
+
+
+def write_corpus(corpus, path):
+    """One [input, output] row per line so a changed golden output shows up as a readable diff"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", newline="\n") as f:
+        f.write('{"version": %d, "seed": %d, "sections": {\n' % (corpus["version"], corpus["seed"]))
+        names = list(corpus["sections"])
+        for index, name in enumerate(names):
+            rows = corpus["sections"][name]
+            f.write(f' "{name}": [\n')
+            f.write(",\n".join("  " + json.dumps(row, separators=(",", ":")) for row in rows))
+            f.write("\n ]" + ("," if index < len(names) - 1 else "") + "\n")
+        f.write("}}\n")
+
+
+def record(args):
+    if os.path.exists(args.corpus) and not args.force:
+        print(f"❌ {args.corpus} exists - pass --force to re-record (this accepts the current outputs as correct)")
+        return 1
+
+    sections = {}
+    for name, cases in build_cases(args.seed).items():
+        reference_name, reference = IMPLEMENTATIONS[name][0]
+        outputs = reference(cases)
+        sections[name] = [[case, output] for case, output in zip(cases, outputs)]
+        print(f"📝 {name}: {len(cases)} cases from {reference_name}")
+
+    write_corpus({"version": CORPUS_VERSION, "seed": args.seed, "sections": sections}, args.corpus)
+    print(f"💾 Golden corpus written to {args.corpus}")
+    return 0
+
+
+def check(args):
+    corpus = load_corpus(args.corpus)
+    failures = 0
+    print(f"🔍 Checking against {args.corpus}")
+    for name, rows in corpus["sections"].items():
+        cases = [case for case, _ in rows]
+        for implementation_name, implementation in IMPLEMENTATIONS.get(name, []):
+            outputs = implementation(cases)
+            mismatches = [index for index, (got, row) in enumerate(zip(outputs, rows))
+                          if not same(got, row[1])]
+            if len(outputs) != len(rows):
+                mismatches.append(len(rows))
+            if mismatches:
+                failures += 1
+                first = mismatches[0]
+                print(f"   ❌ {name} / {implementation_name}: {len(mismatches)} of {len(rows)} differ")
+                if first < len(rows):
+                    case, expected = rows[first]
+                    print(f"      first: {json.dumps(case)}\n"
+                          f"      expected {json.dumps(expected)}, got {json.dumps(outputs[first])}")
+            else:
+                print(f"   ✅ {name} / {implementation_name}: {len(rows)} identical")
+    return 1 if failures else 0
+
+
+def time_best(implementation, cases, repeat):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        implementation(cases)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def bench(args):
+    corpus = load_corpus(args.corpus)
+    print(f"⏱️ Best of {args.repeat} runs, corpus repeated {args.scale}x")
+    for name, rows in corpus["sections"].items():
+        cases = [case for case, _ in rows] * args.scale
+        print(f"\n   {name} ({len(cases)} cases)")
+        reference_seconds = None
+        for implementation_name, implementation in IMPLEMENTATIONS.get(name, []):
+            seconds = time_best(implementation, cases, args.repeat)
+            reference_seconds = reference_seconds or seconds
+            print(f"     {implementation_name:<48} {len(cases) / seconds:>14,.0f} ops/s"
+                  f"  {seconds * 1000:>9.1f}ms  {reference_seconds / seconds:>6.1f}x")
+    return 0
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Golden-output check and microbenchmarks for the rating formulas")
+    parser.add_argument("command", nargs="?", choices=["all", "check", "bench", "record"], default="all")
+    parser.add_argument("--corpus", default=CORPUS_PATH)
+    parser.add_argument("--seed", type=int, default=CORPUS_SEED, help="Seed for `record`")
+    parser.add_argument("--force", action="store_true", help="Let `record` overwrite the corpus")
+    parser.add_argument("--scale", type=int, default=20, help="Times the corpus is repeated for `bench`")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per implementation (best is kept)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.command == "record":
+        return record(args)
+    if args.command == "check":
+        return check(args)
+    if args.command == "bench":
+        return bench(args)
+
+    failed = check(args)
+    if failed:
+        print("\n❌ Outputs differ from the golden corpus - not benchmarking")
+        return failed
+    print()
+    return bench(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,392 @@
+"""
+Monte Carlo season simulator for tuning the MMR constants in mmr_engine.
+
+Synthetic players get a hidden true skill (in MMR units) and a starting rank role. Each tick a share of the
+idle players joins the queue of the channel for their current tier in random order; every full group of six
+(FIFO) becomes a match with balanced, random or captains teams, the outcome is sampled from the true skills
+and the whole tick is rated at once with mmr_engine.batch_changes - the same formula as live reports.
+
+    python rating_simulator.py                                  # 5000 players, 100k ranked matches
+    python rating_simulator.py --set BASE_MMR_CHANGE=35 --set PLACEMENT_GAMES=10
+    python rating_simulator.py --sweep DECAY_RATE=0.05,0.1,0.2 --matches 50000
+
+Reported per season:
+    convergence   rank correlation between MMR and true skill over the season, and how many games players
+                  need before their MMR first lands within --tolerance of their skill
+    inflation     mean MMR minus mean skill, and each tier's share against the share true skill would give
+    oscillation   tier crossings and flip-flops (a crossing undone within --flip-window games) per 1000 matches
+
+Only ranked MMR is simulated; global matches don't move ranked ratings.
+"""
+import argparse
+import json
+import sys
+import time
+
+import numpy as np
+
+import mmr_engine
+from tiers import TIER_STARTING_MMR
+
+# Starting MMR for a first match by verified rank role, lowest tier first
+TIER_NAMES = ["Rank C", "Rank B", "Rank A"]
+STARTING_MMR = [TIER_STARTING_MMR[name] for name in TIER_NAMES]
+
+TEAM_MODES = ("balanced", "random", "captains")
+
+# Logistic scale for win probability from the true-skill gap between team averages
+OUTCOME_SCALE = 400.0
+
+
+def tiers_for(mmr):
+    """0 = Rank C, 1 = Rank B, 2 = Rank A, by mmr_engine.RANK_BOUNDARIES"""
+    return np.searchsorted(np.asarray(mmr_engine.RANK_BOUNDARIES), mmr, side="right")
+
+
+def spearman(a, b):
+    rank_a = np.argsort(np.argsort(a)).astype(np.float64)
+    rank_b = np.argsort(np.argsort(b)).astype(np.float64)
+    return float(np.corrcoef(rank_a, rank_b)[0, 1])
+
+
+class Season:
+    """State of every synthetic player, as parallel NumPy arrays indexed by player"""
+
+    def __init__(self, players, rng, skill_mean=1100.0, skill_sd=400.0, role_noise=250.0, start="tier",
+                 flip_window=5):
+        self.rng = rng
+        self.flip_window = flip_window
+        self.count = players
+        self.skill = rng.normal(skill_mean, skill_sd, players)
+
+        # Verified rank role from a noisy look at true skill; "flat" starts everyone at Rank C's 600
+        if start == "tier":
+            roles = tiers_for(self.skill + rng.normal(0, role_noise, players))
+            self.mmr = np.asarray(STARTING_MMR, dtype=np.float64)[roles]
+        else:
+            self.mmr = np.full(players, float(STARTING_MMR[0]))
+        self.start_mmr = self.mmr.copy()
+
+        self.matches = np.zeros(players, dtype=np.int64)
+        self.streak = np.zeros(players, dtype=np.int64)
+        self.matches_at_promotion = np.full(players, -1, dtype=np.int64)
+
+        # Last MOMENTUM_RECENT_GAMES results per player as a ring buffer
+        self.recent = np.zeros((players, mmr_engine.MOMENTUM_RECENT_GAMES), dtype=bool)
+
+        # First time |MMR - skill| was within tolerance (matches played then), -1 until it happens
+        self.converged_at = np.full(players, -1, dtype=np.int64)
+
+        self.crossings = np.zeros(players, dtype=np.int64)
+        self.flip_flops = np.zeros(players, dtype=np.int64)
+        self.last_cross_match = np.full(players, -10 ** 9, dtype=np.int64)
+        self.last_cross_direction = np.zeros(players, dtype=np.int64)
+
+        # FIFO queue per tier (player indexes, oldest first)
+        self.queues = [np.empty(0, dtype=np.int64) for _ in TIER_NAMES]
+        self.matches_played = 0
+
+    # ------------------------------------------------------------ queue
+
+    def form_matches(self, activity):
+        """Idle players join their tier's queue in random order; full groups of six come off the front"""
+        queued = np.concatenate(self.queues)
+        idle = np.ones(self.count, dtype=bool)
+        idle[queued] = False
+        candidates = np.flatnonzero(idle)
+        arrivals = candidates[self.rng.random(candidates.size) < activity]
+        arrivals = self.rng.permutation(arrivals)
+        arrival_tiers = tiers_for(self.mmr[arrivals])
+
+        groups = []
+        for tier in range(len(TIER_NAMES)):
+            line = np.concatenate([self.queues[tier], arrivals[arrival_tiers == tier]])
+            full = line.size // 6 * 6
+            groups.append(line[:full].reshape(-1, 6))
+            self.queues[tier] = line[full:]
+        return np.concatenate(groups) if groups else np.empty((0, 6), dtype=np.int64)
+
+    # ------------------------------------------------------------ team selection
+
+    def balanced_teams(self, groups):
+        """VoteSystem.create_balanced_teams: highest MMR first, each to the lighter team until it has three"""
+        order = np.argsort(-self.mmr[groups], axis=1, kind="stable")
+        ordered = np.take_along_axis(groups, order, axis=1)
+        rows = np.arange(len(groups))
+        team1 = np.zeros((len(groups), 3), dtype=np.int64)
+        team2 = np.zeros((len(groups), 3), dtype=np.int64)
+        size1 = np.zeros(len(groups), dtype=np.int64)
+        size2 = np.zeros(len(groups), dtype=np.int64)
+        mmr1 = np.zeros(len(groups))
+        mmr2 = np.zeros(len(groups))
+        for slot in range(6):
+            player = ordered[:, slot]
+            to_team1 = (size1 < 3) & ((size2 >= 3) | (mmr1 <= mmr2))
+            team1[rows[to_team1], size1[to_team1]] = player[to_team1]
+            team2[rows[~to_team1], size2[~to_team1]] = player[~to_team1]
+            mmr1 += np.where(to_team1, self.mmr[player], 0)
+            mmr2 += np.where(to_team1, 0, self.mmr[player])
+            size1 += to_team1
+            size2 += ~to_team1
+        return team1, team2
+
+    def random_teams(self, groups):
+        shuffled = self.rng.permuted(groups, axis=1)
+        return shuffled[:, :3], shuffled[:, 3:]
+
+    def captains_teams(self, groups):
+        """Two random captains picking the highest MMR left: captain 1 one, captain 2 two, the last to captain 1"""
+        shuffled = self.rng.permuted(groups, axis=1)
+        captains, pool = shuffled[:, :2], shuffled[:, 2:]
+        order = np.argsort(-self.mmr[pool], axis=1, kind="stable")
+        picks = np.take_along_axis(pool, order, axis=1)
+        team1 = np.stack([captains[:, 0], picks[:, 0], picks[:, 3]], axis=1)
+        team2 = np.stack([captains[:, 1], picks[:, 1], picks[:, 2]], axis=1)
+        return team1, team2
+
+    def pick_teams(self, groups, mode_weights):
+        modes = self.rng.choice(len(TEAM_MODES), size=len(groups), p=mode_weights)
+        team1 = np.zeros((len(groups), 3), dtype=np.int64)
+        team2 = np.zeros((len(groups), 3), dtype=np.int64)
+        for index, mode in enumerate(TEAM_MODES):
+            chosen = modes == index
+            if chosen.any():
+                team1[chosen], team2[chosen] = getattr(self, f"{mode}_teams")(groups[chosen])
+        return team1, team2
+
+    # ------------------------------------------------------------ rating
+
+    def play(self, team1, team2):
+        """Sample outcomes and rate every match of the tick in one batch_changes call"""
+        skill_gap = self.skill[team1].mean(axis=1) - self.skill[team2].mean(axis=1)
+        team1_won = self.rng.random(len(team1)) < 1 / (1 + 10 ** (-skill_gap / OUTCOME_SCALE))
+
+        team1_avg = np.repeat(self.mmr[team1].mean(axis=1), 3)
+        team2_avg = np.repeat(self.mmr[team2].mean(axis=1), 3)
+        players = np.concatenate([team1.ravel(), team2.ravel()])
+        is_win = np.concatenate([np.repeat(team1_won, 3), np.repeat(~team1_won, 3)])
+        team_avg = np.concatenate([team1_avg, team2_avg])
+        opponent_avg = np.concatenate([team2_avg, team1_avg])
+
+        matches_before = self.matches[players]
+        has_history = matches_before > 0
+        # First match: a new player is rated from their starting MMR
+        old_mmr = self.mmr[players]
+        streak = self.streak[players]
+        new_streak = np.where(is_win, np.where(streak >= 0, streak + 1, 1), np.where(streak <= 0, streak - 1, -1))
+
+        promoted_at = self.matches_at_promotion[players]
+        games_since_promotion = np.where(promoted_at >= 0, matches_before - promoted_at, np.nan)
+
+        # At report time the match is already completed, so momentum counts its own result
+        slot = matches_before % mmr_engine.MOMENTUM_RECENT_GAMES
+        self.recent[players, slot] = is_win
+        recent_count = np.minimum(matches_before + 1, mmr_engine.MOMENTUM_RECENT_GAMES)
+        recent_wins = self.recent[players].sum(axis=1)
+
+        change = mmr_engine.batch_changes(
+            old_mmr, team_avg, opponent_avg, matches_before + 1, is_win, new_streak,
+            games_since_promotion, has_history, recent_wins, recent_count
+        )
+        new_mmr = np.where(is_win, old_mmr + change, np.maximum(0, old_mmr - change))
+
+        self.mmr[players] = new_mmr
+        self.matches[players] = matches_before + 1
+        self.streak[players] = new_streak
+        self.track_tiers(players, old_mmr, new_mmr, matches_before + 1)
+        self.matches_played += len(team1)
+
+    def track_tiers(self, players, old_mmr, new_mmr, matches_after):
+        old_tier, new_tier = tiers_for(old_mmr), tiers_for(new_mmr)
+        moved = new_tier != old_tier
+        direction = np.sign(new_tier - old_tier)
+
+        promoted = players[direction > 0]
+        self.matches_at_promotion[promoted] = matches_after[direction > 0]
+
+        movers = players[moved]
+        flip = ((direction[moved] == -self.last_cross_direction[movers]) &
+                (matches_after[moved] - self.last_cross_match[movers] <= self.flip_window))
+        self.flip_flops[movers[flip]] += 1
+        self.crossings[movers] += 1
+        self.last_cross_match[movers] = matches_after[moved]
+        self.last_cross_direction[movers] = direction[moved]
+
+    # ------------------------------------------------------------ metrics
+
+    def note_convergence(self, tolerance):
+        newly = (self.converged_at < 0) & (self.matches > 0) & (np.abs(self.mmr - self.skill) <= tolerance)
+        self.converged_at[newly] = self.matches[newly]
+
+    def checkpoint(self):
+        active = self.matches > 0
+        mmr, skill = self.mmr[active], self.skill[active]
+        return {
+            "matches": self.matches_played,
+            "rank_correlation": round(spearman(mmr, skill), 4) if active.sum() > 1 else None,
+            "mean_abs_error": round(float(np.abs(mmr - skill).mean()), 1) if active.any() else None,
+            "mean_mmr_minus_skill": round(float((mmr - skill).mean()), 1) if active.any() else None,
+            "tier_share": tier_shares(mmr)
+        }
+
+
+def tier_shares(values):
+    counts = np.bincount(tiers_for(values), minlength=len(TIER_NAMES))
+    return {name: round(float(count / max(1, counts.sum())), 3) for name, count in zip(TIER_NAMES, counts)}
+
+
+def run_season(args, overrides):
+    """Play one season with mmr_engine constants overridden; returns the report dict"""
+    saved = {name: getattr(mmr_engine, name) for name in overrides}
+    for name, value in overrides.items():
+        setattr(mmr_engine, name, value)
+    try:
+        rng = np.random.default_rng(args.seed)
+        season = Season(args.players, rng, args.skill_mean, args.skill_sd, args.role_noise, args.start,
+                        args.flip_window)
+        mode_weights = np.asarray(args.modes, dtype=np.float64) / sum(args.modes)
+
+        checkpoints = []
+        next_checkpoint = args.matches / args.checkpoints
+        started = time.perf_counter()
+        ticks = 0
+        while season.matches_played < args.matches:
+            groups = season.form_matches(args.activity)
+            groups = groups[:args.matches - season.matches_played]
+            ticks += 1
+            if not len(groups):
+                continue
+            season.play(*season.pick_teams(groups, mode_weights))
+            season.note_convergence(args.tolerance)
+            if season.matches_played >= next_checkpoint:
+                checkpoints.append(season.checkpoint())
+                next_checkpoint += args.matches / args.checkpoints
+        elapsed = time.perf_counter() - started
+
+        active = season.matches > 0
+        converged = season.converged_at[active]
+        converged = converged[converged >= 0]
+        per_thousand = 1000 / max(1, season.matches_played)
+        return {
+            "constants": {name: getattr(mmr_engine, name) for name in overrides},
+            "matches": season.matches_played,
+            "players_active": int(active.sum()),
+            "ticks": ticks,
+            "seconds": round(elapsed, 2),
+            "matches_per_second": round(season.matches_played / elapsed) if elapsed else None,
+            "convergence": {
+                "final_rank_correlation": checkpoints[-1]["rank_correlation"] if checkpoints else None,
+                "converged_share": round(converged.size / max(1, active.sum()), 3),
+                "median_games_to_converge": float(np.median(converged)) if converged.size else None,
+                "p90_games_to_converge": float(np.percentile(converged, 90)) if converged.size else None,
+                "median_games_played": float(np.median(season.matches[active])) if active.any() else None
+            },
+            "inflation": {
+                "start_mean_mmr": round(float(season.start_mmr[active].mean()), 1) if active.any() else None,
+                "end_mean_mmr": round(float(season.mmr[active].mean()), 1) if active.any() else None,
+                "mean_skill": round(float(season.skill[active].mean()), 1) if active.any() else None,
+                "tier_share": tier_shares(season.mmr[active]),
+                "true_tier_share": tier_shares(season.skill[active])
+            },
+            "oscillation": {
+                "crossings_per_1000_matches": round(float(season.crossings.sum() * per_thousand), 1),
+                "flip_flops_per_1000_matches": round(float(season.flip_flops.sum() * per_thousand), 1),
+                "flip_flop_share_of_crossings": round(float(season.flip_flops.sum() / max(1, season.crossings.sum())), 3),
+                "players_with_flip_flops": round(float((season.flip_flops > 0).sum() / max(1, active.sum())), 3)
+            },
+            "checkpoints": checkpoints
+        }
+    finally:
+        for name, value in saved.items():
+            setattr(mmr_engine, name, value)
+
+
+def parse_constant(text):
+    """NAME=VALUE for a mmr_engine constant; RANK_BOUNDARIES takes a comma list"""
+    name, _, value = text.partition("=")
+    name = name.strip().upper()
+    if not hasattr(mmr_engine, name) or not name.isupper():
+        raise argparse.ArgumentTypeError(f"mmr_engine has no constant {name}")
+    current = getattr(mmr_engine, name)
+    if isinstance(current, list):
+        return name, [type(current[0])(part) for part in value.split(",")]
+    return name, type(current)(value)
+
+
+def parse_sweep(text):
+    name, _, values = text.partition("=")
+    return [parse_constant(f"{name}={value}") for value in values.split(";" if "RANK_BOUNDARIES" in name.upper()
+                                                                        else ",")]
+
+
+def print_season(report):
+    constants = ", ".join(f"{name}={value}" for name, value in report["constants"].items()) or "current constants"
+    convergence, inflation, oscillation = report["convergence"], report["inflation"], report["oscillation"]
+    print(f"\n🎲 {constants} - {report['matches']:,} matches, {report['players_active']:,} players, "
+          f"{report['seconds']}s ({report['matches_per_second']:,} matches/s)")
+    print(f"   📈 Convergence: rank correlation {convergence['final_rank_correlation']}, "
+          f"{convergence['converged_share'] * 100:.0f}% within tolerance, "
+          f"median {convergence['median_games_to_converge']} / p90 {convergence['p90_games_to_converge']} games "
+          f"(median played {convergence['median_games_played']})")
+    print(f"   🎈 Inflation: mean MMR {inflation['start_mean_mmr']} → {inflation['end_mean_mmr']} "
+          f"(true skill {inflation['mean_skill']})")
+    print(f"      tiers {inflation['tier_share']} vs true {inflation['true_tier_share']}")
+    print(f"   🔁 Oscillation: {oscillation['crossings_per_1000_matches']} crossings and "
+          f"{oscillation['flip_flops_per_1000_matches']} flip-flops per 1000 matches, "
+          f"{oscillation['players_with_flip_flops'] * 100:.1f}% of players flip-flopped")
+
+
+def print_checkpoints(report):
+    print("   matches    corr    MAE   drift   " + "  ".join(f"{name:>7}" for name in TIER_NAMES))
+    for point in report["checkpoints"]:
+        shares = "  ".join(f"{point['tier_share'][name] * 100:6.1f}%" for name in TIER_NAMES)
+        print(f"   {point['matches']:>7,}  {point['rank_correlation']:>6}  {point['mean_abs_error']:>5}  "
+              f"{point['mean_mmr_minus_skill']:>6}   {shares}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Monte Carlo season simulator for the MMR constants")
+    parser.add_argument("--players", type=int, default=5000)
+    parser.add_argument("--matches", type=int, default=100000, help="Ranked matches per season")
+    parser.add_argument("--activity", type=float, default=0.3, help="Share of idle players queueing each tick")
+    parser.add_argument("--modes", type=float, nargs=3, default=[1, 1, 1], metavar=("BALANCED", "RANDOM", "CAPTAINS"),
+                        help="Relative weights of the team selection modes")
+    parser.add_argument("--start", choices=["tier", "flat"], default="tier",
+                        help="Start from a noisy rank role (tier) or everyone at 600 (flat)")
+    parser.add_argument("--skill-mean", type=float, default=1100.0)
+    parser.add_argument("--skill-sd", type=float, default=400.0)
+    parser.add_argument("--role-noise", type=float, default=250.0, help="Error of the starting rank role")
+    parser.add_argument("--tolerance", type=float, default=150.0, help="MMR distance from skill that counts as converged")
+    parser.add_argument("--flip-window", type=int, default=5, help="Games within which an undone crossing is a flip-flop")
+    parser.add_argument("--checkpoints", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--set", dest="constants", type=parse_constant, action="append", default=[],
+                        metavar="NAME=VALUE", help="Override a mmr_engine constant (repeatable)")
+    parser.add_argument("--sweep", type=parse_sweep, metavar="NAME=V1,V2,...",
+                        help="Run one season per value (RANK_BOUNDARIES values are separated by ';')")
+    parser.add_argument("--json", help="Also write the reports to this file")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    base = dict(args.constants)
+    runs = [dict(base, **{name: value}) for name, value in args.sweep] if args.sweep else [base]
+
+    reports = []
+    for overrides in runs:
+        report = run_season(args, overrides)
+        print_season(report)
+        if not args.sweep:
+            print_checkpoints(report)
+        reports.append(report)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(reports, f, indent=2)
+        print(f"\n💾 Reports written to {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
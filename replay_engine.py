@@ -0,0 +1,429 @@
+import collections
+import datetime
+import time
+from pymongo import UpdateOne
+import mmr_engine
+from mmr_engine import PlayerState
+from logging_config import get_logger
+from tiers import with_tier
+
+logger = get_logger("replay_engine")
+
+# Players fields a replay owns - everything the rating rules read or write
+RATING_FIELDS = (
+    "mmr", "wins", "losses", "matches", "current_streak", "longest_win_streak", "longest_loss_streak",
+    "global_mmr", "global_wins", "global_losses", "global_matches", "global_current_streak",
+    "global_longest_win_streak", "global_longest_loss_streak", "last_promotion"
+)
+
+MATCH_PROJECTION = {
+    "_id": 0, "match_id": 1, "winner": 1, "is_global": 1, "completed_at": 1,
+    "team1.id": 1, "team1.name": 1, "team2.id": 1, "team2.name": 1,
+    "mmr_changes.player_id": 1, "mmr_changes.old_mmr": 1, "mmr_changes.mmr_change": 1,
+    "mmr_changes.is_global": 1, "mmr_changes.is_win": 1, "mmr_changes.streak": 1
+}
+
+WRITE_BATCH_SIZE = 1000
+
+
+class ReplayPlayer:
+    """One row of the replay's state table"""
+
+    __slots__ = ("player_id", "name", "exists", "mmr", "wins", "losses", "matches", "current_streak",
+                 "longest_win_streak", "longest_loss_streak", "global_mmr", "global_wins", "global_losses",
+                 "global_matches", "global_current_streak", "global_longest_win_streak",
+                 "global_longest_loss_streak", "last_promotion", "recent")
+
+    def __init__(self, player_id, name, mmr, global_mmr):
+        self.player_id = player_id
+        self.name = name
+        self.exists = False
+        self.mmr = mmr
+        self.global_mmr = global_mmr
+        self.wins = self.losses = self.matches = 0
+        self.global_wins = self.global_losses = self.global_matches = 0
+        self.current_streak = self.longest_win_streak = self.longest_loss_streak = 0
+        self.global_current_streak = self.global_longest_win_streak = self.global_longest_loss_streak = 0
+        self.last_promotion = None
+        # Won/lost over the last completed matches of either type, newest first (for momentum)
+        self.recent = collections.deque(maxlen=mmr_engine.MOMENTUM_RECENT_GAMES)
+
+    def fields(self):
+        return {field: getattr(self, field) for field in RATING_FIELDS}
+
+
+class MatchReplayEngine:
+    """
+    Rebuilds player ratings by replaying completed matches in completed_at order through mmr_engine,
+    following the same rules as reporting. Matches are read with a projection and held in memory (the
+    replay walks them twice - once to roll records back, once to rate them) along with the state table,
+    and the result is written back with bulk_write - or returned as a diff for a dry run.
+    """
+
+    def __init__(self, match_system):
+        self.match_system = match_system
+        self.players = match_system.players
+        self.matches = match_system.matches
+        self.ranks = match_system.db.get_collection('ranks')
+        self.resets = match_system.db.get_collection('resets')
+
+    def season_start(self):
+        """
+        When the latest soft reset happened, or None if there hasn't been one since the last full reset.
+        A soft reset carries MMR and lifetime records over and archives the season's matches, so
+        ratings before it can't be rebuilt from verification
+        """
+        latest = self.resets.find_one({"type": "leaderboard_reset"}, {"_id": 0, "reset_type": 1, "timestamp": 1},
+                                      sort=[("timestamp", -1)])
+        if latest and latest.get("reset_type") in ("ranked", "global"):
+            return latest.get("timestamp")
+        return None
+
+    def stream_matches(self, since=None):
+        """
+        Completed and rated matches with a winner, oldest first. Claimed matches the report pipeline
+        hasn't finished (rating_status set) are left to it - their jobs rebuild on top of the replay
+        """
+        match_filter = {"status": "completed", "winner": {"$in": [1, 2]}, "rating_status": {"$exists": False}}
+        if since is not None:
+            match_filter["completed_at"] = {"$gte": since}
+        return self.matches.aggregate([
+            {"$match": match_filter},
+            {"$sort": {"completed_at": 1}},
+            {"$project": MATCH_PROJECTION}
+        ], allowDiskUse=True, batchSize=WRITE_BATCH_SIZE)
+
+    @staticmethod
+    def real_players(team):
+        return [p for p in team if p.get("id") and not p.get("id").startswith('9000')]
+
+    def replay(self, since=None):
+        """
+        Replay every match (or those completed since a time) and return the rebuilt state without writing.
+        A full replay starts everyone from their rank verification, unless a soft reset has happened - then
+        it replays the current season. A partial one starts each player from the MMR recorded on their
+        first replayed match and their current record minus the replayed matches
+        """
+        started = time.perf_counter()
+        season_start = self.season_start() if since is None else None
+        if season_start is not None:
+            since = season_start
+        matches = list(self.stream_matches(since))
+        fetched = time.perf_counter()
+
+        rank_records = {doc["discord_id"]: doc for doc in self.ranks.find({}, {"_id": 0, "discord_id": 1, "tier": 1,
+                                                                              "global_mmr": 1})}
+        table = self.initial_table(matches, rank_records, since)
+
+        match_results = []
+        for match in matches:
+            match_results.append(self.apply_match(match, table, rank_records))
+
+        logger.info("🔄 Replayed %s matches for %s players in %.2fs (%.2fs fetching)",
+                    len(matches), len(table), time.perf_counter() - started, fetched - started)
+        return {
+            "since": since,
+            "season_start": season_start,
+            "matches": matches,
+            "match_results": match_results,
+            "table": table,
+            "duration_seconds": time.perf_counter() - started
+        }
+
+    def initial_table(self, matches, rank_records, since):
+        """State table as it stood before the first replayed match"""
+        table = {}
+        if since is None:
+            return table
+
+        player_ids = {p["id"] for match in matches for team in ("team1", "team2")
+                      for p in self.real_players(match.get(team, []))}
+        current = {doc["id"]: doc for doc in self.players.find({"id": {"$in": list(player_ids)}})}
+
+        # Roll each player's record back by the matches about to be replayed
+        window = {player_id: collections.Counter() for player_id in player_ids}
+        anchors = {}
+        for match in matches:
+            prefix = "global_" if match.get("is_global", False) else ""
+            recorded = {change.get("player_id"): change for change in match.get("mmr_changes", [])}
+            for team_number in (1, 2):
+                for player in self.real_players(match.get(f"team{team_number}", [])):
+                    counts = window[player["id"]]
+                    counts[f"{prefix}matches"] += 1
+                    counts[f"{prefix}wins" if team_number == match["winner"] else f"{prefix}losses"] += 1
+                    change = recorded.get(player["id"])
+                    if change and change.get("old_mmr") is not None:
+                        anchors.setdefault((player["id"], prefix), (change["old_mmr"], change.get("streak"),
+                                                                    change.get("is_win")))
+                    counts[f"{prefix}recorded_change"] += (change or {}).get("mmr_change", 0) or 0
+
+        recent_results = self.match_system.get_recent_results(list(player_ids), before=since)
+        previous_streaks = self.previous_streaks(list(player_ids), since)
+
+        for player_id in player_ids:
+            doc = current.get(player_id, {})
+            counts = window[player_id]
+            state = self.new_player(player_id, doc.get("name", "Unknown"), rank_records.get(player_id))
+            for prefix, default_mmr in (("", 600), ("global_", 300)):
+                for field in ("matches", "wins", "losses"):
+                    setattr(state, f"{prefix}{field}", max(0, doc.get(f"{prefix}{field}", 0) - counts[f"{prefix}{field}"]))
+                anchor = anchors.get((player_id, prefix))
+                if anchor:
+                    old_mmr, streak, won = anchor
+                    setattr(state, f"{prefix}mmr", old_mmr)
+                    previous = previous_streaks.get((player_id, bool(prefix)))
+                    setattr(state, f"{prefix}current_streak",
+                            previous if previous is not None else self.streak_before(streak, won))
+                elif doc:
+                    # No matches of this type in the window, so the stored values still stand
+                    setattr(state, f"{prefix}mmr",
+                            doc.get(f"{prefix}mmr", default_mmr) - counts[f"{prefix}recorded_change"])
+                    setattr(state, f"{prefix}current_streak", doc.get(f"{prefix}current_streak", 0))
+                setattr(state, f"{prefix}longest_win_streak", doc.get(f"{prefix}longest_win_streak", 0))
+                setattr(state, f"{prefix}longest_loss_streak", doc.get(f"{prefix}longest_loss_streak", 0))
+
+            state.exists = bool(state.matches or state.global_matches)
+            promotion = doc.get("last_promotion")
+            if promotion and promotion.get("matches_at_promotion", 0) <= state.matches:
+                state.last_promotion = promotion
+            state.recent.extend(recent_results.get(player_id, []))
+            table[player_id] = state
+        return table
+
+    def previous_streaks(self, player_ids, since):
+        """{(player_id, is_global): streak} recorded on each player's last match of each type before since"""
+        pipeline = [
+            {"$match": {"status": "completed", "completed_at": {"$lt": since},
+                        "mmr_changes.player_id": {"$in": player_ids}}},
+            {"$sort": {"completed_at": -1}},
+            {"$project": {"_id": 0, "is_global": 1, "mmr_changes.player_id": 1, "mmr_changes.streak": 1}},
+            {"$unwind": "$mmr_changes"},
+            {"$match": {"mmr_changes.player_id": {"$in": player_ids}}},
+            {"$group": {
+                "_id": {"player_id": "$mmr_changes.player_id", "is_global": {"$ifNull": ["$is_global", False]}},
+                "streak": {"$first": "$mmr_changes.streak"}
+            }}
+        ]
+        return {(row["_id"]["player_id"], bool(row["_id"]["is_global"])): row["streak"]
+                for row in self.matches.aggregate(pipeline, allowDiskUse=True)}
+
+    @staticmethod
+    def streak_before(streak, won):
+        """
+        Pre-match streak worked back from a recorded post-match one, for players with no earlier match.
+        A recorded 1/-1 came from an opposite or empty streak, so 0 stands in for it
+        """
+        if streak is None or won is None:
+            return 0
+        if won:
+            return streak - 1 if streak > 1 else 0
+        return streak + 1 if streak < -1 else 0
+
+    def new_player(self, player_id, name, rank_record):
+        return ReplayPlayer(player_id, name, self.match_system.get_starting_mmr(rank_record, False),
+                            self.match_system.get_starting_mmr(rank_record, True))
+
+    def apply_match(self, match, table, rank_records):
+        """Rate one match against the state table and update it, as report_match_by_id would"""
+        is_global = match.get("is_global", False)
+        winner = match["winner"]
+
+        teams = {}
+        averages = {}
+        for team_number in (1, 2):
+            rows = []
+            mmrs = []
+            for player in self.real_players(match.get(f"team{team_number}", [])):
+                state = table.get(player["id"])
+                if state is None:
+                    state = table[player["id"]] = self.new_player(
+                        player["id"], player.get("name", "Unknown"), rank_records.get(player["id"])
+                    )
+                rows.append(state)
+                # First global matches average at 300 whatever the player starts at, like reporting does
+                if is_global:
+                    mmrs.append(state.global_mmr if state.exists else 300)
+                else:
+                    mmrs.append(state.mmr)
+            teams[team_number] = rows
+            averages[team_number] = sum(mmrs) / len(mmrs) if mmrs else 0
+
+        engine_teams = {}
+        for team_number, rows in teams.items():
+            won = team_number == winner
+            engine_teams[team_number] = [
+                PlayerState(
+                    state.player_id,
+                    state.global_mmr if is_global else state.mmr,
+                    state.global_matches if is_global else state.matches,
+                    state.global_current_streak if is_global else state.current_streak,
+                    (state.matches - state.last_promotion.get("matches_at_promotion", 0)
+                     if state.last_promotion else None),
+                    # Reporting marks the match completed before rating it, so it counts towards momentum
+                    [won] + list(state.recent),
+                    has_history=state.exists
+                )
+                for state in rows
+            ]
+
+        deltas = mmr_engine.match_deltas(engine_teams[1], engine_teams[2], winner, averages[1], averages[2])
+
+        mmr_changes = []
+        for team_number, rows in teams.items():
+            won = team_number == winner
+            for state in rows:
+                delta = deltas[state.player_id]
+                existed = state.exists
+                if is_global:
+                    old_mmr = state.global_mmr
+                    state.global_matches += 1
+                    state.global_mmr = max(0, old_mmr + delta)
+                    state.global_current_streak = mmr_engine.next_streak(state.global_current_streak, won)
+                    if won:
+                        state.global_wins += 1
+                        state.global_longest_win_streak = max(state.global_longest_win_streak,
+                                                              state.global_current_streak)
+                    else:
+                        state.global_losses += 1
+                        state.global_longest_loss_streak = min(state.global_longest_loss_streak,
+                                                               state.global_current_streak)
+                    new_mmr, streak = state.global_mmr, state.global_current_streak
+                else:
+                    old_mmr = state.mmr
+                    if not existed:
+                        # A first ranked match creates the entry with the default global MMR, not the verified one
+                        state.global_mmr = 300
+                    state.matches += 1
+                    state.mmr = max(0, old_mmr + delta)
+                    state.current_streak = mmr_engine.next_streak(state.current_streak, won)
+                    if won:
+                        state.wins += 1
+                        state.longest_win_streak = max(state.longest_win_streak, state.current_streak)
+                        # Reporting only records promotions for players who already had an entry
+                        if existed:
+                            self.track_promotion(state, old_mmr, match.get("completed_at"))
+                    else:
+                        state.losses += 1
+                        state.longest_loss_streak = min(state.longest_loss_streak, state.current_streak)
+                    new_mmr, streak = state.mmr, state.current_streak
+
+                state.exists = True
+                state.recent.appendleft(won)
+                mmr_changes.append({
+                    "player_id": state.player_id,
+                    "old_mmr": old_mmr,
+                    "new_mmr": new_mmr,
+                    "mmr_change": delta,
+                    "is_win": won,
+                    "is_global": is_global,
+                    "streak": streak
+                })
+
+        return {"mmr_changes": mmr_changes, "team1_avg_mmr": averages[1], "team2_avg_mmr": averages[2]}
+
+    def track_promotion(self, state, old_mmr, completed_at):
+        """Promotion protection starts when a player moves up a tier on a ranked win"""
+        old_tier = self.match_system.get_rank_tier_from_mmr(old_mmr)
+        new_tier = self.match_system.get_rank_tier_from_mmr(state.mmr)
+        rank_value = {"Rank C": 1, "Rank B": 2, "Rank A": 3}
+        if rank_value.get(new_tier, 1) > rank_value.get(old_tier, 1):
+            state.last_promotion = {
+                "matches_at_promotion": state.matches,
+                "promoted_at": completed_at or datetime.datetime.utcnow(),
+                "from_rank": old_tier,
+                "to_rank": new_tier,
+                "mmr_at_promotion": state.mmr
+            }
+
+    def diff(self, result, limit=None):
+        """
+        What applying a replay would change: per player rating differences (largest MMR moves first)
+        and how many matches would get different recorded changes
+        """
+        table = result["table"]
+        current = {doc["id"]: doc for doc in self.players.find(
+            {"id": {"$in": list(table)}}, {"_id": 0, "id": 1, "name": 1, **{field: 1 for field in RATING_FIELDS}}
+        )}
+
+        players = []
+        for player_id, state in table.items():
+            doc = current.get(player_id, {})
+            changes = {}
+            for field in ("mmr", "global_mmr", "matches", "wins", "losses", "global_matches", "global_wins",
+                          "global_losses", "current_streak", "global_current_streak"):
+                old = doc.get(field)
+                new = getattr(state, field)
+                if old != new:
+                    changes[field] = (old, new)
+            if changes:
+                players.append({
+                    "player_id": player_id,
+                    "name": doc.get("name", state.name),
+                    "new_player": not doc,
+                    "changes": changes,
+                    "mmr_delta": (state.mmr - (doc.get("mmr") or 0)) if "mmr" in changes else 0,
+                    "global_mmr_delta": (state.global_mmr - (doc.get("global_mmr") or 0))
+                    if "global_mmr" in changes else 0
+                })
+        players.sort(key=lambda row: max(abs(row["mmr_delta"]), abs(row["global_mmr_delta"])), reverse=True)
+
+        matches_changed = 0
+        for match, replayed in zip(result["matches"], result["match_results"]):
+            recorded = {(c.get("player_id"), c.get("mmr_change")) for c in match.get("mmr_changes", [])}
+            if recorded != {(c["player_id"], c["mmr_change"]) for c in replayed["mmr_changes"]}:
+                matches_changed += 1
+
+        return {
+            "matches_replayed": len(result["matches"]),
+            "players_replayed": len(table),
+            "players_changed": len(players),
+            "matches_changed": matches_changed,
+            "players": players[:limit] if limit else players,
+            "season_start": result["season_start"],
+            "duration_seconds": round(result["duration_seconds"], 2)
+        }
+
+    def apply(self, result, update_matches=True):
+        """
+        Write a replay back - one bulk_write for players, batched bulk_writes for match histories.
+        Rebuilt players get a new last_rated_match, so rating jobs built before the rebuild go stale
+        instead of landing on top of it. Pause the report pipeline around this
+        """
+        now = datetime.datetime.utcnow()
+        rebuild_id = f"rebuild_{now.strftime('%Y%m%d_%H%M%S')}"
+        player_ops = [
+            UpdateOne(
+                {"id": player_id},
+                {"$set": {**with_tier(state.fields()), "last_rated_match": rebuild_id, "last_updated": now},
+                 "$setOnInsert": {"name": state.name, "created_at": now}},
+                upsert=True
+            )
+            for player_id, state in result["table"].items()
+        ]
+
+        players_written = 0
+        if player_ops:
+            players_written = self.players.bulk_write(player_ops, ordered=False).matched_count
+
+        matches_written = 0
+        if update_matches:
+            batch = []
+            for match, replayed in zip(result["matches"], result["match_results"]):
+                batch.append(UpdateOne({"match_id": match["match_id"]}, {"$set": replayed}))
+                if len(batch) >= WRITE_BATCH_SIZE:
+                    matches_written += self.matches.bulk_write(batch, ordered=False).matched_count
+                    batch = []
+            if batch:
+                matches_written += self.matches.bulk_write(batch, ordered=False).matched_count
+
+        logger.info("✅ Replay written: %s players, %s matches", players_written, matches_written)
+        return {"players_written": players_written, "matches_written": matches_written}
+
+    def rebuild(self, since=None, dry_run=True, update_matches=True, limit=None):
+        """Replay and either report the diff (dry run) or write it"""
+        result = self.replay(since)
+        summary = self.diff(result, limit=limit)
+        if not dry_run:
+            summary.update(self.apply(result, update_matches=update_matches))
+        summary["dry_run"] = dry_run
+        return summary
@@ -0,0 +1,352 @@
+import asyncio
+import collections
+import datetime
+import os
+import time
+import types
+from logging_config import get_logger
+
+logger = get_logger("report_pipeline")
+
+# Workers rating reported matches concurrently, and how many claimed reports may wait for one
+REPORT_WORKERS = int(os.getenv("REPORT_WORKERS", 4))
+REPORT_QUEUE_SIZE = int(os.getenv("REPORT_QUEUE_SIZE", 200))
+
+# Tries per report before it is left for the recovery sweep
+MAX_ATTEMPTS = 3
+
+# How often the sweep looks for claimed reports nobody is working on, and how old they must be
+RECOVERY_INTERVAL = 60
+STALE_AFTER = 120
+
+# How long pause() waits for ratings in progress to finish
+DRAIN_TIMEOUT = 120
+
+
+class ReportJob:
+    """One claimed match waiting to be rated"""
+
+    __slots__ = ("match_id", "player_ids", "interaction", "ctx", "attempts", "queued_at", "recovered", "turn")
+
+    def __init__(self, match_id, player_ids, interaction=None, ctx=None, recovered=False):
+        self.match_id = match_id
+        self.player_ids = sorted({str(player_id) for player_id in player_ids if player_id})
+        self.interaction = interaction
+        self.ctx = ctx
+        self.attempts = 0
+        self.queued_at = time.perf_counter()
+        self.recovered = recovered
+        self.turn = None
+
+
+class ReportPipeline:
+    """
+    Rates reported matches off the command path. /report claims the match and replies straight away,
+    then a bounded pool of workers applies the MMR changes, queues role updates and hands the result
+    to the result handler (which edits the original reply).
+
+    Ratings are idempotent (see MatchSystem.rate_reported_match), so a failed job is simply retried,
+    and claimed matches that were never finished - a crashed worker or a restart - are picked up again
+    by a periodic sweep.
+    """
+
+    def __init__(self, match_system, workers=REPORT_WORKERS, max_queue=REPORT_QUEUE_SIZE):
+        self.match_system = match_system
+        self.worker_count = workers
+        self.max_queue = max_queue
+        self.bot = None
+
+        # async handler(job, match_result, error) that shows the outcome
+        self.result_handler = None
+
+        self.queue = None
+        self.workers = []
+        self.recovery_task = None
+
+        # Match IDs queued or being rated, so the sweep leaves them alone
+        self.tracked = set()
+        self.in_flight = 0
+
+        # Cleared by pause() - workers hold new ratings and the sweep stops requeueing until resume()
+        self.unpaused = asyncio.Event()
+        self.unpaused.set()
+
+        # player_id -> jobs waiting for (or holding) that player, in queue order. A job is rated once
+        # it heads the line of every one of its players, so matches sharing a player go one at a time
+        self.player_lines = {}
+
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.retried = 0
+        self.recovered = 0
+        self.worker_restarts = 0
+        self.backpressure_waits = 0
+        self.max_depth = 0
+        self.last_error = None
+        self.wait_times = collections.deque(maxlen=200)
+        self.process_times = collections.deque(maxlen=200)
+
+        try:
+            self.match_system.matches.create_index("rating_status", sparse=True)
+        except Exception as e:
+            print(f"⚠️ Could not create rating_status index: {e}")
+
+    def set_bot(self, bot):
+        self.bot = bot
+
+    def set_result_handler(self, handler):
+        self.result_handler = handler
+
+    def start(self):
+        """Start the workers and the recovery sweep (call from the running loop)"""
+        loop = asyncio.get_running_loop()
+        if self.queue is None:
+            self.queue = asyncio.Queue(maxsize=self.max_queue)
+
+        self.workers = [task for task in self.workers if not task.done()]
+        while len(self.workers) < self.worker_count:
+            self.workers.append(loop.create_task(self._worker(len(self.workers))))
+
+        if not self.recovery_task or self.recovery_task.done():
+            self.recovery_task = loop.create_task(self._recovery_loop())
+        print(f"✅ Report pipeline started ({self.worker_count} workers, queue limit {self.max_queue})")
+
+    async def stop(self):
+        for task in self.workers + [self.recovery_task]:
+            if task:
+                task.cancel()
+        self.workers = []
+
+    async def pause(self, timeout=DRAIN_TIMEOUT):
+        """
+        Hold new ratings and wait for the ones in progress to finish, for bulk rating writes such as a
+        rebuild. Queued and newly submitted reports wait until resume()
+        """
+        self.unpaused.clear()
+        deadline = time.perf_counter() + timeout
+        while self.in_flight:
+            if time.perf_counter() > deadline:
+                self.resume()
+                raise TimeoutError(f"{self.in_flight} match ratings still in progress after {timeout}s")
+            await asyncio.sleep(0.1)
+        logger.info("⏸️ Report pipeline paused")
+
+    def resume(self):
+        if not self.unpaused.is_set():
+            self.unpaused.set()
+            logger.info("▶️ Report pipeline resumed")
+
+    def is_paused(self):
+        return not self.unpaused.is_set()
+
+    def is_running(self):
+        return self.queue is not None and any(not task.done() for task in self.workers)
+
+    @staticmethod
+    def team_player_ids(match):
+        return [player.get("id") for team in ("team1", "team2") for player in match.get(team, [])]
+
+    async def submit(self, match_id, player_ids, interaction=None, ctx=None):
+        """Queue a claimed match. Waits for room when the queue is full (callers have already replied)"""
+        if not self.is_running():
+            self.start()
+        await self._enqueue(ReportJob(match_id, player_ids, interaction, ctx))
+        self.submitted += 1
+
+    async def _enqueue(self, job):
+        self.tracked.add(job.match_id)
+        if self.queue.full():
+            self.backpressure_waits += 1
+            logger.warning("⏳ Report queue full (%s) - waiting to queue match %s", self.queue.qsize(), job.match_id)
+        job.queued_at = time.perf_counter()
+        await self.queue.put(job)
+        self.max_depth = max(self.max_depth, self.queue.qsize())
+
+    async def _worker(self, index):
+        while True:
+            job = await self.queue.get()
+            try:
+                await self.process(job)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("❌ Report worker %s failed on match %s: %s", index, job.match_id, e)
+            finally:
+                self.queue.task_done()
+
+    def is_turn(self, job):
+        return all(self.player_lines[player_id][0] is job for player_id in job.player_ids)
+
+    async def wait_turn(self, job):
+        """
+        Join every player's line (all at once, so queue order is kept) and wait to reach the front,
+        and for the pipeline to be unpaused
+        """
+        job.turn = asyncio.Event()
+        for player_id in job.player_ids:
+            self.player_lines.setdefault(player_id, collections.deque()).append(job)
+        if self.is_turn(job):
+            job.turn.set()
+        try:
+            await job.turn.wait()
+            await self.unpaused.wait()
+        except asyncio.CancelledError:
+            self.end_turn(job)
+            raise
+
+    def end_turn(self, job):
+        """Leave the lines and start whichever jobs are now at the front of all of theirs"""
+        next_jobs = []
+        for player_id in job.player_ids:
+            line = self.player_lines[player_id]
+            line.remove(job)
+            if line:
+                next_jobs.append(line[0])
+            else:
+                del self.player_lines[player_id]
+        for next_job in next_jobs:
+            if self.is_turn(next_job):
+                next_job.turn.set()
+
+    async def process(self, job):
+        """
+        Rate one match, queue its role updates and report the outcome. Failed attempts are retried
+        with backoff before the job gives up its turn, so no other match for its players runs in between
+        """
+        self.wait_times.append(time.perf_counter() - job.queued_at)
+        match_result, error = None, None
+        await self.wait_turn(job)
+
+        self.in_flight += 1
+        started = time.perf_counter()
+        try:
+            while True:
+                job.attempts += 1
+                # RatingPending (still unrated after its stale jobs were rebuilt) is retried like any error
+                try:
+                    match_result = await asyncio.to_thread(self.match_system.rate_reported_match, job.match_id)
+                    break
+                except Exception as e:
+                    self.last_error = f"{job.match_id}: {e}"
+                    if job.attempts >= MAX_ATTEMPTS:
+                        error = e
+                        break
+                    self.retried += 1
+                    logger.warning("🔁 Rating match %s failed (attempt %s/%s), retrying: %s",
+                                   job.match_id, job.attempts, MAX_ATTEMPTS, e)
+                    await asyncio.sleep(2 ** job.attempts)
+        finally:
+            self.end_turn(job)
+            self.in_flight -= 1
+            self.tracked.discard(job.match_id)
+
+        if error is not None:
+            self.failed += 1
+            logger.error("❌ Rating match %s failed after %s attempts - leaving it for the recovery sweep: %s",
+                         job.match_id, job.attempts, error)
+            await self._report(job, None, "The MMR update hit an error and will be retried automatically.")
+            return
+
+        self.process_times.append(time.perf_counter() - started)
+        if not match_result:
+            self.failed += 1
+            await self._report(job, None, "This match could not be found after it was reported.")
+            return
+
+        self.completed += 1
+        ctx = job.ctx or self.context_for(match_result)
+        if ctx and not match_result.get("is_global", False):
+            try:
+                await self.match_system.queue_match_role_updates(ctx, match_result)
+            except Exception as e:
+                logger.error("❌ Error queueing role updates for match %s: %s", job.match_id, e)
+
+        await self._report(job, match_result, None)
+
+    async def _report(self, job, match_result, error):
+        if not self.result_handler:
+            return
+        try:
+            await self.result_handler(job, match_result, error)
+        except Exception as e:
+            logger.error("❌ Error showing the result of match %s: %s", job.match_id, e)
+
+    def context_for(self, match_result):
+        """Guild and channel of a recovered match, for role updates without an interaction"""
+        if not self.bot or not match_result.get("channel_id"):
+            return None
+        channel = self.bot.get_channel(int(match_result["channel_id"]))
+        if not channel:
+            return None
+        return types.SimpleNamespace(guild=channel.guild, channel=channel)
+
+    async def _recovery_loop(self):
+        max_age = 0
+        while True:
+            try:
+                # Restart any worker that died, then requeue reports nobody is rating
+                for index, task in enumerate(self.workers):
+                    if task.done():
+                        self.worker_restarts += 1
+                        logger.warning("🔁 Restarting report worker %s", index)
+                        self.workers[index] = asyncio.get_running_loop().create_task(self._worker(index))
+
+                recovered = await self.recover(max_age) if not self.is_paused() else []
+                if recovered:
+                    logger.info("🔁 Requeued %s unfinished match reports: %s", len(recovered), recovered)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                print(f"❌ Error in report recovery sweep: {e}")
+
+            # Everything unfinished at startup is from before the restart; after that only stuck jobs count
+            max_age = STALE_AFTER
+            await asyncio.sleep(RECOVERY_INTERVAL)
+
+    async def recover(self, max_age=STALE_AFTER):
+        """Queue claimed matches that are still unrated and older than max_age seconds"""
+        cutoff = datetime.datetime.utcnow() - datetime.timedelta(seconds=max_age)
+        pending = await asyncio.to_thread(lambda: list(self.match_system.matches.find(
+            {"rating_status": {"$in": ["pending", "writing"]}, "completed_at": {"$lte": cutoff}},
+            {"match_id": 1, "team1.id": 1, "team2.id": 1}
+        ).sort("completed_at", 1)))
+
+        recovered = []
+        for match in pending:
+            if match["match_id"] in self.tracked:
+                continue
+            await self._enqueue(ReportJob(match["match_id"], self.team_player_ids(match), recovered=True))
+            self.recovered += 1
+            recovered.append(match["match_id"])
+        return recovered
+
+    @staticmethod
+    def percentile(values, pct):
+        if not values:
+            return None
+        ordered = sorted(values)
+        return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+    def get_stats(self):
+        return {
+            "running": self.is_running(),
+            "paused": self.is_paused(),
+            "workers": self.worker_count,
+            "queue_depth": self.queue.qsize() if self.queue else 0,
+            "queue_limit": self.max_queue,
+            "max_depth": self.max_depth,
+            "in_flight": self.in_flight,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "retried": self.retried,
+            "recovered": self.recovered,
+            "worker_restarts": self.worker_restarts,
+            "backpressure_waits": self.backpressure_waits,
+            "wait_p50_seconds": self.percentile(self.wait_times, 50),
+            "wait_p95_seconds": self.percentile(self.wait_times, 95),
+            "process_p50_seconds": self.percentile(self.process_times, 50),
+            "process_p95_seconds": self.percentile(self.process_times, 95),
+            "last_error": self.last_error
+        }
@@ -0,0 +1,258 @@
+"""
+Season reset helpers shared by the bot and the leaderboard site.
+The soft reset curve lives here once - as plain Python for single values and as a
+MongoDB $switch expression so resets run entirely server-side.
+"""
+
+import datetime
+import time
+from tiers import TIER_FLOORS, tier_expression, tier_for_mmr
+
+try:
+    import numpy as np
+except ImportError:  # Previews fall back to plain Python
+    np = None
+
+# Lower MMR bound of each ranked tier, highest first
+RANK_TIER_FLOORS = TIER_FLOORS
+
+
+def calculate_soft_reset_mmr(current_mmr, reset_type="ranked"):
+    """
+    Calculate soft reset MMR - compresses players toward tier benchmarks
+    """
+    if reset_type == "global":
+        # Global MMR soft reset - compress toward 400-500 range
+        if current_mmr >= 600:
+            # High global players: compress to 450-550
+            base_reset = 450
+            bonus = min((current_mmr - 600) * 0.1, 100)
+            return int(base_reset + bonus)
+        elif current_mmr >= 400:
+            # Mid global players: slight compression
+            return int(current_mmr * 0.85)
+        else:
+            # Low global players: minimal reset
+            return int(max(current_mmr * 0.9, 300))
+
+    else:  # ranked reset
+        # Tier-based compression approach
+        if current_mmr >= 1600:  # Rank A players
+            # Compress Rank A players to 1650-1800 range
+            excess_mmr = current_mmr - 1600
+            compression_factor = 0.3  # Keep 30% of excess above 1600
+            new_mmr = 1650 + (excess_mmr * compression_factor)
+            return int(min(new_mmr, 1800))  # Cap at 1800
+
+        elif current_mmr >= 1100:  # Rank B players
+            # Compress Rank B players to 1200-1450 range
+            excess_mmr = current_mmr - 1100
+            compression_factor = 0.5  # Keep 50% of excess above 1100
+            new_mmr = 1200 + (excess_mmr * compression_factor)
+            return int(min(new_mmr, 1450))  # Cap at 1450
+
+        else:  # Rank C players (below 1100)
+            # Compress Rank C players to 700-1000 range
+            excess_mmr = current_mmr - 600
+            compression_factor = 0.6  # Keep 60% of progress above 600
+            new_mmr = 700 + (excess_mmr * compression_factor)
+            return int(min(new_mmr, 1000))  # Cap at 1000
+
+
+def _whole(expression):
+    """Truncate an MMR expression to a stored integer"""
+    return {"$toInt": {"$trunc": expression}}
+
+
+def soft_reset_mmr_expression(reset_type="ranked"):
+    """
+    The calculate_soft_reset_mmr curve as an aggregation expression.
+    $trunc matches Python's int() for the positive values involved, and $toInt keeps the
+    stored type an integer like calculate_soft_reset_mmr (on MongoDB $trunc of a double is a double).
+    """
+    if reset_type == "global":
+        mmr = {"$ifNull": ["$global_mmr", 300]}
+        return {"$switch": {
+            "branches": [
+                {"case": {"$gte": [mmr, 600]},
+                 "then": _whole({"$add": [450, {"$min": [{"$multiply": [{"$subtract": [mmr, 600]}, 0.1]}, 100]}]})},
+                {"case": {"$gte": [mmr, 400]},
+                 "then": _whole({"$multiply": [mmr, 0.85]})}
+            ],
+            "default": _whole({"$max": [{"$multiply": [mmr, 0.9]}, 300]})
+        }}
+
+    mmr = {"$ifNull": ["$mmr", 600]}
+    return {"$switch": {
+        "branches": [
+            {"case": {"$gte": [mmr, 1600]},
+             "then": _whole({"$min": [{"$add": [1650, {"$multiply": [{"$subtract": [mmr, 1600]}, 0.3]}]}, 1800]})},
+            {"case": {"$gte": [mmr, 1100]},
+             "then": _whole({"$min": [{"$add": [1200, {"$multiply": [{"$subtract": [mmr, 1100]}, 0.5]}]}, 1450]})}
+        ],
+        "default": _whole({"$min": [{"$add": [700, {"$multiply": [{"$subtract": [mmr, 600]}, 0.6]}]}, 1000]})
+    }}
+
+
+def apply_soft_reset(players_collection, reset_type="ranked"):
+    """
+    Soft reset every player with one pipeline update_many.
+    Returns the number of players matched.
+    """
+    now = datetime.datetime.utcnow()
+
+    if reset_type == "global":
+        stage = {"$set": {
+            "global_mmr": soft_reset_mmr_expression("global"),
+            "global_current_streak": 0,  # Reset global streaks
+            "last_updated": now
+        }}
+    else:
+        stage = {"$set": {
+            "mmr": soft_reset_mmr_expression("ranked"),
+            "current_streak": 0,  # Reset streaks
+            "last_promotion": None,  # Remove promotion protection
+            "last_updated": now
+        }}
+
+    stages = [stage]
+    if reset_type != "global":
+        # Keep the persisted tier in step with the new MMR
+        stages.append({"$set": {"tier": tier_expression()}})
+
+    result = players_collection.update_many({}, stages)
+    return result.matched_count
+
+
+def backup_collection(source_collection, backup_name):
+    """
+    Copy a collection into backup_name server-side with $merge.
+    Re-running into the same backup is safe. Returns the backup document count.
+    """
+    source_collection.aggregate([
+        {"$merge": {
+            "into": backup_name,
+            "on": "_id",
+            "whenMatched": "replace",
+            "whenNotMatched": "insert"
+        }}
+    ])
+    return source_collection.database[backup_name].estimated_document_count()
+
+
+def soft_reset_array(values, reset_type="ranked"):
+    """calculate_soft_reset_mmr applied to a whole NumPy array at once"""
+    m = np.asarray(values, dtype=np.float64)
+
+    if reset_type == "global":
+        new = np.where(m >= 600, 450 + np.minimum((m - 600) * 0.1, 100),
+                       np.where(m >= 400, m * 0.85, np.maximum(m * 0.9, 300)))
+    else:
+        new = np.where(m >= 1600, np.minimum(1650 + (m - 1600) * 0.3, 1800),
+                       np.where(m >= 1100, np.minimum(1200 + (m - 1100) * 0.5, 1450),
+                                np.minimum(700 + (m - 600) * 0.6, 1000)))
+
+    return np.trunc(new).astype(np.int64)
+
+
+def preview_soft_reset(players_collection, reset_type="ranked", bin_width=100, top_movers=5):
+    """
+    Dry run of a soft reset - nothing is written.
+    Loads the MMR column once and returns before/after histograms, tier populations
+    (ranked only) and the players losing the most MMR.
+    """
+    started = time.perf_counter()
+    field, default = ("global_mmr", 300) if reset_type == "global" else ("mmr", 600)
+
+    names = []
+    before_values = []
+    for player in players_collection.find({}, {"_id": 0, "name": 1, field: 1}):
+        names.append(player.get("name", "Unknown"))
+        before_values.append(player.get(field, default))
+
+    preview = {
+        "reset_type": reset_type,
+        "player_count": len(before_values),
+        "engine": "numpy" if np is not None else "python",
+        "histogram": [],
+        "tiers": {},
+        "tier_changes": {},
+        "movers": []
+    }
+
+    if not before_values:
+        preview["elapsed_ms"] = (time.perf_counter() - started) * 1000
+        return preview
+
+    if np is not None:
+        before = np.asarray(before_values, dtype=np.int64)
+        after = soft_reset_array(before, reset_type)
+
+        # Histogram over shared buckets
+        before_bins = (before // bin_width) * bin_width
+        after_bins = (after // bin_width) * bin_width
+        before_keys, before_counts = np.unique(before_bins, return_counts=True)
+        after_keys, after_counts = np.unique(after_bins, return_counts=True)
+        buckets = np.union1d(before_keys, after_keys)
+        before_hist = np.zeros(len(buckets), dtype=np.int64)
+        after_hist = np.zeros(len(buckets), dtype=np.int64)
+        before_hist[np.searchsorted(buckets, before_keys)] = before_counts
+        after_hist[np.searchsorted(buckets, after_keys)] = after_counts
+        preview["histogram"] = [(int(b), int(bc), int(ac)) for b, bc, ac in zip(buckets, before_hist, after_hist)]
+
+        if reset_type != "global":
+            floors = np.array([floor for _, floor in reversed(RANK_TIER_FLOORS)])
+            tier_names = [name for name, _ in reversed(RANK_TIER_FLOORS)]
+            before_tier = np.searchsorted(floors, before, side="right") - 1
+            after_tier = np.searchsorted(floors, after, side="right") - 1
+            for i, name in enumerate(tier_names):
+                preview["tiers"][name] = {"before": int(np.count_nonzero(before_tier == i)),
+                                          "after": int(np.count_nonzero(after_tier == i))}
+            moved = before_tier != after_tier
+            if moved.any():
+                pairs, counts = np.unique(np.stack([before_tier[moved], after_tier[moved]], axis=1), axis=0,
+                                          return_counts=True)
+                for (old_i, new_i), count in zip(pairs, counts):
+                    preview["tier_changes"][(tier_names[old_i], tier_names[new_i])] = int(count)
+
+        # Biggest movers by MMR lost
+        drops = before - after
+        k = min(top_movers, len(drops))
+        top = np.argpartition(-drops, k - 1)[:k]
+        top = top[np.argsort(-drops[top], kind="stable")]
+        preview["movers"] = [(names[i], int(before[i]), int(after[i])) for i in top]
+
+        preview["mean_before"] = float(before.mean())
+        preview["mean_after"] = float(after.mean())
+
+    else:
+        after_values = [calculate_soft_reset_mmr(value, reset_type) for value in before_values]
+
+        histogram = {}
+        for value in before_values:
+            bucket = (value // bin_width) * bin_width
+            histogram.setdefault(bucket, [0, 0])[0] += 1
+        for value in after_values:
+            bucket = (value // bin_width) * bin_width
+            histogram.setdefault(bucket, [0, 0])[1] += 1
+        preview["histogram"] = [(bucket, counts[0], counts[1]) for bucket, counts in sorted(histogram.items())]
+
+        if reset_type != "global":
+            for name, _ in RANK_TIER_FLOORS:
+                preview["tiers"][name] = {"before": 0, "after": 0}
+            for old, new in zip(before_values, after_values):
+                old_tier, new_tier = tier_for_mmr(old), tier_for_mmr(new)
+                preview["tiers"][old_tier]["before"] += 1
+                preview["tiers"][new_tier]["after"] += 1
+                if old_tier != new_tier:
+                    key = (old_tier, new_tier)
+                    preview["tier_changes"][key] = preview["tier_changes"].get(key, 0) + 1
+
+        order = sorted(range(len(before_values)), key=lambda i: before_values[i] - after_values[i], reverse=True)
+        preview["movers"] = [(names[i], before_values[i], after_values[i]) for i in order[:top_movers]]
+
+        preview["mean_before"] = sum(before_values) / len(before_values)
+        preview["mean_after"] = sum(after_values) / len(after_values)
+
+    preview["elapsed_ms"] = (time.perf_counter() - started) * 1000
+    return preview
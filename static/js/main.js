@@ -1,3 +1,120 @@
+// "#37 of 812" with the top percentage, for positions from /api/player
+function formatPosition(position) {
+    if (!position) {
+        return 'Unranked';
+    }
+    const top = Math.max(1, Math.ceil(position.rank / position.total * 100));
+    return `#${position.rank} of ${position.total} <small>(top ${top}%)</small>`;
+}
+
+// Player modal match history, loaded a page at a time from /api/player/<id>/matches
+// (each page continues from the previous one's next_before cursor)
+const MATCH_HISTORY_TITLES = {ranked: 'Recent Ranked Matches', global: 'Recent Global Matches'};
+
+function matchHistoryRow(match) {
+    const teamNames = team => Array.isArray(team) ? team.map(p => p.name || 'Unknown').join(', ') : 'Unknown Team';
+    const resultBadge = match.player_result === 'Win' ?
+        '<span class="badge bg-success">Win</span>' :
+        '<span class="badge bg-danger">Loss</span>';
+    const mmrChange = match.mmr_change || 0;
+    const mmrChangeClass = mmrChange >= 0 ? 'text-success' : 'text-danger';
+    const mmrChangeDisplay = mmrChange >= 0 ? `+${mmrChange}` : `${mmrChange}`;
+
+    return `
+        <tr>
+            <td style="vertical-align:middle">${match.date || 'Unknown'}</td>
+            <td style="text-align:center;vertical-align:middle">${resultBadge}</td>
+            <td style="vertical-align:middle" class="${mmrChangeClass}">${mmrChangeDisplay}</td>
+            <td style="vertical-align:middle">${match.streak_display || '—'}</td>
+            <td style="vertical-align:middle">
+                <span style="display:inline-block;margin-right:5px">${teamNames(match.team1)}</span>
+                <span class="badge bg-dark mx-2">vs</span>
+                <span style="display:inline-block;margin-left:5px">${teamNames(match.team2)}</span>
+            </td>
+        </tr>
+    `;
+}
+
+function loadMatchHistory(playerId, type, container, before = null) {
+    if (!container) {
+        return;
+    }
+    const firstPage = !before;
+    if (firstPage) {
+        container.innerHTML = '<p class="text-muted">Loading matches...</p>';
+    }
+
+    const cursor = before ? `&before=${encodeURIComponent(before)}` : '';
+    fetch(`/api/player/${playerId}/matches?type=${type}${cursor}`)
+        .then(response => {
+            if (!response.ok) {
+                throw new Error(`HTTP error ${response.status}`);
+            }
+            return response.json();
+        })
+        .then(data => {
+            const matches = data.matches || [];
+            if (firstPage) {
+                if (matches.length === 0) {
+                    container.innerHTML = `<p class="text-muted">No recent ${type} matches found.</p>`;
+                    return;
+                }
+                const globalClass = type === 'global' ? ' global-match-table' : '';
+                container.innerHTML = `
+                    <h4 class="section-header${type === 'global' ? ' global-section-header' : ''}">${MATCH_HISTORY_TITLES[type]}</h4>
+                    <div class="table-responsive">
+                        <table class="table table-dark table-striped match-table${globalClass}">
+                            <thead>
+                                <tr>
+                                    <th style="width:120px">Date</th>
+                                    <th style="width:90px;text-align:center">Result</th>
+                                    <th style="width:120px">MMR Change</th>
+                                    <th style="width:120px">Streak</th>
+                                    <th>Teams</th>
+                                </tr>
+                            </thead>
+                            <tbody></tbody>
+                        </table>
+                    </div>
+                    <div class="text-center match-history-more"></div>
+                `;
+            }
+
+            container.querySelector('tbody').insertAdjacentHTML('beforeend', matches.map(matchHistoryRow).join(''));
+
+            const more = container.querySelector('.match-history-more');
+            more.innerHTML = '';
+            if (data.pagination && data.pagination.has_more && data.pagination.next_before) {
+                const button = document.createElement('button');
+                button.className = 'btn btn-sm btn-outline-light';
+                button.textContent = 'Load more';
+                button.addEventListener('click', () => {
+                    button.disabled = true;
+                    loadMatchHistory(playerId, type, container, data.pagination.next_before);
+                });
+                more.appendChild(button);
+            }
+        })
+        .catch(error => {
+            console.error(`Error loading ${type} matches:`, error);
+            if (firstPage) {
+                container.innerHTML = `<p class="text-muted">Couldn't load ${type} matches.</p>`;
+            }
+        });
+}
+
+// Ranked history straight away, global history the first time its tab is opened
+function loadModalMatchHistory(playerId) {
+    loadMatchHistory(playerId, 'ranked', document.getElementById('ranked-match-history'));
+
+    const globalTab = document.getElementById('global-tab');
+    if (globalTab) {
+        globalTab.addEventListener('shown.bs.tab', () => {
+            loadMatchHistory(playerId, 'global', document.getElementById('global-match-history'));
+        }, { once: true });
+    }
+}
+
 // MAKE SHOWPLAYERDETAILS GLOBAL - Define it outside of DOMContentLoaded
 function showPlayerDetails(playerId) {
     // First check if the modal element exists
@@ -122,6 +239,10 @@ function showPlayerDetails(playerId) {
                                                 <h5>Matches</h5>
                                                 <span class="stat-value">${player.matches || 0}</span>
                                             </div>
+                                            <div class="stat-item">
+                                                <h5>Leaderboard</h5>
+                                                <span class="stat-value">${formatPosition((player.leaderboard_positions || {}).ranked)}</span>
+                                            </div>
                                         </div>
                                     </div>
                                 </div>
@@ -158,77 +279,8 @@ function showPlayerDetails(playerId) {
                         </div>
             `;
 
-            // Display recent ranked matches if available
-            const hasMatches = player.recent_matches && player.recent_matches.length > 0;
-            const rankedMatches = hasMatches ? player.recent_matches.filter(match => !match.is_global) : [];
-
-            if (rankedMatches.length > 0) {
-                content += `
-                    <h4 class="section-header">Recent Ranked Matches</h4>
-                    <div class="table-responsive">
-                        <table class="table table-dark table-striped match-table">
-                            <thead>
-                                <tr>
-                                    <th style="width:120px">Date</th>
-                                    <th style="width:90px;text-align:center">Result</th>
-                                    <th style="width:120px">MMR Change</th>
-                                    <th style="width:120px">Streak</th>
-                                    <th>Teams</th>
-                                </tr>
-                            </thead>
-                            <tbody>
-                `;
-
-                rankedMatches.forEach(match => {
-                    // Safely format teams with error checking
-                    let team1Names = '';
-                    let team2Names = '';
-
-                    try {
-                        team1Names = match.team1 && Array.isArray(match.team1) ?
-                            match.team1.map(p => p.name || 'Unknown').join(', ') : 'Unknown Team';
-
-                        team2Names = match.team2 && Array.isArray(match.team2) ?
-                            match.team2.map(p => p.name || 'Unknown').join(', ') : 'Unknown Team';
-                    } catch (e) {
-                        console.error("Error formatting teams:", e);
-                        team1Names = 'Error loading team';
-                        team2Names = 'Error loading team';
-                    }
-
-                    // Determine result class
-                    let resultBadge = match.player_result === 'Win' ?
-                        '<span class="badge bg-success">Win</span>' :
-                        '<span class="badge bg-danger">Loss</span>';
-
-                    // Format MMR change
-                    let mmrChange = match.mmr_change || 0;
-                    let mmrChangeClass = mmrChange >= 0 ? 'text-success' : 'text-danger';
-                    let mmrChangeDisplay = mmrChange >= 0 ? `+${mmrChange}` : `${mmrChange}`;
-
-                    content += `
-                        <tr>
-                            <td style="vertical-align:middle">${match.date || 'Unknown'}</td>
-                            <td style="text-align:center;vertical-align:middle">${resultBadge}</td>
-                            <td style="vertical-align:middle" class="${mmrChangeClass}">${mmrChangeDisplay}</td>
-                            <td style="vertical-align:middle">${match.streak_display || '—'}</td>
-                            <td style="vertical-align:middle">
-                                <span style="display:inline-block;margin-right:5px">${team1Names}</span>
-                                <span class="badge bg-dark mx-2">vs</span>
-                                <span style="display:inline-block;margin-left:5px">${team2Names}</span>
-                            </td>
-                        </tr>
-                    `;
-                });
-
-                content += `
-                            </tbody>
-                        </table>
-                    </div>
-                `;
-            } else {
-                content += `<p class="text-muted">No recent ranked matches found.</p>`;
-            }
+            // Ranked match history loads on its own, see loadModalMatchHistory
+            content += `<div id="ranked-match-history"></div>`;
 
             // Close ranked stats tab and begin global stats tab
             content += `
@@ -260,6 +312,10 @@ function showPlayerDetails(playerId) {
                                                 <h5>Matches</h5>
                                                 <span class="stat-value">${player.global_matches || 0}</span>
                                             </div>
+                                            <div class="stat-item">
+                                                <h5>Leaderboard</h5>
+                                                <span class="stat-value">${formatPosition((player.leaderboard_positions || {}).global)}</span>
+                                            </div>
                                         </div>
                                     </div>
                                 </div>
@@ -296,75 +352,8 @@ function showPlayerDetails(playerId) {
                         </div>
             `;
 
-            // Display recent global matches
-            const globalMatches = hasMatches ? player.recent_matches.filter(match => match.is_global) : [];
-            if (globalMatches.length > 0) {
-                content += `
-                    <h4 class="section-header">Recent Global Matches</h4>
-                    <div class="table-responsive">
-                        <table class="table table-dark table-striped match-table">
-                            <thead>
-                                <tr>
-                                    <th style="width:120px">Date</th>
-                                    <th style="width:90px;text-align:center">Result</th>
-                                    <th style="width:120px">MMR Change</th>
-                                    <th style="width:120px">Streak</th>
-                                    <th>Teams</th>
-                                </tr>
-                            </thead>
-                            <tbody>
-                `;
-
-                globalMatches.forEach(match => {
-                    // Safely format teams with error checking
-                    let team1Names = '';
-                    let team2Names = '';
-
-                    try {
-                        team1Names = match.team1 && Array.isArray(match.team1) ?
-                            match.team1.map(p => p.name || 'Unknown').join(', ') : 'Unknown Team';
-
-                        team2Names = match.team2 && Array.isArray(match.team2) ?
-                            match.team2.map(p => p.name || 'Unknown').join(', ') : 'Unknown Team';
-                    } catch (e) {
-                        console.error("Error formatting teams:", e);
-                        team1Names = 'Error loading team';
-                        team2Names = 'Error loading team';
-                    }
-
-                    // Determine result class
-                    let resultBadge = match.player_result === 'Win' ?
-                        '<span class="badge bg-success">Win</span>' :
-                        '<span class="badge bg-danger">Loss</span>';
-
-                    // Format MMR change
-                    let mmrChange = match.mmr_change || 0;
-                    let mmrChangeClass = mmrChange >= 0 ? 'text-success' : 'text-danger';
-                    let mmrChangeDisplay = mmrChange >= 0 ? `+${mmrChange}` : `${mmrChange}`;
-
-                    content += `
-                        <tr>
-                            <td style="vertical-align:middle">${match.date || 'Unknown'}</td>
-                            <td style="text-align:center;vertical-align:middle">${resultBadge}</td>
-                            <td style="vertical-align:middle" class="${mmrChangeClass}">${mmrChangeDisplay}</td>
-                            <td style="vertical-align:middle">${match.streak_display || '—'}</td>
-                            <td style="vertical-align:middle">
-                                <span style="display:inline-block;margin-right:5px">${team1Names}</span>
-                                <span class="badge bg-dark mx-2">vs</span>
-                                <span style="display:inline-block;margin-left:5px">${team2Names}</span>
-                            </td>
-                        </tr>
-                    `;
-                });
-
-                content += `
-                            </tbody>
-                        </table>
-                    </div>
-                `;
-            } else {
-                content += `<p class="text-muted">No recent global matches found.</p>`;
-            }
+            // Global match history loads when its tab is first shown
+            content += `<div id="global-match-history"></div>`;
 
             // Close global stats tab
             content += `
@@ -373,6 +362,7 @@ function showPlayerDetails(playerId) {
             `;
 
             modalContent.innerHTML = content;
+            loadModalMatchHistory(playerId);
         })
         .catch(error => {
             console.error('Error fetching player details:', error);
@@ -0,0 +1,84 @@
+"""
+Rank tier definitions shared by the bot and the leaderboard site - the one place the MMR
+boundaries live. Players also carry a persisted tier field, kept in step with mmr on every write,
+so the per-rank leaderboards walk a (tier, mmr) index instead of scanning MMR ranges.
+"""
+
+# Lower MMR bound of each ranked tier, highest first
+TIER_FLOORS = [("Rank A", 1600), ("Rank B", 1100), ("Rank C", 0)]
+
+TIER_NAMES = [name for name, _ in TIER_FLOORS]
+TIER_FLOOR = dict(TIER_FLOORS)
+
+# MMR values where a tier starts, lowest first (mmr_engine's rank protection boundaries)
+TIER_BOUNDARIES = sorted(floor for _, floor in TIER_FLOORS if floor > 0)
+
+# MMR a player's first ranked match starts from, by verified rank role
+TIER_STARTING_MMR = {"Rank A": 1850, "Rank B": 1350, "Rank C": 600}
+
+# Website board types for each tier
+BOARD_TIERS = {"rank-a": "Rank A", "rank-b": "Rank B", "rank-c": "Rank C"}
+
+# Per-rank boards only list players who have played, which is also the partial index filter
+RANKED_FILTER = {"matches": {"$gt": 0}}
+
+
+def tier_for_mmr(mmr):
+    """Tier name for an MMR value"""
+    for name, floor in TIER_FLOORS:
+        if (mmr or 0) >= floor:
+            return name
+    return TIER_NAMES[-1]
+
+
+def tier_range(tier):
+    """(lowest MMR, first MMR of the tier above or None) for a tier name"""
+    index = TIER_NAMES.index(tier)
+    return TIER_FLOOR[tier], TIER_FLOORS[index - 1][1] if index > 0 else None
+
+
+def tier_expression(mmr="$mmr"):
+    """tier_for_mmr as an aggregation expression, for pipeline updates"""
+    value = {"$ifNull": [mmr, 0]}
+    return {"$switch": {
+        "branches": [{"case": {"$gte": [value, floor]}, "then": name} for name, floor in TIER_FLOORS[:-1]],
+        "default": TIER_NAMES[-1]
+    }}
+
+
+def with_tier(fields):
+    """A player $set/insert document with tier added whenever it sets mmr"""
+    if "mmr" in fields:
+        fields["tier"] = tier_for_mmr(fields["mmr"])
+    return fields
+
+
+def board_query(board_type):
+    """Players query for a per-rank board, or None for boards that aren't tiers"""
+    tier = BOARD_TIERS.get(board_type)
+    if tier is None:
+        return None
+    return dict(RANKED_FILTER, tier=tier)
+
+
+def ensure_tier_indexes(players_collection):
+    """Indexes every leaderboard sort can walk: (tier, mmr) for the rank boards, plus all and global"""
+    players_collection.create_index([("tier", 1), ("mmr", -1)], name="tier_mmr_ranked",
+                                    partialFilterExpression=RANKED_FILTER)
+    players_collection.create_index([("mmr", -1)], name="mmr_desc")
+    players_collection.create_index([("global_mmr", -1)], name="global_mmr_ranked",
+                                    partialFilterExpression={"global_matches": {"$gt": 0}})
+
+
+def sync_tiers(players_collection):
+    """Set tier on players where it is missing or out of step with mmr. Returns how many changed"""
+    mismatched = [{"tier": {"$nin": TIER_NAMES}}]
+    for name in TIER_NAMES:
+        low, high = tier_range(name)
+        outside = [{"mmr": {"$gte": high}}] if high is not None else []
+        if name != TIER_NAMES[-1]:
+            outside.append({"$or": [{"mmr": {"$lt": low}}, {"mmr": None}]})
+        mismatched.append({"tier": name, "$or": outside})
+
+    result = players_collection.update_many({"$or": mismatched}, [{"$set": {"tier": tier_expression()}}])
+    return result.modified_count
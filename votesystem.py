@@ -529,7 +529,11 @@ class VoteSystem:
             return
 
         # Update match with teams in queue manager
-        self.queue_manager.assign_teams_to_match(match_id, team1, team2)
+        mmr_preview = self.queue_manager.assign_teams_to_match(match_id, team1, team2)
+        team1_mentions = [mention + self.match_system.format_mmr_preview(mmr_preview, player.get('id'))
+                          for player, mention in zip(team1, team1_mentions)]
+        team2_mentions = [mention + self.match_system.format_mmr_preview(mmr_preview, player.get('id'))
+                          for player, mention in zip(team2, team2_mentions)]
 
         # Ensure players are properly tracked
         for player in team1 + team2:
@@ -700,7 +704,11 @@ class VoteSystem:
             return
 
         # Update match with teams in queue manager
-        self.queue_manager.assign_teams_to_match(match_id, team1, team2)
+        mmr_preview = self.queue_manager.assign_teams_to_match(match_id, team1, team2)
+        team1_mentions = [mention + self.match_system.format_mmr_preview(mmr_preview, player.get('id'))
+                          for player, mention in zip(team1, team1_mentions)]
+        team2_mentions = [mention + self.match_system.format_mmr_preview(mmr_preview, player.get('id'))
+                          for player, mention in zip(team2, team2_mentions)]
 
         # Ensure players are properly tracked
         for player in team1 + team2: